@@ -0,0 +1,12 @@
+"""Arquivo responsável pela junção de todas as funcionalidades
+do processamento em lote de comandos SQL."""
+
+# pylint: disable=import-error
+from .batch_processor import BatchProcessor, benchmark, read_statements
+
+# Indica o que, neste pacote, está disponível para uso.
+__all__ = [
+    'benchmark',
+    'BatchProcessor',
+    'read_statements'
+]
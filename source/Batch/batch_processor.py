@@ -0,0 +1,216 @@
+"""Arquivo responsável pelo processamento em lote de comandos
+SQL, distribuindo a verificação (Parser) e a conversão para
+Álgebra Relacional (Converter) entre vários processos."""
+
+import io
+import os
+import time
+import contextlib
+from collections import deque
+from itertools import islice
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Tuple
+
+# pylint: disable=import-error
+import Examples
+from Parser.cache import ParserCache
+from Parser.script_reader import ScriptReader
+from RelationalAlgebra.Converter import Converter
+
+# O cache de comandos SQL de cada processo.
+_worker_parser_cache: ParserCache = ParserCache()
+
+def process_statement(sql_command: str, database: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Verifica e converte um único comando SQL.
+
+    As mensagens impressas pelo Parser e pelo Converter são descartadas.
+
+    Args:
+        sql_command (str): O comando SQL.
+        database (Dict[str, List[str]]): Um dicionário contendo o nome
+        das tabelas (chaves) e uma lista com as colunas da tabela (valor).
+
+    Returns:
+        Dict[str, Any]: A Álgebra Relacional ('relational_algebra') e a
+        árvore serializada ('tree') do comando, ou o erro ('error'), com
+        o nome da exceção ('type') e a sua mensagem ('message').
+    """
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser = _worker_parser_cache.parse(sql_command)
+            parser.check_database_compatibility(database)
+            converter: Converter = Converter(parser)
+            relational_algebra: str = converter.convert_in_database_context(database)
+        return {
+            "relational_algebra": relational_algebra,
+            "tree": converter.relational_algebra_tree.serialize()
+        }
+    # pylint: disable=broad-exception-caught
+    except Exception as excp:
+        return {"error": {"type": type(excp).__name__, "message": str(excp)}}
+
+def process_chunk(chunk: List[Tuple[int, str]], database: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """Verifica e converte um bloco de comandos SQL, em um processo.
+
+    Args:
+        chunk (List[Tuple[int, str]]): O índice (na entrada) e o texto
+        de cada comando SQL do bloco.
+        database (Dict[str, List[str]]): O banco de dados exemplar.
+
+    Returns:
+        List[Dict[str, Any]]: O resultado de cada comando, na mesma
+        ordem do bloco, acompanhado do índice e do texto do comando.
+    """
+    return [
+        {"index": index, "sql": sql_command, **process_statement(sql_command, database)}
+        for index, sql_command in chunk
+    ]
+
+def read_statements(path: str) -> Iterator[str]:
+    """Lê, sob demanda, os comandos SQL de um arquivo, separados por ';'.
+
+    Comentários ('--') são ignorados. Veja 'Parser/script_reader.py'.
+
+    Args:
+        path (str): O caminho do arquivo.
+
+    Returns:
+        Iterator[str]: Os comandos SQL, na ordem do arquivo.
+    """
+    return ScriptReader(path).statements()
+
+class BatchProcessor:
+    """Classe responsável pelo processamento em lote de comandos SQL.
+
+    Os comandos são divididos em blocos, e cada bloco é verificado e
+    convertido em um processo de um 'ProcessPoolExecutor'. Os resultados
+    são retornados na mesma ordem da entrada.
+
+    Os comandos são consumidos sob demanda, com no máximo dois blocos
+    por processo em andamento, mantendo o uso de memória limitado mesmo
+    para arquivos muito grandes (veja 'process_iter').
+    """
+
+    # A quantia de processos.
+    __workers: int
+    # A quantia de comandos em cada bloco.
+    __chunk_size: int
+    # O banco de dados exemplar usado na verificação e na conversão.
+    __database: Dict[str, List[str]]
+
+    def __init__(
+            self,
+            workers: int | None = None,
+            chunk_size: int = 256,
+            database: Dict[str, List[str]] | None = None) -> None:
+        """Construtor da classe.
+
+        Args:
+            workers (int | None, optional): A quantia de processos. Valor
+            padrão: None (a quantia de processadores disponíveis).
+            chunk_size (int, optional): A quantia de comandos em cada
+            bloco. Valor padrão: 256.
+            database (Dict[str, List[str]] | None, optional): O banco de
+            dados exemplar. Valor padrão: None ('Examples.pagamento_example_db').
+        """
+        self.__workers = workers or os.cpu_count() or 1
+        self.__chunk_size = max(1, chunk_size)
+        self.__database = database if database is not None else Examples.pagamento_example_db
+
+    @property
+    def workers(self) -> int:
+        """Extrai o conteúdo da variável privada workers.
+
+        Returns:
+            int: A quantia de processos.
+        """
+        return self.__workers
+
+    @property
+    def chunk_size(self) -> int:
+        """Extrai o conteúdo da variável privada chunk_size.
+
+        Returns:
+            int: A quantia de comandos em cada bloco.
+        """
+        return self.__chunk_size
+
+    def process(self, statements: Iterable[str]) -> List[Dict[str, Any]]:
+        """Verifica e converte os comandos SQL.
+
+        Args:
+            statements (Iterable[str]): Os comandos SQL.
+
+        Returns:
+            List[Dict[str, Any]]: O resultado de cada comando, na ordem
+            da entrada (veja 'process_statement').
+        """
+        return list(self.process_iter(statements))
+
+    def process_iter(self, statements: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Verifica e converte os comandos SQL, gerando os resultados sob demanda.
+
+        Args:
+            statements (Iterable[str]): Os comandos SQL, consumidos sob demanda.
+
+        Yields:
+            Dict[str, Any]: O resultado de cada comando, na ordem da
+            entrada (veja 'process_statement').
+        """
+        indexed: Iterator[Tuple[int, str]] = enumerate(statements)
+        chunks: Iterator[List[Tuple[int, str]]] = iter(lambda: list(islice(indexed, self.chunk_size)), [])
+
+        # Com um único processo, evita o custo de criação do 'ProcessPoolExecutor'.
+        if self.workers == 1:
+            for chunk in chunks:
+                yield from process_chunk(chunk, self.__database)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Os blocos em andamento, na ordem da entrada.
+            pending: Deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(process_chunk, chunk, self.__database))
+                if len(pending) >= 2 * self.workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def process_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Verifica e converte os comandos SQL de um arquivo.
+
+        Args:
+            path (str): O caminho do arquivo (veja 'read_statements').
+
+        Returns:
+            Iterator[Dict[str, Any]]: O resultado de cada comando, na
+            ordem do arquivo, gerado sob demanda.
+        """
+        return self.process_iter(read_statements(path))
+
+def benchmark(
+        statements: List[str],
+        worker_counts: Iterable[int],
+        chunk_size: int = 256,
+        database: Dict[str, List[str]] | None = None) -> Dict[int, float]:
+    """Mede a vazão do processamento em lote para cada quantia de processos.
+
+    Args:
+        statements (List[str]): Os comandos SQL.
+        worker_counts (Iterable[int]): As quantias de processos a serem medidas.
+        chunk_size (int, optional): A quantia de comandos em cada bloco.
+        Valor padrão: 256.
+        database (Dict[str, List[str]] | None, optional): O banco de dados
+        exemplar. Valor padrão: None ('Examples.pagamento_example_db').
+
+    Returns:
+        Dict[int, float]: A quantia de comandos por segundo, para cada
+        quantia de processos.
+    """
+    throughput: Dict[int, float] = {}
+    for workers in worker_counts:
+        processor: BatchProcessor = BatchProcessor(workers, chunk_size, database)
+        start: float = time.perf_counter()
+        processor.process(statements)
+        throughput[workers] = len(statements) / (time.perf_counter() - start)
+    return throughput
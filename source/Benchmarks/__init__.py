@@ -0,0 +1,5 @@
+"""Arquivo responsável pela junção de todos os benchmarks
+do processador de consultas.
+
+Cada benchmark pode ser executado, a partir de '/source', com
+'python -m Benchmarks.<nome_do_benchmark>'."""
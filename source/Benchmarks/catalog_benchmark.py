@@ -0,0 +1,104 @@
+"""Benchmark da verificação de tabelas e colunas no banco de dados.
+
+Compara o catálogo (índices hash) com as antigas buscas lineares de
+'check_database_compatibility' e 'search_table_in_database', em um
+esquema sintético com 2.000 tabelas.
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.catalog_benchmark
+"""
+
+from timeit import timeit
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+
+# A quantia de tabelas do esquema sintético.
+TABLES: int = 2_000
+# A quantia de colunas de cada tabela do esquema sintético.
+COLUMNS_PER_TABLE: int = 12
+# A quantia de repetições de cada medição.
+REPEAT: int = 200
+
+def generate_database(tables: int, columns_per_table: int) -> Dict[str, List[str]]:
+    """Gera um banco de dados exemplar sintético.
+
+    Args:
+        tables (int): A quantia de tabelas.
+        columns_per_table (int): A quantia de colunas de cada tabela.
+
+    Returns:
+        Dict[str, List[str]]: O banco de dados, com colunas únicas por tabela.
+    """
+    return {
+        f"tabela{t}": [f"t{t}_coluna{c}" for c in range(columns_per_table)]
+        for t in range(tables)
+    }
+
+def legacy_check(database: Dict[str, List[str]], tables: List[str], columns: List[str]) -> bool:
+    """A antiga verificação de 'check_database_compatibility', usada como referência.
+
+    Args:
+        database (Dict[str, List[str]]): O banco de dados exemplar.
+        tables (List[str]): As tabelas do comando.
+        columns (List[str]): As colunas do comando.
+
+    Returns:
+        bool: Verdadeiro caso as tabelas e as colunas existam.
+    """
+    tables_in_database: List[str] = list(database.keys())
+    columns_in_database: List[str] = [column for columns in database.values() for column in columns]
+    return set(tables).issubset(tables_in_database) and set(columns).issubset(columns_in_database)
+
+def legacy_search(database: Dict[str, List[str]], context_tables: List[str], column: str) -> str:
+    """A antiga busca de 'search_table_in_database', usada como referência.
+
+    Args:
+        database (Dict[str, List[str]]): O banco de dados exemplar.
+        context_tables (List[str]): As tabelas do comando.
+        column (str): A coluna procurada.
+
+    Returns:
+        str: O nome da tabela da coluna.
+    """
+    for example_table, example_columns in database.items():
+        if example_table in context_tables:
+            if column in example_columns:
+                return example_table
+    return ""
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    database: Dict[str, List[str]] = generate_database(TABLES, COLUMNS_PER_TABLE)
+    # Um comando com 4 tabelas do fim do esquema (pior caso da busca linear).
+    context_tables: List[str] = [f"tabela{t}" for t in range(TABLES - 4, TABLES)]
+    columns: List[str] = [f"t{t}_coluna{c}" for t in range(TABLES - 4, TABLES) for c in range(0, COLUMNS_PER_TABLE, 3)]
+
+    build_time: float = timeit(lambda: Catalog(database), number=10) / 10
+    catalog: Catalog = Catalog.for_database(database)
+
+    legacy_check_time: float = timeit(lambda: legacy_check(database, context_tables, columns), number=REPEAT) / REPEAT
+    catalog_check_time: float = timeit(
+        lambda: all(map(catalog.has_table, context_tables)) and all(map(catalog.has_column, columns)),
+        number=REPEAT
+    ) / REPEAT
+    legacy_search_time: float = timeit(
+        lambda: [legacy_search(database, context_tables, column) for column in columns],
+        number=REPEAT
+    ) / REPEAT
+    catalog_search_time: float = timeit(
+        lambda: [catalog.resolve_column(column, context_tables) for column in columns],
+        number=REPEAT
+    ) / REPEAT
+
+    print(f"esquema: {TABLES} tabelas, {TABLES * COLUMNS_PER_TABLE} colunas; comando: {len(columns)} colunas")
+    print(f"criação do catálogo (uma vez por banco de dados): {build_time * 1e3:.3f} ms")
+    print(f"{'operação':>28} | {'linear (ms)':>12} | {'catálogo (ms)':>14} | {'ganho':>8}")
+    for name, legacy_time, catalog_time in (
+            ("check_database_compatibility", legacy_check_time, catalog_check_time),
+            ("search_table_in_database", legacy_search_time, catalog_search_time)):
+        print(f"{name:>28} | {legacy_time * 1e3:>12.4f} | {catalog_time * 1e3:>14.4f} | {legacy_time / catalog_time:>7.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark da abertura das tabelas gravadas no formato em colunas.
+
+Grava os dados exemplares de pagamentos na escala '--scale' (escala 50:
+1.000.000 de movimentações) em CSV e no formato em colunas, e compara,
+como em um processo reiniciado, o tempo até o resultado da primeira
+consulta: carregando os arquivos CSV ou mapeando as colunas na memória.
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.columnar_benchmark [--scale 50]
+"""
+
+import argparse
+import os
+import tempfile
+from time import perf_counter
+from typing import Dict
+
+# pylint: disable=import-error
+import Examples
+from Benchmarks.executor_benchmark import convert
+from Catalog import Catalog
+from Executor import Executor
+from RelationalAlgebra.Converter import Converter
+from Storage import CsvLoader, Table, write_columnar, write_csv
+
+# A consulta executada após a abertura.
+QUERY: str = "select valor, contas_idconta from movimentacao where valor > 500 and categoria_idcategoria = 3;"
+
+def first_query(catalog: Catalog, converter: Converter) -> int:
+    """Executa a consulta no modo vetorizado.
+
+    Args:
+        catalog (Catalog): O catálogo, com os dados anexados.
+        converter (Converter): O Conversor, com a consulta convertida.
+
+    Returns:
+        int: A quantia de linhas do resultado.
+    """
+    return sum(batch.size for batch in Executor(catalog).vectorized_executor.execute_batches(converter))
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    arguments: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark do formato em colunas.")
+    arguments.add_argument("--scale", type=float, default=50, help="Escala dos dados exemplares.")
+    options: argparse.Namespace = arguments.parse_args()
+
+    data: Dict[str, Table] = Examples.pagamento_example_data(options.scale)
+    converter: Converter = convert(QUERY)
+    with tempfile.TemporaryDirectory() as directory:
+        for table in data.values():
+            write_csv(table, os.path.join(directory, f"{table.name}.csv"))
+            write_columnar(table, directory)
+
+        start: float = perf_counter()
+        catalog: Catalog = Catalog(Examples.pagamento_example_db)
+        for table in CsvLoader(Examples.pagamento_example_db).load_directory(directory).values():
+            catalog.attach_table(table)
+        rows: int = first_query(catalog, converter)
+        csv_time: float = perf_counter() - start
+
+        start = perf_counter()
+        catalog = Catalog(Examples.pagamento_example_db)
+        catalog.attach_columnar(directory)
+        open_time: float = perf_counter() - start
+        assert first_query(catalog, converter) == rows, "Os dois formatos devem produzir as mesmas linhas."
+        mapped_time: float = perf_counter() - start
+
+    print(f"{data['movimentacao'].row_count:,} movimentações; a consulta produz {rows:,} linhas")
+    print(f"{'CSV (CsvLoader)':>26}: {csv_time * 1000:10.1f} ms")
+    print(f"{'em colunas (mmap)':>26}: {mapped_time * 1000:10.1f} ms (abertura: {open_time * 1000:.1f} ms)")
+
+if __name__ == '__main__':
+    main()
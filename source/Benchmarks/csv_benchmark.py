@@ -0,0 +1,82 @@
+"""Benchmark da carga dos arquivos CSV das tabelas.
+
+Escreve a tabela 'movimentacao' dos dados exemplares de pagamentos na
+escala '--scale' (escala 50: 1.000.000 de movimentações) em um arquivo
+CSV temporário e compara a vazão (MB/s) da leitura linha a linha com o
+'csv.reader', em um único processo, com a do 'CsvLoader', com um e com
+'--workers' processos.
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.csv_benchmark [--scale 50] [--workers N] [--chunk-size 33554432]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+from time import perf_counter
+from typing import Any, List
+
+# pylint: disable=import-error
+import Examples
+from Storage import CsvLoader, LoadReport, Table, write_csv
+
+def read_rows(path: str) -> Table:
+    """Lê um arquivo CSV linha a linha com o 'csv.reader' (a leitura de referência).
+
+    Args:
+        path (str): O caminho do arquivo.
+
+    Returns:
+        Table: Os dados da tabela, com os valores convertidos pelo tipo
+        de cada coluna na primeira linha.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header: List[str] = next(reader)
+        table: Table = Table("movimentacao", header)
+        for row in reader:
+            values: List[Any] = []
+            for value in row:
+                if value == "":
+                    values.append(None)
+                    continue
+                try:
+                    values.append(int(value))
+                except ValueError:
+                    try:
+                        values.append(float(value))
+                    except ValueError:
+                        values.append(value)
+            table.append(values)
+    return table
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    arguments: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark da carga de arquivos CSV.")
+    arguments.add_argument("--scale", type=float, default=50, help="Escala dos dados exemplares.")
+    arguments.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Quantia de processos de carga.")
+    arguments.add_argument("--chunk-size", type=int, default=32 << 20, help="Tamanho máximo, em bytes, de cada trecho.")
+    options: argparse.Namespace = arguments.parse_args()
+
+    table: Table = Examples.pagamento_example_data(options.scale)["movimentacao"]
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "movimentacao.csv")
+        write_csv(table, path)
+        size: int = os.path.getsize(path)
+        print(f"movimentacao.csv: {table.row_count:,} linhas, {size / 1e6:.1f} MB")
+
+        start: float = perf_counter()
+        read_rows(path)
+        seconds: float = perf_counter() - start
+        print(f"{'csv.reader, linha a linha':>28}: {seconds:.2f} s ({size / 1e6 / seconds:.1f} MB/s)")
+
+        for workers in sorted({1, options.workers}):
+            loader: CsvLoader = CsvLoader(Examples.pagamento_example_db, workers, options.chunk_size)
+            loaded: Table = loader.load("movimentacao", path)
+            assert list(loaded) == list(table), "A carga deve reproduzir os dados escritos."
+            report: LoadReport = loader.reports[-1]
+            print(f"{f'CsvLoader, {workers} processo(s)':>28}: {report.seconds:.2f} s ({report.megabytes_per_second:.1f} MB/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark da execução dos comandos SQL: linha a linha (Volcano)
+e vetorizada (lotes de colunas com o NumPy).
+
+As consultas analíticas sobre 'movimentacao' usam os dados exemplares
+de pagamentos na escala '--scale' (escala 50: 1.000.000 de
+movimentações). As junções usam a escala '--join-scale', com os
+algoritmos (hash join ou merge join) escolhidos pelo Conversor.
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.executor_benchmark [--scale 50] [--join-scale 5] [--batch-size 65536]
+"""
+
+import argparse
+import contextlib
+import io
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+# pylint: disable=import-error
+import Examples
+from Catalog import Catalog
+from Executor import Executor
+from Parser.parser import Parser
+from RelationalAlgebra.Converter import Converter
+from Storage import Table
+
+# As consultas analíticas, sobre uma única tabela.
+ANALYTICAL_QUERIES: List[str] = [
+    "select valor from movimentacao where valor > 500;",
+    "select valor, categoria_idcategoria from movimentacao where valor > 100 and categoria_idcategoria in (1, 2, 3);",
+    "select descricao, contas_idconta from movimentacao where contas_idconta <= 20000 and descricao <> 'Movimentacao 7';",
+]
+# As consultas com junções.
+JOIN_QUERIES: List[str] = [
+    "select saldoinicial, valor from contas join movimentacao on contas.idconta = movimentacao.contas_idconta where valor > 300;",
+    "select nome, valor from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+    "join movimentacao on contas.idconta = movimentacao.contas_idconta where uf = 'SP';",
+]
+
+def prepare(scale: float) -> Catalog:
+    """Gera os dados exemplares e cria um catálogo com os dados anexados e analisados.
+
+    Args:
+        scale (float): A escala dos dados.
+
+    Returns:
+        Catalog: O catálogo.
+    """
+    catalog: Catalog = Catalog(Examples.pagamento_example_db)
+    data: Dict[str, Table] = Examples.pagamento_example_data(scale)
+    for table in data.values():
+        catalog.attach_table(table)
+    catalog.analyze()
+    return catalog
+
+def convert(sql_command: str) -> Converter:
+    """Analisa e converte um comando SQL, sem as mensagens do Conversor.
+
+    Args:
+        sql_command (str): O comando SQL.
+
+    Returns:
+        Converter: O Conversor, com o comando convertido.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser: Parser = Parser(sql_command)
+        parser.check_database_compatibility(Examples.pagamento_example_db)
+        converter: Converter = Converter(parser)
+        converter.convert_in_database_context(Examples.pagamento_example_db)
+    return converter
+
+def measure(run: Callable[[], int]) -> Tuple[float, int]:
+    """Mede o tempo de uma execução.
+
+    Args:
+        run (Callable[[], int]): A execução, que retorna a quantia de linhas.
+
+    Returns:
+        Tuple[float, int]: O tempo (em segundos) e a quantia de linhas.
+    """
+    start: float = perf_counter()
+    rows: int = run()
+    return (perf_counter() - start, rows)
+
+def report(title: str, executor: Executor, queries: List[str], rows: int) -> None:
+    """Executa as consultas nos dois modos e mostra os resultados.
+
+    Args:
+        title (str): O título da tabela de resultados.
+        executor (Executor): O executor, com os dados anexados.
+        queries (List[str]): As consultas.
+        rows (int): A quantia de linhas de 'movimentacao'.
+    """
+    print(f"\n{title} ({rows:,} movimentações)")
+    print(f"{'consulta':>8} | {'linhas':>9} | {'Volcano (s)':>11} | {'vetorizado (s)':>14} | {'ganho':>7}")
+    for number, query in enumerate(queries, start=1):
+        converter: Converter = convert(query)
+        # A primeira execução vetorizada converte as colunas das tabelas.
+        sum(1 for _ in executor.execute(converter, vectorized=True))
+        (row_time, row_count) = measure(lambda: sum(1 for _ in executor.execute(converter)))
+        (vector_time, vector_count) = measure(
+            lambda: sum(batch.size for batch in executor.vectorized_executor.execute_batches(converter))
+        )
+        assert row_count == vector_count, "Os dois modos devem produzir as mesmas linhas."
+        print(f"{number:>8} | {row_count:>9,} | {row_time:>11.3f} | {vector_time:>14.4f} | {row_time / vector_time:>6.0f}x")
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    arguments: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark da execução Volcano e vetorizada.")
+    arguments.add_argument("--scale", type=float, default=50, help="Escala das consultas analíticas.")
+    arguments.add_argument("--join-scale", type=float, default=5, help="Escala das consultas com junções.")
+    arguments.add_argument("--batch-size", type=int, default=1 << 16, help="Linhas por lote no modo vetorizado.")
+    options: argparse.Namespace = arguments.parse_args()
+
+    for title, scale, queries in (
+            ("consultas analíticas", options.scale, ANALYTICAL_QUERIES),
+            ("junções", options.join_scale, JOIN_QUERIES)):
+        catalog: Catalog = prepare(scale)
+        report(title, Executor(catalog, options.batch_size), queries, catalog.statistics("movimentacao").row_count)
+
+if __name__ == '__main__':
+    main()
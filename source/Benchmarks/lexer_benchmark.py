@@ -0,0 +1,68 @@
+"""Benchmark da análise léxica de comandos SQL.
+
+Compara o Lexer (passagem única) com a antiga expressão regular
+de extração de cláusulas, para comandos de 100 B até 1 MB.
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.lexer_benchmark
+"""
+
+import re
+from timeit import timeit
+from typing import List
+
+# pylint: disable=import-error
+from Parser.lexer import Lexer
+
+# A antiga expressão regular de extração de cláusulas, usada como referência.
+LEGACY_TOKEN_PATTERN: str = r'(?<!\()\b(select|from|join|on|where|and|in|not\s+in)\b(?!([^()]*\)))|(;$)'
+# Tamanho máximo de comando testado com a expressão regular antiga (quadrática).
+LEGACY_MAX_SIZE: int = 100_000
+# Os tamanhos de comando testados, em bytes.
+SIZES: List[int] = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+def generate_command(size: int) -> str:
+    """Gera um comando SQL com, aproximadamente, 'size' bytes.
+
+    O comando contém várias junções e uma longa lista no IN,
+    semelhante às consultas geradas automaticamente.
+
+    Args:
+        size (int): O tamanho desejado do comando, em bytes.
+
+    Returns:
+        str: O comando SQL gerado, terminado em ';'.
+    """
+    join: str = "join contas on usuario.idusuario = contas.usuario_idusuario "
+    # Metade do comando é composta por junções, a outra metade pela lista do IN.
+    joins: int = max(1, size // (2 * len(join)))
+    command: str = f"select nome, saldoinicial from usuario {join * joins}where idusuario in ("
+    values: List[str] = []
+    length: int = len(command)
+    value: int = 0
+    while length < size - 3:
+        values.append(str(value))
+        length += len(values[-1]) + 2
+        value += 1
+    return f"{command}{', '.join(values) or '0'}) ;"
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    print(f"{'tamanho (B)':>12} | {'Lexer (ms)':>12} | {'ns/B':>8} | {'regex (ms)':>12}")
+    for size in SIZES:
+        command: str = generate_command(size)
+        repeat: int = max(1, 100_000 // size)
+
+        lexer_time: float = timeit(lambda: Lexer(command), number=repeat) / repeat
+        legacy: str = "-"
+        if size <= LEGACY_MAX_SIZE:
+            legacy_time: float = timeit(
+                lambda: list(re.finditer(LEGACY_TOKEN_PATTERN, command, re.IGNORECASE)),
+                number=repeat
+            ) / repeat
+            legacy = f"{legacy_time * 1e3:.3f}"
+
+        print(f"{len(command):>12} | {lexer_time * 1e3:>12.3f} | {lexer_time * 1e9 / len(command):>8.1f} | {legacy:>12}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark da junção paralela ('ParallelHashJoin') no modo vetorizado.
+
+Une 'contas' e 'movimentacao' dos dados exemplares de pagamentos na
+escala '--scale' (escala 50: 1.000.000 de movimentações) com a junção
+vetorizada de um único processo ('BatchJoin') e com a junção
+particionada, dobrando a quantia de processos até '--workers' (por
+padrão, todos os núcleos disponíveis).
+
+Uso (a partir de '/source'):
+    python -m Benchmarks.parallel_join_benchmark [--scale 50] [--workers N] [--repeat 3]
+"""
+
+import argparse
+import os
+from time import perf_counter
+from typing import List, Tuple
+
+# pylint: disable=import-error
+from Benchmarks.executor_benchmark import convert, prepare
+from Catalog import Catalog
+from Executor import Executor
+from Executor.vectorized import VectorizedExecutor
+from RelationalAlgebra.Converter import Converter
+
+# A junção executada.
+QUERY: str = "select saldoinicial, valor from contas join movimentacao on contas.idconta = movimentacao.contas_idconta;"
+
+def measure(executor: VectorizedExecutor, converter: Converter, repeat: int) -> Tuple[float, int]:
+    """Executa a junção após uma execução de aquecimento (que converte
+    as colunas das tabelas) e mede o menor tempo.
+
+    Args:
+        executor (VectorizedExecutor): O executor vetorizado.
+        converter (Converter): O Conversor, com a consulta convertida.
+        repeat (int): A quantia de execuções medidas.
+
+    Returns:
+        Tuple[float, int]: O menor tempo, em segundos, e a quantia de
+        linhas do resultado.
+    """
+    rows: int = sum(batch.size for batch in executor.execute_batches(converter))
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = perf_counter()
+        sum(batch.size for batch in executor.execute_batches(converter))
+        best = min(best, perf_counter() - start)
+    return (best, rows)
+
+def main() -> None:
+    """Executa o benchmark e mostra os resultados."""
+    arguments: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark da junção paralela.")
+    arguments.add_argument("--scale", type=float, default=50, help="Escala dos dados exemplares.")
+    arguments.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Quantia máxima de processos.")
+    arguments.add_argument("--repeat", type=int, default=3, help="Execuções medidas de cada configuração.")
+    options: argparse.Namespace = arguments.parse_args()
+
+    catalog: Catalog = prepare(options.scale)
+    converter: Converter = convert(QUERY)
+    print(f"{catalog.table('contas').row_count:,} contas |x| {catalog.table('movimentacao').row_count:,} movimentações")
+
+    (baseline, rows) = measure(Executor(catalog).vectorized_executor, converter, options.repeat)
+    print(f"{'BatchJoin, 1 processo':>30}: {baseline * 1000:9.1f} ms ({rows:,} linhas)")
+
+    workers: List[int] = [2 ** power for power in range(1, max(2, options.workers).bit_length())]
+    for count in sorted(set(workers) | {max(2, options.workers)}):
+        with Executor(catalog, workers=count) as executor:
+            (seconds, parallel_rows) = measure(executor.vectorized_executor, converter, options.repeat)
+        assert parallel_rows == rows, "A junção paralela deve produzir as mesmas linhas."
+        print(
+            f"{f'ParallelHashJoin, {count} processos':>30}: {seconds * 1000:9.1f} ms "
+            f"(aceleração: {baseline / seconds:.2f}x)"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+"""Arquivo responsável pela junção de todas as funcionalidades
+do catálogo (esquema) dos bancos de dados exemplares."""
+
+# pylint: disable=import-error
+from .catalog import Catalog
+from .statistics import ColumnStatistics, TableStatistics
+from .views import MaterializedView, qualify
+
+# Indica o que, neste pacote, está disponível para uso.
+__all__ = [
+    'Catalog',
+    'ColumnStatistics',
+    'TableStatistics',
+    'MaterializedView',
+    'qualify'
+]
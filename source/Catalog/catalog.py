@@ -0,0 +1,392 @@
+"""Arquivo responsável pelo catálogo de um banco de dados
+exemplar, com índices (hash) das tabelas e das colunas, as
+estatísticas, os índices secundários dos dados das tabelas e as
+visões materializadas."""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Catalog.statistics import TableStatistics
+from Storage import HASH_INDEX, SORTED_INDEX, HashIndex, Index, SortedIndex, Table, open_columnar_database
+
+if TYPE_CHECKING:
+    from Catalog.views import MaterializedView
+
+class Catalog:
+    """Classe responsável pelo catálogo de um banco de dados exemplar.
+
+    O catálogo é criado uma única vez por banco de dados (veja
+    'for_database') e indexa as tabelas e as colunas, em minúsculo,
+    em dicionários e conjuntos: a busca de uma tabela, de uma coluna
+    ou da tabela de uma coluna não depende do tamanho do esquema.
+
+    Os dados das tabelas podem ser anexados ao catálogo (veja
+    'attach_table'); o ANALYZE (veja 'analyze') calcula as estatísticas
+    usadas na estimativa de custo dos planos de execução, e os índices
+    secundários (veja 'create_index') permitem ler somente as linhas
+    selecionadas por uma condicional. As visões materializadas (veja
+    'add_view') podem substituir as junções de outros comandos SQL.
+    """
+
+    # As colunas de cada tabela (índice tabela -> colunas), em minúsculo.
+    __table_columns: Dict[str, FrozenSet[str]]
+    # As tabelas de cada coluna (índice coluna -> tabelas), em minúsculo.
+    __column_tables: Dict[str, FrozenSet[str]]
+    # Os dados anexados de cada tabela, indexados pelo nome em minúsculo.
+    __tables: Dict[str, Table]
+    # As estatísticas de cada tabela analisada, indexadas pelo nome em minúsculo.
+    __statistics: Dict[str, TableStatistics]
+    # Os índices secundários, indexados pelo nome do índice.
+    __indexes: Dict[str, Index]
+    # As visões materializadas, indexadas pelo nome em minúsculo.
+    __views: Dict[str, 'MaterializedView']
+    # Os catálogos usados mais recentemente, indexados pelo id do banco de dados.
+    __catalogs: 'OrderedDict[int, Tuple[Dict[str, List[str]], Catalog]]' = OrderedDict()
+    # A quantia máxima de catálogos guardados por 'for_database'.
+    __max_catalogs: int = 8
+
+    def __init__(self, database: Dict[str, List[str]]) -> None:
+        """Construtor da classe.
+
+        Args:
+            database (Dict[str, List[str]]): Um dicionário contendo o nome
+            das tabelas (chaves) e uma lista com as colunas da tabela (valor).
+
+        Veja '/source/Examples' para mais detalhes sobre a estrutura de 'database'.
+        """
+        self.__table_columns = {
+            table.casefold(): frozenset(column.casefold() for column in columns)
+            for table, columns in database.items()
+        }
+        column_tables: Dict[str, List[str]] = {}
+        for table, columns in self.__table_columns.items():
+            for column in columns:
+                column_tables.setdefault(column, []).append(table)
+        self.__column_tables = {column: frozenset(tables) for column, tables in column_tables.items()}
+        self.__tables = {}
+        self.__statistics = {}
+        self.__indexes = {}
+        self.__views = {}
+
+    @classmethod
+    def for_database(cls, database: Dict[str, List[str]]) -> 'Catalog':
+        """Retorna o catálogo de um banco de dados, criando-o somente
+        na primeira vez em que o banco de dados é usado.
+
+        Os bancos de dados exemplares não são alterados após a criação;
+        caso o dicionário seja alterado, um novo catálogo deve ser criado
+        com o construtor da classe. Somente os catálogos dos últimos
+        bancos de dados usados são guardados (como as cópias do banco de
+        dados recebidas por cada bloco do processamento em lote).
+
+        Args:
+            database (Dict[str, List[str]]): O banco de dados exemplar.
+
+        Returns:
+            Catalog: O catálogo do banco de dados.
+        """
+        entry: Tuple[Dict[str, List[str]], Catalog] | None = cls.__catalogs.get(id(database))
+        # Confere a identidade, pois o id pode ser reaproveitado por outro objeto.
+        if entry is None or entry[0] is not database:
+            entry = (database, cls(database))
+            cls.__catalogs[id(database)] = entry
+        cls.__catalogs.move_to_end(id(database))
+        if len(cls.__catalogs) > cls.__max_catalogs:
+            cls.__catalogs.popitem(last=False)
+        return entry[1]
+
+    def has_table(self, table: str) -> bool:
+        """Verifica se uma tabela existe no banco de dados.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            bool: Verdadeiro caso a tabela exista.
+        """
+        return table.casefold() in self.__table_columns
+
+    def has_column(self, column: str) -> bool:
+        """Verifica se uma coluna existe em alguma tabela do banco de dados.
+
+        Args:
+            column (str): O nome da coluna.
+
+        Returns:
+            bool: Verdadeiro caso a coluna exista.
+        """
+        return column.casefold() in self.__column_tables
+
+    def columns_of(self, table: str) -> FrozenSet[str]:
+        """Retorna as colunas (em minúsculo) de uma tabela do banco de dados.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            FrozenSet[str]: As colunas da tabela, ou um conjunto vazio
+            caso a tabela não exista.
+        """
+        return self.__table_columns.get(table.casefold(), frozenset())
+
+    def tables_of(self, column: str) -> FrozenSet[str]:
+        """Retorna as tabelas (em minúsculo) que possuem uma coluna.
+
+        Args:
+            column (str): O nome da coluna.
+
+        Returns:
+            FrozenSet[str]: As tabelas que possuem a coluna, ou um
+            conjunto vazio caso nenhuma tabela possua a coluna.
+        """
+        return self.__column_tables.get(column.casefold(), frozenset())
+
+    def resolve_column(self, column: str, context_tables: Iterable[str]) -> str:
+        """Procura pela tabela de uma coluna, sem o nome da tabela
+        explícito, entre as tabelas usadas no comando SQL.
+
+        Args:
+            column (str): O nome da coluna.
+            context_tables (Iterable[str]): As tabelas usadas no comando SQL.
+
+        Returns:
+            str: O nome da tabela (como escrito no comando SQL) que possui a coluna.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar a
+            utilização de uma coluna que não existe nas tabelas do comando.
+            AmbiguousColumnException: Exceção customizada para alertar a
+            utilização de uma coluna presente em mais de uma tabela do comando.
+        """
+        owners: FrozenSet[str] = self.tables_of(column)
+        matches: List[str] = [table for table in context_tables if table.casefold() in owners]
+        if not matches:
+            Exceptions.raise_column_mismatch_in_example_exception(column)
+        if len(matches) > 1:
+            Exceptions.raise_ambiguous_column_exception(column, matches)
+        return matches[0]
+
+    def attach_table(self, table: Table) -> None:
+        """Anexa os dados de uma tabela ao catálogo.
+
+        As estatísticas da tabela somente são (re)calculadas no
+        próximo ANALYZE (veja 'analyze').
+
+        Args:
+            table (Table): Os dados da tabela.
+
+        Raises:
+            TableMismatchException: Exceção customizada para alertar que
+            a tabela não existe no banco de dados exemplar.
+            ColumnMismatchException: Exceção customizada para alertar que
+            alguma coluna do banco de dados não existe nos dados da tabela.
+        """
+        if not self.has_table(table.name):
+            Exceptions.raise_table_mismatch_in_example_exception(table.name)
+        for column in self.columns_of(table.name):
+            if not table.has_column(column):
+                Exceptions.raise_column_mismatch_in_example_exception(f"{table.name}.{column}")
+        if self.__tables.get(table.name.casefold()) is not table:
+            self.__statistics.pop(table.name.casefold(), None)
+            # Os índices da tabela anterior são reconstruídos sobre os novos dados.
+            for index in self.indexes(table.name):
+                self.__indexes[index.name] = type(index)(index.name, table, index.column)
+                table.add_index(self.__indexes[index.name])
+        self.__tables[table.name.casefold()] = table
+
+    def attach_columnar(self, directory: str) -> List[str]:
+        """Anexa ao catálogo as tabelas gravadas no formato em colunas
+        ('Storage.write_columnar') em um diretório, mapeadas na memória.
+
+        Somente as tabelas do banco de dados exemplar são anexadas; os
+        dados não são lidos do disco até serem consultados.
+
+        Args:
+            directory (str): O diretório do banco de dados.
+
+        Returns:
+            List[str]: O nome das tabelas anexadas.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar que
+            alguma coluna do banco de dados não existe nos dados da tabela.
+        """
+        attached: List[str] = []
+        for name, table in open_columnar_database(directory).items():
+            if self.has_table(name):
+                self.attach_table(table)
+                attached.append(name)
+        return attached
+
+    def table(self, table: str) -> Union[Table, None]:
+        """Retorna os dados anexados de uma tabela.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            Table | None: Os dados da tabela, ou None caso nenhum dado
+            tenha sido anexado.
+        """
+        return self.__tables.get(table.casefold())
+
+    def create_index(self, table: str, column: str, kind: str = HASH_INDEX, name: Union[str, None] = None) -> Index:
+        """Cria (CREATE INDEX) um índice secundário sobre uma coluna de uma tabela.
+
+        O índice é mantido a cada inclusão de linhas na tabela, e o
+        Conversor passa a considerá-lo na leitura da tabela (veja
+        'CostModel.choose_index').
+
+        Args:
+            table (str): O nome da tabela, com dados anexados.
+            column (str): O nome da coluna.
+            kind (str, optional): O tipo do índice: HASH_INDEX (igualdades e
+            IN) ou SORTED_INDEX (também intervalos). Valor padrão: HASH_INDEX.
+            name (str | None, optional): O nome do índice. Valor padrão:
+            None ('<tabela>_<coluna>_<tipo>').
+
+        Returns:
+            Index: O índice criado.
+
+        Raises:
+            TableMismatchException: Exceção customizada para alertar que
+            a tabela não possui dados anexados ao catálogo.
+            ColumnMismatchException: Exceção customizada para alertar que
+            a coluna não existe na tabela.
+            ValueError: Caso o tipo seja desconhecido ou o nome já esteja em uso.
+        """
+        kinds: Dict[str, type] = {HASH_INDEX: HashIndex, SORTED_INDEX: SortedIndex}
+        if kind not in kinds:
+            raise ValueError(f"O tipo de índice {kind} não existe; use {HASH_INDEX} ou {SORTED_INDEX}.")
+        data: Union[Table, None] = self.table(table)
+        if data is None:
+            Exceptions.raise_table_mismatch_in_example_exception(table)
+        name = name or f"{data.name}_{column}_{kind}".casefold()
+        if name in self.__indexes:
+            raise ValueError(f"O índice {name} já existe.")
+        index: Index = kinds[kind](name, data, column)
+        data.add_index(index)
+        self.__indexes[name] = index
+        return index
+
+    def drop_index(self, name: str) -> None:
+        """Remove (DROP INDEX) um índice secundário.
+
+        Args:
+            name (str): O nome do índice.
+
+        Raises:
+            KeyError: Caso o índice não exista.
+        """
+        index: Index = self.__indexes.pop(name)
+        if (data := self.table(index.table)) is not None:
+            data.remove_index(index)
+
+    def index(self, name: str) -> Union[Index, None]:
+        """Retorna um índice secundário.
+
+        Args:
+            name (str): O nome do índice.
+
+        Returns:
+            Index | None: O índice, ou None caso não exista.
+        """
+        return self.__indexes.get(name)
+
+    def indexes(self, table: str) -> List[Index]:
+        """Retorna os índices secundários de uma tabela.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            List[Index]: Os índices da tabela, na ordem de criação.
+        """
+        return [index for index in self.__indexes.values() if index.table.casefold() == table.casefold()]
+
+    def add_view(self, view: 'MaterializedView') -> None:
+        """Registra (CREATE MATERIALIZED VIEW) uma visão materializada.
+
+        Args:
+            view (MaterializedView): A visão.
+
+        Raises:
+            ValueError: Caso o nome já seja usado por uma tabela ou por outra visão.
+        """
+        if self.has_table(view.name) or view.name.casefold() in self.__views:
+            raise ValueError(f"O nome {view.name} já está em uso.")
+        self.__views[view.name.casefold()] = view
+
+    def drop_view(self, name: str) -> None:
+        """Remove (DROP MATERIALIZED VIEW) uma visão materializada.
+
+        Args:
+            name (str): O nome da visão.
+
+        Raises:
+            KeyError: Caso a visão não exista.
+        """
+        del self.__views[name.casefold()]
+        self.__statistics.pop(name.casefold(), None)
+
+    def view(self, name: str) -> Union['MaterializedView', None]:
+        """Retorna uma visão materializada.
+
+        Args:
+            name (str): O nome da visão.
+
+        Returns:
+            MaterializedView | None: A visão, ou None caso não exista.
+        """
+        return self.__views.get(name.casefold())
+
+    def views(self) -> List['MaterializedView']:
+        """Retorna as visões materializadas.
+
+        Returns:
+            List[MaterializedView]: As visões, na ordem de criação.
+        """
+        return list(self.__views.values())
+
+    def analyze(self, table: Union[str, None] = None) -> None:
+        """Calcula (ANALYZE) as estatísticas de uma tabela ou de todas
+        as tabelas com dados anexados.
+
+        Uma tabela já analisada é atualizada de forma incremental: somente
+        as linhas incluídas desde o último ANALYZE entram na amostra, e
+        uma tabela sem novas linhas não é processada novamente. As visões
+        materializadas também são analisadas, sempre por completo.
+
+        Args:
+            table (str | None, optional): O nome da tabela (ou da visão).
+            Valor padrão: None (todas as tabelas com dados anexados e
+            todas as visões).
+
+        Raises:
+            TableMismatchException: Exceção customizada para alertar que
+            a tabela não possui dados anexados ao catálogo.
+        """
+        names: List[str] = list(self.__tables) + list(self.__views) if table is None else [table.casefold()]
+        for name in names:
+            if name in self.__views:
+                # Os dados de uma visão são substituídos a cada atualização.
+                self.__statistics[name] = TableStatistics()
+                self.__statistics[name].update(self.__views[name].table)
+                continue
+            if name not in self.__tables:
+                Exceptions.raise_table_mismatch_in_example_exception(name)
+            self.__statistics.setdefault(name, TableStatistics()).update(self.__tables[name])
+
+    def statistics(self, table: str) -> Union[TableStatistics, None]:
+        """Retorna as estatísticas de uma tabela.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            TableStatistics | None: As estatísticas do último ANALYZE da
+            tabela, ou None caso a tabela não tenha sido analisada.
+        """
+        return self.__statistics.get(table.casefold())
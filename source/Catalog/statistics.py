@@ -0,0 +1,340 @@
+"""Arquivo responsável pelas estatísticas (ANALYZE) dos dados
+de uma tabela: quantia de linhas, valores distintos, fração de
+nulos e histogramas, calculados sobre uma amostra (reservatório)."""
+
+import math
+import random
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, List, Union
+
+# pylint: disable=import-error
+from Storage import Table
+
+class ColumnStatistics:
+    """Representa as estatísticas de uma coluna.
+
+    O histograma é de altura igual (equi-depth): cada intervalo entre
+    dois limites consecutivos contém a mesma fração das linhas não nulas.
+    """
+
+    __slots__ = ("distinct", "null_fraction", "histogram", "is_sorted")
+
+    def __init__(self, distinct: float, null_fraction: float, histogram: List[Any], is_sorted: bool = False) -> None:
+        """Construtor da classe.
+
+        Args:
+            distinct (float): A quantia estimada de valores distintos (não nulos).
+            null_fraction (float): A fração de linhas com valor nulo.
+            histogram (List[Any]): Os limites dos intervalos do histograma,
+            em ordem crescente (vazio caso não haja valores comparáveis).
+            is_sorted (bool, optional): Verdadeiro caso os valores não nulos
+            estejam em ordem crescente na ordem das linhas. Valor padrão: False.
+        """
+        self.distinct = distinct
+        self.null_fraction = null_fraction
+        self.histogram = histogram
+        self.is_sorted = is_sorted
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnStatistics(distinct={self.distinct:.1f}, null_fraction={self.null_fraction:.3f}, "
+            f"buckets={max(0, len(self.histogram) - 1)}, is_sorted={self.is_sorted})"
+        )
+
+    def equality_selectivity(self, value: Any) -> float:
+        """Estima a fração das linhas cujo valor é igual a 'value'.
+
+        Assume uma distribuição uniforme entre os valores distintos.
+
+        Args:
+            value (Any): O valor comparado (None nunca é igual).
+
+        Returns:
+            float: A seletividade, entre 0 e 1.
+        """
+        if value is None or self.distinct < 1:
+            return 0.0
+        return (1 - self.null_fraction) / self.distinct
+
+    def range_selectivity(self, operator: str, value: Any) -> Union[float, None]:
+        """Estima, pelo histograma, a fração das linhas que satisfaz 'coluna operador valor'.
+
+        Args:
+            operator (str): O operador ('<', '<=', '>' ou '>=').
+            value (Any): O valor comparado.
+
+        Returns:
+            float | None: A seletividade, entre 0 e 1, ou None caso o
+            histograma não seja comparável com o valor.
+        """
+        try:
+            below: float = self.__fraction_below(value)
+        except TypeError:
+            return None
+        if operator in ("<=", ">"):
+            below = min(1.0, below + self.equality_selectivity(value) / max(1e-9, 1 - self.null_fraction))
+        fraction: float = below if operator in ("<", "<=") else 1 - below
+        return max(0.0, min(1.0, fraction)) * (1 - self.null_fraction)
+
+    def __fraction_below(self, value: Any) -> float:
+        """Estima a fração das linhas não nulas com valor menor que 'value'.
+
+        Dentro de um intervalo do histograma, valores numéricos são
+        interpolados linearmente; os demais ficam no meio do intervalo.
+
+        Args:
+            value (Any): O valor comparado.
+
+        Returns:
+            float: A fração, entre 0 e 1.
+
+        Raises:
+            TypeError: Caso o valor não seja comparável com o histograma.
+        """
+        bounds: List[Any] = self.histogram
+        if value is None or len(bounds) < 2:
+            raise TypeError("Histograma indisponível.")
+        buckets: int = len(bounds) - 1
+        if value <= bounds[0]:
+            return 0.0
+        if value > bounds[-1]:
+            return 1.0
+        # Limites repetidos (valores frequentes) ocupam vários intervalos.
+        first: int = bisect_left(bounds, value)
+        last: int = bisect_right(bounds, value)
+        if first < last:
+            return (first + last - 1) / 2 / buckets
+        bucket: int = first - 1
+        (low, high) = (bounds[bucket], bounds[bucket + 1])
+        within: float = 0.5
+        if isinstance(value, (int, float)) and isinstance(low, (int, float)) and high > low:
+            within = (value - low) / (high - low)
+        return (bucket + within) / buckets
+
+class TableStatistics:
+    """Classe responsável pelas estatísticas de uma tabela.
+
+    As linhas são amostradas com um reservatório (algoritmo L de Li),
+    que mantém uma amostra uniforme de tamanho fixo em uma única
+    passagem, pulando as linhas que não entram na amostra. Como as
+    tabelas somente recebem novas linhas, uma atualização continua o
+    reservatório a partir da última linha vista, sem reler a tabela.
+
+    A quantia de valores distintos é estimada com o GEE (Guaranteed-Error
+    Estimator, Charikar et al.): sqrt(n/r) * f1 + soma(fj, j >= 2), em que
+    fj é a quantia de valores que aparecem j vezes na amostra de r linhas.
+
+    A ordenação das colunas (usada na escolha do merge join) não pode
+    ser amostrada: as novas linhas das colunas ainda ordenadas são
+    verificadas por completo, a partir do último valor visto.
+    """
+
+    # A quantia máxima de linhas da amostra.
+    __sample_size: int
+    # A quantia de intervalos dos histogramas.
+    __buckets: int
+    # Gerador de números aleatórios do reservatório.
+    __random: random.Random
+    # A posição das linhas amostradas (o reservatório).
+    __reservoir: List[int]
+    # A quantia de linhas já vistas pelo reservatório.
+    __seen: int
+    # A próxima linha a entrar no reservatório e o peso atual (algoritmo L).
+    __next_row: int
+    __weight: float
+    # A versão da tabela nas estatísticas atuais.
+    __table_version: int
+    # A quantia de linhas da tabela.
+    __row_count: int
+    # As estatísticas de cada coluna, indexadas pelo nome em minúsculo.
+    __columns: Dict[str, ColumnStatistics]
+    # O maior valor visto de cada coluna ainda ordenada (colunas
+    # fora de ordem não estão presentes), indexado pelo nome em minúsculo.
+    __sorted_until: Dict[str, Any]
+
+    def __init__(self, sample_size: int = 10_000, buckets: int = 20, seed: int = 0) -> None:
+        """Construtor da classe.
+
+        Args:
+            sample_size (int, optional): A quantia máxima de linhas da
+            amostra. Valor padrão: 10000.
+            buckets (int, optional): A quantia de intervalos dos
+            histogramas. Valor padrão: 20.
+            seed (int, optional): A semente do reservatório. Valor padrão: 0.
+        """
+        self.__sample_size = max(1, sample_size)
+        self.__buckets = max(1, buckets)
+        self.__random = random.Random(seed)
+        self.__reservoir = []
+        self.__seen = 0
+        self.__next_row = 0
+        self.__weight = 1.0
+        self.__table_version = -1
+        self.__row_count = 0
+        self.__columns = {}
+        self.__sorted_until = {}
+
+    @property
+    def row_count(self) -> int:
+        """Extrai o conteúdo da variável privada row_count.
+
+        Returns:
+            int: A quantia de linhas da tabela.
+        """
+        return self.__row_count
+
+    @property
+    def sample_rows(self) -> int:
+        """Retorna a quantia de linhas da amostra.
+
+        Returns:
+            int: A quantia de linhas amostradas.
+        """
+        return len(self.__reservoir)
+
+    @property
+    def table_version(self) -> int:
+        """Extrai o conteúdo da variável privada table_version.
+
+        Returns:
+            int: A versão da tabela nas estatísticas atuais.
+        """
+        return self.__table_version
+
+    def column(self, column: str) -> Union[ColumnStatistics, None]:
+        """Retorna as estatísticas de uma coluna.
+
+        Args:
+            column (str): O nome da coluna, em qualquer caixa.
+
+        Returns:
+            ColumnStatistics | None: As estatísticas, ou None caso a
+            coluna não tenha sido analisada.
+        """
+        return self.__columns.get(column.casefold())
+
+    def update(self, table: Table) -> None:
+        """Atualiza as estatísticas com as linhas incluídas desde a última atualização.
+
+        Args:
+            table (Table): A tabela analisada.
+        """
+        if table.version == self.__table_version:
+            return
+        first_new_row: int = self.__seen
+        self.__sample(table.row_count)
+        self.__row_count = table.row_count
+        self.__table_version = table.version
+        self.__columns = {
+            column.casefold(): self.__analyze_column(
+                table.column(column),
+                self.__still_sorted(column.casefold(), table.column(column), first_new_row, first_new_row == 0)
+            )
+            for column in table.columns
+        }
+
+    def __sample(self, row_count: int) -> None:
+        """Continua o reservatório, das linhas já vistas até 'row_count'.
+
+        Args:
+            row_count (int): A quantia atual de linhas da tabela.
+        """
+        # Preenche o reservatório com as primeiras linhas.
+        while self.__seen < row_count and len(self.__reservoir) < self.__sample_size:
+            self.__reservoir.append(self.__seen)
+            self.__seen += 1
+            if len(self.__reservoir) == self.__sample_size:
+                self.__weight = math.exp(math.log(self.__random.random()) / self.__sample_size)
+                self.__next_row = self.__seen + self.__skip()
+
+        # Substitui uma linha aleatória do reservatório, pulando as demais.
+        while len(self.__reservoir) == self.__sample_size and self.__next_row < row_count:
+            self.__reservoir[self.__random.randrange(self.__sample_size)] = self.__next_row
+            self.__weight *= math.exp(math.log(self.__random.random()) / self.__sample_size)
+            self.__next_row += 1 + self.__skip()
+        self.__seen = max(self.__seen, row_count)
+
+    def __skip(self) -> int:
+        """Sorteia quantas linhas são puladas até a próxima substituição (algoritmo L).
+
+        Returns:
+            int: A quantia de linhas puladas.
+        """
+        if self.__weight >= 1.0:
+            return 0
+        return int(math.log(1.0 - self.__random.random()) / math.log(1.0 - self.__weight))
+
+    def __still_sorted(self, column: str, values: List[Any], start: int, first_update: bool) -> bool:
+        """Verifica se uma coluna continua ordenada após a inclusão de novas linhas.
+
+        Args:
+            column (str): O nome da coluna, em minúsculo.
+            values (List[Any]): Todos os valores da coluna.
+            start (int): A primeira linha ainda não verificada.
+            first_update (bool): Verdadeiro na primeira atualização.
+
+        Returns:
+            bool: Verdadeiro caso os valores não nulos estejam em ordem crescente.
+        """
+        if not first_update and column not in self.__sorted_until:
+            return False
+        previous: Any = self.__sorted_until.pop(column, None)
+        try:
+            for value in islice(values, start, None):
+                if value is not None:
+                    if previous is not None and value < previous:
+                        return False
+                    previous = value
+        except TypeError:
+            return False
+        self.__sorted_until[column] = previous
+        return True
+
+    def __analyze_column(self, values: List[Any], is_sorted: bool) -> ColumnStatistics:
+        """Calcula as estatísticas de uma coluna a partir da amostra.
+
+        Args:
+            values (List[Any]): Todos os valores da coluna.
+            is_sorted (bool): Verdadeiro caso a coluna esteja ordenada.
+
+        Returns:
+            ColumnStatistics: As estatísticas da coluna.
+        """
+        sample: List[Any] = [values[row] for row in self.__reservoir]
+        if not sample:
+            return ColumnStatistics(0.0, 0.0, [], is_sorted)
+        non_null: List[Any] = [value for value in sample if value is not None]
+        null_fraction: float = 1 - len(non_null) / len(sample)
+
+        # GEE, escalado para as linhas não nulas da tabela.
+        frequencies: Counter = Counter(Counter(non_null).values())
+        non_null_rows: float = self.__row_count * (1 - null_fraction)
+        distinct: float = 0.0
+        if non_null:
+            distinct = math.sqrt(non_null_rows / len(non_null)) * frequencies[1] + sum(
+                count for times, count in frequencies.items() if times >= 2
+            )
+            distinct = min(non_null_rows, max(distinct, len(set(non_null))))
+
+        return ColumnStatistics(distinct, null_fraction, self.__histogram(non_null), is_sorted)
+
+    def __histogram(self, values: List[Any]) -> List[Any]:
+        """Calcula os limites de um histograma de altura igual.
+
+        Args:
+            values (List[Any]): Os valores não nulos da amostra.
+
+        Returns:
+            List[Any]: Os limites dos intervalos, ou uma lista vazia caso
+            os valores não sejam comparáveis entre si.
+        """
+        try:
+            ordered: List[Any] = sorted(values)
+        except TypeError:
+            return []
+        if not ordered:
+            return []
+        last: int = len(ordered) - 1
+        return [ordered[round(i * last / self.__buckets)] for i in range(self.__buckets + 1)]
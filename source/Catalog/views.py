@@ -0,0 +1,287 @@
+"""Arquivo responsável pelas visões materializadas: o resultado de
+um comando SQL, armazenado como uma tabela, que pode substituir as
+junções e as condicionais que ele contém em outros comandos."""
+
+import weakref
+from typing import TYPE_CHECKING, Callable, FrozenSet, Iterable, List, Sequence, Tuple, Union
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef, Comparison, InList, InSubquery, Predicate, Select
+from Storage import Table
+
+if TYPE_CHECKING:
+    from Catalog.catalog import Catalog
+    from RelationalAlgebra.Converter import Converter
+
+# As colunas de uma visão: o nome da tabela de origem e o nome da coluna.
+ViewSchema = List[Tuple[str, str]]
+
+def qualify(predicate: Predicate, table_of: Callable[[ColumnRef], str]) -> Predicate:
+    """Reescreve uma condicional com o nome (em minúsculo) da tabela de
+    cada coluna, permitindo comparar condicionais escritas de formas
+    diferentes ('idconta' e 'contas.idconta').
+
+    As igualdades e desigualdades entre duas colunas são escritas com as
+    colunas em ordem alfabética ('a.x = b.y' e 'b.y = a.x' são iguais).
+
+    Args:
+        predicate (Predicate): A condicional.
+        table_of (Callable[[ColumnRef], str]): Retorna a tabela de uma coluna.
+
+    Returns:
+        Predicate: A condicional, com as colunas explícitas.
+    """
+    def column(reference: ColumnRef) -> ColumnRef:
+        return ColumnRef(table_of(reference).casefold(), reference.column.casefold())
+
+    if isinstance(predicate, ColumnRef):
+        return column(predicate)
+    if isinstance(predicate, InList):
+        return InList(column(predicate.column), predicate.values, predicate.negated)
+    if isinstance(predicate, InSubquery):
+        return InSubquery(column(predicate.column), predicate.query, predicate.text, predicate.negated)
+    (left, right) = (column(predicate.left), predicate.right)
+    if isinstance(right, ColumnRef):
+        right = column(right)
+        if predicate.operator in ("=", "<>") and str(right) < str(left):
+            (left, right) = (right, left)
+    return Comparison(left, predicate.operator, right)
+
+def select_tables(select: Select) -> List[str]:
+    """Retorna as tabelas de um comando SQL (FROM e JOIN), sem repetições.
+
+    Args:
+        select (Select): A Árvore Sintática Abstrata do comando.
+
+    Returns:
+        List[str]: O nome das tabelas, em minúsculo, na ordem do comando.
+    """
+    return list(dict.fromkeys(
+        table.name.casefold() for table in list(select.tables) + [join.table for join in select.joins]
+    ))
+
+def source_tables(select: Select) -> List[str]:
+    """Retorna as tabelas lidas por um comando SQL: as tabelas do comando
+    (veja 'select_tables') e, recursivamente, as das suas subconsultas.
+
+    Args:
+        select (Select): A Árvore Sintática Abstrata do comando.
+
+    Returns:
+        List[str]: O nome das tabelas, em minúsculo, sem repetições.
+    """
+    tables: List[str] = select_tables(select)
+    for predicate in list(select.where) + [condition for join in select.joins for condition in join.conditions]:
+        if isinstance(predicate, InSubquery):
+            tables.extend(source_tables(predicate.query))
+    return list(dict.fromkeys(tables))
+
+class MaterializedView:
+    """Representa uma visão materializada: o resultado de um comando SQL
+    (SELECT, FROM, JOIN e WHERE), armazenado como uma tabela.
+
+    A definição da visão é mantida na forma usada pela busca de visões
+    do Conversor: as tabelas, as condicionais de junção (ON) e as demais
+    condicionais (WHERE e subconsultas), com as colunas explícitas. Um
+    comando com as mesmas tabelas (ou mais), unidas e selecionadas ao
+    menos pelas mesmas condicionais, pode ler a visão no lugar das
+    junções (veja 'covers').
+
+    As colunas da visão mantêm o nome das tabelas de origem, de modo que
+    as condicionais e projeções do comando são avaliadas diretamente
+    sobre as linhas da visão. A visão fica desatualizada quando alguma
+    tabela lida pelo comando, inclusive pelas subconsultas, recebe linhas
+    (veja 'is_fresh'), e é atualizada pelo
+    executor ('Executor.refresh_materialized_view').
+    """
+
+    # O nome da visão.
+    __name: str
+    # O Conversor do comando SQL da visão, executado a cada atualização.
+    __converter: 'Converter'
+    # As tabelas de origem, em minúsculo.
+    __tables: FrozenSet[str]
+    # As tabelas lidas pelo comando (as de origem e as das subconsultas), em minúsculo.
+    __source_tables: FrozenSet[str]
+    # As condicionais de junção (ON), com as colunas explícitas.
+    __join_conditions: FrozenSet[Predicate]
+    # As demais condicionais (WHERE e subconsultas), com as colunas explícitas.
+    __restrictions: FrozenSet[Predicate]
+    # As colunas da visão, com o nome da tabela de origem.
+    __columns: ViewSchema
+    # Os dados da visão.
+    __table: Table
+    # A tabela (sem impedir a sua remoção da memória) e a versão de cada
+    # tabela lida pelo comando na última atualização.
+    __versions: List[Tuple[str, 'weakref.ref[Table]', int]]
+
+    def __init__(self, name: str, converter: 'Converter', catalog: 'Catalog', columns: ViewSchema) -> None:
+        """Construtor da classe: a visão é criada sem linhas (veja 'refresh').
+
+        Args:
+            name (str): O nome da visão.
+            converter (Converter): O Conversor, com o comando SQL da visão já convertido.
+            catalog (Catalog): O catálogo do banco de dados.
+            columns (ViewSchema): As colunas do resultado do comando; as
+            colunas repetidas são armazenadas uma única vez.
+        """
+        select: Select = converter.parser.sql_ast
+        tables: List[str] = select_tables(select)
+
+        def table_of(column: ColumnRef) -> str:
+            return column.table if column.table is not None else catalog.resolve_column(column.column, tables)
+
+        on_conditions: List[Predicate] = [condition for join in select.joins for condition in join.conditions]
+        self.__name = name
+        self.__converter = converter
+        self.__tables = frozenset(tables)
+        self.__source_tables = frozenset(source_tables(select))
+        self.__join_conditions = frozenset(
+            qualify(condition, table_of) for condition in on_conditions if not isinstance(condition, InSubquery)
+        )
+        self.__restrictions = frozenset(
+            qualify(predicate, table_of)
+            for predicate in list(select.where) + [condition for condition in on_conditions if isinstance(condition, InSubquery)]
+        )
+        self.__columns = list(dict.fromkeys((table.casefold(), column.casefold()) for table, column in columns))
+        self.__table = Table(name, [f"{table}.{column}" for table, column in self.__columns])
+        self.__versions = []
+
+    @property
+    def name(self) -> str:
+        """Extrai o conteúdo da variável privada name.
+
+        Returns:
+            str: O nome da visão.
+        """
+        return self.__name
+
+    @property
+    def converter(self) -> 'Converter':
+        """Extrai o conteúdo da variável privada converter.
+
+        Returns:
+            Converter: O Conversor do comando SQL da visão.
+        """
+        return self.__converter
+
+    @property
+    def tables(self) -> FrozenSet[str]:
+        """Extrai o conteúdo da variável privada tables.
+
+        Returns:
+            FrozenSet[str]: As tabelas de origem, em minúsculo.
+        """
+        return self.__tables
+
+    @property
+    def join_conditions(self) -> FrozenSet[Predicate]:
+        """Extrai o conteúdo da variável privada join_conditions.
+
+        Returns:
+            FrozenSet[Predicate]: As condicionais de junção, com as colunas explícitas.
+        """
+        return self.__join_conditions
+
+    @property
+    def restrictions(self) -> FrozenSet[Predicate]:
+        """Extrai o conteúdo da variável privada restrictions.
+
+        Returns:
+            FrozenSet[Predicate]: As demais condicionais, com as colunas explícitas.
+        """
+        return self.__restrictions
+
+    @property
+    def columns(self) -> ViewSchema:
+        """Extrai o conteúdo da variável privada columns.
+
+        Returns:
+            ViewSchema: As colunas da visão, com o nome da tabela de origem.
+        """
+        return self.__columns
+
+    @property
+    def table(self) -> Table:
+        """Extrai o conteúdo da variável privada table.
+
+        Returns:
+            Table: Os dados da visão (colunas no formato 'tabela.coluna').
+        """
+        return self.__table
+
+    def is_fresh(self, catalog: 'Catalog') -> bool:
+        """Verifica se a visão corresponde aos dados atuais das tabelas de origem.
+
+        Args:
+            catalog (Catalog): O catálogo com os dados das tabelas.
+
+        Returns:
+            bool: Verdadeiro caso nenhuma tabela lida pelo comando
+            (inclusive pelas subconsultas) tenha recebido linhas, ou sido
+            substituída, desde a última atualização.
+        """
+        return bool(self.__versions) and all(
+            (table := catalog.table(name)) is not None and reference() is table and table.version == version
+            for name, reference, version in self.__versions
+        )
+
+    def refresh(self, catalog: 'Catalog', columns: ViewSchema, rows: Iterable[Sequence]) -> None:
+        """Atualiza os dados da visão.
+
+        Args:
+            catalog (Catalog): O catálogo com os dados das tabelas.
+            columns (ViewSchema): As colunas das linhas do comando SQL da
+            visão (podendo repetir colunas).
+            rows (Iterable[Sequence]): As linhas do comando, percorridas
+            somente após a leitura das versões das tabelas de origem.
+        """
+        # As versões são lidas antes da execução: uma inclusão durante a
+        # execução deixa a visão desatualizada, e não incorreta.
+        versions: List[Tuple[str, 'weakref.ref[Table]', int]] = []
+        for name in sorted(self.__source_tables):
+            table: Union[Table, None] = catalog.table(name)
+            if table is not None:
+                versions.append((name, weakref.ref(table), table.version))
+        names: List[Tuple[str, str]] = [(table.casefold(), column.casefold()) for table, column in columns]
+        positions: List[int] = [names.index(column) for column in self.columns]
+        data: Table = Table(self.name, self.__table.columns, (
+            row if len(positions) == len(row) else [row[position] for position in positions]
+            for row in rows
+        ))
+        (self.__table, self.__versions) = (data, versions)
+
+    def covers(
+            self,
+            tables: Iterable[str],
+            join_conditions: Iterable[Predicate],
+            restrictions: Iterable[Predicate],
+            columns: Iterable[Tuple[str, str]]) -> bool:
+        """Verifica se a visão pode substituir as junções de algumas tabelas de um comando SQL.
+
+        Todas as condicionais da visão devem estar no comando (as linhas
+        da visão contêm as linhas do comando), e as colunas usadas pelo
+        comando devem estar na visão. As condicionais do comando que não
+        estão na visão são avaliadas sobre as linhas da visão.
+
+        Args:
+            tables (Iterable[str]): As tabelas do comando, em minúsculo.
+            join_conditions (Iterable[Predicate]): As condicionais de junção
+            do comando, com as colunas explícitas.
+            restrictions (Iterable[Predicate]): As demais condicionais do
+            comando, com as colunas explícitas.
+            columns (Iterable[Tuple[str, str]]): As colunas do comando (tabela e
+            coluna, em minúsculo) das tabelas da visão.
+
+        Returns:
+            bool: Verdadeiro caso a visão contenha as linhas e as colunas do comando.
+        """
+        return (
+            self.tables <= set(tables)
+            and self.join_conditions <= set(join_conditions)
+            and self.restrictions <= set(restrictions)
+            and set(columns) <= set(self.columns)
+        )
+
+    def __repr__(self) -> str:
+        return f"MaterializedView({self.name!r}, {' |x| '.join(sorted(self.tables))})"
@@ -0,0 +1,90 @@
+"""Arquivo responsável pela geração, determinística, dos
+dados do banco de dados exemplar de pagamentos."""
+
+import random
+from datetime import date, timedelta
+from typing import Dict
+
+# pylint: disable=import-error
+from Storage import Table
+
+# As unidades federativas usadas na geração dos usuários.
+UFS = ["SP", "RJ", "MG", "RS", "PR", "SC", "BA", "PE", "CE", "GO", "DF", "ES"]
+
+def pagamento_example_data(scale: float = 1.0, seed: int = 0) -> Dict[str, Table]:
+    """Gera os dados das tabelas do banco de dados exemplar de pagamentos.
+
+    Com a mesma escala e a mesma semente, os dados gerados são sempre
+    os mesmos. As chaves estrangeiras referenciam linhas existentes e
+    algumas colunas opcionais possuem valores nulos (None).
+
+    Args:
+        scale (float, optional): A escala dos dados; com escala 1 são
+        gerados 1000 usuários, 2000 contas e 20000 movimentações. Valor
+        padrão: 1.0.
+        seed (int, optional): A semente da geração. Valor padrão: 0.
+
+    Returns:
+        Dict[str, Table]: Os dados de cada tabela, indexados pelo nome da tabela.
+    """
+    generator: random.Random = random.Random(seed)
+    users: int = max(1, int(1000 * scale))
+    accounts: int = max(1, int(2000 * scale))
+    movements: int = max(1, int(20000 * scale))
+    first_day: date = date(2020, 1, 1)
+
+    tipoconta: Table = Table("tipoconta", ["idtipoconta", "descrição"], [
+        (1, "Corrente"), (2, "Poupança"), (3, "Investimento")
+    ])
+    tipomovimentacao: Table = Table("tipomovimentacao", ["idtipomovimentacao", "descmovimentacao"], [
+        (1, "Crédito"), (2, "Débito"), (3, "Transferência"), (4, "Estorno")
+    ])
+    categoria: Table = Table("categoria", ["idcategoria", "desccategoria"], [
+        (i, f"Categoria {i}") for i in range(1, 13)
+    ])
+    usuario: Table = Table("usuario", [
+        "idusuario", "nome", "logradouro", "número",
+        "bairro", "cep", "uf", "datanascimento"
+    ], [
+        (
+            i,
+            f"Usuario {i}",
+            f"Rua {generator.randint(1, 300)}",
+            generator.randint(1, 2000),
+            f"Bairro {generator.randint(1, 80)}" if generator.random() > 0.05 else None,
+            f"{generator.randint(10000, 99999):05d}-{generator.randint(0, 999):03d}",
+            generator.choice(UFS),
+            (first_day - timedelta(days=generator.randint(18 * 365, 80 * 365))).isoformat()
+        )
+        for i in range(1, users + 1)
+    ])
+    contas: Table = Table("contas", [
+        "idconta", "descricao", "tipoconta_idtipoconta",
+        "usuario_idusuario", "saldoinicial"
+    ], [
+        (
+            i,
+            f"Conta {i}" if generator.random() > 0.1 else None,
+            generator.randint(1, 3),
+            generator.randint(1, users),
+            round(generator.uniform(0, 10000), 2)
+        )
+        for i in range(1, accounts + 1)
+    ])
+    movimentacao: Table = Table("movimentacao", [
+        "idmovimentacao", "datamovimentacao", "descricao",
+        "tipomovimento_idtipomovimento", "categoria_idcategoria",
+        "contas_idconta", "valor"
+    ], [
+        (
+            i,
+            (first_day + timedelta(days=generator.randint(0, 4 * 365))).isoformat(),
+            f"Movimentacao {i}" if generator.random() > 0.2 else None,
+            generator.randint(1, 4),
+            generator.randint(1, 12),
+            generator.randint(1, accounts),
+            round(generator.expovariate(1 / 200), 2)
+        )
+        for i in range(1, movements + 1)
+    ])
+    return {table.name: table for table in (usuario, contas, movimentacao, tipomovimentacao, categoria, tipoconta)}
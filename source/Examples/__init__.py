@@ -3,8 +3,10 @@ de dados exemplares."""
 
 # pylint: disable=import-error
 from .Pagamento.example_db import pagamento_example_db
+from .Pagamento.example_data import pagamento_example_data
 
 # Indica o que, neste pacote, está disponível para uso.
 __all__ = [
-    'pagamento_example_db'
+    'pagamento_example_db',
+    'pagamento_example_data'
 ]
\ No newline at end of file
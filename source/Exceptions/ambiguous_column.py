@@ -0,0 +1,32 @@
+"""Arquivo responsável pela exceção relacionada a
+existencia da utilização de colunas ambíguas em
+uma cláusula SQL.
+"""
+
+from typing import List
+
+class AmbiguousColumnException(Exception):
+    """Exceção lançada quando existe a
+    utilização de uma coluna, sem o nome da
+    tabela, presente em mais de uma tabela
+    do comando SQL.
+    """
+
+def raise_ambiguous_column_exception(column: str, tables: List[str]) -> None:
+    """Lança uma exceção quando existe a
+    utilização de uma coluna, sem o nome da
+    tabela, presente em mais de uma tabela
+    do comando SQL.
+
+    Args:
+        column (str): O nome da coluna ambígua.
+        tables (List[str]): As tabelas que possuem a coluna.
+
+    Raises:
+        AmbiguousColumnException: Exceção customizada
+        para alertar a utilização de colunas ambíguas
+        em uma cláusula SQL.
+    """
+    raise AmbiguousColumnException(
+        f"A coluna {column} é ambígua, pois existe nas tabelas {', '.join(tables)}; use 'nomeTabela.{column}'."
+    )
@@ -0,0 +1,28 @@
+"""Arquivo responsável pela exceção relacionada a
+leitura de um arquivo CSV incompatível com o
+banco de dados exemplar.
+"""
+
+class InvalidCsvException(Exception):
+    """Exceção lançada quando um arquivo CSV
+    não é compatível com a tabela do banco
+    de dados exemplar em que é carregado.
+    """
+
+def raise_invalid_csv_exception(path: str, reason: str) -> None:
+    """Lança uma exceção quando um arquivo CSV
+    não é compatível com a tabela do banco
+    de dados exemplar em que é carregado.
+
+    Args:
+        path (str): O caminho do arquivo CSV.
+        reason (str): O motivo da incompatibilidade.
+
+    Raises:
+        InvalidCsvException: Exceção customizada
+        para alertar a leitura de um arquivo CSV
+        incompatível.
+    """
+    raise InvalidCsvException(
+        f"O arquivo CSV {path} é incompatível com o banco de dados exemplar: {reason}."
+    )
@@ -0,0 +1,27 @@
+"""Arquivo responsável pela exceção relacionada a
+execução de um comando SQL sobre uma tabela sem
+dados anexados ao catálogo.
+"""
+
+class MissingTableDataException(Exception):
+    """Exceção lançada quando um comando SQL
+    é executado sobre uma tabela sem dados
+    anexados ao catálogo.
+    """
+
+def raise_missing_table_data_exception(table: str) -> None:
+    """Lança uma exceção quando um comando SQL
+    é executado sobre uma tabela sem dados
+    anexados ao catálogo.
+
+    Args:
+        table (str): O nome da tabela sem dados.
+
+    Raises:
+        MissingTableDataException: Exceção customizada
+        para alertar a execução de um comando SQL sobre
+        uma tabela sem dados.
+    """
+    raise MissingTableDataException(
+        f"A tabela {table} não possui dados anexados ao catálogo; use 'Catalog.attach_table'."
+    )
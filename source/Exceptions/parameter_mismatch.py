@@ -0,0 +1,44 @@
+"""Arquivo responsável pela exceção relacionada a
+incompatibilidade dos parâmetros fornecidos a um comando
+SQL preparado.
+"""
+
+class ParameterMismatchException(Exception):
+    """Exceção lançada quando os parâmetros fornecidos
+    a um comando SQL preparado são incompatíveis com os
+    marcadores ('?') do comando.
+    """
+
+def raise_parameter_count_mismatch_exception(expected: int, received: int) -> None:
+    """Lança uma exceção quando a quantia de parâmetros
+    fornecidos é diferente da quantia de marcadores ('?')
+    do comando SQL preparado.
+
+    Args:
+        expected (int): A quantia de marcadores do comando.
+        received (int): A quantia de parâmetros fornecidos.
+
+    Raises:
+        ParameterMismatchException: Exceção customizada
+        para alertar a incompatibilidade dos parâmetros
+        de um comando SQL preparado.
+    """
+    raise ParameterMismatchException(
+        f"O comando SQL preparado espera {expected} parâmetro(s), porém {received} foram fornecido(s)."
+    )
+
+def raise_parameter_type_mismatch_exception(parameter: object) -> None:
+    """Lança uma exceção quando o tipo de um parâmetro
+    fornecido não pode ser representado como um literal SQL.
+
+    Args:
+        parameter (object): O parâmetro incompatível.
+
+    Raises:
+        ParameterMismatchException: Exceção customizada
+        para alertar a incompatibilidade dos parâmetros
+        de um comando SQL preparado.
+    """
+    raise ParameterMismatchException(
+        f"O parâmetro {parameter!r} ({type(parameter).__name__}) não pode ser usado em um comando SQL preparado."
+    )
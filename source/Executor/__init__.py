@@ -0,0 +1,31 @@
+"""Arquivo responsável pela junção de todas as funcionalidades
+da execução dos planos (árvores da Álgebra Relacional)."""
+
+# pylint: disable=import-error
+from .executor import Executor, VectorizedExecutor
+from .explain import PlanAnalysis, NodeStatistics, strip_explain_analyze
+from .result_cache import ResultCache
+from .volcano import (
+    PhysicalOperator, TableScan, IndexScan, EmptyRelation, Filter, HashSemiJoin, Projection, NestedLoopJoin, HashJoin,
+    MergeJoin
+)
+
+# Indica o que, neste pacote, está disponível para uso.
+__all__ = [
+    'Executor',
+    'VectorizedExecutor',
+    'PlanAnalysis',
+    'NodeStatistics',
+    'strip_explain_analyze',
+    'ResultCache',
+    'PhysicalOperator',
+    'TableScan',
+    'IndexScan',
+    'EmptyRelation',
+    'Filter',
+    'HashSemiJoin',
+    'Projection',
+    'NestedLoopJoin',
+    'HashJoin',
+    'MergeJoin'
+]
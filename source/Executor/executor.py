@@ -0,0 +1,362 @@
+"""Arquivo responsável pela execução da árvore da Álgebra
+Relacional de um comando SQL sobre os dados das tabelas."""
+
+from typing import Any, Callable, Dict, Iterator, List, Set, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Catalog import Catalog, MaterializedView, TableStatistics
+from Executor.explain import AnalyzedOperator, PlanAnalysis
+from Executor.expressions import join_keys, read_columns, star_columns
+from Executor.volcano import (
+    EmptyRelation, Filter, HashJoin, HashSemiJoin, IndexScan, MergeJoin, NestedLoopJoin, PhysicalOperator, Projection, Row, TableScan
+)
+from Parser.sql_ast import InSubquery, Predicate
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter, Node
+from Storage import Index, Table
+
+# A execução vetorizada depende do NumPy, que é opcional.
+try:
+    from Executor.vectorized import VectorizedExecutor
+except ImportError:
+    VectorizedExecutor = None
+
+class Executor:
+    """Classe responsável pela execução dos comandos SQL já convertidos.
+
+    A árvore da Álgebra Relacional ('Converter.relational_algebra_tree')
+    é compilada, na ordem de execução calculada pelo Conversor
+    ('node_execution_order'), em operadores físicos (veja 'volcano.py')
+    sobre os dados anexados ao catálogo ('Catalog.attach_table'). As
+    linhas são produzidas sob demanda, sem resultados intermediários.
+
+    Cada comando pode, também, ser executado no modo vetorizado (veja
+    'vectorized.py'), que processa lotes de colunas com o NumPy.
+    """
+
+    # O catálogo com os dados das tabelas.
+    __catalog: Catalog
+    # A quantia máxima de linhas por lote, no modo vetorizado.
+    __batch_size: int
+    # A quantia de processos das junções paralelas, no modo vetorizado.
+    __workers: int
+    # O executor vetorizado, criado no primeiro uso.
+    __vectorized_executor: Union['VectorizedExecutor', None]
+
+    def __init__(self, catalog: Catalog, batch_size: int = 1 << 16, workers: int = 1) -> None:
+        """Construtor da classe.
+
+        Args:
+            catalog (Catalog): O catálogo com os dados das tabelas.
+            batch_size (int, optional): A quantia máxima de linhas por
+            lote, no modo vetorizado. Valor padrão: 65536.
+            workers (int, optional): A quantia de processos das junções
+            paralelas, no modo vetorizado. Valor padrão: 1.
+        """
+        self.__catalog = catalog
+        self.__batch_size = batch_size
+        self.__workers = workers
+        self.__vectorized_executor = None
+
+    @property
+    def catalog(self) -> Catalog:
+        """Extrai o conteúdo da variável privada catalog.
+
+        Returns:
+            Catalog: O catálogo com os dados das tabelas.
+        """
+        return self.__catalog
+
+    def compile(self, converter: Converter, analysis: Union[PlanAnalysis, None] = None) -> PhysicalOperator:
+        """Compila a árvore da Álgebra Relacional em operadores físicos.
+
+        Os nós são compilados na ordem de execução: os filhos (e as
+        subconsultas) sempre antes do pai.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já
+            convertido ('convert_in_database_context').
+            analysis (PlanAnalysis | None, optional): A análise do EXPLAIN
+            ANALYZE; o operador de cada nó é envolvido por um operador de
+            medição. Valor padrão: None.
+
+        Returns:
+            PhysicalOperator: O operador da raiz da árvore, ainda fechado;
+            as colunas do resultado estão em 'columns'.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        operators: Dict[Node, PhysicalOperator] = {}
+        empty_nodes: Set[Node] = set()
+        for node in converter.node_execution_order:
+            operator: PhysicalOperator = self.__compile_node(node, operators)
+            # Todas as junções são internas: uma entrada vazia torna o resultado do nó vazio.
+            if isinstance(operator, EmptyRelation) or any(
+                child in empty_nodes
+                for child in (node.left_children, node.right_children)
+                if child is not None and child.parent is node
+            ):
+                operator = EmptyRelation(operator.columns)
+                empty_nodes.add(node)
+            if analysis is not None:
+                operator = AnalyzedOperator(operator, analysis, analysis.register(node))
+            operators[node] = operator
+        root: PhysicalOperator = operators[converter.relational_algebra_tree]
+
+        # Um '*' mantém as colunas na ordem das tabelas do comando SQL,
+        # e não na ordem das junções escolhida pelo Conversor.
+        if converter.parser.sql_ast.is_star:
+            root = Projection(root, star_columns(root.columns, converter.context_tables))
+        return root
+
+    def explain_analyze(self, converter: Converter, vectorized: bool = False, trace_memory: bool = True) -> PlanAnalysis:
+        """Executa o comando SQL convertido medindo cada nó da árvore (EXPLAIN ANALYZE).
+
+        O resultado é descartado; as medidas de cada nó (tempo, linhas,
+        lotes e pico de memória) ficam na análise retornada. O 'tracemalloc'
+        torna a execução muito mais lenta: o pico de memória é medido em
+        uma segunda execução, mantendo os tempos da primeira.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+            vectorized (bool, optional): Verdadeiro para executar no modo
+            vetorizado. Valor padrão: False.
+            trace_memory (bool, optional): Verdadeiro para medir, também, o
+            pico de memória de cada nó. Valor padrão: True.
+
+        Returns:
+            PlanAnalysis: As medidas da execução.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        compile_plan: Callable[[Converter, PlanAnalysis], Any] = (
+            self.vectorized_executor.compile if vectorized else self.compile
+        )
+        analysis: PlanAnalysis = PlanAnalysis(converter, trace_memory=False)
+        analysis.run(compile_plan(converter, analysis))
+        if trace_memory:
+            memory: PlanAnalysis = PlanAnalysis(converter, trace_memory=True)
+            analysis.include_memory(memory.run(compile_plan(converter, memory)))
+        return analysis
+
+    @property
+    def vectorized_executor(self) -> 'VectorizedExecutor':
+        """Retorna o executor vetorizado, criando-o no primeiro uso.
+
+        Returns:
+            VectorizedExecutor: O executor vetorizado, sobre o mesmo catálogo.
+
+        Raises:
+            ModuleNotFoundError: Caso o NumPy não esteja instalado.
+        """
+        if VectorizedExecutor is None:
+            raise ModuleNotFoundError("O modo vetorizado requer o NumPy ('pip install numpy').")
+        if self.__vectorized_executor is None:
+            self.__vectorized_executor = VectorizedExecutor(self.catalog, self.__batch_size, self.__workers)
+        return self.__vectorized_executor
+
+    def close(self) -> None:
+        """Encerra os processos das junções paralelas do executor vetorizado, caso criado."""
+        if self.__vectorized_executor is not None:
+            self.__vectorized_executor.close()
+
+    def __enter__(self) -> 'Executor':
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def create_materialized_view(self, name: str, converter: Converter) -> MaterializedView:
+        """Cria (CREATE MATERIALIZED VIEW) uma visão materializada com o
+        resultado de um comando SQL, registrando-a no catálogo.
+
+        Os comandos convertidos em seguida cujas junções e condicionais
+        contêm as da visão leem a visão no lugar das junções.
+
+        Args:
+            name (str): O nome da visão.
+            converter (Converter): O Conversor, com o comando SQL da visão já convertido.
+
+        Returns:
+            MaterializedView: A visão, com o resultado atual do comando.
+
+        Raises:
+            ValueError: Caso o nome já seja usado por uma tabela ou por outra visão.
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        root: PhysicalOperator = self.compile(converter)
+        view: MaterializedView = MaterializedView(name, converter, self.catalog, root.columns)
+        view.refresh(self.catalog, root.columns, root)
+        self.catalog.add_view(view)
+        return view
+
+    def refresh_materialized_view(self, name: str) -> MaterializedView:
+        """Atualiza (REFRESH MATERIALIZED VIEW) uma visão materializada,
+        executando novamente o seu comando SQL.
+
+        Args:
+            name (str): O nome da visão.
+
+        Returns:
+            MaterializedView: A visão atualizada.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que a visão, ou alguma tabela do seu comando, não existe.
+        """
+        view: Union[MaterializedView, None] = self.catalog.view(name)
+        if view is None:
+            Exceptions.raise_missing_table_data_exception(name)
+        root: PhysicalOperator = self.compile(view.converter)
+        view.refresh(self.catalog, root.columns, root)
+        return view
+
+    def execute(self, converter: Converter, vectorized: bool = False) -> Iterator[Row]:
+        """Executa o comando SQL convertido, produzindo as linhas sob demanda.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+            vectorized (bool, optional): Verdadeiro para executar no modo
+            vetorizado. Valor padrão: False.
+
+        Returns:
+            Iterator[Row]: As linhas do resultado.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        if vectorized:
+            return self.vectorized_executor.execute(converter)
+        return iter(self.compile(converter))
+
+    def __compile_node(self, node: Node, operators: Dict[Node, PhysicalOperator]) -> PhysicalOperator:
+        """Compila um nó da árvore, cujos filhos já foram compilados.
+
+        A entrada de uma projeção ou de uma seleção é o filho ligado ao
+        nó ('parent'); o outro filho de uma seleção é a árvore das suas
+        subconsultas, que não possui pai.
+
+        Args:
+            node (Node): O nó.
+            operators (Dict[Node, PhysicalOperator]): Os operadores dos
+            nós já compilados.
+
+        Returns:
+            PhysicalOperator: O operador do nó.
+        """
+        operator: plan.Operator = node.operator
+        if isinstance(operator, plan.ViewScan):
+            # Uma tabela da visão recebeu linhas após a conversão: a visão é atualizada.
+            view: Union[MaterializedView, None] = self.catalog.view(operator.table)
+            if view is None or not view.is_fresh(self.catalog):
+                view = self.refresh_materialized_view(operator.table)
+            read: List[str] = read_columns(view.table.columns, operator.columns)
+            return TableScan(view.table, operator.table, read, [
+                column for name, column in zip(view.table.columns, view.columns) if name in read
+            ])
+        if isinstance(operator, plan.Scan):
+            table: Union[Table, None] = self.catalog.table(operator.table)
+            if table is None:
+                Exceptions.raise_missing_table_data_exception(operator.table)
+            # Somente as colunas usadas pelo comando são lidas (veja 'plan.Scan.columns').
+            read = read_columns(table.columns, operator.columns)
+            if isinstance(operator, plan.EmptyScan):
+                return EmptyRelation([(operator.table, column) for column in read])
+            if isinstance(operator, plan.IndexScan):
+                index: Union[Index, None] = self.catalog.index(operator.index)
+                if index is not None and index in table.indexes:
+                    return IndexScan(table, operator.table, index, operator.predicates, read)
+                # O índice foi removido após a conversão: a seleção é feita sobre a leitura completa.
+                return Filter(TableScan(table, operator.table, read), operator.predicates)
+            return TableScan(table, operator.table, read)
+
+        if isinstance(operator, plan.Join):
+            return self.__compile_join(node, operators[node.left_children], operators[node.right_children])
+
+        inputs: List[Node] = [
+            child for child in (node.left_children, node.right_children)
+            if child is not None and child.parent is node
+        ]
+        if isinstance(operator, plan.Select):
+            # Os IN e NOT IN com subconsultas são semijunções (e antijunções),
+            # aplicadas após as demais condicionais.
+            root: PhysicalOperator = operators[inputs[0]]
+            predicates: List[Predicate] = [
+                predicate for predicate in operator.predicates if not isinstance(predicate, InSubquery)
+            ]
+            if predicates:
+                root = Filter(root, predicates)
+            for predicate in operator.predicates:
+                if isinstance(predicate, InSubquery):
+                    subquery: Node = operator.subqueries[predicate.text].relational_algebra_tree
+                    root = HashSemiJoin(root, operators[subquery], predicate)
+            return root
+        return Projection(operators[inputs[0]], operator.columns)
+
+    def __compile_join(self, node: Node, left: PhysicalOperator, right: PhysicalOperator) -> PhysicalOperator:
+        """Compila uma junção no algoritmo físico escolhido pelo planejador.
+
+        Um merge join depende da ordenação das tabelas registrada no
+        último ANALYZE; caso alguma tabela da junção tenha recebido novas
+        linhas desde então, um hash join é usado no lugar.
+
+        Args:
+            node (Node): O nó da junção.
+            left (PhysicalOperator): O operador da entrada esquerda.
+            right (PhysicalOperator): O operador da entrada direita.
+
+        Returns:
+            PhysicalOperator: O operador da junção.
+        """
+        operator: plan.Join = node.operator
+        conditions: List[Predicate] = operator.conditions
+        if operator.merge_key is not None:
+            # O merge join une as entradas pela primeira chave: a chave ordenada.
+            conditions = [operator.merge_key] + [
+                condition for condition in conditions if condition is not operator.merge_key
+            ]
+        (keys, residual) = join_keys(conditions, left.columns, right.columns)
+        if not keys or operator.method not in (plan.HASH, plan.MERGE):
+            return NestedLoopJoin(left, right, operator.conditions)
+        if operator.method == plan.MERGE and all(map(self.__is_analyzed, self.__scanned_tables(node))):
+            return MergeJoin(left, right, keys, residual)
+        return HashJoin(left, right, keys, residual, operator.build_left)
+
+    def __is_analyzed(self, table: str) -> bool:
+        """Verifica se as estatísticas de uma tabela correspondem aos seus dados atuais.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            bool: Verdadeiro caso a tabela não tenha mudado desde o último ANALYZE.
+        """
+        statistics: Union[TableStatistics, None] = self.catalog.statistics(table)
+        data: Union[Table, None] = self.catalog.table(table)
+        return statistics is not None and data is not None and statistics.table_version == data.version
+
+    @staticmethod
+    def __scanned_tables(node: Node) -> List[str]:
+        """Retorna as tabelas lidas abaixo de um nó (sem as subconsultas).
+
+        Args:
+            node (Node): O nó.
+
+        Returns:
+            List[str]: O nome das tabelas.
+        """
+        if isinstance(node.operator, plan.Scan):
+            return [node.operator.table]
+        return [
+            table
+            for child in (node.left_children, node.right_children)
+            if child is not None and child.parent is node
+            for table in Executor.__scanned_tables(child)
+        ]
@@ -0,0 +1,358 @@
+"""Arquivo responsável pelo EXPLAIN ANALYZE: a execução de um plano
+medindo, em cada nó da árvore, o tempo, as linhas, os lotes e o pico
+de memória dos seus operadores."""
+
+import re
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+# pylint: disable=import-error
+from Executor.volcano import PhysicalOperator, Row
+from RelationalAlgebra.Converter import Converter, Node
+
+# O prefixo de um comando SQL executado pelo EXPLAIN ANALYZE.
+EXPLAIN_ANALYZE: re.Pattern = re.compile(r"^\s*explain\s+analyze\s+", re.IGNORECASE)
+
+def strip_explain_analyze(sql_command: str) -> Tuple[str, bool]:
+    """Remove o prefixo 'EXPLAIN ANALYZE' de um comando SQL.
+
+    Args:
+        sql_command (str): O comando SQL, com ou sem o prefixo.
+
+    Returns:
+        Tuple[str, bool]: O comando sem o prefixo e se o prefixo existia.
+    """
+    match: Union[re.Match, None] = EXPLAIN_ANALYZE.match(sql_command)
+    return (sql_command[match.end():], True) if match else (sql_command, False)
+
+def format_bytes(size: int) -> str:
+    """Representa uma quantia de bytes na maior unidade adequada.
+
+    Args:
+        size (int): A quantia de bytes.
+
+    Returns:
+        str: A quantia, como '512 B', '1.5 KiB' ou '12.0 MiB'.
+    """
+    if size < 1024:
+        return f"{size} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024 or unit == "GiB":
+            break
+    return f"{size:.1f} {unit}"
+
+class NodeStatistics:
+    """Representa as medidas de um nó da árvore em uma execução.
+
+    O tempo total inclui as entradas do nó (e as suas subconsultas); o
+    tempo próprio ('self_time') desconta o tempo gasto nos operadores
+    dos outros nós. O pico de memória é o maior aumento da memória
+    alocada (medida com o 'tracemalloc') desde a abertura do operador,
+    incluindo as suas entradas.
+    """
+
+    __slots__ = ("time", "self_time", "rows_in", "rows_out", "batches", "loops", "peak_memory")
+
+    def __init__(self) -> None:
+        """Construtor da classe."""
+        # Os tempos, em segundos.
+        self.time: float = 0.0
+        self.self_time: float = 0.0
+        # As linhas recebidas das entradas (None nas folhas) e as produzidas.
+        self.rows_in: Union[int, None] = None
+        self.rows_out: int = 0
+        # As chamadas de 'next' que produziram linhas (uma por linha, no modelo de iteradores).
+        self.batches: int = 0
+        # As aberturas do operador.
+        self.loops: int = 0
+        # O pico de memória, em bytes (None caso a memória não seja medida).
+        self.peak_memory: Union[int, None] = None
+
+    @property
+    def self_milliseconds(self) -> float:
+        """Retorna o tempo próprio em milissegundos, arredondado como exibido.
+
+        Returns:
+            float: O tempo próprio, com duas casas decimais.
+        """
+        return round(self.self_time * 1000, 2)
+
+    def render(self) -> str:
+        """Representa as medidas do nó, como exibidas na árvore.
+
+        Returns:
+            str: As medidas, como '2.41 ms (total 5.02 ms), 20000 → 1653
+            linhas, 1.2 MiB'. Os lotes somente são exibidos quando
+            diferentes das linhas (no modo vetorizado).
+        """
+        parts: List[str] = [f"{self.self_milliseconds:.2f} ms (total {self.time * 1000:.2f} ms)"]
+        rows: str = f"{self.rows_out} linhas"
+        parts.append(rows if self.rows_in is None else f"{self.rows_in} → {rows}")
+        if self.batches != self.rows_out:
+            parts.append(f"{self.batches} {'lote' if self.batches == 1 else 'lotes'}")
+        if self.peak_memory is not None:
+            parts.append(format_bytes(self.peak_memory))
+        return ", ".join(parts)
+
+    def __repr__(self) -> str:
+        return f"NodeStatistics({self.render()})"
+
+class PlanAnalysis:
+    """Classe responsável pelas medidas de uma execução (EXPLAIN ANALYZE).
+
+    O operador de cada nó é envolvido por um operador de medição (veja
+    'AnalyzedOperator' e 'AnalyzedBatchOperator'), que cronometra cada
+    chamada de 'open', 'next' e 'close'. As chamadas aninhadas formam
+    uma pilha: o tempo de um operador chamado por outro é descontado do
+    tempo próprio de quem o chamou, como em um profiler.
+    """
+
+    # O Conversor, com o comando SQL já convertido.
+    __converter: Converter
+    # Verdadeiro para medir o pico de memória (mais lento).
+    __trace_memory: bool
+    # As medidas de cada nó.
+    __statistics: Dict[Node, NodeStatistics]
+    # As chamadas em andamento: o tempo e o pico de memória dos operadores chamados.
+    __frames: List[List[Any]]
+    # A memória alocada na abertura de cada operador.
+    __opened: Dict[NodeStatistics, int]
+    # O tempo total da execução, em segundos.
+    __total_time: float
+
+    def __init__(self, converter: Converter, trace_memory: bool = True) -> None:
+        """Construtor da classe.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+            trace_memory (bool, optional): Verdadeiro para medir o pico de
+            memória de cada nó; a medição torna a execução mais lenta.
+            Valor padrão: True.
+        """
+        self.__converter = converter
+        self.__trace_memory = trace_memory
+        self.__statistics = {}
+        self.__frames = []
+        self.__opened = {}
+        self.__total_time = 0.0
+
+    @property
+    def converter(self) -> Converter:
+        """Extrai o conteúdo da variável privada converter.
+
+        Returns:
+            Converter: O Conversor, com o comando SQL já convertido.
+        """
+        return self.__converter
+
+    @property
+    def total_time(self) -> float:
+        """Extrai o conteúdo da variável privada total_time.
+
+        Returns:
+            float: O tempo total da execução, em segundos.
+        """
+        return self.__total_time
+
+    @property
+    def result_rows(self) -> int:
+        """Retorna a quantia de linhas do resultado.
+
+        Returns:
+            int: As linhas produzidas pela raiz da árvore.
+        """
+        return self.__statistics[self.converter.relational_algebra_tree].rows_out
+
+    def statistics(self, node: Node) -> Union[NodeStatistics, None]:
+        """Retorna as medidas de um nó.
+
+        Args:
+            node (Node): O nó.
+
+        Returns:
+            NodeStatistics | None: As medidas, ou None caso o nó não faça
+            parte da execução.
+        """
+        return self.__statistics.get(node)
+
+    def register(self, node: Node) -> NodeStatistics:
+        """Registra um nó, antes da sua execução.
+
+        Args:
+            node (Node): O nó.
+
+        Returns:
+            NodeStatistics: As medidas (ainda vazias) do nó.
+        """
+        statistics: NodeStatistics = NodeStatistics()
+        if self.__trace_memory:
+            statistics.peak_memory = 0
+        self.__statistics[node] = statistics
+        return statistics
+
+    def measure(self, statistics: NodeStatistics, call: Callable[[], Any], opening: bool = False) -> Any:
+        """Executa e mede uma chamada de um operador.
+
+        Args:
+            statistics (NodeStatistics): As medidas do nó do operador.
+            call (Callable[[], Any]): A chamada ('open', 'next' ou 'close').
+            opening (bool, optional): Verdadeiro caso seja a abertura do
+            operador. Valor padrão: False.
+
+        Returns:
+            Any: O retorno da chamada.
+        """
+        # O tempo dos operadores chamados e o pico de memória durante a chamada.
+        frame: List[Any] = [0.0, 0]
+        if self.__trace_memory:
+            (current, peak) = tracemalloc.get_traced_memory()
+            if self.__frames:
+                # O pico anterior, de quem chamou, é guardado antes de ser reiniciado.
+                self.__frames[-1][1] = max(self.__frames[-1][1], peak)
+            tracemalloc.reset_peak()
+            if opening or statistics not in self.__opened:
+                self.__opened[statistics] = current
+        self.__frames.append(frame)
+        start: float = perf_counter()
+        try:
+            return call()
+        finally:
+            elapsed: float = perf_counter() - start
+            self.__frames.pop()
+            statistics.time += elapsed
+            statistics.self_time += elapsed - frame[0]
+            if self.__frames:
+                self.__frames[-1][0] += elapsed
+            if self.__trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                statistics.peak_memory = max(statistics.peak_memory, peak - self.__opened[statistics])
+                if self.__frames:
+                    self.__frames[-1][1] = max(self.__frames[-1][1], peak)
+
+    def run(self, root: Iterable[Any]) -> 'PlanAnalysis':
+        """Executa o plano já compilado, descartando o resultado.
+
+        Args:
+            root (Iterable[Any]): O operador da raiz (linhas ou lotes).
+
+        Returns:
+            PlanAnalysis: A própria análise, com as medidas preenchidas.
+        """
+        started: bool = self.__trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        start: float = perf_counter()
+        try:
+            for _ in root:
+                pass
+        finally:
+            self.__total_time = perf_counter() - start
+            if started:
+                tracemalloc.stop()
+            self.__opened = {}
+
+        # As linhas recebidas são as produzidas pelas entradas ligadas ao nó.
+        for node, statistics in self.__statistics.items():
+            inputs: List[Node] = [
+                child for child in (node.left_children, node.right_children)
+                if child is not None and child.parent is node and child in self.__statistics
+            ]
+            if inputs:
+                statistics.rows_in = sum(self.__statistics[child].rows_out for child in inputs)
+        return self
+
+    def include_memory(self, other: 'PlanAnalysis') -> None:
+        """Copia o pico de memória de cada nó medido em outra execução do mesmo plano.
+
+        Args:
+            other (PlanAnalysis): A análise da outra execução, com a memória medida.
+        """
+        for node, statistics in self.__statistics.items():
+            measured: Union[NodeStatistics, None] = other.statistics(node)
+            statistics.peak_memory = measured.peak_memory if measured is not None else None
+
+    def hottest(self, count: int = 3) -> List[Node]:
+        """Retorna os nós com o maior tempo próprio.
+
+        Os nós cujo tempo próprio é exibido como zero não são retornados.
+
+        Args:
+            count (int, optional): A quantia de nós. Valor padrão: 3.
+
+        Returns:
+            List[Node]: Os nós, do mais lento ao mais rápido.
+        """
+        nodes: List[Node] = sorted(self.__statistics, key=lambda node: self.__statistics[node].self_time, reverse=True)
+        return [node for node in nodes[:count] if self.__statistics[node].self_milliseconds > 0]
+
+    def heat(self, node: Node) -> float:
+        """Retorna o tempo próprio de um nó relativo ao nó mais lento.
+
+        Args:
+            node (Node): O nó.
+
+        Returns:
+            float: Entre 0 (sem tempo próprio, ou fora da execução) e 1 (o
+            nó mais lento). Os tempos são comparados como exibidos: caso
+            todos sejam exibidos como zero, nenhum nó é destacado.
+        """
+        slowest: float = max((statistics.self_milliseconds for statistics in self.__statistics.values()), default=0.0)
+        statistics: Union[NodeStatistics, None] = self.__statistics.get(node)
+        return statistics.self_milliseconds / slowest if statistics is not None and slowest > 0 else 0.0
+
+    def render(self) -> str:
+        """Representa a árvore, em texto, com as medidas de cada nó.
+
+        Returns:
+            str: Um nó por linha, indentado pela profundidade, no formato
+            'ordem°- operador  [medidas]', seguido do tempo total.
+        """
+        lines: List[str] = []
+
+        def visit(node: Union[Node, None], depth: int) -> None:
+            if node is None:
+                return
+            statistics: Union[NodeStatistics, None] = self.__statistics.get(node)
+            measures: str = f"  [{statistics.render()}]" if statistics is not None else ""
+            lines.append(f"{'  ' * depth}{node.execution_order}°- {node.value}{measures}")
+            visit(node.left_children, depth + 1)
+            visit(node.right_children, depth + 1)
+
+        visit(self.converter.relational_algebra_tree, 0)
+        lines.append(f"Tempo total: {self.total_time * 1000:.2f} ms, {self.result_rows} linhas")
+        return "\n".join(lines)
+
+class AnalyzedOperator(PhysicalOperator):
+    """Operador de medição: repassa as chamadas ao operador de um nó,
+    medindo-as (veja 'PlanAnalysis.measure')."""
+
+    __slots__ = ("operator", "analysis", "statistics")
+
+    def __init__(self, operator: PhysicalOperator, analysis: PlanAnalysis, statistics: NodeStatistics) -> None:
+        """Construtor da classe.
+
+        Args:
+            operator (PhysicalOperator): O operador medido.
+            analysis (PlanAnalysis): A análise da execução.
+            statistics (NodeStatistics): As medidas do nó do operador.
+        """
+        super().__init__(operator.columns)
+        self.operator = operator
+        self.analysis = analysis
+        self.statistics = statistics
+
+    def open(self) -> None:
+        self.statistics.loops += 1
+        self.analysis.measure(self.statistics, self.operator.open, opening=True)
+
+    def next(self) -> Union[Row, None]:
+        row: Union[Row, None] = self.analysis.measure(self.statistics, self.operator.next)
+        if row is not None:
+            self.statistics.rows_out += 1
+            self.statistics.batches += 1
+        return row
+
+    def close(self) -> None:
+        self.analysis.measure(self.statistics, self.operator.close)
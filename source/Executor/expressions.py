@@ -0,0 +1,274 @@
+"""Arquivo responsável pela resolução das colunas e pela
+avaliação das condicionais sobre as linhas de um operador."""
+
+import operator
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Parser.sql_ast import ColumnRef, Comparison, InSubquery, Literal, Predicate
+
+# As colunas das linhas de um operador: o nome da tabela e o nome da coluna.
+Schema = List[Tuple[str, str]]
+
+# Uma condicional compilada: recebe uma linha e retorna Verdadeiro, Falso
+# ou None (desconhecido, quando algum valor comparado é nulo).
+RowPredicate = Callable[[Tuple[Any, ...]], Union[bool, None]]
+
+# As funções dos operadores de comparação.
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+
+def column_positions(schema: Schema, column: ColumnRef) -> List[int]:
+    """Procura pelas posições das colunas, com o nome de uma coluna, nas linhas de um operador.
+
+    Args:
+        schema (Schema): As colunas das linhas.
+        column (ColumnRef): A coluna, com ou sem o nome da tabela.
+
+    Returns:
+        List[int]: As posições encontradas (vazia caso não exista, e com
+        mais de uma posição caso a coluna seja ambígua).
+    """
+    name: str = column.column.casefold()
+    table: Union[str, None] = column.table.casefold() if column.table else None
+    return [
+        position for position, (owner, candidate) in enumerate(schema)
+        if candidate.casefold() == name and (table is None or owner.casefold() == table)
+    ]
+
+def resolve_column(schema: Schema, column: ColumnRef) -> int:
+    """Procura pela posição de uma coluna nas linhas de um operador.
+
+    Args:
+        schema (Schema): As colunas das linhas.
+        column (ColumnRef): A coluna, com ou sem o nome da tabela.
+
+    Returns:
+        int: A posição da coluna nas linhas.
+
+    Raises:
+        ColumnMismatchException: Exceção customizada para alertar a
+        utilização de uma coluna que não existe nas linhas.
+        AmbiguousColumnException: Exceção customizada para alertar a
+        utilização de uma coluna presente em mais de uma tabela.
+    """
+    matches: List[int] = column_positions(schema, column)
+    if not matches:
+        Exceptions.raise_column_mismatch_in_example_exception(str(column))
+    if len(matches) > 1:
+        Exceptions.raise_ambiguous_column_exception(column.column, [schema[position][0] for position in matches])
+    return matches[0]
+
+def join_keys(
+        conditions: List[Predicate],
+        left: Schema,
+        right: Schema) -> Tuple[List[Tuple[int, int]], List[Predicate]]:
+    """Separa as chaves de uma junção (igualdades entre uma coluna de cada
+    entrada) das demais condicionais.
+
+    Args:
+        conditions (List[Predicate]): As condicionais da junção.
+        left (Schema): As colunas da entrada esquerda.
+        right (Schema): As colunas da entrada direita.
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[Predicate]]: A posição de cada
+        chave na entrada esquerda e na direita, e as condicionais restantes.
+    """
+    keys: List[Tuple[int, int]] = []
+    residual: List[Predicate] = []
+    for condition in conditions:
+        key: Union[Tuple[int, int], None] = None
+        if isinstance(condition, Comparison) and condition.operator == "=" and isinstance(condition.right, ColumnRef):
+            for (first, second) in ((condition.left, condition.right), (condition.right, condition.left)):
+                (left_positions, right_positions) = (column_positions(left, first), column_positions(right, second))
+                if len(left_positions) == 1 and len(right_positions) == 1:
+                    key = (left_positions[0], right_positions[0])
+                    break
+        if key is not None:
+            keys.append(key)
+        else:
+            residual.append(condition)
+    return (keys, residual)
+
+def star_columns(schema: Schema, tables: Sequence[str]) -> List[ColumnRef]:
+    """Ordena as colunas de um '*' na ordem das tabelas do comando SQL.
+
+    A ordem das junções escolhida pelo Conversor não altera a ordem
+    das colunas do resultado.
+
+    Args:
+        schema (Schema): As colunas das linhas, na ordem das junções.
+        tables (Sequence[str]): As tabelas, na ordem do comando SQL.
+
+    Returns:
+        List[ColumnRef]: As colunas, explícitas, na ordem das tabelas.
+    """
+    order: Dict[str, int] = {table.casefold(): position for position, table in enumerate(tables)}
+    return [
+        ColumnRef(table, column)
+        for table, column in sorted(schema, key=lambda column: order[column[0].casefold()])
+    ]
+
+def read_columns(table_columns: Sequence[str], columns: Union[Sequence[str], None]) -> List[str]:
+    """Retorna as colunas lidas de uma tabela, na ordem da tabela.
+
+    Args:
+        table_columns (Sequence[str]): As colunas da tabela.
+        columns (Sequence[str] | None): As colunas escolhidas pela poda de
+        colunas do Conversor ('plan.Scan.columns'), em minúsculo; None
+        representa todas as colunas.
+
+    Returns:
+        List[str]: As colunas lidas, como escritas na tabela.
+    """
+    if columns is None:
+        return list(table_columns)
+    wanted: Set[str] = set(columns)
+    return [column for column in table_columns if column.casefold() in wanted]
+
+class ValueSet:
+    """Conjunto de hash dos valores de um IN (uma lista ou o resultado de
+    uma subconsulta), construído uma única vez, antes da avaliação.
+
+    Os valores não nulos ficam em um conjunto (busca em O(1)); um texto
+    nunca é igual a um número, pois os valores mantêm os seus tipos. Os
+    nulos são somente registrados ('has_null'), pois nunca são iguais a
+    um valor.
+    """
+
+    __slots__ = ("values", "has_null")
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        """Construtor da classe.
+
+        Args:
+            values (Iterable[Any]): Os valores, percorridos uma única vez
+            (None representa NULL).
+        """
+        distinct: Set[Any] = set(values)
+        self.has_null: bool = None in distinct
+        distinct.discard(None)
+        self.values: FrozenSet[Any] = frozenset(distinct)
+
+    @property
+    def is_empty(self) -> bool:
+        """Verifica se o conjunto não possui valores, nem mesmo nulos.
+
+        Returns:
+            bool: Verdadeiro caso a lista (ou a subconsulta) seja vazia.
+        """
+        return not self.values and not self.has_null
+
+    def __len__(self) -> int:
+        return len(self.values) + self.has_null
+
+    def __repr__(self) -> str:
+        return f"ValueSet({len(self.values)} valores{', com nulo' if self.has_null else ''})"
+
+def membership(value: Any, values: ValueSet, negated: bool) -> Union[bool, None]:
+    """Avalia um IN (ou NOT IN) com a lógica de três valores do SQL.
+
+    Um IN sobre uma lista vazia é sempre falso, e um NOT IN, sempre
+    verdadeiro, mesmo que o valor seja nulo.
+
+    Args:
+        value (Any): O valor verificado.
+        values (ValueSet): Os valores da lista (ou da subconsulta).
+        negated (bool): Verdadeiro caso seja um NOT IN.
+
+    Returns:
+        bool | None: O resultado, ou None (desconhecido) caso o valor seja
+        nulo ou não esteja na lista e a lista possua um nulo.
+    """
+    if values.is_empty:
+        return negated
+    if value is None:
+        return None
+    if value in values.values:
+        return not negated
+    if values.has_null:
+        return None
+    return negated
+
+def compile_predicate(predicate: Predicate, schema: Schema) -> RowPredicate:
+    """Compila uma condicional em uma função sobre as linhas de um operador.
+
+    As colunas são resolvidas, e os valores de um IN são colocados em um
+    conjunto de hash ('ValueSet'), uma única vez, na compilação. Os IN e
+    NOT IN com subconsultas são avaliados por semijunções (veja
+    'HashSemiJoin'), e não por condicionais.
+
+    Uma comparação entre valores de tipos não comparáveis (como um
+    texto e um número, em 'nome > 5') é desconhecida, e não aceita a
+    linha, assim como nos índices ordenados e no modo vetorizado.
+
+    Args:
+        predicate (Predicate): A condicional.
+        schema (Schema): As colunas das linhas.
+
+    Returns:
+        RowPredicate: A condicional compilada.
+
+    Raises:
+        ValueError: Caso a condicional seja um IN (ou NOT IN) com uma subconsulta.
+    """
+    if isinstance(predicate, ColumnRef):
+        position: int = resolve_column(schema, predicate)
+        return lambda row: None if row[position] is None else bool(row[position])
+
+    if isinstance(predicate, Comparison):
+        compare: Callable[[Any, Any], bool] = COMPARISONS[predicate.operator]
+        left: int = resolve_column(schema, predicate.left)
+        if isinstance(predicate.right, Literal):
+            literal: Any = predicate.right.value
+
+            def compare_literal(row: Tuple[Any, ...]) -> Union[bool, None]:
+                if row[left] is None or literal is None:
+                    return None
+                try:
+                    return compare(row[left], literal)
+                except TypeError:
+                    # Valores de tipos não comparáveis (um texto e um número) resultam em desconhecido.
+                    return None
+            return compare_literal
+        right: int = resolve_column(schema, predicate.right)
+
+        def compare_columns(row: Tuple[Any, ...]) -> Union[bool, None]:
+            if row[left] is None or row[right] is None:
+                return None
+            try:
+                return compare(row[left], row[right])
+            except TypeError:
+                return None
+        return compare_columns
+
+    if isinstance(predicate, InSubquery):
+        raise ValueError(f"A subconsulta de {predicate.column} deve ser avaliada por uma semijunção.")
+    position = resolve_column(schema, predicate.column)
+    negated: bool = predicate.negated
+    values: ValueSet = ValueSet(value.value for value in predicate.values)
+    return lambda row: membership(row[position], values, negated)
+
+def compile_conjunction(predicates: List[Predicate], schema: Schema) -> Callable[[Tuple[Any, ...]], bool]:
+    """Compila condicionais unidas por AND em uma única função.
+
+    Uma linha somente é aceita caso todas as condicionais sejam
+    verdadeiras (um resultado desconhecido rejeita a linha).
+
+    Args:
+        predicates (List[Predicate]): As condicionais.
+        schema (Schema): As colunas das linhas.
+
+    Returns:
+        Callable[[Tuple[Any, ...]], bool]: As condicionais compiladas.
+    """
+    tests: List[RowPredicate] = [compile_predicate(predicate, schema) for predicate in predicates]
+    return lambda row: all(test(row) is True for test in tests)
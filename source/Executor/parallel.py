@@ -0,0 +1,159 @@
+"""Arquivo responsável pela junção particionada e paralela: as
+chaves das duas entradas são particionadas (radix) pelo seu hash, e
+cada par de partições é unido em um processo separado."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+# A constante multiplicativa (razão áurea, 64 bits) usada no hash das chaves.
+GOLDEN_RATIO: np.uint64 = np.uint64(0x9E3779B97F4A7C15)
+
+# A quantia mínima de linhas (somadas as duas entradas) para unir em processos.
+PARALLEL_THRESHOLD: int = 1 << 17
+
+# As posições dos pares de linhas (esquerda, direita) de uma junção.
+Pairs = Tuple[np.ndarray, np.ndarray]
+
+def key_codes(left: np.ndarray, right: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Converte as chaves das duas entradas em inteiros de 64 bits, iguais
+    somente quando as chaves são iguais.
+
+    Inteiros são usados diretamente e reais pelos seus bits; as demais
+    chaves (textos) são codificadas por um dicionário comum às duas entradas.
+
+    Args:
+        left (np.ndarray): As chaves (não nulas) da entrada esquerda.
+        right (np.ndarray): As chaves (não nulas) da entrada direita.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Os códigos das chaves de cada entrada.
+    """
+    kinds: str = left.dtype.kind + right.dtype.kind
+    if set(kinds) <= set("iub"):
+        return (left.astype(np.int64, copy=False), right.astype(np.int64, copy=False))
+    if set(kinds) <= set("iubf"):
+        # Somar 0.0 transforma -0.0 em 0.0, que são iguais.
+        return tuple(
+            (np.asarray(keys, dtype=np.float64) + 0.0).view(np.int64)
+            for keys in (left, right)
+        )
+    if left.dtype.kind == right.dtype.kind == "U":
+        (_, codes) = np.unique(np.concatenate([left, right]), return_inverse=True)
+        codes = codes.astype(np.int64, copy=False)
+        return (codes[:len(left)], codes[len(left):])
+    # Chaves de tipos mistos: a igualdade do Python decide.
+    dictionary: Dict[Any, int] = {}
+    return tuple(
+        np.fromiter((dictionary.setdefault(key, len(dictionary)) for key in keys.tolist()), dtype=np.int64, count=len(keys))
+        for keys in (left, right)
+    )
+
+def radix_partition(codes: np.ndarray, bits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Particiona as chaves pelos 'bits' mais altos do seu hash multiplicativo.
+
+    Args:
+        codes (np.ndarray): Os códigos das chaves.
+        bits (int): A quantia de bits (2^bits partições).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: As posições das chaves, agrupadas por
+        partição, e os limites de cada partição nessas posições
+        (2^bits + 1 valores).
+    """
+    if bits == 0:
+        return (np.arange(len(codes)), np.array([0, len(codes)]))
+    hashes: np.ndarray = codes.view(np.uint64) * GOLDEN_RATIO
+    partitions: np.ndarray = (hashes >> np.uint64(64 - bits)).astype(np.intp)
+    order: np.ndarray = np.argsort(partitions, kind="stable")
+    bounds: np.ndarray = np.zeros((1 << bits) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(partitions, minlength=1 << bits), out=bounds[1:])
+    return (order, bounds)
+
+def join_partition(left: np.ndarray, right: np.ndarray) -> Pairs:
+    """Une um par de partições: as chaves da direita são ordenadas e as
+    da esquerda encontram os seus pares com buscas binárias vetorizadas.
+
+    Executada nos processos da junção.
+
+    Args:
+        left (np.ndarray): Os códigos das chaves da partição da esquerda.
+        right (np.ndarray): Os códigos das chaves da partição da direita.
+
+    Returns:
+        Pairs: As posições (na partição) dos pares de linhas.
+    """
+    order: np.ndarray = np.argsort(right, kind="stable")
+    keys: np.ndarray = right[order]
+    low: np.ndarray = np.searchsorted(keys, left, side="left")
+    counts: np.ndarray = np.searchsorted(keys, left, side="right") - low
+    total: int = int(counts.sum())
+    offsets: np.ndarray = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return (np.repeat(np.arange(len(left)), counts), order[np.repeat(low, counts) + offsets])
+
+def parallel_join(
+        left: np.ndarray,
+        right: np.ndarray,
+        workers: int,
+        pool: Union[ProcessPoolExecutor, None] = None,
+        partitions_per_worker: int = 4) -> Pairs:
+    """Une duas entradas pelas suas chaves, com as partições distribuídas
+    entre 'workers' processos.
+
+    Args:
+        left (np.ndarray): As chaves (não nulas) da entrada esquerda.
+        right (np.ndarray): As chaves (não nulas) da entrada direita.
+        workers (int): A quantia de processos; com 1, as partições são
+        unidas no processo atual.
+        pool (ProcessPoolExecutor | None, optional): Os processos, com
+        'workers' processos, reaproveitados entre as junções (veja
+        'VectorizedExecutor'). Valor padrão: None (as partições são
+        unidas no processo atual).
+        partitions_per_worker (int, optional): As partições por processo,
+        que equilibram a carga entre os processos. Valor padrão: 4.
+
+    Returns:
+        Pairs: As posições dos pares de linhas nas duas entradas, agrupados
+        por partição.
+    """
+    (left_codes, right_codes) = key_codes(left, right)
+    bits: int = max(0, (workers * partitions_per_worker - 1).bit_length()) if workers > 1 else 0
+    (left_order, left_bounds) = radix_partition(left_codes, bits)
+    (right_order, right_bounds) = radix_partition(right_codes, bits)
+    # As posições das linhas de cada par de partições não vazio.
+    partitions: List[Tuple[np.ndarray, np.ndarray]] = [
+        (left_order[left_bounds[part]:left_bounds[part + 1]], right_order[right_bounds[part]:right_bounds[part + 1]])
+        for part in range(len(left_bounds) - 1)
+        if left_bounds[part] < left_bounds[part + 1] and right_bounds[part] < right_bounds[part + 1]
+    ]
+    arguments: Tuple[List[np.ndarray], List[np.ndarray]] = (
+        [left_codes[rows] for rows, _ in partitions],
+        [right_codes[rows] for _, rows in partitions]
+    )
+
+    results: List[Pairs]
+    if pool is not None and workers > 1 and len(partitions) > 1:
+        results = list(pool.map(join_partition, *arguments))
+    else:
+        results = list(map(join_partition, *arguments))
+
+    pairs: List[Pairs] = [
+        (left_rows[left_pairs], right_rows[right_pairs])
+        for (left_rows, right_rows), (left_pairs, right_pairs) in zip(partitions, results)
+    ]
+    if not pairs:
+        return (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+    return (np.concatenate([pair[0] for pair in pairs]), np.concatenate([pair[1] for pair in pairs]))
+
+def valid_rows(nulls: Union[np.ndarray, None], size: int) -> np.ndarray:
+    """Retorna as posições das linhas com chave não nula.
+
+    Args:
+        nulls (np.ndarray | None): A máscara dos nulos das chaves.
+        size (int): A quantia de linhas.
+
+    Returns:
+        np.ndarray: As posições das linhas não nulas.
+    """
+    return np.flatnonzero(~nulls) if nulls is not None else np.arange(size)
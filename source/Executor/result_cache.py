@@ -0,0 +1,356 @@
+"""Arquivo responsável pelo cache dos resultados dos comandos SQL
+executados, indexados pelo comando normalizado e invalidados quando
+alguma tabela do comando recebe novas linhas."""
+
+import re
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Iterable, List, Set, Tuple, Union
+
+# pylint: disable=import-error
+from Executor.executor import Executor
+from Executor.volcano import Row
+from Parser.lexer import Lexer
+from Parser.parser import Parser
+from RelationalAlgebra.Converter import Converter
+from Storage import Table
+
+# A tabela (sem impedir a sua remoção da memória) e a versão lida de cada tabela do comando.
+TableVersions = Tuple[Tuple[str, 'weakref.ref[Table]', int], ...]
+# O comando normalizado e a sua Álgebra Relacional (veja 'cache_key').
+CacheKey = Tuple[str, str]
+
+def normalize(sql_command: str) -> str:
+    """Normaliza um comando SQL: fora dos literais, as letras ficam em
+    minúsculo, os espaços em branco são reduzidos a um e removidos ao
+    redor dos operadores, vírgulas e parênteses.
+
+    Args:
+        sql_command (str): O comando SQL.
+
+    Returns:
+        str: O comando normalizado; os literais são mantidos.
+    """
+    command: str = sql_command.strip()
+    parts: List[str] = []
+    start: int = 0
+    for (literal_start, literal_end) in Lexer(command).literals + [(len(command), len(command))]:
+        text: str = " ".join(command[start:literal_start].split()).casefold()
+        parts.append(re.sub(r" ?([=<>!,();]) ?", r"\1", text))
+        parts.append(command[literal_start:literal_end])
+        start = literal_end
+    return "".join(parts)
+
+def cache_key(converter: Converter) -> CacheKey:
+    """Retorna a chave de um comando SQL convertido no cache.
+
+    O comando de um PreparedStatement mantém os literais sentinelas no
+    lugar dos marcadores; os parâmetros atribuídos (bind) aparecem somente
+    na Álgebra Relacional, que também compõe a chave.
+
+    Args:
+        converter (Converter): O Conversor, com o comando SQL já convertido.
+
+    Returns:
+        CacheKey: O comando normalizado e a sua Álgebra Relacional.
+    """
+    return (normalize(converter.parser.sql_command), converter.relational_algebra)
+
+def parser_tables(parser: Parser) -> Set[str]:
+    """Retorna as tabelas usadas por um comando SQL e pelas suas subconsultas.
+
+    Args:
+        parser (Parser): O Parser do comando, já verificado no contexto
+        do banco de dados ('check_database_compatibility').
+
+    Returns:
+        Set[str]: O nome das tabelas, em minúsculo.
+    """
+    tables: Set[str] = {table.casefold() for names in parser.sql_tables.values() for table in names}
+    for subquery in parser.sql_subqueries.values():
+        tables |= parser_tables(subquery)
+    return tables
+
+def result_size(rows: Iterable[Row]) -> int:
+    """Estima a memória ocupada por um resultado.
+
+    Args:
+        rows (Iterable[Row]): As linhas do resultado.
+
+    Returns:
+        int: A quantia aproximada de bytes das linhas e dos seus valores.
+    """
+    size: int = 0
+    count: int = 0
+    for row in rows:
+        size += sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+        count += 1
+    return size + sys.getsizeof([]) + 8 * count
+
+class ResultCache:
+    """Classe responsável pelo cache LRU dos resultados dos comandos SQL.
+
+    Cada resultado é indexado pelo comando normalizado ('cache_key') e
+    guarda a versão de cada tabela lida (as tabelas de 'Parser.sql_tables',
+    inclusive das subconsultas). Caso alguma dessas tabelas tenha recebido
+    linhas, ou sido substituída no catálogo, o resultado é invalidado e o
+    comando é executado novamente.
+
+    O cache é limitado pela memória estimada dos resultados ('max_bytes'):
+    os resultados menos usados recentemente são removidos primeiro, e
+    resultados maiores que o limite não são armazenados.
+    """
+
+    # O executor dos comandos SQL não encontrados no cache.
+    __executor: Executor
+    # A quantia máxima de bytes (estimada) dos resultados armazenados.
+    __max_bytes: int
+    # Os resultados armazenados, do comando normalizado às versões das tabelas, ao resultado e ao seu tamanho.
+    __entries: "OrderedDict[CacheKey, Tuple[TableVersions, Tuple[Row, ...], int]]"
+    # A quantia de bytes (estimada) dos resultados armazenados.
+    __size: int
+    # Os contadores de acertos, falhas, remoções e invalidações do cache.
+    __hits: int
+    __misses: int
+    __evictions: int
+    __invalidations: int
+
+    def __init__(self, executor: Executor, max_bytes: int = 64 << 20) -> None:
+        """Construtor da classe.
+
+        Args:
+            executor (Executor): O executor dos comandos SQL, com o
+            catálogo dos dados das tabelas.
+            max_bytes (int, optional): A quantia máxima de bytes
+            (estimada) dos resultados armazenados. Valor padrão: 64 MiB.
+        """
+        self.__executor = executor
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+        self.max_bytes = max_bytes
+
+    @property
+    def executor(self) -> Executor:
+        """Extrai o conteúdo da variável privada executor.
+
+        Returns:
+            Executor: O executor dos comandos SQL.
+        """
+        return self.__executor
+
+    @property
+    def max_bytes(self) -> int:
+        """Extrai o conteúdo da variável privada max_bytes.
+
+        Returns:
+            int: A quantia máxima de bytes dos resultados armazenados.
+        """
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, new_max_bytes: int) -> None:
+        """Altera o conteúdo da variável privada max_bytes, removendo
+        os resultados menos usados recentemente caso necessário.
+
+        Args:
+            new_max_bytes (int): A nova quantia máxima de bytes, deve
+            ser maior que zero.
+        """
+        if new_max_bytes < 1:
+            raise ValueError("O tamanho do cache deve ser maior que zero.")
+        self.__max_bytes = new_max_bytes
+        self.__evict()
+
+    @property
+    def size(self) -> int:
+        """Extrai o conteúdo da variável privada size.
+
+        Returns:
+            int: A quantia de bytes (estimada) dos resultados armazenados.
+        """
+        return self.__size
+
+    @property
+    def hits(self) -> int:
+        """Extrai o conteúdo da variável privada hits.
+
+        Returns:
+            int: A quantia de comandos respondidos pelo cache.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Extrai o conteúdo da variável privada misses.
+
+        Returns:
+            int: A quantia de comandos executados (ausentes ou invalidados).
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Extrai o conteúdo da variável privada evictions.
+
+        Returns:
+            int: A quantia de resultados removidos por falta de espaço.
+        """
+        return self.__evictions
+
+    @property
+    def invalidations(self) -> int:
+        """Extrai o conteúdo da variável privada invalidations.
+
+        Returns:
+            int: A quantia de resultados removidos por mudanças nas tabelas.
+        """
+        return self.__invalidations
+
+    @property
+    def hit_rate(self) -> float:
+        """Retorna a taxa de acertos do cache.
+
+        Returns:
+            float: A fração dos comandos respondidos pelo cache (0 caso
+            nenhum comando tenha sido executado).
+        """
+        total: int = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Retorna a quantia de resultados armazenados no cache.
+
+        Returns:
+            int: A quantia de resultados armazenados.
+        """
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        """Remove todos os resultados do cache, mantendo os contadores."""
+        self.__entries.clear()
+        self.__size = 0
+
+    def execute(self, converter: Converter, vectorized: bool = False) -> List[Row]:
+        """Executa o comando SQL convertido, reaproveitando o resultado do
+        cache caso as tabelas do comando não tenham mudado.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+            vectorized (bool, optional): Verdadeiro para executar no modo
+            vetorizado. Valor padrão: False.
+
+        Returns:
+            List[Row]: As linhas do resultado.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        key: CacheKey = cache_key(converter)
+        versions: TableVersions = self.__table_versions(converter.parser)
+        entry: Union[Tuple[TableVersions, Tuple[Row, ...], int], None] = self.__entries.get(key)
+        if entry is not None:
+            if self.__is_valid(entry[0], versions):
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+                return list(entry[1])
+            self.__invalidations += 1
+            self.__remove(key)
+
+        self.__misses += 1
+        rows: Tuple[Row, ...] = tuple(self.executor.execute(converter, vectorized))
+        size: int = result_size(rows)
+        if size <= self.__max_bytes:
+            self.__entries[key] = (versions, rows, size)
+            self.__size += size
+            self.__evict()
+        return list(rows)
+
+    def purge(self) -> int:
+        """Remove os resultados cujas tabelas mudaram desde a sua execução.
+
+        Os resultados inválidos também são removidos quando o seu comando
+        é executado novamente, ou antes dos demais quando falta espaço.
+
+        Returns:
+            int: A quantia de resultados removidos.
+        """
+        stale: List[CacheKey] = [
+            key for key, (versions, _, _) in self.__entries.items()
+            if not self.__is_valid(versions, self.__current_versions(name for name, _, _ in versions))
+        ]
+        for key in stale:
+            self.__remove(key)
+        self.__invalidations += len(stale)
+        return len(stale)
+
+    def __current_versions(self, names: Iterable[str]) -> TableVersions:
+        """Lê a versão atual de algumas tabelas.
+
+        Args:
+            names (Iterable[str]): O nome das tabelas, em minúsculo.
+
+        Returns:
+            TableVersions: A tabela e a versão de cada tabela com dados
+            anexados ao catálogo, na ordem de 'names'.
+        """
+        versions: List[Tuple[str, 'weakref.ref[Table]', int]] = []
+        for name in names:
+            table: Union[Table, None] = self.executor.catalog.table(name)
+            if table is not None:
+                versions.append((name, weakref.ref(table), table.version))
+        return tuple(versions)
+
+    def __table_versions(self, parser: Parser) -> TableVersions:
+        """Lê a versão atual de cada tabela do comando.
+
+        Args:
+            parser (Parser): O Parser do comando.
+
+        Returns:
+            TableVersions: A tabela e a versão de cada tabela com dados
+            anexados, em ordem alfabética.
+        """
+        return self.__current_versions(sorted(parser_tables(parser)))
+
+    @staticmethod
+    def __is_valid(stored: TableVersions, current: TableVersions) -> bool:
+        """Verifica se um resultado armazenado ainda corresponde às tabelas.
+
+        Args:
+            stored (TableVersions): As tabelas e versões lidas pelo resultado.
+            current (TableVersions): As tabelas e versões atuais.
+
+        Returns:
+            bool: Verdadeiro caso as mesmas tabelas estejam anexadas, nas
+            mesmas versões.
+        """
+        return len(stored) == len(current) and all(
+            name == current_name and reference() is current_reference() and version == current_version
+            for (name, reference, version), (current_name, current_reference, current_version) in zip(stored, current)
+        )
+
+    def __remove(self, key: CacheKey) -> None:
+        """Remove um resultado do cache.
+
+        Args:
+            key (CacheKey): A chave do comando ('cache_key').
+        """
+        (_, _, size) = self.__entries.pop(key)
+        self.__size -= size
+
+    def __evict(self) -> None:
+        """Remove os resultados menos usados recentemente, até que o
+        cache respeite a quantia máxima de bytes. Os resultados
+        inválidos são removidos antes.
+        """
+        if self.__size > self.__max_bytes:
+            self.purge()
+        while self.__size > self.__max_bytes:
+            self.__remove(next(iter(self.__entries)))
+            self.__evictions += 1
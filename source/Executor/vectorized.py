@@ -0,0 +1,1203 @@
+"""Arquivo responsável pela execução vetorizada: os operadores
+processam lotes de linhas, armazenados em colunas (vetores NumPy),
+em vez de uma linha por vez."""
+
+import itertools
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+# pylint: disable=import-error
+import Exceptions
+from Catalog import Catalog, MaterializedView
+from Executor.explain import NodeStatistics, PlanAnalysis
+from Executor.expressions import COMPARISONS, Schema, ValueSet, join_keys, read_columns, resolve_column, star_columns
+from Executor.parallel import PARALLEL_THRESHOLD, parallel_join, valid_rows
+from Executor.volcano import Row
+from Parser.sql_ast import ColumnRef, Comparison, InSubquery, Literal, Predicate
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter, Node
+from Storage import Index, MappedColumn, Table
+from Storage.columnar import INT, TEXT
+
+# Uma coluna vetorizada: os valores e a máscara dos nulos (None caso a
+# coluna não possua nulos). A posição de um nulo guarda um valor qualquer.
+Column = Tuple[np.ndarray, Union[np.ndarray, None]]
+
+# Uma condicional compilada: recebe um lote e retorna a máscara das
+# linhas em que a condicional é verdadeira (desconhecido é falso).
+BatchPredicate = Callable[['Batch'], np.ndarray]
+
+def to_column(values: Sequence[Any]) -> Column:
+    """Converte os valores de uma coluna em um vetor NumPy.
+
+    Colunas somente com inteiros (ou reais) e somente com textos usam
+    tipos nativos do NumPy; as demais usam objetos do Python.
+
+    Args:
+        values (Sequence[Any]): Os valores da coluna (None representa NULL).
+
+    Returns:
+        Column: O vetor dos valores e a máscara dos nulos.
+    """
+    nulls: np.ndarray = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    has_nulls: bool = bool(nulls.any())
+    present: Sequence[Any] = [value for value in values if value is not None] if has_nulls else values
+    types: set = set(map(type, present))
+
+    dtype: Any = object
+    fill: Any = present[0] if present else None
+    if types and types <= {int, bool}:
+        (dtype, fill) = (bool if types == {bool} else np.int64, 0)
+    elif types and types <= {int, float, bool}:
+        (dtype, fill) = (np.float64, 0.0)
+    elif types == {str}:
+        (dtype, fill) = (str, "")
+
+    filled: Sequence[Any] = [fill if value is None else value for value in values] if has_nulls else values
+    try:
+        array: np.ndarray = np.array(filled, dtype=dtype)
+    except OverflowError:
+        array = np.array(filled, dtype=object)
+    return (array, nulls if has_nulls else None)
+
+class Batch:
+    """Representa um lote de linhas, armazenado em colunas."""
+
+    __slots__ = ("values", "nulls", "size")
+
+    def __init__(self, values: List[np.ndarray], nulls: List[Union[np.ndarray, None]], size: int) -> None:
+        """Construtor da classe.
+
+        Args:
+            values (List[np.ndarray]): Os valores de cada coluna.
+            nulls (List[np.ndarray | None]): A máscara dos nulos de cada coluna.
+            size (int): A quantia de linhas do lote.
+        """
+        self.values = values
+        self.nulls = nulls
+        self.size = size
+
+    @staticmethod
+    def concatenate(batches: List['Batch'], width: int) -> 'Batch':
+        """Une vários lotes, com as mesmas colunas, em um único lote.
+
+        Args:
+            batches (List[Batch]): Os lotes.
+            width (int): A quantia de colunas (usada caso não haja lotes).
+
+        Returns:
+            Batch: O lote com todas as linhas, na ordem dos lotes.
+        """
+        if not batches:
+            return Batch([np.empty(0, dtype=object) for _ in range(width)], [None] * width, 0)
+        if len(batches) == 1:
+            return batches[0]
+        nulls: List[Union[np.ndarray, None]] = []
+        for column in range(width):
+            masks: List[Union[np.ndarray, None]] = [batch.nulls[column] for batch in batches]
+            nulls.append(None if all(mask is None for mask in masks) else np.concatenate([
+                mask if mask is not None else np.zeros(batch.size, dtype=bool)
+                for mask, batch in zip(masks, batches)
+            ]))
+        return Batch(
+            [np.concatenate([batch.values[column] for batch in batches]) for column in range(width)],
+            nulls,
+            sum(batch.size for batch in batches)
+        )
+
+    def column(self, position: int) -> Column:
+        """Retorna uma coluna do lote.
+
+        Args:
+            position (int): A posição da coluna.
+
+        Returns:
+            Column: Os valores e a máscara dos nulos da coluna.
+        """
+        return (self.values[position], self.nulls[position])
+
+    def take(self, selection: np.ndarray) -> 'Batch':
+        """Seleciona linhas do lote.
+
+        Args:
+            selection (np.ndarray): Uma máscara booleana, ou as posições
+            das linhas (podendo repetir posições).
+
+        Returns:
+            Batch: Um novo lote com as linhas selecionadas.
+        """
+        return Batch(
+            [column[selection] for column in self.values],
+            [mask[selection] if mask is not None else None for mask in self.nulls],
+            int(np.count_nonzero(selection)) if selection.dtype == bool else len(selection)
+        )
+
+    def pick(self, positions: List[int]) -> 'Batch':
+        """Seleciona colunas do lote, sem copiar os valores.
+
+        Args:
+            positions (List[int]): As posições das colunas.
+
+        Returns:
+            Batch: Um novo lote com as colunas selecionadas.
+        """
+        return Batch([self.values[p] for p in positions], [self.nulls[p] for p in positions], self.size)
+
+    def combine(self, other: 'Batch') -> 'Batch':
+        """Une, lado a lado, as colunas de dois lotes com a mesma quantia de linhas.
+
+        Args:
+            other (Batch): O lote à direita.
+
+        Returns:
+            Batch: As colunas deste lote seguidas das colunas de 'other'.
+        """
+        return Batch(self.values + other.values, self.nulls + other.nulls, self.size)
+
+    def rows(self) -> Iterator[Row]:
+        """Converte o lote em linhas.
+
+        Returns:
+            Iterator[Row]: As linhas do lote, com None nas posições nulas.
+        """
+        columns: List[List[Any]] = []
+        for values, nulls in zip(self.values, self.nulls):
+            column: List[Any] = values.tolist()
+            if nulls is not None:
+                for position in np.flatnonzero(nulls).tolist():
+                    column[position] = None
+            columns.append(column)
+        return zip(*columns)
+
+def mapped_column(column: MappedColumn) -> Column:
+    """Converte uma coluna mapeada na memória ('Storage.MappedTable') em um vetor NumPy.
+
+    Os números são lidos diretamente dos arquivos mapeados, sem cópia;
+    somente os textos são convertidos.
+
+    Args:
+        column (MappedColumn): A coluna mapeada.
+
+    Returns:
+        Column: O vetor dos valores e a máscara dos nulos.
+    """
+    nulls: Union[np.ndarray, None] = np.frombuffer(column.nulls, dtype=bool) if column.nulls is not None else None
+    if nulls is not None and not nulls.any():
+        nulls = None
+    if column.kind != TEXT:
+        return (np.frombuffer(column.values, dtype=np.int64 if column.kind == INT else np.float64), nulls)
+
+    # Os textos são copiados para uma matriz de bytes, uma linha por
+    # valor, e decodificados de uma única vez.
+    offsets: np.ndarray = np.frombuffer(column.values, dtype=np.int64)
+    data: np.ndarray = np.frombuffer(column.data, dtype=np.uint8)[offsets[0]:offsets[-1]]
+    lengths: np.ndarray = np.diff(offsets)
+    width: int = max(1, int(lengths.max(initial=0)))
+    matrix: np.ndarray = np.zeros((len(lengths), width), dtype=np.uint8)
+    matrix[
+        np.repeat(np.arange(len(lengths)), lengths),
+        np.arange(len(data)) - np.repeat(offsets[:-1] - offsets[0], lengths)
+    ] = data
+    encoded: np.ndarray = matrix.view(f"S{width}").ravel()
+    values: np.ndarray = (
+        encoded.astype(f"U{width}") if not (data >= 0x80).any()
+        else np.char.decode(encoded, "utf-8").astype(str)
+    )
+    return (values, nulls)
+
+def valid(column: Column, size: int) -> np.ndarray:
+    """Retorna a máscara das linhas não nulas de uma coluna.
+
+    Args:
+        column (Column): A coluna.
+        size (int): A quantia de linhas.
+
+    Returns:
+        np.ndarray: Verdadeiro nas linhas não nulas.
+    """
+    return ~column[1] if column[1] is not None else np.ones(size, dtype=bool)
+
+def comparable_kinds(left: str, right: str) -> bool:
+    """Verifica se o NumPy compara dois vetores como o Python: números
+    com números, ou textos com textos.
+
+    Args:
+        left (str): O tipo ('dtype.kind') do primeiro vetor.
+        right (str): O tipo ('dtype.kind') do segundo vetor.
+
+    Returns:
+        bool: Verdadeiro caso os vetores sejam comparáveis; vetores de
+        objetos nunca são.
+    """
+    return (left in "biuf" and right in "biuf") or left == right == "U"
+
+def compare(left: Any, operator_name: str, right: Any, size: int) -> np.ndarray:
+    """Compara, elemento a elemento, dois vetores (ou um vetor e um valor).
+
+    Args:
+        left (Any): O vetor à esquerda.
+        operator_name (str): O operador de comparação.
+        right (Any): O vetor, ou o valor, à direita.
+        size (int): A quantia de linhas.
+
+    Returns:
+        np.ndarray: O resultado da comparação de cada linha. Os valores de
+        tipos não comparáveis (como um texto e um número) resultam em
+        falso, como no modo por linhas ('compile_predicate').
+    """
+    operation: Callable[[Any, Any], Any] = COMPARISONS[operator_name]
+    try:
+        result: Any = operation(left, right)
+    except TypeError:
+        # Compara elemento a elemento: um vetor de objetos pode misturar tipos comparáveis ou não.
+        def element(first: Any, second: Any) -> bool:
+            try:
+                return bool(operation(first, second))
+            except TypeError:
+                return False
+        rights: Iterable[Any] = right if isinstance(right, np.ndarray) else itertools.repeat(right)
+        return np.fromiter(map(element, left, rights), dtype=bool, count=size)
+    # Tipos não comparáveis por igualdade resultam em um único valor.
+    return result if isinstance(result, np.ndarray) else np.full(size, bool(result))
+
+def compile_isin(position: int, values: ValueSet, negated: bool) -> BatchPredicate:
+    """Compila um IN (ou NOT IN) sobre uma coluna, com a lógica de três valores do SQL.
+
+    Os valores do mesmo tipo da coluna (números ou textos) são separados
+    em um vetor uma única vez, no primeiro lote de cada tipo, e não a cada
+    lote; cada lote é verificado com o 'np.isin' (por tabela, nas chaves
+    inteiras). As colunas de objetos usam o conjunto de hash.
+
+    Args:
+        position (int): A posição da coluna verificada.
+        values (ValueSet): Os valores da lista (ou da subconsulta).
+        negated (bool): Verdadeiro caso seja um NOT IN.
+
+    Returns:
+        BatchPredicate: A máscara das linhas em que a condicional é verdadeira.
+    """
+    # Os valores de cada tipo de coluna: números ('f') ou textos ('U').
+    candidates: Dict[str, np.ndarray] = {}
+
+    def typed_candidates(kind: str) -> np.ndarray:
+        if kind not in candidates:
+            if kind == "f":
+                typed: List[Any] = [value for value in values.values if isinstance(value, (int, float))]
+            else:
+                typed = [value for value in values.values if isinstance(value, str)]
+            candidates[kind] = np.array(typed) if typed else np.empty(0)
+        return candidates[kind]
+
+    def matches(array: np.ndarray) -> np.ndarray:
+        if array.dtype == object:
+            return np.fromiter((value in values.values for value in array), dtype=bool, count=len(array))
+        typed: np.ndarray = typed_candidates("f" if array.dtype.kind in "biuf" else "U")
+        if not len(typed):
+            return np.zeros(len(array), dtype=bool)
+        return np.isin(array, typed)
+
+    def mask(batch: Batch) -> np.ndarray:
+        # Um IN sobre uma lista vazia é sempre falso, e um NOT IN, sempre verdadeiro.
+        if values.is_empty:
+            return np.full(batch.size, negated)
+        column: Column = batch.column(position)
+        if not negated:
+            return matches(column[0]) & valid(column, batch.size)
+        # Um NOT IN com um nulo na lista nunca é verdadeiro.
+        if values.has_null:
+            return np.zeros(batch.size, dtype=bool)
+        return ~matches(column[0]) & valid(column, batch.size)
+
+    return mask
+
+def compile_mask(predicate: Predicate, schema: Schema) -> BatchPredicate:
+    """Compila uma condicional em uma função sobre os lotes de um operador.
+
+    Os IN e NOT IN com subconsultas são avaliados por semijunções (veja
+    'BatchSemiJoin'), e não por condicionais.
+
+    Args:
+        predicate (Predicate): A condicional.
+        schema (Schema): As colunas dos lotes.
+
+    Returns:
+        BatchPredicate: A condicional compilada.
+
+    Raises:
+        ValueError: Caso a condicional seja um IN (ou NOT IN) com uma subconsulta.
+    """
+    if isinstance(predicate, ColumnRef):
+        position: int = resolve_column(schema, predicate)
+        return lambda batch: batch.values[position].astype(bool) & valid(batch.column(position), batch.size)
+
+    if isinstance(predicate, Comparison):
+        left: int = resolve_column(schema, predicate.left)
+        if isinstance(predicate.right, Literal):
+            literal: Any = predicate.right.value
+            if literal is None:
+                return lambda batch: np.zeros(batch.size, dtype=bool)
+            return lambda batch: (
+                compare(batch.values[left], predicate.operator, literal, batch.size)
+                & valid(batch.column(left), batch.size)
+            )
+        right: int = resolve_column(schema, predicate.right)
+        return lambda batch: (
+            compare(batch.values[left], predicate.operator, batch.values[right], batch.size)
+            & valid(batch.column(left), batch.size) & valid(batch.column(right), batch.size)
+        )
+
+    if isinstance(predicate, InSubquery):
+        raise ValueError(f"A subconsulta de {predicate.column} deve ser avaliada por uma semijunção.")
+    position = resolve_column(schema, predicate.column)
+    return compile_isin(position, ValueSet(value.value for value in predicate.values), predicate.negated)
+
+def compile_masks(predicates: List[Predicate], schema: Schema) -> BatchPredicate:
+    """Compila condicionais unidas por AND em uma única máscara.
+
+    Args:
+        predicates (List[Predicate]): As condicionais.
+        schema (Schema): As colunas dos lotes.
+
+    Returns:
+        BatchPredicate: As condicionais compiladas.
+    """
+    masks: List[BatchPredicate] = [compile_mask(predicate, schema) for predicate in predicates]
+
+    def conjunction(batch: Batch) -> np.ndarray:
+        result: np.ndarray = np.ones(batch.size, dtype=bool)
+        for mask in masks:
+            result &= mask(batch)
+        return result
+
+    return conjunction
+
+class BatchOperator(ABC):
+    """Representa um operador físico vetorizado.
+
+    Segue o mesmo protocolo dos operadores de linhas ('open', 'next' e
+    'close'), mas cada chamada de 'next' produz um lote de linhas.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Schema) -> None:
+        """Construtor da classe.
+
+        Args:
+            columns (Schema): As colunas dos lotes produzidos.
+        """
+        self.columns = columns
+
+    @abstractmethod
+    def open(self) -> None:
+        """Prepara o operador (e as suas entradas) para produzir lotes."""
+
+    @abstractmethod
+    def next(self) -> Union[Batch, None]:
+        """Produz o próximo lote.
+
+        Returns:
+            Batch | None: O próximo lote, ou None caso não haja mais linhas.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Libera o estado do operador (e das suas entradas)."""
+
+    def __iter__(self) -> Iterator[Batch]:
+        """Abre o operador e percorre todos os seus lotes, fechando-o ao final.
+
+        Returns:
+            Iterator[Batch]: Os lotes produzidos.
+        """
+        self.open()
+        try:
+            while (batch := self.next()) is not None:
+                yield batch
+        finally:
+            self.close()
+
+    def materialize(self) -> Batch:
+        """Executa o operador e une todos os seus lotes.
+
+        Returns:
+            Batch: Todas as linhas produzidas, em um único lote.
+        """
+        return Batch.concatenate(list(self), len(self.columns))
+
+class ColumnScan(BatchOperator):
+    """Operador de leitura, em lotes, das colunas de uma tabela.
+
+    Os lotes são fatias (views) dos vetores das colunas, sem cópia.
+    """
+
+    __slots__ = ("table_columns", "batch_size", "__start")
+
+    def __init__(self, table_columns: List[Column], columns: Schema, batch_size: int) -> None:
+        """Construtor da classe.
+
+        Args:
+            table_columns (List[Column]): Os vetores das colunas da tabela.
+            columns (Schema): As colunas, com o nome da tabela.
+            batch_size (int): A quantia máxima de linhas por lote.
+        """
+        super().__init__(columns)
+        self.table_columns = table_columns
+        self.batch_size = batch_size
+        self.__start: int = 0
+
+    def open(self) -> None:
+        self.__start = 0
+
+    def next(self) -> Union[Batch, None]:
+        size: int = len(self.table_columns[0][0]) if self.table_columns else 0
+        if self.__start >= size:
+            return None
+        (start, end) = (self.__start, min(size, self.__start + self.batch_size))
+        self.__start = end
+        return Batch(
+            [values[start:end] for values, _ in self.table_columns],
+            [nulls[start:end] if nulls is not None else None for _, nulls in self.table_columns],
+            end - start
+        )
+
+    def close(self) -> None:
+        self.__start = 0
+
+class IndexColumnScan(BatchOperator):
+    """Operador de leitura, em lotes, somente das linhas de uma tabela
+    encontradas por um índice secundário.
+
+    As posições são buscadas no índice a cada abertura; as linhas são
+    copiadas dos vetores das colunas, em ordem crescente de posição.
+    """
+
+    __slots__ = ("scan", "index", "predicates", "__rows", "__start")
+
+    def __init__(self, scan: ColumnScan, index: Index, predicates: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            scan (ColumnScan): A leitura completa da tabela.
+            index (Index): O índice da tabela.
+            predicates (List[Predicate]): As condicionais (unidas por AND)
+            respondidas pelo índice.
+        """
+        super().__init__(scan.columns)
+        self.scan = scan
+        self.index = index
+        self.predicates = predicates
+        self.__rows: np.ndarray = np.empty(0, dtype=np.int64)
+        self.__start: int = 0
+
+    def open(self) -> None:
+        self.__rows = np.asarray(self.index.lookup_all(self.predicates), dtype=np.int64)
+        self.__start = 0
+
+    def next(self) -> Union[Batch, None]:
+        if self.__start >= len(self.__rows):
+            return None
+        rows: np.ndarray = self.__rows[self.__start:self.__start + self.scan.batch_size]
+        self.__start += len(rows)
+        return Batch(
+            [values[rows] for values, _ in self.scan.table_columns],
+            [nulls[rows] if nulls is not None else None for _, nulls in self.scan.table_columns],
+            len(rows)
+        )
+
+    def close(self) -> None:
+        self.__rows = np.empty(0, dtype=np.int64)
+        self.__start = 0
+
+class BatchEmptyRelation(BatchOperator):
+    """Operador de uma relação vazia: não produz lotes, nem lê as suas
+    entradas (como uma tabela com condicionais contraditórias, veja
+    'plan.EmptyScan')."""
+
+    __slots__ = ()
+
+    def open(self) -> None:
+        pass
+
+    def next(self) -> Union[Batch, None]:
+        return None
+
+    def close(self) -> None:
+        pass
+
+class AnalyzedBatchOperator(BatchOperator):
+    """Operador de medição vetorizado: repassa as chamadas ao operador de
+    um nó, medindo-as (veja 'PlanAnalysis.measure')."""
+
+    __slots__ = ("operator", "analysis", "statistics")
+
+    def __init__(self, operator: BatchOperator, analysis: PlanAnalysis, statistics: NodeStatistics) -> None:
+        """Construtor da classe.
+
+        Args:
+            operator (BatchOperator): O operador medido.
+            analysis (PlanAnalysis): A análise da execução.
+            statistics (NodeStatistics): As medidas do nó do operador.
+        """
+        super().__init__(operator.columns)
+        self.operator = operator
+        self.analysis = analysis
+        self.statistics = statistics
+
+    def open(self) -> None:
+        self.statistics.loops += 1
+        self.analysis.measure(self.statistics, self.operator.open, opening=True)
+
+    def next(self) -> Union[Batch, None]:
+        batch: Union[Batch, None] = self.analysis.measure(self.statistics, self.operator.next)
+        if batch is not None:
+            self.statistics.rows_out += batch.size
+            self.statistics.batches += 1
+        return batch
+
+    def close(self) -> None:
+        self.analysis.measure(self.statistics, self.operator.close)
+
+class BatchFilter(BatchOperator):
+    """Operador de seleção (σ) vetorizado: cada condicional produz uma
+    máscara booleana, e somente as linhas verdadeiras seguem adiante."""
+
+    __slots__ = ("child", "predicates", "__mask")
+
+    def __init__(self, child: BatchOperator, predicates: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (BatchOperator): A entrada.
+            predicates (List[Predicate]): As condicionais (unidas por AND),
+            sem subconsultas (veja 'BatchSemiJoin').
+        """
+        super().__init__(child.columns)
+        self.child = child
+        self.predicates = predicates
+        self.__mask: BatchPredicate = compile_masks(predicates, self.columns)
+
+    def open(self) -> None:
+        self.child.open()
+
+    def next(self) -> Union[Batch, None]:
+        while (batch := self.child.next()) is not None:
+            mask: np.ndarray = self.__mask(batch)
+            if mask.all():
+                return batch
+            if mask.any():
+                return batch.take(mask)
+        return None
+
+    def close(self) -> None:
+        self.child.close()
+
+class BatchSemiJoin(BatchOperator):
+    """Operador de semijunção (IN) ou de antijunção (NOT IN) vetorizado,
+    com uma subconsulta não correlacionada.
+
+    O resultado da subconsulta é calculado uma única vez, na primeira
+    abertura do operador, em um conjunto ('ValueSet'), e cada lote é
+    verificado por uma máscara (veja 'compile_isin'). A antijunção
+    considera os nulos (null-aware), como o NOT IN.
+    """
+
+    __slots__ = ("child", "subquery", "predicate", "__values", "__mask")
+
+    def __init__(self, child: BatchOperator, subquery: BatchOperator, predicate: InSubquery) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (BatchOperator): A entrada.
+            subquery (BatchOperator): O plano da subconsulta (de uma coluna).
+            predicate (InSubquery): O IN (ou NOT IN) com a subconsulta.
+        """
+        super().__init__(child.columns)
+        self.child = child
+        self.subquery = subquery
+        self.predicate = predicate
+        self.__values: Union[ValueSet, None] = None
+        self.__mask: Union[BatchPredicate, None] = None
+
+    @property
+    def values(self) -> Union[ValueSet, None]:
+        """Extrai o conteúdo da variável privada values.
+
+        Returns:
+            ValueSet | None: O resultado da subconsulta, ou None caso o
+            operador ainda não tenha sido aberto.
+        """
+        return self.__values
+
+    def open(self) -> None:
+        if self.__values is None:
+            (values, nulls) = self.subquery.materialize().column(0)
+            self.__values = ValueSet(
+                values.tolist() if nulls is None
+                else values[~nulls].tolist() + ([None] if nulls.any() else [])
+            )
+            self.__mask = compile_isin(
+                resolve_column(self.columns, self.predicate.column), self.__values, self.predicate.negated
+            )
+        self.child.open()
+
+    def next(self) -> Union[Batch, None]:
+        while (batch := self.child.next()) is not None:
+            mask: np.ndarray = self.__mask(batch)
+            if mask.all():
+                return batch
+            if mask.any():
+                return batch.take(mask)
+        return None
+
+    def close(self) -> None:
+        self.child.close()
+
+class BatchProjection(BatchOperator):
+    """Operador de projeção (π) vetorizado: seleciona as colunas, sem cópia."""
+
+    __slots__ = ("child", "__positions")
+
+    def __init__(self, child: BatchOperator, columns: List[ColumnRef]) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (BatchOperator): A entrada.
+            columns (List[ColumnRef]): As colunas projetadas; '*'
+            mantém todas as colunas da entrada.
+        """
+        self.__positions: Union[List[int], None] = None
+        if any(column.column == "*" for column in columns):
+            super().__init__(child.columns)
+        else:
+            self.__positions = [resolve_column(child.columns, column) for column in columns]
+            super().__init__([child.columns[position] for position in self.__positions])
+        self.child = child
+
+    def open(self) -> None:
+        self.child.open()
+
+    def next(self) -> Union[Batch, None]:
+        batch: Union[Batch, None] = self.child.next()
+        if batch is None or self.__positions is None:
+            return batch
+        return batch.pick(self.__positions)
+
+    def close(self) -> None:
+        self.child.close()
+
+class BatchJoin(BatchOperator):
+    """Operador de junção (|x|) vetorizado, sobre os vetores das chaves.
+
+    A entrada de construção (a direita, ou a esquerda caso o planejador
+    a tenha escolhido como a menor) é lida por completo e as chaves da
+    primeira igualdade entre as duas entradas são ordenadas; cada lote
+    da outra entrada encontra os seus pares com buscas binárias
+    vetorizadas ('searchsorted'), e as demais chaves e condicionais
+    filtram o resultado. Sem igualdades, é feito o produto cartesiano em
+    fatias, limitadas ao tamanho do lote, sempre construindo a direita.
+
+    Chaves de tipos mistos (vetores de objetos, ou números de um lado e
+    textos do outro) não podem ser ordenadas nem comparadas pelo NumPy:
+    elas são codificadas por um dicionário, e a igualdade do Python decide.
+    """
+
+    __slots__ = (
+        "left", "right", "conditions", "batch_size", "build_left",
+        "_keys", "__other_keys", "__residual", "__build", "__build_rows", "__sorted_keys", "__dictionary",
+        "__output"
+    )
+
+    def __init__(
+            self,
+            left: BatchOperator,
+            right: BatchOperator,
+            conditions: List[Predicate],
+            batch_size: int,
+            build_left: bool = False) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (BatchOperator): A entrada esquerda.
+            right (BatchOperator): A entrada direita.
+            conditions (List[Predicate]): As condicionais (unidas por AND).
+            batch_size (int): A quantia aproximada de linhas por lote, no
+            produto cartesiano.
+            build_left (bool, optional): Verdadeiro para ler por completo
+            a entrada esquerda, em vez da direita. Valor padrão: False.
+        """
+        super().__init__(left.columns + right.columns)
+        self.left = left
+        self.right = right
+        self.conditions = conditions
+        self.batch_size = batch_size
+        (keys, residual) = join_keys(conditions, left.columns, right.columns)
+        self.build_left = build_left and bool(keys)
+        # A primeira igualdade, como posições nas colunas de cada entrada.
+        self._keys: Union[Tuple[int, int], None] = keys[0] if keys else None
+        # As demais chaves, como posições nas linhas combinadas.
+        self.__other_keys: List[Tuple[int, int]] = [
+            (left_key, len(left.columns) + right_key) for left_key, right_key in keys[1:]
+        ]
+        self.__residual: Union[BatchPredicate, None] = compile_masks(residual, self.columns) if residual else None
+        self.__build: Union[Batch, None] = None
+        self.__build_rows: Union[np.ndarray, None] = None
+        self.__sorted_keys: Union[np.ndarray, None] = None
+        # O código de cada chave da construção, caso as chaves sejam de tipos mistos.
+        self.__dictionary: Union[Dict[Any, int], None] = None
+        self.__output: Union[Iterator[Batch], None] = None
+
+    def open(self) -> None:
+        (build, probe) = (self.left, self.right) if self.build_left else (self.right, self.left)
+        self.__build = build.materialize()
+        if self._keys is not None:
+            (values, nulls) = self.__build.column(self._keys[0 if self.build_left else 1])
+            rows: np.ndarray = np.flatnonzero(~nulls) if nulls is not None else np.arange(self.__build.size)
+            (self.__build_rows, self.__sorted_keys, self.__dictionary) = (rows, values[rows], None)
+            if values.dtype == object:
+                self.__encode()
+            else:
+                order: np.ndarray = np.argsort(self.__sorted_keys, kind="stable")
+                (self.__build_rows, self.__sorted_keys) = (rows[order], self.__sorted_keys[order])
+        probe.open()
+        self.__output = self.__generate(probe)
+
+    def next(self) -> Union[Batch, None]:
+        return next(self.__output, None)
+
+    def close(self) -> None:
+        (self.right if self.build_left else self.left).close()
+        self.__build = self.__build_rows = self.__sorted_keys = self.__dictionary = self.__output = None
+
+    def __encode(self) -> None:
+        """Codifica as chaves da construção por um dicionário, reordenando-as pelos códigos."""
+        self.__dictionary = {}
+        codes: np.ndarray = np.fromiter(
+            (self.__dictionary.setdefault(key, len(self.__dictionary)) for key in self.__sorted_keys.tolist()),
+            dtype=np.int64, count=len(self.__sorted_keys)
+        )
+        order: np.ndarray = np.argsort(codes, kind="stable")
+        (self.__build_rows, self.__sorted_keys) = (self.__build_rows[order], codes[order])
+
+    def __generate(self, probe: BatchOperator) -> Iterator[Batch]:
+        """Produz os lotes da junção.
+
+        Args:
+            probe (BatchOperator): A entrada lida em lotes.
+
+        Yields:
+            Batch: Cada lote não vazio do resultado, com as colunas da
+            esquerda seguidas das da direita.
+        """
+        while (batch := probe.next()) is not None:
+            for (probe_rows, build_rows) in self.__pairs(batch):
+                joined: Batch = (
+                    self.__build.take(build_rows).combine(batch.take(probe_rows)) if self.build_left
+                    else batch.take(probe_rows).combine(self.__build.take(build_rows))
+                )
+                mask: Union[np.ndarray, None] = self._filter(joined)
+                if mask is not None and not mask.all():
+                    joined = joined.take(mask)
+                if joined.size:
+                    yield joined
+
+    def _filter(self, joined: Batch) -> Union[np.ndarray, None]:
+        """Avalia as demais chaves e condicionais sobre um lote combinado.
+
+        Args:
+            joined (Batch): O lote combinado.
+
+        Returns:
+            np.ndarray | None: A máscara das linhas aceitas, ou None caso
+            não haja o que avaliar.
+        """
+        mask: Union[np.ndarray, None] = self.__residual(joined) if self.__residual is not None else None
+        for (left_key, right_key) in self.__other_keys:
+            (left, right) = (joined.column(left_key), joined.column(right_key))
+            equal: np.ndarray = (
+                compare(left[0], "=", right[0], joined.size)
+                & valid(left, joined.size) & valid(right, joined.size)
+            )
+            mask = equal if mask is None else mask & equal
+        return mask
+
+    def __pairs(self, batch: Batch) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Encontra os pares de linhas de um lote da entrada lida em lotes.
+
+        Args:
+            batch (Batch): O lote.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: As posições das linhas do lote
+            e da entrada de construção (completa).
+        """
+        build_size: int = self.__build.size
+        if self._keys is None:
+            # Produto cartesiano, em fatias de aproximadamente 'batch_size' linhas.
+            step: int = max(1, self.batch_size // max(1, build_size))
+            for start in range(0, batch.size, step):
+                rows: np.ndarray = np.arange(start, min(batch.size, start + step))
+                yield (np.repeat(rows, build_size), np.tile(np.arange(build_size), len(rows)))
+            return
+
+        (values, nulls) = batch.column(self._keys[1 if self.build_left else 0])
+        if self.__dictionary is None and batch.size and not comparable_kinds(self.__sorted_keys.dtype.kind, values.dtype.kind):
+            self.__encode()
+        if self.__dictionary is not None:
+            # Chaves ausentes da construção recebem um código sem pares.
+            values = np.fromiter(
+                (self.__dictionary.get(key, -1) for key in values.tolist()), dtype=np.int64, count=batch.size
+            )
+        low: np.ndarray = np.searchsorted(self.__sorted_keys, values, side="left")
+        counts: np.ndarray = np.searchsorted(self.__sorted_keys, values, side="right") - low
+        if nulls is not None:
+            counts[nulls] = 0
+        total: int = int(counts.sum())
+        if total:
+            offsets: np.ndarray = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            yield (
+                np.repeat(np.arange(batch.size), counts),
+                self.__build_rows[np.repeat(low, counts) + offsets]
+            )
+
+class ParallelHashJoin(BatchJoin):
+    """Operador de junção (|x|) paralelo, particionado pelas chaves.
+
+    As duas entradas são lidas por completo e as chaves da primeira
+    igualdade são particionadas (radix) pelo seu hash; cada par de
+    partições é unido em um processo separado (veja 'parallel_join') e
+    os pares encontrados são combinados em lotes de 'batch_size' linhas,
+    filtrados pelas demais chaves e condicionais. Entradas menores que
+    'threshold' linhas, que não compensam o custo dos processos, são
+    unidas no processo atual. Sem igualdades, equivale a 'BatchJoin'.
+    """
+
+    __slots__ = ("workers", "pool", "threshold", "__output")
+
+    def __init__(
+            self,
+            left: BatchOperator,
+            right: BatchOperator,
+            conditions: List[Predicate],
+            batch_size: int,
+            workers: int,
+            pool: ProcessPoolExecutor,
+            threshold: int = PARALLEL_THRESHOLD) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (BatchOperator): A entrada esquerda.
+            right (BatchOperator): A entrada direita.
+            conditions (List[Predicate]): As condicionais (unidas por AND).
+            batch_size (int): A quantia máxima de linhas por lote.
+            workers (int): A quantia de processos.
+            pool (ProcessPoolExecutor): Os processos do executor, com
+            'workers' processos, compartilhados entre as junções.
+            threshold (int, optional): A quantia mínima de linhas (somadas
+            as duas entradas) para usar os processos. Valor padrão: 131072.
+        """
+        super().__init__(left, right, conditions, batch_size)
+        self.workers = workers
+        self.pool = pool
+        self.threshold = threshold
+        self.__output: Union[Iterator[Batch], None] = None
+
+    def open(self) -> None:
+        if self._keys is None:
+            super().open()
+            return
+        (left, right) = (self.left.materialize(), self.right.materialize())
+        ((left_values, left_nulls), (right_values, right_nulls)) = (
+            left.column(self._keys[0]), right.column(self._keys[1])
+        )
+        left_rows: np.ndarray = valid_rows(left_nulls, left.size)
+        right_rows: np.ndarray = valid_rows(right_nulls, right.size)
+        workers: int = self.workers if left.size + right.size >= self.threshold else 1
+        (left_pairs, right_pairs) = parallel_join(left_values[left_rows], right_values[right_rows], workers, self.pool)
+        self.__output = self.__generate(left, right, left_rows[left_pairs], right_rows[right_pairs])
+
+    def next(self) -> Union[Batch, None]:
+        if self._keys is None:
+            return super().next()
+        return next(self.__output, None)
+
+    def close(self) -> None:
+        if self._keys is None:
+            super().close()
+        self.__output = None
+
+    def __generate(self, left: Batch, right: Batch, left_rows: np.ndarray, right_rows: np.ndarray) -> Iterator[Batch]:
+        """Produz os lotes da junção.
+
+        Args:
+            left (Batch): A entrada esquerda, completa.
+            right (Batch): A entrada direita, completa.
+            left_rows (np.ndarray): As posições dos pares na entrada esquerda.
+            right_rows (np.ndarray): As posições dos pares na entrada direita.
+
+        Yields:
+            Batch: Cada lote não vazio do resultado.
+        """
+        for start in range(0, len(left_rows), self.batch_size):
+            end: int = start + self.batch_size
+            joined: Batch = left.take(left_rows[start:end]).combine(right.take(right_rows[start:end]))
+            mask: Union[np.ndarray, None] = self._filter(joined)
+            if mask is not None and not mask.all():
+                joined = joined.take(mask)
+            if joined.size:
+                yield joined
+
+class VectorizedExecutor:
+    """Classe responsável pela execução vetorizada dos comandos SQL já convertidos.
+
+    Mesma compilação da árvore do 'Executor', com operadores que
+    processam lotes de 'batch_size' linhas. As colunas de cada tabela
+    são convertidas para vetores uma única vez por versão da tabela.
+
+    Com 'workers' maior que 1, as junções com igualdades entre as duas
+    entradas são particionadas e unidas em paralelo ('ParallelHashJoin'),
+    nos mesmos processos em todas as junções: os processos são criados
+    no primeiro uso e encerrados por 'close' (ou ao final de um 'with').
+    """
+
+    # O catálogo com os dados das tabelas.
+    __catalog: Catalog
+    # A quantia máxima de linhas por lote.
+    __batch_size: int
+    # A quantia de processos das junções paralelas.
+    __workers: int
+    # Os processos das junções paralelas, ou None caso não tenham sido criados.
+    __pool: Union[ProcessPoolExecutor, None]
+    # Os vetores das colunas já lidas de cada tabela (indexados pelo nome
+    # da coluna em minúsculo), com a tabela e a versão convertidas.
+    __columns: Dict[str, Tuple[Table, int, Dict[str, Column]]]
+
+    def __init__(self, catalog: Catalog, batch_size: int = 1 << 16, workers: int = 1) -> None:
+        """Construtor da classe.
+
+        Args:
+            catalog (Catalog): O catálogo com os dados das tabelas.
+            batch_size (int, optional): A quantia máxima de linhas por
+            lote. Valor padrão: 65536.
+            workers (int, optional): A quantia de processos das junções
+            paralelas; com 1, as junções não são paralelas. Valor padrão: 1.
+        """
+        self.__catalog = catalog
+        self.__batch_size = max(1, batch_size)
+        self.__workers = max(1, workers)
+        self.__pool = None
+        self.__columns = {}
+
+    @property
+    def catalog(self) -> Catalog:
+        """Extrai o conteúdo da variável privada catalog.
+
+        Returns:
+            Catalog: O catálogo com os dados das tabelas.
+        """
+        return self.__catalog
+
+    @property
+    def batch_size(self) -> int:
+        """Extrai o conteúdo da variável privada batch_size.
+
+        Returns:
+            int: A quantia máxima de linhas por lote.
+        """
+        return self.__batch_size
+
+    @property
+    def workers(self) -> int:
+        """Extrai o conteúdo da variável privada workers.
+
+        Returns:
+            int: A quantia de processos das junções paralelas.
+        """
+        return self.__workers
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Retorna os processos das junções paralelas, criando-os no primeiro uso.
+
+        Returns:
+            ProcessPoolExecutor: Os 'workers' processos, compartilhados
+            entre as junções de todos os comandos.
+        """
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(self.__workers)
+        return self.__pool
+
+    def close(self) -> None:
+        """Encerra os processos das junções paralelas; um novo uso os cria novamente."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __enter__(self) -> 'VectorizedExecutor':
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def table_columns(self, table: Table, columns: Union[List[str], None] = None) -> List[Column]:
+        """Retorna os vetores de algumas colunas de uma tabela, convertendo
+        cada coluna somente na sua primeira leitura em cada versão da tabela.
+
+        As colunas não lidas pelos comandos nunca são convertidas.
+
+        Args:
+            table (Table): Os dados da tabela.
+            columns (List[str] | None, optional): As colunas lidas. Valor
+            padrão: None (todas as colunas).
+
+        Returns:
+            List[Column]: Os vetores das colunas, na ordem de 'columns'.
+        """
+        entry: Union[Tuple[Table, int, Dict[str, Column]], None] = self.__columns.get(table.name.casefold())
+        if entry is None or entry[0] is not table or entry[1] != table.version:
+            entry = (table, table.version, {})
+            self.__columns[table.name.casefold()] = entry
+        vectors: Dict[str, Column] = entry[2]
+        for column in (columns if columns is not None else table.columns):
+            if column.casefold() not in vectors:
+                values: Sequence[Any] = table.column(column)
+                vectors[column.casefold()] = mapped_column(values) if isinstance(values, MappedColumn) else to_column(values)
+        return [vectors[column.casefold()] for column in (columns if columns is not None else table.columns)]
+
+    def compile(self, converter: Converter, analysis: Union[PlanAnalysis, None] = None) -> BatchOperator:
+        """Compila a árvore da Álgebra Relacional em operadores vetorizados.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+            analysis (PlanAnalysis | None, optional): A análise do EXPLAIN
+            ANALYZE; o operador de cada nó é envolvido por um operador de
+            medição. Valor padrão: None.
+
+        Returns:
+            BatchOperator: O operador da raiz da árvore, ainda fechado.
+
+        Raises:
+            MissingTableDataException: Exceção customizada para alertar
+            que alguma tabela do comando não possui dados anexados.
+        """
+        operators: Dict[Node, BatchOperator] = {}
+        empty_nodes: Set[Node] = set()
+        for node in converter.node_execution_order:
+            operator: BatchOperator = self.__compile_node(node, operators)
+            # Todas as junções são internas: uma entrada vazia torna o resultado do nó vazio.
+            if isinstance(operator, BatchEmptyRelation) or any(
+                child in empty_nodes
+                for child in (node.left_children, node.right_children)
+                if child is not None and child.parent is node
+            ):
+                operator = BatchEmptyRelation(operator.columns)
+                empty_nodes.add(node)
+            if analysis is not None:
+                operator = AnalyzedBatchOperator(operator, analysis, analysis.register(node))
+            operators[node] = operator
+        root: BatchOperator = operators[converter.relational_algebra_tree]
+        if converter.parser.sql_ast.is_star:
+            root = BatchProjection(root, star_columns(root.columns, converter.context_tables))
+        return root
+
+    def execute_batches(self, converter: Converter) -> Iterator[Batch]:
+        """Executa o comando SQL convertido, produzindo os lotes sob demanda.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+
+        Returns:
+            Iterator[Batch]: Os lotes do resultado.
+        """
+        return iter(self.compile(converter))
+
+    def execute(self, converter: Converter) -> Iterator[Row]:
+        """Executa o comando SQL convertido, produzindo as linhas sob demanda.
+
+        Args:
+            converter (Converter): O Conversor, com o comando SQL já convertido.
+
+        Yields:
+            Row: Cada linha do resultado.
+        """
+        for batch in self.execute_batches(converter):
+            yield from batch.rows()
+
+    def __compile_node(self, node: Node, operators: Dict[Node, BatchOperator]) -> BatchOperator:
+        """Compila um nó da árvore, cujos filhos já foram compilados.
+
+        Args:
+            node (Node): O nó.
+            operators (Dict[Node, BatchOperator]): Os operadores dos nós
+            já compilados.
+
+        Returns:
+            BatchOperator: O operador do nó.
+        """
+        plan_operator: plan.Operator = node.operator
+        if isinstance(plan_operator, plan.ViewScan):
+            view: Union[MaterializedView, None] = self.catalog.view(plan_operator.table)
+            if view is None:
+                Exceptions.raise_missing_table_data_exception(plan_operator.table)
+            if not view.is_fresh(self.catalog):
+                # Uma tabela da visão recebeu linhas após a conversão: a visão é atualizada.
+                definition: BatchOperator = self.compile(view.converter)
+                view.refresh(self.catalog, definition.columns, (row for batch in definition for row in batch.rows()))
+            read: List[str] = read_columns(view.table.columns, plan_operator.columns)
+            return ColumnScan(self.table_columns(view.table, read), [
+                column for name, column in zip(view.table.columns, view.columns) if name in read
+            ], self.batch_size)
+        if isinstance(plan_operator, plan.Scan):
+            table: Union[Table, None] = self.catalog.table(plan_operator.table)
+            if table is None:
+                Exceptions.raise_missing_table_data_exception(plan_operator.table)
+            # Somente as colunas usadas pelo comando são convertidas e lidas (veja 'plan.Scan.columns').
+            read = read_columns(table.columns, plan_operator.columns)
+            if isinstance(plan_operator, plan.EmptyScan):
+                return BatchEmptyRelation([(plan_operator.table, column) for column in read])
+            scan: ColumnScan = ColumnScan(
+                self.table_columns(table, read),
+                [(plan_operator.table, column) for column in read],
+                self.batch_size
+            )
+            if isinstance(plan_operator, plan.IndexScan):
+                index: Union[Index, None] = self.catalog.index(plan_operator.index)
+                if index is not None and index in table.indexes:
+                    return IndexColumnScan(scan, index, plan_operator.predicates)
+                # O índice foi removido após a conversão: a seleção é feita sobre a leitura completa.
+                return BatchFilter(scan, plan_operator.predicates)
+            return scan
+
+        if isinstance(plan_operator, plan.Join):
+            if self.workers > 1 and plan_operator.method != plan.NESTED_LOOP:
+                return ParallelHashJoin(
+                    operators[node.left_children], operators[node.right_children],
+                    plan_operator.conditions, self.batch_size, self.workers, self.pool
+                )
+            return BatchJoin(
+                operators[node.left_children], operators[node.right_children],
+                plan_operator.conditions, self.batch_size, plan_operator.build_left
+            )
+
+        inputs: List[Node] = [
+            child for child in (node.left_children, node.right_children)
+            if child is not None and child.parent is node
+        ]
+        if isinstance(plan_operator, plan.Select):
+            # Os IN e NOT IN com subconsultas são semijunções (e antijunções),
+            # aplicadas após as demais condicionais.
+            root: BatchOperator = operators[inputs[0]]
+            predicates: List[Predicate] = [
+                predicate for predicate in plan_operator.predicates if not isinstance(predicate, InSubquery)
+            ]
+            if predicates:
+                root = BatchFilter(root, predicates)
+            for predicate in plan_operator.predicates:
+                if isinstance(predicate, InSubquery):
+                    subquery: Node = plan_operator.subqueries[predicate.text].relational_algebra_tree
+                    root = BatchSemiJoin(root, operators[subquery], predicate)
+            return root
+        return BatchProjection(operators[inputs[0]], plan_operator.columns)
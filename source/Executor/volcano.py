@@ -0,0 +1,487 @@
+"""Arquivo responsável pelos operadores físicos, no modelo de
+iteradores (Volcano): cada operador é aberto ('open'), produz uma
+linha por chamada ('next') e, por fim, é fechado ('close')."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+# pylint: disable=import-error
+from Executor.expressions import Schema, ValueSet, compile_conjunction, membership, resolve_column
+from Parser.sql_ast import ColumnRef, InSubquery, Predicate
+from Storage import Index, Table
+
+# Uma linha produzida por um operador.
+Row = Tuple[Any, ...]
+
+class PhysicalOperator(ABC):
+    """Representa um operador físico de um plano de execução.
+
+    As linhas são produzidas sob demanda, uma por vez: nenhum operador
+    armazena o resultado completo das suas entradas, somente a linha
+    atual. 'next' retorna None quando não há mais linhas.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Schema) -> None:
+        """Construtor da classe.
+
+        Args:
+            columns (Schema): As colunas das linhas produzidas.
+        """
+        self.columns = columns
+
+    @abstractmethod
+    def open(self) -> None:
+        """Prepara o operador (e as suas entradas) para produzir linhas."""
+
+    @abstractmethod
+    def next(self) -> Union[Row, None]:
+        """Produz a próxima linha.
+
+        Returns:
+            Row | None: A próxima linha, ou None caso não haja mais linhas.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Libera o estado do operador (e das suas entradas)."""
+
+    def __iter__(self) -> Iterator[Row]:
+        """Abre o operador e percorre todas as suas linhas, fechando-o ao final.
+
+        Returns:
+            Iterator[Row]: As linhas produzidas.
+        """
+        self.open()
+        try:
+            while (row := self.next()) is not None:
+                yield row
+        finally:
+            self.close()
+
+class TableScan(PhysicalOperator):
+    """Operador de leitura, linha a linha, dos dados de uma tabela."""
+
+    __slots__ = ("table", "read", "__rows")
+
+    def __init__(
+            self,
+            table: Table,
+            name: str,
+            read: Union[List[str], None] = None,
+            columns: Union[Schema, None] = None) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (Table): Os dados da tabela.
+            name (str): O nome da tabela, como escrito no comando SQL.
+            read (List[str] | None, optional): As colunas lidas da tabela;
+            as demais não são lidas. Valor padrão: None (todas as colunas).
+            columns (Schema | None, optional): As colunas das linhas, caso
+            não sejam as colunas lidas da tabela 'name' (como nas visões
+            materializadas). Valor padrão: None.
+        """
+        super().__init__(
+            columns if columns is not None
+            else [(name, column) for column in (read if read is not None else table.columns)]
+        )
+        self.table = table
+        self.read = read
+        self.__rows: Union[Iterator[Row], None] = None
+
+    def open(self) -> None:
+        self.__rows = self.table.scan(self.read)
+
+    def next(self) -> Union[Row, None]:
+        return next(self.__rows, None)
+
+    def close(self) -> None:
+        self.__rows = None
+
+class IndexScan(PhysicalOperator):
+    """Operador de leitura, por um índice secundário, somente das linhas
+    de uma tabela que satisfazem as condicionais do índice.
+
+    As posições são buscadas no índice a cada abertura e percorridas em
+    ordem crescente, mantendo a ordem das linhas da tabela.
+    """
+
+    __slots__ = ("table", "index", "predicates", "read", "__rows")
+
+    def __init__(
+            self,
+            table: Table,
+            name: str,
+            index: Index,
+            predicates: List[Predicate],
+            read: Union[List[str], None] = None) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (Table): Os dados da tabela.
+            name (str): O nome da tabela, como escrito no comando SQL.
+            index (Index): O índice da tabela.
+            predicates (List[Predicate]): As condicionais (unidas por AND)
+            respondidas pelo índice.
+            read (List[str] | None, optional): As colunas lidas da tabela.
+            Valor padrão: None (todas as colunas).
+        """
+        super().__init__([(name, column) for column in (read if read is not None else table.columns)])
+        self.table = table
+        self.index = index
+        self.predicates = predicates
+        self.read: List[str] = read if read is not None else table.columns
+        self.__rows: Union[Iterator[Row], None] = None
+
+    def open(self) -> None:
+        columns: List[Sequence[Any]] = [self.table.column(column) for column in self.read]
+        self.__rows = (
+            tuple(values[position] for values in columns)
+            for position in self.index.lookup_all(self.predicates)
+        )
+
+    def next(self) -> Union[Row, None]:
+        return next(self.__rows, None)
+
+    def close(self) -> None:
+        self.__rows = None
+
+class EmptyRelation(PhysicalOperator):
+    """Operador de uma relação vazia: não produz linhas, nem lê as suas
+    entradas (como uma tabela com condicionais contraditórias, veja
+    'plan.EmptyScan')."""
+
+    __slots__ = ()
+
+    def open(self) -> None:
+        pass
+
+    def next(self) -> Union[Row, None]:
+        return None
+
+    def close(self) -> None:
+        pass
+
+class Filter(PhysicalOperator):
+    """Operador de seleção (σ): produz as linhas da entrada que
+    satisfazem todas as condicionais."""
+
+    __slots__ = ("child", "predicates", "__test")
+
+    def __init__(self, child: PhysicalOperator, predicates: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (PhysicalOperator): A entrada.
+            predicates (List[Predicate]): As condicionais (unidas por AND),
+            sem subconsultas (veja 'HashSemiJoin').
+        """
+        super().__init__(child.columns)
+        self.child = child
+        self.predicates = predicates
+        self.__test: Callable[[Row], bool] = compile_conjunction(predicates, self.columns)
+
+    def open(self) -> None:
+        self.child.open()
+
+    def next(self) -> Union[Row, None]:
+        while (row := self.child.next()) is not None:
+            if self.__test(row):
+                return row
+        return None
+
+    def close(self) -> None:
+        self.child.close()
+
+class HashSemiJoin(PhysicalOperator):
+    """Operador de semijunção (IN) ou de antijunção (NOT IN) com uma
+    subconsulta não correlacionada: produz as linhas da entrada cujo
+    valor está (ou não está) no resultado da subconsulta.
+
+    A subconsulta não depende da linha atual: o seu resultado é
+    calculado uma única vez, na primeira abertura do operador, em um
+    conjunto de hash ('ValueSet'), e cada linha da entrada é verificada
+    em O(1). A antijunção considera os nulos (null-aware), como o NOT IN:
+    com um nulo no resultado, nenhuma linha é produzida; com o resultado
+    vazio, todas as linhas são produzidas, inclusive as de valor nulo.
+    """
+
+    __slots__ = ("child", "subquery", "predicate", "__position", "__values")
+
+    def __init__(self, child: PhysicalOperator, subquery: PhysicalOperator, predicate: InSubquery) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (PhysicalOperator): A entrada.
+            subquery (PhysicalOperator): O plano da subconsulta (de uma coluna).
+            predicate (InSubquery): O IN (ou NOT IN) com a subconsulta.
+        """
+        super().__init__(child.columns)
+        self.child = child
+        self.subquery = subquery
+        self.predicate = predicate
+        self.__position: int = resolve_column(self.columns, predicate.column)
+        self.__values: Union[ValueSet, None] = None
+
+    @property
+    def values(self) -> Union[ValueSet, None]:
+        """Extrai o conteúdo da variável privada values.
+
+        Returns:
+            ValueSet | None: O resultado da subconsulta, ou None caso o
+            operador ainda não tenha sido aberto.
+        """
+        return self.__values
+
+    def open(self) -> None:
+        if self.__values is None:
+            self.__values = ValueSet(row[0] for row in self.subquery)
+        self.child.open()
+
+    def next(self) -> Union[Row, None]:
+        (position, values, negated) = (self.__position, self.__values, self.predicate.negated)
+        while (row := self.child.next()) is not None:
+            if membership(row[position], values, negated):
+                return row
+        return None
+
+    def close(self) -> None:
+        self.child.close()
+
+class Projection(PhysicalOperator):
+    """Operador de projeção (π): produz somente as colunas projetadas."""
+
+    __slots__ = ("child", "__positions")
+
+    def __init__(self, child: PhysicalOperator, columns: List[ColumnRef]) -> None:
+        """Construtor da classe.
+
+        Args:
+            child (PhysicalOperator): A entrada.
+            columns (List[ColumnRef]): As colunas projetadas; '*'
+            mantém todas as colunas da entrada.
+        """
+        self.__positions: Union[List[int], None] = None
+        if any(column.column == "*" for column in columns):
+            super().__init__(child.columns)
+        else:
+            self.__positions = [resolve_column(child.columns, column) for column in columns]
+            super().__init__([child.columns[position] for position in self.__positions])
+        self.child = child
+
+    def open(self) -> None:
+        self.child.open()
+
+    def next(self) -> Union[Row, None]:
+        row: Union[Row, None] = self.child.next()
+        if row is None or self.__positions is None:
+            return row
+        return tuple(row[position] for position in self.__positions)
+
+    def close(self) -> None:
+        self.child.close()
+
+class NestedLoopJoin(PhysicalOperator):
+    """Operador de junção (|x|) por laços aninhados.
+
+    Para cada linha da entrada esquerda, a entrada direita é aberta e
+    percorrida novamente; as linhas combinadas que satisfazem as
+    condicionais são produzidas. Sem condicionais, é um produto
+    cartesiano (×).
+    """
+
+    __slots__ = ("left", "right", "conditions", "__test", "__left_row")
+
+    def __init__(self, left: PhysicalOperator, right: PhysicalOperator, conditions: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (PhysicalOperator): A entrada esquerda (externa).
+            right (PhysicalOperator): A entrada direita (interna).
+            conditions (List[Predicate]): As condicionais (unidas por AND).
+        """
+        super().__init__(left.columns + right.columns)
+        self.left = left
+        self.right = right
+        self.conditions = conditions
+        self.__test: Callable[[Row], bool] = compile_conjunction(conditions, self.columns)
+        self.__left_row: Union[Row, None] = None
+
+    def open(self) -> None:
+        self.left.open()
+        self.__left_row = None
+
+    def next(self) -> Union[Row, None]:
+        while True:
+            if self.__left_row is None:
+                if (left_row := self.left.next()) is None:
+                    return None
+                self.__left_row = left_row
+                self.right.open()
+            if (right_row := self.right.next()) is None:
+                self.right.close()
+                self.__left_row = None
+                continue
+            row: Row = self.__left_row + right_row
+            if self.__test(row):
+                return row
+
+    def close(self) -> None:
+        if self.__left_row is not None:
+            self.right.close()
+            self.__left_row = None
+        self.left.close()
+
+class HashJoin(PhysicalOperator):
+    """Operador de junção (|x|) por hash, para junções com igualdades.
+
+    A entrada de construção (a menor, escolhida pelo planejador) é lida
+    por completo em uma tabela de hash, indexada pelas chaves; a outra
+    entrada é percorrida uma única vez, em fluxo, buscando os seus pares.
+    Chaves nulas nunca são iguais e são ignoradas.
+    """
+
+    __slots__ = ("left", "right", "keys", "residual", "build_left", "__build", "__probe", "__test", "__table", "__output")
+
+    def __init__(
+            self,
+            left: PhysicalOperator,
+            right: PhysicalOperator,
+            keys: List[Tuple[int, int]],
+            residual: List[Predicate],
+            build_left: bool = False) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (PhysicalOperator): A entrada esquerda.
+            right (PhysicalOperator): A entrada direita.
+            keys (List[Tuple[int, int]]): A posição de cada chave na
+            entrada esquerda e na direita.
+            residual (List[Predicate]): As demais condicionais da junção.
+            build_left (bool, optional): Verdadeiro para construir a tabela
+            de hash com a entrada esquerda. Valor padrão: False.
+        """
+        super().__init__(left.columns + right.columns)
+        self.left = left
+        self.right = right
+        self.keys = keys
+        self.residual = residual
+        self.build_left = build_left
+        # As entradas de construção e de busca, e a posição das suas chaves.
+        (left_keys, right_keys) = ([key for key, _ in keys], [key for _, key in keys])
+        self.__build: Tuple[PhysicalOperator, List[int]] = (left, left_keys) if build_left else (right, right_keys)
+        self.__probe: Tuple[PhysicalOperator, List[int]] = (right, right_keys) if build_left else (left, left_keys)
+        self.__test: Callable[[Row], bool] = compile_conjunction(residual, self.columns)
+        self.__table: Dict[Tuple[Any, ...], List[Row]] = {}
+        self.__output: Union[Iterator[Row], None] = None
+
+    def open(self) -> None:
+        (build, build_keys) = self.__build
+        self.__table = {}
+        for row in build:
+            key: Tuple[Any, ...] = tuple(row[position] for position in build_keys)
+            if None not in key:
+                self.__table.setdefault(key, []).append(row)
+        self.__probe[0].open()
+        self.__output = self.__join()
+
+    def next(self) -> Union[Row, None]:
+        return next(self.__output, None)
+
+    def close(self) -> None:
+        self.__probe[0].close()
+        self.__table = {}
+        self.__output = None
+
+    def __join(self) -> Iterator[Row]:
+        """Percorre a entrada de busca, produzindo as linhas combinadas.
+
+        Yields:
+            Row: Cada linha da junção, com as colunas da esquerda seguidas das da direita.
+        """
+        (probe, probe_keys) = self.__probe
+        while (row := probe.next()) is not None:
+            key: Tuple[Any, ...] = tuple(row[position] for position in probe_keys)
+            for match in self.__table.get(key, ()):
+                joined: Row = match + row if self.build_left else row + match
+                if self.__test(joined):
+                    yield joined
+
+class MergeJoin(PhysicalOperator):
+    """Operador de junção (|x|) por intercalação (merge), para entradas
+    que já chegam ordenadas pela primeira chave da junção.
+
+    As duas entradas são percorridas uma única vez, em fluxo; somente
+    as linhas da direita com a chave atual ficam em memória. Chaves
+    nulas nunca são iguais e são ignoradas.
+    """
+
+    __slots__ = ("left", "right", "keys", "residual", "__test", "__output")
+
+    def __init__(
+            self,
+            left: PhysicalOperator,
+            right: PhysicalOperator,
+            keys: List[Tuple[int, int]],
+            residual: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (PhysicalOperator): A entrada esquerda, ordenada pela primeira chave.
+            right (PhysicalOperator): A entrada direita, ordenada pela primeira chave.
+            keys (List[Tuple[int, int]]): A posição de cada chave na
+            entrada esquerda e na direita.
+            residual (List[Predicate]): As demais condicionais da junção.
+        """
+        super().__init__(left.columns + right.columns)
+        self.left = left
+        self.right = right
+        self.keys = keys
+        self.residual = residual
+        self.__test: Callable[[Row], bool] = compile_conjunction(residual, self.columns)
+        self.__output: Union[Iterator[Row], None] = None
+
+    def open(self) -> None:
+        self.left.open()
+        self.right.open()
+        self.__output = self.__merge()
+
+    def next(self) -> Union[Row, None]:
+        return next(self.__output, None)
+
+    def close(self) -> None:
+        self.left.close()
+        self.right.close()
+        self.__output = None
+
+    def __merge(self) -> Iterator[Row]:
+        """Intercala as duas entradas, produzindo as linhas combinadas.
+
+        Yields:
+            Row: Cada linha da junção, com as colunas da esquerda seguidas das da direita.
+        """
+        ((left_key, right_key), others) = (self.keys[0], self.keys[1:])
+        right_row: Union[Row, None] = self.right.next()
+        # As linhas da direita com a chave atual.
+        group: List[Row] = []
+        group_key: Any = None
+
+        while (left_row := self.left.next()) is not None:
+            key: Any = left_row[left_key]
+            if key is None:
+                continue
+            if not group or key != group_key:
+                # Avança a direita até a chave atual da esquerda.
+                while right_row is not None and (right_row[right_key] is None or right_row[right_key] < key):
+                    right_row = self.right.next()
+                (group, group_key) = ([], key)
+                while right_row is not None and right_row[right_key] in (None, key):
+                    if right_row[right_key] is not None:
+                        group.append(right_row)
+                    right_row = self.right.next()
+            for match in group:
+                if all(left_row[left] == match[right] for left, right in others):
+                    joined: Row = left_row + match
+                    if self.__test(joined):
+                        yield joined
@@ -1,5 +1,6 @@
 """Representa o corpo de uma aplicação"""
 
+from typing import List, Union
 from tkinter.font import Font
 from tkinter import Button, END
 from tkinter.ttk import Frame, Label, Entry
@@ -8,9 +9,13 @@ from tkinter.ttk import Frame, Label, Entry
 # pylint: disable=no-name-in-module
 import Examples
 
+from Catalog import Catalog
+from Executor import Executor, PlanAnalysis, strip_explain_analyze
 from Parser.parser import Parser
+from Parser.cache import ParserCache
 from GUI.frames.TreeCanvas import TreeCanvas
 from RelationalAlgebra.Converter import Node, Converter
+from RelationalAlgebra.join_order import CostModel, JoinOrderer
 
 class Body(Frame):
     """Representa um corpo para uma aplicação.
@@ -25,8 +30,13 @@ class Body(Frame):
     body_button_font: Font
     # O parser.
     parser: Parser
+    # O cache de comandos SQL já analisados.
+    parser_cache: ParserCache = ParserCache()
     # O conversor.
     converter: Converter
+    # O executor dos comandos com 'EXPLAIN ANALYZE', sobre os dados
+    # exemplares (criado no primeiro uso).
+    example_executor: Union[Executor, None] = None
     # O entry.
     body_entry: Entry
 
@@ -75,11 +85,59 @@ class Body(Frame):
         """
         self.grid_rowconfigure(row_id, weight=weight)
 
+    def __example_executor(self) -> Executor:
+        """Retorna o executor sobre os dados exemplares, criando-o no primeiro uso.
+
+        Returns:
+            Executor: O executor, com os dados exemplares anexados e analisados.
+        """
+        if Body.example_executor is None:
+            catalog: Catalog = Catalog(Examples.pagamento_example_db)
+            for table in Examples.pagamento_example_data().values():
+                catalog.attach_table(table)
+            catalog.analyze()
+            Body.example_executor = Executor(catalog)
+        return Body.example_executor
+
     def __draw_tree(self) -> None:
         """Limpa o Canvas do cabeçalho e desenha 
         a Árvore da Álgebra Relacional.
+
+        Um comando iniciado por 'EXPLAIN ANALYZE' também é executado sobre
+        os dados exemplares: cada nó exibe as suas medidas (veja
+        'PlanAnalysis'), e os nós com o maior tempo próprio são destacados.
         """
 
+        def node_label(node: Node) -> str:
+            """Retorna o texto exibido acima de um nó.
+
+            Args:
+                node (Node): O nó.
+
+            Returns:
+                str: A ordem de execução e o operador do nó, seguidos das
+                suas medidas, no EXPLAIN ANALYZE.
+            """
+            label: str = f"{node.execution_order}°- {node.value}"
+            if analysis is None or analysis.statistics(node) is None:
+                return label
+            return f"{label}  [{analysis.statistics(node).render()}]"
+
+        def heat_color(node: Node) -> str:
+            """Retorna a cor do círculo de um nó: do branco (sem tempo
+            próprio) ao vermelho (o nó mais lento).
+
+            Args:
+                node (Node): O nó.
+
+            Returns:
+                str: A cor, em hexadecimal.
+            """
+            if analysis is None:
+                return "white"
+            shade: int = round(255 * (1 - analysis.heat(node)))
+            return f"#ff{shade:02x}{shade:02x}"
+
         def dfs_drawing(canvas: TreeCanvas, node: Node, xpos: int, ypos: int, padx: int = 50, pady: int = 50) -> None:
             """Desenha uma Árvore para a Álgebra Relacional usando DFS.
 
@@ -98,18 +156,19 @@ class Body(Frame):
                 canvas.create_oval(
                     xpos - 10, ypos - 10,
                     xpos + 10, ypos + 10,
-                    fill="white", outline="black"
+                    fill=heat_color(node), outline="black"
                 )
                 # Adiciona um texto acima do Nó.
                 canvas.create_text(
                     xpos, ypos - 20,
-                    text=f"{node.execution_order}°- {node.value}",
-                    font=node_text_font
+                    text=node_label(node),
+                    font=node_text_font,
+                    fill="red" if node in hottest_nodes else "black"
                 )
 
                 # Desenha o Nó filho esquerdo, se houver.
                 if node.left_children:
-                    node_text = f"{node.execution_order}°- {node.value}"
+                    node_text = node_label(node)
                     node_text_width = node_text_font.measure(node_text)
                     # Cria uma aresta entre os dois Nós.
                     padx = node_text_width / 2
@@ -118,7 +177,7 @@ class Body(Frame):
 
                 # Desenha o Nó filho direito, se houver.
                 if node.right_children:
-                    node_text = f"{node.right_children.execution_order}°- {node.right_children.value}"
+                    node_text = node_label(node.right_children)
                     node_text_width = node_text_font.measure(node_text)
                     # Cria uma aresta entre os dois Nós.
                     padx = node_text_width / 2
@@ -130,12 +189,21 @@ class Body(Frame):
             target_canvas: TreeCanvas = self.master_container.header.canvas
             # Pega o texto do entry e passa para o parser, verificando se o
             # comando é válido.
-            self.parser = Parser(self.body_entry.get())
+            (sql_command, explain_analyze) = strip_explain_analyze(self.body_entry.get())
+            self.parser = self.parser_cache.parse(sql_command)
             self.parser.check_database_compatibility(Examples.pagamento_example_db)
             # Inicializa o conversor passando o texto de 'Label' para um Parser.
-            self.converter = Converter(self.parser)
+            # No EXPLAIN ANALYZE, o plano usa as estatísticas dos dados exemplares.
+            self.converter = Converter(self.parser, JoinOrderer(CostModel(
+                catalog=self.__example_executor().catalog
+            )) if explain_analyze else None)
             # Converte o comando SQL para Álgebra Relacional.
             self.converter.convert_in_database_context(Examples.pagamento_example_db)
+            # Executa o comando, medindo cada nó, no EXPLAIN ANALYZE.
+            analysis: Union[PlanAnalysis, None] = (
+                self.__example_executor().explain_analyze(self.converter) if explain_analyze else None
+            )
+            hottest_nodes: List[Node] = analysis.hottest() if analysis is not None else []
             # TODO: Mostrar as Exceptions em um footer (em vermelho).
             # Limpa o Entry.
             self.body_entry.delete(0, END)
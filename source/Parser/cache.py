@@ -0,0 +1,264 @@
+"""Arquivo responsável pelo cache de comandos SQL já
+analisados pelo Parser, indexados por uma impressão digital
+(fingerprint) normalizada do comando."""
+
+import re
+from copy import copy
+from collections import OrderedDict
+from typing import List, Tuple
+
+# pylint: disable=import-error
+from Parser.lexer import Lexer
+from Parser.parser import Parser
+from Parser.sql_ast import Select
+from Parser.syntax_parser import SyntaxParser
+
+class ParserCache:
+    """Classe responsável pelo cache LRU de comandos SQL analisados.
+
+    Comandos com o mesmo formato, diferindo somente nos literais,
+    compartilham a mesma impressão digital. Quando uma impressão
+    digital já está no cache, o resultado do Parser é reaproveitado,
+    substituindo somente os literais, sem executar novamente a
+    verificação e a validação do comando.
+
+    A impressão digital é formada pelas cláusulas SQL (em minúsculo)
+    e pelos parâmetros de cada cláusula, sem os espaços em branco ao
+    redor, com os literais substituídos por marcadores do seu tipo.
+    Os espaços em branco dentro dos parâmetros são mantidos, pois
+    fazem parte da validação do Parser.
+    """
+
+    # A quantia máxima de comandos armazenados no cache.
+    __max_size: int
+    # Os comandos armazenados, da impressão digital ao Parser.
+    __entries: "OrderedDict[str, Parser]"
+    # Os contadores de acertos, falhas e remoções do cache.
+    __hits: int
+    __misses: int
+    __evictions: int
+    # Literais textuais que podem ser substituídos por um marcador.
+    __string_literal_pattern: re.Pattern = re.compile(r"'[a-zA-Z\d]\w*'")
+    # Literais numéricos (inteiros) que podem ser substituídos por um marcador.
+    __integer_literal_pattern: re.Pattern = re.compile(r"[0-9]+")
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Construtor da classe.
+
+        Args:
+            max_size (int, optional): A quantia máxima de comandos
+            armazenados no cache. Valor padrão: 1024.
+        """
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        """Extrai o conteúdo da variável privada max_size.
+
+        Returns:
+            int: A quantia máxima de comandos armazenados no cache.
+        """
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, new_max_size: int) -> None:
+        """Altera o conteúdo da variável privada max_size, removendo
+        os comandos menos usados recentemente caso necessário.
+
+        Args:
+            new_max_size (int): A nova quantia máxima de comandos
+            armazenados no cache, deve ser maior que zero.
+        """
+        if new_max_size < 1:
+            raise ValueError("O tamanho do cache deve ser maior que zero.")
+        self.__max_size = new_max_size
+        self.__evict()
+
+    @property
+    def hits(self) -> int:
+        """Extrai o conteúdo da variável privada hits.
+
+        Returns:
+            int: A quantia de comandos encontrados no cache.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Extrai o conteúdo da variável privada misses.
+
+        Returns:
+            int: A quantia de comandos não encontrados no cache.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Extrai o conteúdo da variável privada evictions.
+
+        Returns:
+            int: A quantia de comandos removidos do cache por falta de espaço.
+        """
+        return self.__evictions
+
+    def __len__(self) -> int:
+        """Retorna a quantia de comandos armazenados no cache.
+
+        Returns:
+            int: A quantia de comandos armazenados.
+        """
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        """Remove todos os comandos do cache, mantendo os contadores."""
+        self.__entries.clear()
+
+    def parse(self, sql_command: str) -> Parser:
+        """Analisa um comando SQL, reaproveitando um resultado do cache
+        caso o formato do comando já tenha sido analisado.
+
+        Args:
+            sql_command (str): O comando SQL a ser analisado.
+
+        Returns:
+            Parser: O resultado da análise do comando SQL, com os
+            literais do comando fornecido.
+        """
+        # Comandos sem ';' (ou vazios) seguem para o Parser, que lança a exceção.
+        if not sql_command or sql_command[-1] != ";":
+            return Parser(sql_command)
+
+        # Mesma adaptação realizada pelo Parser.
+        lexer: Lexer = Lexer(sql_command.replace(";", " ;", 1))
+        fingerprint: str = self.fingerprint(lexer)
+
+        template: Parser | None = self.__entries.get(fingerprint)
+        if template is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(fingerprint)
+            return self.__rebind(template, lexer)
+
+        self.__misses += 1
+        template = Parser(sql_command)
+        self.__entries[fingerprint] = template
+        self.__evict()
+        return self.__rebind(template, lexer)
+
+    def fingerprint(self, lexer: Lexer) -> str:
+        """Cria a impressão digital de um comando SQL já analisado pelo Lexer.
+
+        Args:
+            lexer (Lexer): O Lexer do comando SQL.
+
+        Returns:
+            str: A impressão digital do comando.
+        """
+        command: str = lexer.sql_command
+        literals: List[Tuple[int, int]] = lexer.literals
+        tokens: List[Tuple[str, int]] = lexer.tokens
+        parts: List[str] = []
+        # Índice do próximo literal ainda não substituído.
+        literal_index: int = 0
+
+        for i, (token, position) in enumerate(tokens):
+            parts.append(token.lower())
+            if i + 1 == len(tokens):
+                break
+
+            # Monta o parâmetro da cláusula, substituindo os literais.
+            start: int = position + len(token)
+            end: int = tokens[i + 1][1]
+            param: List[str] = []
+            # Ignora os literais anteriores à cláusula, também ignorados pelo Parser.
+            while literal_index < len(literals) and literals[literal_index][0] < start:
+                literal_index += 1
+            while literal_index < len(literals) and literals[literal_index][0] < end:
+                (literal_start, literal_end) = literals[literal_index]
+                param.append(command[start:literal_start])
+                param.append(self.__literal_marker(command[literal_start:literal_end]))
+                start = literal_end
+                literal_index += 1
+            param.append(command[start:end])
+            parts.append("".join(param).strip())
+
+        return "\x00".join(parts)
+
+    def __literal_marker(self, literal: str) -> str:
+        """Retorna o marcador de um literal.
+
+        Somente os literais cujo tipo, sozinho, define a validez do
+        comando no Parser são substituídos. Os demais são mantidos.
+
+        Args:
+            literal (str): O literal, textual ou numérico.
+
+        Returns:
+            str: O marcador do tipo do literal, ou o próprio literal.
+        """
+        if self.__integer_literal_pattern.fullmatch(literal):
+            return "\x01i"
+        if literal[0].isdigit():
+            return "\x01f"
+        if self.__string_literal_pattern.fullmatch(literal):
+            return "\x01s"
+        return literal
+
+    def __rebind(self, template: Parser, lexer: Lexer) -> Parser:
+        """Cria um novo resultado do Parser a partir de um resultado
+        do cache, com as cláusulas e os parâmetros do comando analisado.
+
+        Args:
+            template (Parser): O resultado armazenado no cache.
+            lexer (Lexer): O Lexer do comando SQL analisado.
+
+        Returns:
+            Parser: O resultado do Parser para o comando analisado.
+        """
+        command: str = lexer.sql_command
+        tokens: List[Tuple[str, int]] = lexer.tokens
+        parser: Parser = copy(template)
+
+        parser.sql_command = command
+        # Reaproveita os sufixos ('_ON' e '_WHERE') das cláusulas do cache.
+        parser.sql_tokens = [
+            (token + cached_token[cached_token.find("_"):] if "_" in cached_token else token, position)
+            for (token, position), (cached_token, _) in zip(tokens, template.sql_tokens)
+        ]
+        parser.sql_params = [
+            command[tokens[i - 1][1] + len(tokens[i - 1][0]):tokens[i][1]].strip()
+            for i in range(1, len(tokens))
+        ]
+        parser.sql_tables = {clause: list(tables) for clause, tables in template.sql_tables.items()}
+        parser.sql_columns = {clause: list(columns) for clause, columns in template.sql_columns.items()}
+        parser.sql_subqueries = {}
+
+        def parse_subquery(subcommand: str) -> Select:
+            """Analisa uma subconsulta pelo cache, uma única vez por texto.
+
+            Args:
+                subcommand (str): A subconsulta, sem o ';'.
+
+            Returns:
+                Select: A Árvore Sintática Abstrata da subconsulta.
+            """
+            subcommand = subcommand.strip()
+            if subcommand not in parser.sql_subqueries:
+                parser.sql_subqueries[subcommand] = self.parse(subcommand + ";")
+            return parser.sql_subqueries[subcommand].sql_ast
+
+        # A Árvore Sintática Abstrata contém os literais, sendo reconstruída
+        # sem validação; as subconsultas também passam pelo cache.
+        parser.sql_ast = SyntaxParser(parser.sql_tokens, parser.sql_params, parse_subquery).parse()
+        return parser
+
+    def __evict(self) -> None:
+        """Remove os comandos menos usados recentemente, até que o
+        cache respeite a quantia máxima de comandos.
+        """
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
@@ -0,0 +1,139 @@
+"""Arquivo responsável pela análise léxica de um comando SQL,
+extraindo as cláusulas SQL e as suas posições em uma única
+passagem sobre o texto."""
+
+import re
+from typing import List, Tuple
+
+class Lexer:
+    """Classe responsável pela extração das cláusulas SQL de um comando.
+
+    Percorre o comando SQL uma única vez, elemento por elemento,
+    acompanhando a profundidade dos parênteses e os literais textuais,
+    de modo que somente as cláusulas que estão fora de parênteses e
+    fora de aspas sejam extraídas.
+
+    O tempo de execução é linear em relação ao tamanho do comando.
+    """
+
+    # Um comando SQL qualquer.
+    __sql_command: str
+    # Os tokens, cláusulas SQL, do comando e suas posições.
+    __tokens: List[Tuple[str, int]]
+    # As posições (início e fim) dos literais textuais e numéricos do comando.
+    __literals: List[Tuple[int, int]]
+    # As posições dos marcadores de parâmetros ('?') do comando.
+    __placeholders: List[int]
+    # As palavras reservadas (cláusulas) reconhecidas pelo Lexer.
+    __keywords: frozenset = frozenset(("select", "from", "join", "on", "where", "and", "in"))
+    # Expressão regular que reconhece, a partir de uma posição, o próximo
+    # elemento relevante do comando: um literal textual (respeitando aspas
+    # escapadas), um parêntese, um marcador de parâmetro, um literal numérico
+    # ou uma palavra.
+    # Não há verificações à frente além de um caractere, mantendo a análise linear.
+    __lexeme_pattern: re.Pattern = re.compile(
+        r"""(?P<string>'(?:[^'\\]|\\.)*(?:'|\\?\Z)|"(?:[^"\\]|\\.)*(?:"|\\?\Z))"""
+        r"|(?P<open>\()|(?P<close>\))|(?P<placeholder>\?)"
+        r"|(?P<number>[0-9]+(?:\.[0-9]+)?(?:e[+-]?[0-9]+)?(?!\w))"
+        r"|(?P<word>\w+)",
+        re.DOTALL
+    )
+    # Expressão regular que reconhece o 'in' do operador 'not in', logo após o 'not'.
+    __not_in_pattern: re.Pattern = re.compile(r"\s+in(?!\w)", re.IGNORECASE)
+
+    def __init__(self, sql_command: str) -> None:
+        """Construtor da classe.
+
+        Atribui o comando SQL e realiza a extração dos tokens.
+
+        Args:
+            sql_command (str): O comando SQL a ser analisado.
+        """
+        self.__sql_command = sql_command
+        self.__tokens = []
+        self.__literals = []
+        self.__placeholders = []
+        self.__tokenize()
+
+    @property
+    def sql_command(self) -> str:
+        """Extrai o conteúdo da variável privada sql_command.
+
+        Returns:
+            str: O comando SQL analisado.
+        """
+        return self.__sql_command
+
+    @property
+    def tokens(self) -> List[Tuple[str, int]]:
+        """Extrai o conteúdo da variável privada tokens.
+
+        Returns:
+            List[Tuple[str, int]]: Uma lista de tuplas, contendo
+            as cláusulas SQL e as suas posições no comando.
+        """
+        return self.__tokens
+
+    @property
+    def literals(self) -> List[Tuple[int, int]]:
+        """Extrai o conteúdo da variável privada literals.
+
+        Os literais são encontrados em qualquer profundidade de
+        parênteses, inclusive dentro de subconsultas.
+
+        Returns:
+            List[Tuple[int, int]]: Uma lista de tuplas, contendo a
+            posição inicial e a posição final (exclusiva) de cada
+            literal textual ou numérico, na ordem em que aparecem.
+        """
+        return self.__literals
+
+    @property
+    def placeholders(self) -> List[int]:
+        """Extrai o conteúdo da variável privada placeholders.
+
+        Returns:
+            List[int]: As posições dos marcadores de parâmetros ('?'),
+            fora de literais textuais, na ordem em que aparecem.
+        """
+        return self.__placeholders
+
+    def __tokenize(self) -> None:
+        """Percorre o comando SQL, extraindo as cláusulas SQL.
+
+        Uma cláusula só é extraída se estiver fora de parênteses e
+        fora de literais textuais. O operador 'not in' é aceito com
+        qualquer quantia de espaços em branco entre as duas palavras,
+        e o ';' só é extraído se for o último caractere do comando.
+        """
+        command: str = self.sql_command
+        # A profundidade atual dos parênteses.
+        depth: int = 0
+        position: int = 0
+
+        while (lexeme := self.__lexeme_pattern.search(command, position)) is not None:
+            kind: str = lexeme.lastgroup
+            (start, position) = lexeme.span()
+
+            if kind == "word":
+                # Somente palavras fora de parênteses são cláusulas SQL.
+                if depth == 0:
+                    word: str = lexeme.group().lower()
+                    if word in self.__keywords:
+                        self.__tokens.append((lexeme.group(), start))
+                    # Verifica se o 'not' é seguido por um 'in'.
+                    elif word == "not" and (not_in := self.__not_in_pattern.match(command, position)):
+                        position = not_in.end()
+                        self.__tokens.append((command[start:position], start))
+            elif kind in ("string", "number"):
+                self.__literals.append((start, position))
+            elif kind == "placeholder":
+                self.__placeholders.append(start)
+            elif kind == "open":
+                depth += 1
+            else:
+                depth = max(depth - 1, 0)
+
+        # O ';' só é considerado se estiver no final do comando.
+        if command.endswith(";"):
+            self.__tokens.append((";", len(command) - 1))
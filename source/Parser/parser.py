@@ -7,6 +7,10 @@ from typing import List, Tuple, Dict, Callable
 
 # pylint: disable=import-error
 import Exceptions
+from Catalog import Catalog
+from Parser.lexer import Lexer
+from Parser.sql_ast import Select
+from Parser.syntax_parser import SyntaxParser
 
 class Parser:
     """Classe responsável pela verificação e validação de um comando SQL.
@@ -26,8 +30,10 @@ class Parser:
     __sql_tables: Dict[str, List[str]]
     # As colunas usadas no comando SQL.
     __sql_columns: Dict[str, List[str]]
-    # Expressão regular para extração de palavras reservadas (cláusulas) do MySQL.
-    __sql_token_pattern: str = r'(?<!\()\b(select|from|join|on|where|and|in|not\s+in)\b(?!([^()]*\)))|(;$)'
+    # A Árvore Sintática Abstrata do comando SQL.
+    __sql_ast: Select
+    # As subconsultas (dos IN e NOT IN) já analisadas, indexadas pelo seu texto.
+    __sql_subqueries: Dict[str, 'Parser']
     # Expressão regular para a verificação do posicionamento das cláusulas do MySQL.
     __sql_command_pattern: str = r'^select\sfrom\s(?:join\son\s((and|in|not\sin)\s)*?|where\s((and|in|not\sin)\s)*?)*;$'
     # Expressão regular para validação dos parâmetros da cláusula SELECT do MySQL.
@@ -57,6 +63,7 @@ class Parser:
         self.sql_tokens = self.__tokenize()
         self.sql_params = self.__extract_params()
         self.__validate_tokens()
+        self.__sql_subqueries = {}
         self.__sql_tables = {
             key: list()
             for key in ["SELECT", "FROM", "JOIN", "ON", "AND_ON", "IN_ON", "NOT IN_ON", "WHERE", "AND_WHERE", "IN_WHERE", "NOT IN_WHERE"]
@@ -66,6 +73,7 @@ class Parser:
             for key in ["SELECT", "FROM", "JOIN", "ON", "AND_ON", "IN_ON", "NOT IN_ON", "WHERE", "AND_WHERE", "IN_WHERE", "NOT IN_WHERE"]
         }
         self.__validate_params()
+        self.sql_ast = SyntaxParser(self.sql_tokens, self.sql_params, self.__parse_subquery).parse()
 
     @property
     def sql_command(self) -> str:
@@ -173,7 +181,7 @@ class Parser:
             new_sql_tables (Dict[str, List[str]]): As tabelas utilizadas
             no comando SQL.
         """
-        self.sql_tables = new_sql_tables
+        self.__sql_tables = new_sql_tables
 
     @property
     def sql_columns(self) -> Dict[str, List[str]]:
@@ -199,20 +207,50 @@ class Parser:
             new_sql_columns (Dict[str, List[str]]): As colunas
             utilizadas no comando SQL.
         """
-        self.sql_columns = new_sql_columns
+        self.__sql_columns = new_sql_columns
 
     @property
-    def sql_token_pattern(self) -> str:
-        """Extrai o conteúdo da variável privada sql_token_pattern.
+    def sql_ast(self) -> Select:
+        """Extrai o conteúdo da variável privada sql_ast.
 
-        Acessa a variável privada da classe, responsável pelo regex
-        da seleção e captura de comandos SQL, bem como o SELECT, FROM,
-        JOIN, ON e WHERE, retornando seu conteúdo.
+        Acessa a variável privada da classe, responsável pelo
+        armazenamento da Árvore Sintática Abstrata do comando SQL,
+        construída uma única vez, após a validação do comando.
 
         Returns:
-            str: O conteúdo, regex, da variável privada da classe.
+            Select: O nó raiz da Árvore Sintática Abstrata.
         """
-        return self.__sql_token_pattern
+        return self.__sql_ast
+
+    @sql_ast.setter
+    def sql_ast(self, new_sql_ast: Select) -> None:
+        """Altera o conteúdo da variável privada sql_ast.
+
+        Args:
+            new_sql_ast (Select): A nova Árvore Sintática Abstrata
+            do comando SQL.
+        """
+        self.__sql_ast = new_sql_ast
+
+    @property
+    def sql_subqueries(self) -> Dict[str, 'Parser']:
+        """Extrai o conteúdo da variável privada sql_subqueries.
+
+        Returns:
+            Dict[str, Parser]: As subconsultas já analisadas, indexadas
+            pelo seu texto (sem o ';').
+        """
+        return self.__sql_subqueries
+
+    @sql_subqueries.setter
+    def sql_subqueries(self, new_sql_subqueries: Dict[str, 'Parser']) -> None:
+        """Altera o conteúdo da variável privada sql_subqueries.
+
+        Args:
+            new_sql_subqueries (Dict[str, Parser]): As novas subconsultas
+            já analisadas, indexadas pelo seu texto.
+        """
+        self.__sql_subqueries = new_sql_subqueries
 
     @property
     def sql_command_pattern(self) -> str:
@@ -323,19 +361,16 @@ class Parser:
         """Itera sobre um comando SQL (sql_command), extraindo
         os comandos SQL válidos e suas posições.
 
-        Itera sobre cada elemento textual do comando SQL, armazenado
-        na variável privada sql_command, armazenando somente os textos
-        que estão de acordo com o regex sql_token_pattern, juntamente
-        com a sua posição no comando.
+        Percorre o comando SQL, armazenado na variável privada
+        sql_command, uma única vez (veja 'Lexer'), armazenando somente
+        as cláusulas SQL que estão fora de parênteses e de literais
+        textuais, juntamente com a sua posição no comando.
 
         Returns:
             List[Tuple[str, int]]: Uma lista de tuplas, as quais contém
             o texto representando um comando SQL e sua posição no texto.
         """
-        return [
-            (match.group(), match.start())
-            for match in re.finditer(self.sql_token_pattern, self.sql_command, re.IGNORECASE)
-        ]
+        return Lexer(self.sql_command).tokens
 
     def __extract_params(self) -> List[str]:
         """Extrai os parâmetros relacionados as cláusulas SQL do
@@ -538,7 +573,7 @@ class Parser:
                 if (matches := re.match(self.sql_in_params_pattern, params)) is not None:
                     # Verifica a subconsulta do IN (do ON).
                     if subcommand := matches.group("subcommand1") or matches.group("subcommand2"):
-                        Parser(subcommand + ";")
+                        self.__parse_subcommand(subcommand)
                 else:
                     Exceptions.raise_invalid_statement_params_exception(params)
             else:
@@ -558,7 +593,7 @@ class Parser:
                 if (matches := re.match(self.sql_in_params_pattern, params)) is not None:
                     # Verifica a subconsulta do NOT IN (do ON).
                     if subcommand := matches.group("subcommand1") or matches.group("subcommand2"):
-                        Parser(subcommand + ";")
+                        self.__parse_subcommand(subcommand)
                 else:
                     Exceptions.raise_invalid_statement_params_exception(params)
             else:
@@ -638,7 +673,7 @@ class Parser:
                 if (matches := re.match(self.sql_in_params_pattern, params)) is not None:
                     # Verifica a subconsulta do IN (do WHERE).
                     if subcommand := matches.group("subcommand1") or matches.group("subcommand2"):
-                        Parser(subcommand + ";")
+                        self.__parse_subcommand(subcommand)
                 else:
                     Exceptions.raise_invalid_statement_params_exception(params)
             else:
@@ -658,7 +693,7 @@ class Parser:
                 if (matches := re.match(self.sql_in_params_pattern, params)) is not None:
                     # Verifica a subconsulta do NOT IN (do WHERE).
                     if subcommand := matches.group("subcommand1") or matches.group("subcommand2"):
-                        Parser(subcommand + ";")
+                        self.__parse_subcommand(subcommand)
                 else:
                     Exceptions.raise_invalid_statement_params_exception(params)
             else:
@@ -684,6 +719,35 @@ class Parser:
             # Chama o método de verificação de parâmetros de um determinada cláusula SQL.
             validator[self.sql_tokens[i][0].upper()](params)
 
+    def __parse_subcommand(self, subcommand: str) -> 'Parser':
+        """Analisa uma subconsulta (de um IN ou NOT IN), uma única vez.
+
+        O resultado é armazenado em 'sql_subqueries', indexado pelo texto
+        da subconsulta, e reaproveitado pelas subconsultas repetidas.
+
+        Args:
+            subcommand (str): A subconsulta, sem o ';'.
+
+        Returns:
+            Parser: O resultado da análise da subconsulta.
+        """
+        subcommand = subcommand.strip()
+        if subcommand not in self.sql_subqueries:
+            self.sql_subqueries[subcommand] = Parser(subcommand + ";")
+        return self.sql_subqueries[subcommand]
+
+    def __parse_subquery(self, subcommand: str) -> Select:
+        """Analisa uma subconsulta (de um IN ou NOT IN), para a
+        Árvore Sintática Abstrata.
+
+        Args:
+            subcommand (str): A subconsulta, sem o ';'.
+
+        Returns:
+            Select: A Árvore Sintática Abstrata da subconsulta.
+        """
+        return self.__parse_subcommand(subcommand).sql_ast
+
     def check_database_compatibility(self, database: Dict[str, List[str]]) -> None:
         """Verifica se todas as tabelas e colunas usadas no comando SQL 
         fornecido são compatíveis com o banco de dados exemplar fornecido.
@@ -695,35 +759,17 @@ class Parser:
         Veja '/source/Examples' para mais detalhes sobre a estrutura de 'database'.
         """
 
-        # Pega o nome das tabelas do exemplo e adiciona em uma lista.
-        tables_in_database: List[str] = list(database.keys())
-        # Pega o nome das colunas do exemplo e adiciona em uma lista.
-        columns_in_database: List[str] = [
-            column
-            for columns in database.values()
-            for column in columns
-        ]
+        # O catálogo (índices das tabelas e colunas) do banco de dados exemplar.
+        catalog: Catalog = Catalog.for_database(database)
 
         # Itera sobre cada tabela e coluna extraída do comando SQL.
         for clause, tables, columns in zip(self.sql_tables.keys(), self.sql_tables.values(), self.sql_columns.values()):
-            # Deixa todos os nomes de tabelas e colunas em minúsculo.
-            tables = set([table.lower() for table in tables])
-            columns = set([column.lower() for column in columns])
             # Verifica se as tabelas e/ou colunas estão no contexto do banco de dados exemplo.
-            if tables:
-                if tables.issubset(tables_in_database):
-                    continue
-                else:
-                    Exceptions.raise_table_mismatch_in_example_exception(clause)
-            if columns:
-                if "*" not in columns:
-                    if columns.issubset(columns_in_database):
-                        continue
-                    else:
-                        Exceptions.raise_column_mismatch_in_example_exception(clause)
-                # Ignora o '*', pq é todas as colunas de uma tabela ...
-                else:
-                    continue
+            if not all(catalog.has_table(table) for table in tables):
+                Exceptions.raise_table_mismatch_in_example_exception(clause)
+            # Ignora o '*', pq é todas as colunas de uma tabela ...
+            if "*" not in columns and not all(catalog.has_column(column) for column in columns):
+                Exceptions.raise_column_mismatch_in_example_exception(clause)
 
         print("[OK!] O comando SQL fornecido é válido.")
         print("[OK!] O comando SQL passou na verificação de tabelas e colunas no banco de dados exemplo.")
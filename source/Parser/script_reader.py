@@ -0,0 +1,186 @@
+"""Arquivo responsável pela leitura, em fluxo, de scripts com
+vários comandos SQL, separados por ';', com uso de memória
+limitado ao tamanho do maior comando."""
+
+import os
+import re
+from typing import Dict, Iterator, List, TextIO, Tuple, Union
+
+# pylint: disable=import-error
+from Parser.cache import ParserCache
+from Parser.parser import Parser
+
+class ScriptReader:
+    """Classe responsável pela leitura de um script SQL em fluxo.
+
+    O script é lido em blocos de tamanho fixo e dividido nos ';' que
+    estão fora de parênteses, de aspas (simples ou duplas, respeitando
+    aspas escapadas) e de comentários ('--' até o fim da linha). Os
+    comandos são gerados sob demanda: somente o bloco atual e o
+    comando em construção ficam em memória.
+
+    Os comentários são removidos dos comandos. Um texto final sem ';'
+    também é gerado, para que o Parser aponte a falta do ';'.
+    """
+
+    # O caminho do script, ou o fluxo de texto já aberto.
+    __source: Union[str, os.PathLike, TextIO]
+    # A quantia de caracteres lidos por bloco.
+    __chunk_size: int
+    # Próximo elemento relevante fora de aspas e de comentários: um ';',
+    # um parêntese, uma aspa, um comentário ou um '-' ao final do bloco.
+    __outside_pattern: re.Pattern = re.compile(r"""[;()'"]|--|-\Z""")
+    # Próximo elemento relevante dentro de aspas: a aspa de fechamento ou um escape.
+    __quote_patterns: Dict[str, re.Pattern] = {"'": re.compile(r"['\\]"), '"': re.compile(r'["\\]')}
+
+    def __init__(self, source: Union[str, os.PathLike, TextIO], chunk_size: int = 1 << 16) -> None:
+        """Construtor da classe.
+
+        Args:
+            source (str | os.PathLike | TextIO): O caminho do script, ou
+            um fluxo de texto (ex.: 'sys.stdin') já aberto.
+            chunk_size (int, optional): A quantia de caracteres lidos por
+            bloco. Valor padrão: 65536.
+        """
+        self.__source = source
+        self.__chunk_size = max(1, chunk_size)
+
+    @property
+    def chunk_size(self) -> int:
+        """Extrai o conteúdo da variável privada chunk_size.
+
+        Returns:
+            int: A quantia de caracteres lidos por bloco.
+        """
+        return self.__chunk_size
+
+    def __iter__(self) -> Iterator[str]:
+        """Percorre os comandos do script (veja 'statements').
+
+        Returns:
+            Iterator[str]: Os comandos SQL, na ordem do script.
+        """
+        return self.statements()
+
+    def statements(self) -> Iterator[str]:
+        """Gera os comandos SQL do script, sob demanda.
+
+        Yields:
+            str: Cada comando SQL, sem os espaços ao redor, terminado
+            em ';' (exceto, possivelmente, o último).
+        """
+        if isinstance(self.__source, (str, os.PathLike)):
+            with open(self.__source, "r", encoding="utf-8") as stream:
+                yield from self.__split(stream)
+        else:
+            yield from self.__split(self.__source)
+
+    def parse(self, parser_cache: Union[ParserCache, None] = None) -> Iterator[Tuple[str, Union[Parser, Exception]]]:
+        """Gera, sob demanda, o resultado do Parser de cada comando do script.
+
+        Um comando inválido não interrompe a leitura: a exceção lançada
+        pelo Parser é gerada no lugar do resultado.
+
+        Args:
+            parser_cache (ParserCache | None, optional): O cache usado na
+            análise dos comandos. Valor padrão: None (um novo cache).
+
+        Yields:
+            Tuple[str, Parser | Exception]: O comando SQL e o resultado
+            do Parser, ou a exceção lançada.
+        """
+        parser_cache = parser_cache if parser_cache is not None else ParserCache()
+        for statement in self.statements():
+            try:
+                yield (statement, parser_cache.parse(statement))
+            # pylint: disable=broad-exception-caught
+            except Exception as excp:
+                yield (statement, excp)
+
+    def __split(self, stream: TextIO) -> Iterator[str]:
+        """Divide o conteúdo de um fluxo de texto nos ';' de nível superior.
+
+        O estado (profundidade dos parênteses, aspas e comentários) é
+        mantido entre os blocos; um '-' ou um escape ao final do bloco
+        é adiado para o próximo bloco.
+
+        Args:
+            stream (TextIO): O fluxo de texto.
+
+        Yields:
+            str: Cada comando SQL do fluxo.
+        """
+        # Os pedaços do comando em construção.
+        pieces: List[str] = []
+        # A profundidade dos parênteses.
+        depth: int = 0
+        # A aspa atualmente aberta, caso haja.
+        quote: Union[str, None] = None
+        # Verdadeiro caso esteja dentro de um comentário.
+        in_comment: bool = False
+        # O final do bloco anterior ainda não analisado.
+        pending: str = ""
+
+        while True:
+            chunk: str = stream.read(self.chunk_size)
+            final: bool = not chunk
+            text: str = pending + chunk
+            pending = ""
+            # Posição atual da análise e início do pedaço ainda não armazenado.
+            position: int = 0
+            start: int = 0
+
+            while position < len(text):
+                if in_comment:
+                    if (newline := text.find("\n", position)) < 0:
+                        start = position = len(text)
+                        break
+                    in_comment = False
+                    start = position = newline
+                    continue
+
+                if quote is not None:
+                    if (match := self.__quote_patterns[quote].search(text, position)) is None:
+                        position = len(text)
+                        break
+                    if match.group() == "\\":
+                        if match.end() == len(text) and not final:
+                            pending = text[match.start():]
+                            break
+                        position = match.end() + 1
+                    else:
+                        quote = None
+                        position = match.end()
+                    continue
+
+                if (match := self.__outside_pattern.search(text, position)) is None:
+                    position = len(text)
+                    break
+                lexeme: str = match.group()
+                if lexeme == ";" and depth == 0:
+                    pieces.append(text[start:match.end()])
+                    if (statement := "".join(pieces).strip()) != ";":
+                        yield statement
+                    pieces = []
+                    start = match.end()
+                elif lexeme == "(":
+                    depth += 1
+                elif lexeme == ")":
+                    depth = max(0, depth - 1)
+                elif lexeme in ("'", '"'):
+                    quote = lexeme
+                elif lexeme == "--":
+                    pieces.append(text[start:match.start()])
+                    in_comment = True
+                    start = match.end()
+                elif lexeme == "-" and not final:
+                    pending = text[match.start():]
+                    break
+                position = match.end()
+
+            pieces.append(text[start:len(text) - len(pending)])
+            if final:
+                break
+
+        if statement := "".join(pieces).strip():
+            yield statement
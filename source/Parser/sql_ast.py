@@ -0,0 +1,252 @@
+"""Arquivo responsável pela representação tipada (Árvore Sintática
+Abstrata) de um comando SQL já verificado e validado pelo Parser."""
+
+from typing import List, Union
+
+class ColumnRef:
+    """Representa uma coluna, no formato 'nomeColuna' ou
+    'nomeTabela.nomeColuna' ('*' representa todas as colunas)."""
+
+    __slots__ = ("table", "column")
+
+    def __init__(self, table: Union[str, None], column: str) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (str | None): O nome da tabela, caso explícito.
+            column (str): O nome da coluna.
+        """
+        self.table = table
+        self.column = column
+
+    def __str__(self) -> str:
+        return f"{self.table}.{self.column}" if self.table else self.column
+
+    def __repr__(self) -> str:
+        return f"ColumnRef({self.table!r}, {self.column!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ColumnRef) and (self.table, self.column) == (other.table, other.column)
+
+    def __hash__(self) -> int:
+        return hash((self.table, self.column))
+
+class Literal:
+    """Representa um literal (textual, numérico, booleano ou nulo)."""
+
+    __slots__ = ("value", "text")
+
+    def __init__(self, value: Union[int, float, str, bool, None], text: str) -> None:
+        """Construtor da classe.
+
+        Args:
+            value (int | float | str | bool | None): O valor do literal, já convertido.
+            text (str): O texto do literal, como escrito no comando SQL.
+        """
+        self.value = value
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"Literal({self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Literal) and self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+class Parameter(Literal):
+    """Representa o literal de um marcador de parâmetro ('?') de um
+    comando preparado: o seu valor somente é conhecido após a
+    atribuição dos parâmetros (bind), e não durante a conversão."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"Parameter({self.text!r})"
+
+class TableRef:
+    """Representa uma tabela, usada no FROM ou no JOIN."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        """Construtor da classe.
+
+        Args:
+            name (str): O nome da tabela.
+        """
+        self.name = name
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return f"TableRef({self.name!r})"
+
+class Comparison:
+    """Representa uma condicional com um operador de comparação
+    (=, >, <, <=, >=, <>)."""
+
+    __slots__ = ("left", "operator", "right")
+
+    def __init__(self, left: ColumnRef, operator: str, right: Union[ColumnRef, Literal]) -> None:
+        """Construtor da classe.
+
+        Args:
+            left (ColumnRef): A coluna à esquerda do operador.
+            operator (str): O operador de comparação.
+            right (ColumnRef | Literal): A coluna, ou o literal, à direita do operador.
+        """
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def __str__(self) -> str:
+        return f"{self.left} {self.operator} {self.right}"
+
+    def __repr__(self) -> str:
+        return f"Comparison({self.left!r}, {self.operator!r}, {self.right!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Comparison) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+class InList:
+    """Representa uma condicional IN (ou NOT IN) com uma lista de literais."""
+
+    __slots__ = ("column", "values", "negated")
+
+    def __init__(self, column: ColumnRef, values: List[Literal], negated: bool) -> None:
+        """Construtor da classe.
+
+        Args:
+            column (ColumnRef): A coluna verificada.
+            values (List[Literal]): Os literais da lista.
+            negated (bool): Verdadeiro caso seja um NOT IN.
+        """
+        self.column = column
+        self.values = values
+        self.negated = negated
+
+    def __str__(self) -> str:
+        return f"{self.column} {'NOT IN' if self.negated else 'IN'} ({', '.join(map(str, self.values))})"
+
+    def __repr__(self) -> str:
+        return f"InList({self.column!r}, {self.values!r}, negated={self.negated})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, InList) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+class InSubquery:
+    """Representa uma condicional IN (ou NOT IN) com uma subconsulta."""
+
+    __slots__ = ("column", "query", "text", "negated")
+
+    def __init__(self, column: ColumnRef, query: "Select", text: str, negated: bool) -> None:
+        """Construtor da classe.
+
+        Args:
+            column (ColumnRef): A coluna verificada.
+            query (Select): A subconsulta, já analisada.
+            text (str): O texto da subconsulta, como escrito no comando SQL.
+            negated (bool): Verdadeiro caso seja um NOT IN.
+        """
+        self.column = column
+        self.query = query
+        self.text = text
+        self.negated = negated
+
+    def __str__(self) -> str:
+        return f"{self.column} {'NOT IN' if self.negated else 'IN'} ({self.text})"
+
+    def __repr__(self) -> str:
+        return f"InSubquery({self.column!r}, {self.text!r}, negated={self.negated})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, InSubquery) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+# Uma condicional do ON ou do WHERE. Uma coluna sozinha também é uma condicional.
+Predicate = Union[Comparison, InList, InSubquery, ColumnRef]
+
+def predicate_columns(predicate: Predicate) -> List[ColumnRef]:
+    """Retorna as colunas usadas em uma condicional.
+
+    As colunas de uma subconsulta não são incluídas.
+
+    Args:
+        predicate (Predicate): A condicional.
+
+    Returns:
+        List[ColumnRef]: As colunas, na ordem em que aparecem.
+    """
+    if isinstance(predicate, ColumnRef):
+        return [predicate]
+    if isinstance(predicate, Comparison):
+        return [predicate.left] + ([predicate.right] if isinstance(predicate.right, ColumnRef) else [])
+    return [predicate.column]
+
+class Join:
+    """Representa um JOIN e as condicionais do seu ON."""
+
+    __slots__ = ("table", "conditions")
+
+    def __init__(self, table: TableRef, conditions: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (TableRef): A tabela da junção.
+            conditions (List[Predicate]): As condicionais do ON (unidas por AND).
+        """
+        self.table = table
+        self.conditions = conditions
+
+    def __repr__(self) -> str:
+        return f"Join({self.table!r}, {self.conditions!r})"
+
+class Select:
+    """Representa um comando SELECT completo."""
+
+    __slots__ = ("columns", "tables", "joins", "where")
+
+    def __init__(
+            self,
+            columns: List[ColumnRef],
+            tables: List[TableRef],
+            joins: List[Join],
+            where: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            columns (List[ColumnRef]): As colunas do SELECT.
+            tables (List[TableRef]): As tabelas do FROM.
+            joins (List[Join]): Os JOINs, na ordem do comando.
+            where (List[Predicate]): As condicionais do WHERE (unidas por AND).
+        """
+        self.columns = columns
+        self.tables = tables
+        self.joins = joins
+        self.where = where
+
+    @property
+    def is_star(self) -> bool:
+        """Verifica se o SELECT seleciona todas as colunas ('*').
+
+        Returns:
+            bool: Verdadeiro caso o SELECT seja um '*'.
+        """
+        return any(column.column == "*" for column in self.columns)
+
+    def __repr__(self) -> str:
+        return f"Select({self.columns!r}, {self.tables!r}, {self.joins!r}, {self.where!r})"
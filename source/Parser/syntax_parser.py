@@ -0,0 +1,242 @@
+"""Arquivo responsável pela construção da Árvore Sintática Abstrata
+de um comando SQL, a partir das cláusulas e dos parâmetros já
+verificados e validados pelo Parser."""
+
+import re
+from typing import Callable, List, Tuple, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Parser.sql_ast import ColumnRef, Comparison, InList, InSubquery, Join, Literal, Predicate, Select, TableRef
+
+# Um elemento de um parâmetro: o tipo, o texto e as posições (início e fim).
+Lexeme = Tuple[str, str, int, int]
+
+class SyntaxParser:
+    """Classe responsável pela construção da Árvore Sintática Abstrata.
+
+    Analisador descendente recursivo, que percorre as cláusulas SQL
+    (e os seus parâmetros) uma única vez, seguindo a gramática:
+
+        select      := SELECT colunas FROM tabelas (junção | filtro)*
+        junção      := JOIN tabela ON condições
+        filtro      := WHERE condições
+        condições   := condição (AND condição)*
+        condição    := coluna operador (coluna | literal)
+                     | coluna ((IN | NOT IN) lista)?
+        lista       := '(' literal (',' literal)* ')' | '(' subconsulta ')'
+    """
+
+    # As cláusulas SQL (em maiúsculo, com os sufixos '_ON' e '_WHERE') e os seus parâmetros.
+    __clauses: List[Tuple[str, str]]
+    # A posição da próxima cláusula a ser analisada.
+    __position: int
+    # Função que analisa uma subconsulta, retornando a sua Árvore Sintática Abstrata.
+    __parse_subquery: Callable[[str], Select]
+    # Expressão regular que reconhece o próximo elemento de um parâmetro.
+    __lexeme_pattern: re.Pattern = re.compile(
+        r"\s*(?:(?P<string>'(?:[^'\\]|\\.)*')"
+        r"|(?P<number>[0-9]+(?:\.[0-9]+)?(?:e[+-]?[0-9]+)?)"
+        r"|(?P<name>[^\W\d]\w*(?:\.[^\W\d]\w*)?|\*)"
+        r"|(?P<operator><=|>=|<>|=|<|>)"
+        r"|(?P<punctuation>[(),]))\s*",
+        re.DOTALL
+    )
+
+    def __init__(
+            self,
+            sql_tokens: List[Tuple[str, int]],
+            sql_params: List[str],
+            parse_subquery: Callable[[str], Select]) -> None:
+        """Construtor da classe.
+
+        Args:
+            sql_tokens (List[Tuple[str, int]]): As cláusulas SQL, já com os
+            sufixos adicionados pelo Parser, e as suas posições.
+            sql_params (List[str]): Os parâmetros de cada cláusula SQL.
+            parse_subquery (Callable[[str], Select]): Função que analisa uma
+            subconsulta (sem o ';'), retornando a sua Árvore Sintática Abstrata.
+        """
+        self.__clauses = [(token.upper(), params) for (token, _), params in zip(sql_tokens, sql_params)]
+        self.__position = 0
+        self.__parse_subquery = parse_subquery
+
+    def parse(self) -> Select:
+        """Constrói a Árvore Sintática Abstrata do comando.
+
+        Returns:
+            Select: O nó raiz da Árvore Sintática Abstrata.
+        """
+        columns: List[ColumnRef] = [self.__parse_column(column) for column in self.__expect("SELECT").split(",")]
+        tables: List[TableRef] = [TableRef(table.strip()) for table in self.__expect("FROM").split(",")]
+        joins: List[Join] = []
+        where: List[Predicate] = []
+
+        while (clause := self.__peek()) is not None:
+            if clause == "JOIN":
+                table: TableRef = TableRef(self.__expect("JOIN").strip())
+                joins.append(Join(table, self.__parse_conditions("ON")))
+            elif clause == "WHERE":
+                where.extend(self.__parse_conditions("WHERE"))
+            else:
+                # Uma cláusula fora de posição, ex.: um IN depois de uma comparação.
+                Exceptions.raise_invalid_statement_params_exception(self.__clauses[self.__position][1])
+
+        return Select(columns, tables, joins, where)
+
+    def __peek(self) -> Union[str, None]:
+        """Retorna a próxima cláusula, sem consumi-la.
+
+        Returns:
+            str | None: A próxima cláusula, ou None caso não haja mais cláusulas.
+        """
+        return self.__clauses[self.__position][0] if self.__position < len(self.__clauses) else None
+
+    def __expect(self, clause: str) -> str:
+        """Consome a próxima cláusula, que deve ser 'clause'.
+
+        Args:
+            clause (str): A cláusula esperada.
+
+        Returns:
+            str: Os parâmetros da cláusula consumida.
+        """
+        if self.__peek() != clause:
+            Exceptions.raise_missing_statement_exception(clause)
+        self.__position += 1
+        return self.__clauses[self.__position - 1][1]
+
+    def __parse_conditions(self, clause: str) -> List[Predicate]:
+        """Analisa as condições de um ON ou de um WHERE.
+
+        Args:
+            clause (str): A cláusula das condições ('ON' ou 'WHERE').
+
+        Returns:
+            List[Predicate]: As condições, unidas por AND.
+        """
+        conditions: List[Predicate] = [self.__parse_condition(self.__expect(clause), clause)]
+        while self.__peek() == f"AND_{clause}":
+            conditions.append(self.__parse_condition(self.__expect(f"AND_{clause}"), clause))
+        return conditions
+
+    def __parse_condition(self, params: str, clause: str) -> Predicate:
+        """Analisa uma única condição.
+
+        Uma coluna sozinha pode ser seguida por um IN ou NOT IN, cuja
+        lista é a próxima cláusula.
+
+        Args:
+            params (str): Os parâmetros da condição.
+            clause (str): A cláusula da condição ('ON' ou 'WHERE').
+
+        Returns:
+            Predicate: A condição analisada.
+        """
+        lexemes: List[Lexeme] = self.__scan(params)
+
+        if len(lexemes) == 1 and lexemes[0][0] == "name":
+            column: ColumnRef = self.__parse_column(lexemes[0][1])
+            if self.__peek() == f"IN_{clause}":
+                return self.__parse_in(column, self.__expect(f"IN_{clause}"), negated=False)
+            if self.__peek() == f"NOT IN_{clause}":
+                return self.__parse_in(column, self.__expect(f"NOT IN_{clause}"), negated=True)
+            return column
+
+        if len(lexemes) == 3 and lexemes[0][0] == "name" and lexemes[1][0] == "operator":
+            right: Union[ColumnRef, Literal] = self.__parse_operand(lexemes[2])
+            return Comparison(self.__parse_column(lexemes[0][1]), lexemes[1][1], right)
+
+        Exceptions.raise_invalid_statement_params_exception(params)
+
+    def __parse_in(self, column: ColumnRef, params: str, negated: bool) -> Union[InList, InSubquery]:
+        """Analisa a lista de um IN ou de um NOT IN.
+
+        Args:
+            column (ColumnRef): A coluna verificada.
+            params (str): A lista, entre parênteses.
+            negated (bool): Verdadeiro caso seja um NOT IN.
+
+        Returns:
+            InList | InSubquery: A condição analisada.
+        """
+        lexemes: List[Lexeme] = self.__scan(params)
+
+        # Subconsulta: todo o conteúdo entre os parênteses.
+        if len(lexemes) > 2 and lexemes[1][0] == "name" and lexemes[1][1].lower() == "select":
+            text: str = params[lexemes[0][3]:lexemes[-1][2]].strip()
+            return InSubquery(column, self.__parse_subquery(text), text, negated)
+
+        # Lista de literais: '(' literal (',' literal)* ')'.
+        values: List[Literal] = []
+        for i, lexeme in enumerate(lexemes[1:-1]):
+            if i % 2:
+                if lexeme[1] != ",":
+                    Exceptions.raise_invalid_statement_params_exception(params)
+                continue
+            operand: Union[ColumnRef, Literal] = self.__parse_operand(lexeme)
+            if not isinstance(operand, Literal):
+                Exceptions.raise_invalid_statement_params_exception(params)
+            values.append(operand)
+
+        if not values or len(lexemes) % 2 == 0 or lexemes[0][1] != "(" or lexemes[-1][1] != ")":
+            Exceptions.raise_invalid_statement_params_exception(params)
+        return InList(column, values, negated)
+
+    def __scan(self, params: str) -> List[Lexeme]:
+        """Divide um parâmetro em elementos.
+
+        Args:
+            params (str): O parâmetro.
+
+        Returns:
+            List[Lexeme]: Os elementos do parâmetro.
+        """
+        lexemes: List[Lexeme] = []
+        position: int = 0
+        while position < len(params):
+            if (lexeme := self.__lexeme_pattern.match(params, position)) is None:
+                Exceptions.raise_invalid_statement_params_exception(params)
+            kind: str = lexeme.lastgroup
+            lexemes.append((kind, lexeme.group(kind), lexeme.start(kind), lexeme.end(kind)))
+            position = lexeme.end()
+        return lexemes
+
+    @staticmethod
+    def __parse_column(text: str) -> ColumnRef:
+        """Analisa uma coluna, no formato 'nomeColuna' ou 'nomeTabela.nomeColuna'.
+
+        Args:
+            text (str): O texto da coluna.
+
+        Returns:
+            ColumnRef: A coluna analisada.
+        """
+        text = text.strip()
+        if "." in text:
+            (table, column) = text.split(".", 1)
+            return ColumnRef(table, column)
+        return ColumnRef(None, text)
+
+    def __parse_operand(self, lexeme: Lexeme) -> Union[ColumnRef, Literal]:
+        """Analisa um operando: uma coluna ou um literal.
+
+        Args:
+            lexeme (Lexeme): O elemento do operando.
+
+        Returns:
+            ColumnRef | Literal: O operando analisado.
+        """
+        (kind, text, _, _) = lexeme
+        if kind == "number":
+            return Literal(int(text) if text.isdigit() else float(text), text)
+        if kind == "string":
+            return Literal(re.sub(r"\\(.)", r"\1", text[1:-1], flags=re.DOTALL), text)
+        if kind == "name":
+            keyword: str = text.lower()
+            if keyword in ("true", "false"):
+                return Literal(keyword == "true", text)
+            if keyword == "null":
+                return Literal(None, text)
+            return self.__parse_column(text)
+        Exceptions.raise_invalid_statement_params_exception(text)
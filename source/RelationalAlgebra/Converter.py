@@ -1,27 +1,33 @@
 """Arquivo responsável pela conversão de um comando
 SQL para sua expressão em Álgebra Relacional já otimizada."""
 
-import re
 from functools import reduce
 from collections import OrderedDict
-from typing import Dict, List, Union
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 
 # pylint: disable=import-error
 import Exceptions
+from Catalog import Catalog, MaterializedView, qualify
 from Parser.parser import Parser
+from Parser.sql_ast import ColumnRef, InSubquery, Predicate, Select, predicate_columns
+from RelationalAlgebra import plan
+from RelationalAlgebra.join_order import CostModel, JoinCondition, JoinMethod, JoinOrder, JoinOrderer
+from RelationalAlgebra.simplify import simplify
+from Storage import Index
 
 class Node:
-    """Representa uma nó de uma árvore."""
+    """Representa uma nó de uma árvore.
 
-    value: Union[str, None] = None
-    parent: Union['Node', None] = None
-    left_children: Union['Node', None] = None
-    right_children: Union['Node', None] = None
-    execution_order: Union[int, None] = None
+    O nó guarda um operador tipado da Álgebra Relacional (veja
+    'RelationalAlgebra/plan.py'); o valor exibido é a representação
+    textual do operador.
+    """
+
+    __slots__ = ("operator", "parent", "left_children", "right_children", "execution_order")
 
     def __init__(
             self,
-            value: Union[str, None] = None,
+            operator: Union[plan.Operator, None] = None,
             parent: Union['Node', None] = None,
             left_children: Union['Node', None] = None,
             right_children: Union['Node', None] = None,
@@ -29,18 +35,44 @@ class Node:
         """Construtor da classe.
 
         Args:
-            value (str | None, optional): O valor do nó. Valor padrão: None.
+            operator (Operator | None, optional): O operador do nó. Valor padrão: None.
             parent (Node | None, optional): O nó pai desse nó. Valor padrão: None.
             left_children (Node | None, optional): O nó filho (esquerdo) deste nó. Valor padrão: None.
             right_children (Node | None, optional): O nó filho (direito) deste nó. Valor padrão: None.
             execution_order (int | None, optional): A ordem de execução do nó. Valor padrão: None.
         """
-        self.value = value
+        self.operator = operator
         self.parent = parent
         self.left_children = left_children
         self.right_children = right_children
         self.execution_order = execution_order
 
+    @property
+    def value(self) -> str:
+        """Representa o operador do nó, no formato exibido na árvore.
+
+        Returns:
+            str: O valor do nó, ou um texto vazio caso não haja operador.
+        """
+        return self.operator.render() if self.operator is not None else ""
+
+    def serialize(self) -> Dict[str, Any]:
+        """Serializa o nó, e os seus filhos, em um dicionário.
+
+        O dicionário contém somente tipos primitivos, podendo ser
+        convertido para JSON ou transferido entre processos.
+
+        Returns:
+            Dict[str, Any]: O valor, a ordem de execução e os filhos
+            (esquerdo e direito, também serializados) do nó.
+        """
+        return {
+            "value": self.value,
+            "execution_order": self.execution_order,
+            "left_children": self.left_children.serialize() if self.left_children else None,
+            "right_children": self.right_children.serialize() if self.right_children else None
+        }
+
 class Converter:
     """Classe responsável pela conversão de um comando SQL
     para Álgebra Relacional.
@@ -55,14 +87,25 @@ class Converter:
     __parser: Parser
     # A Álgebra Relaciona de algum comando SQL.
     __relational_algebra: str
-    # Informações sobre as tabelas e colunas do comando SQL.
-    __command_info: Dict[str, Dict[str, str]]
+    # Informações sobre as tabelas e colunas do comando SQL: as colunas
+    # projetadas ('projection'), as condicionais de uma única tabela
+    # ('restriction') e as condicionais de junção, do ON ou do WHERE
+    # ('junction'), de cada tabela.
+    __command_info: Dict[str, Dict[str, list]]
     # A Árvore da Álgebra Relacional.
     __relational_algebra_tree: Node
     # A contagem de nós.
     __node_count: int
     # A ordem de execução dos nós.
     __node_execution_order: List[Node]
+    # Os Conversores das subconsultas (dos IN e NOT IN), indexados pelo seu texto.
+    __subquery_converters: Dict[str, 'Converter']
+    # Responsável pela escolha da ordem das junções, caso seja fixo.
+    __join_orderer: JoinOrderer | None
+    # As tabelas do comando SQL, na ordem do comando.
+    __context_tables: List[str]
+    # A visão materializada lida no lugar de algumas junções, caso haja.
+    __materialized_view: MaterializedView | None
 
     @property
     def parser(self) -> Parser:
@@ -118,7 +161,7 @@ class Converter:
         self.__relational_algebra = new_algebra
 
     @property
-    def command_info(self) -> Dict[str, Dict[str, str]]:
+    def command_info(self) -> Dict[str, Dict[str, list]]:
         """Extrai o conteúdo da variável privada command_info.
 
         Acessa a variável privada da classe, responsável pelo
@@ -127,14 +170,14 @@ class Converter:
         em Álgebra Relacional.
 
         Returns:
-            Dict[str, Dict[str, str]]: As tabelas usadas no comando
+            Dict[str, Dict[str, list]]: As tabelas usadas no comando
             SQL algumas informações otimizadas para a representação
             em Álgebra Relacional.
         """
         return self.__command_info
 
     @command_info.setter
-    def command_info(self, new_info: Dict[str, Dict[str, str]]) -> None:
+    def command_info(self, new_info: Dict[str, Dict[str, list]]) -> None:
         """Altera o conteúdo da variável privada command_info.
 
         Acessa a variável privada da classe, responsável pelo
@@ -143,7 +186,7 @@ class Converter:
         variável.
 
         Args:
-            new_info (Dict[str, str]): Um novo dicionário com
+            new_info (Dict[str, Dict[str, list]]): Um novo dicionário com
             novas informações para a variável.
         """
         self.__command_info = new_info
@@ -223,7 +266,52 @@ class Converter:
         """
         self.__node_execution_order = new_order
 
-    def __init__(self, parser: Parser | type) -> None:
+    @property
+    def join_orderer(self) -> JoinOrderer | None:
+        """Extrai o conteúdo da variável privada 'join_orderer'.
+
+        Returns:
+            JoinOrderer | None: Responsável pela escolha da ordem das
+            junções, ou None caso seja usado um 'JoinOrderer' com as
+            estatísticas do catálogo do banco de dados.
+        """
+        return self.__join_orderer
+
+    @property
+    def context_tables(self) -> List[str]:
+        """Extrai o conteúdo da variável privada 'context_tables'.
+
+        Returns:
+            List[str]: As tabelas do comando SQL, na ordem do comando
+            (mesmo que uma visão materializada substitua algumas delas).
+        """
+        return self.__context_tables
+
+    @property
+    def materialized_view(self) -> MaterializedView | None:
+        """Extrai o conteúdo da variável privada 'materialized_view'.
+
+        Returns:
+            MaterializedView | None: A visão materializada lida no lugar
+            das junções de algumas tabelas, ou None caso nenhuma visão
+            contenha o comando.
+        """
+        return self.__materialized_view
+
+    @property
+    def subquery_converters(self) -> Dict[str, 'Converter']:
+        """Extrai o conteúdo da variável privada 'subquery_converters'.
+
+        Cada subconsulta é convertida uma única vez, mesmo que seja
+        usada em mais de uma condicional.
+
+        Returns:
+            Dict[str, Converter]: Os Conversores das subconsultas,
+            indexados pelo texto da subconsulta.
+        """
+        return self.__subquery_converters
+
+    def __init__(self, parser: Parser | type, join_orderer: JoinOrderer | None = None) -> None:
         """Construtor da classe.
 
         Atribui valores a algumas variáveis e realiza
@@ -231,10 +319,18 @@ class Converter:
 
         Args:
             parser (Parser | type): Uma instância da classe Parser.
+            join_orderer (JoinOrderer | None, optional): Responsável pela
+            escolha da ordem das junções, com o seu modelo de custo. Valor
+            padrão: None (um 'JoinOrderer' com as estatísticas do catálogo
+            do banco de dados, veja 'Catalog.analyze').
         """
         if isinstance(parser, Parser):
             self.parser = parser
             self.command_info = OrderedDict()
+            self.__subquery_converters = {}
+            self.__join_orderer = join_orderer
+            self.__context_tables = []
+            self.__materialized_view = None
         else:
             Exceptions.raise_invalid_parser_exception("Converter.py (__init__)")
 
@@ -251,6 +347,10 @@ class Converter:
         b. Aplicar primeiro as operações de seleção e de junção mais restritivas.
         i. Reordenar os nós folha da árvore de consulta; ii. Evitar a operação
         de produto cartesiano; iii. Ajustar o restante da árvore de forma apropriada.
+        c. Ler uma visão materializada no lugar das junções que ela já contém.
+        d. Ler, de cada tabela, somente as colunas usadas pelo comando.
+        e. Simplificar as condicionais de cada tabela e não ler as tabelas
+        com condicionais contraditórias.
 
         Args:
             database (Dict[str, List[str]]): Um dicionário contendo o nome
@@ -263,77 +363,218 @@ class Converter:
         """
 
         def make_projection() -> None:
-            """Identifica as tabelas de cada coluna usada no comando SQL,
-            adicionando-a à tabela correspondente em 'command_info'.
+            """Identifica as tabelas de cada coluna usada no comando SQL
+            (SELECT, ON e WHERE), adicionando-a à tabela correspondente
+            em 'command_info'.
+
+            Com '*', todas as colunas são mantidas: nenhuma projeção é
+            adicionada às tabelas.
             """
-            for token, columns in self.parser.sql_columns.items():
-                if token in ["SELECT", "ON", "WHERE"]:
-                    for column_name in columns:
-                        if column_name != "*":
-                            column_name = column_name.lower()
-                            target_table: str | None = search_table_in_database(column_name)
-                            if target_table is not None:
-                                if column_name not in self.command_info[target_table]['projection']:
-                                    self.command_info[target_table]['projection'] += f"{column_name} "
-                            else:
-                                Exceptions.raise_column_mismatch_in_example_exception(column_name)
+            if select.is_star:
+                return
+            columns: List[ColumnRef] = list(select.columns)
+            for join in select.joins:
+                for condition in join.conditions:
+                    columns.extend(predicate_columns(condition))
+            for predicate in select.where:
+                columns.extend(predicate_columns(predicate))
+
+            for column in columns:
+                if column.column != "*":
+                    column_name: str = column.column.lower()
+                    target_table: str = search_table_of_column(column)
+                    if column_name not in self.command_info[target_table]['projection']:
+                        self.command_info[target_table]['projection'].append(column_name)
 
         def convert_on2ra() -> None:
-            """Converte os parâmetros do ON, do JOIN, para Álgebra Relacional.
+            """Converte as condicionais do ON, de cada JOIN, para Álgebra Relacional.
+
+            As condicionais do n-ésimo JOIN são atribuídas à n-ésima tabela
+            do comando, que é o lado esquerdo da junção. Uma subconsulta
+            (IN ou NOT IN) depende de uma única coluna, sendo equivalente a
+            uma seleção na tabela da coluna, onde a sua árvore é anexada.
             """
-            table_index: int = -1
-            for token_info, params in zip(self.parser.sql_tokens, self.parser.sql_params):
-                (token, _) = token_info
-                token = token.upper()
-
-                if token == "JOIN":
-                    table_index += 1
-                elif token == "ON":
-                    self.command_info[sql_context_tables[table_index]]['junction'] += f"{params} "
-                elif token.endswith("_ON"):
-                    self.command_info[sql_context_tables[table_index]]['junction'] += f"{token.replace('_ON', '', 1)} {params} "
+            for table_index, join in enumerate(select.joins):
+                for condition in join.conditions:
+                    if isinstance(condition, InSubquery):
+                        add_restriction(condition)
+                    else:
+                        self.command_info[sql_context_tables[table_index]]['junction'].append(condition)
 
         def convert_where2ra() -> None:
-            """Converte os parâmetros do WHERE para Álgebra Relacional.
+            """Converte as condicionais do WHERE para Álgebra Relacional.
+
+            Cada condicional é classificada pelo conjunto de tabelas das suas
+            colunas (explícitas ou procuradas no banco de dados): uma
+            condicional de uma única tabela é uma seleção dessa tabela, e uma
+            condicional entre duas tabelas (como 'usuario.idusuario =
+            contas.usuario_idusuario', com as tabelas separadas por vírgula
+            no FROM) é uma condicional de junção, evitando o produto
+            cartesiano. Condicionais repetidas são ignoradas.
             """
-            for token_info, params in zip(self.parser.sql_tokens, self.parser.sql_params):
-                (token, _) = token_info
-                token = token.upper()
-
-                # Converte somente os tokens que possuem o sufixo "WHERE",
-                # usando regex para identificar os parâmetros do 'WHERE' que
-                # possuem, explicitamente, o nome de uma tabela ou não.
-                if token.endswith("WHERE"):
-                    regex_where = r'\b(?<![\'"])([a-zA-Z]\w+\.[a-zA-Z]\w+)(?![\'"])\b|\b(?<![\'"])([a-zA-Z]\w+)(?![\'"])\b'
-                    if (matches := re.match(regex_where, params, re.IGNORECASE)) is not None:
-                        match = matches.groups()
-                        # Verifica se o nome da tabela está explicito.
-                        if match[0]:
-                            self.command_info[match[0].split(".")[0]]['restriction'] += f"{params} "
-                        # Procura pela tabela.
-                        else:
-                            column_name: str = match[1].lower()
-                            if column_name != "*":
-                                target_table: str = search_table_in_database(column_name)
-                                # Ignora duplicatas.
-                                if column_name not in self.command_info[target_table]['restriction']:
-                                    if token.endswith("_WHERE"):
-                                        self.command_info[target_table]['restriction'] += f"{token.replace('_WHERE', '', 1)} {params} "
-                                    else:
-                                        self.command_info[target_table]['restriction'] += f"{params} "
-                    else:
-                        if column_name != "*":
-                            target_table: str = search_table_in_database(column_name)
-                            # Ignora duplicatas.
-                            if token in ("IN_WHERE", "NOT IN_WHERE"):
-                                self.command_info[target_table]['restriction'] += f"{token.replace('_WHERE', '', 1)} {params}"
+            for predicate in select.where:
+                tables: List[str] = list(OrderedDict.fromkeys(
+                    search_table_of_column(column) for column in predicate_columns(predicate)
+                ))
+                if len(tables) == 1:
+                    add_restriction(predicate)
+                elif predicate not in self.command_info[tables[0]]['junction']:
+                    self.command_info[tables[0]]['junction'].append(predicate)
+
+        def add_restriction(predicate: Predicate) -> None:
+            """Atribui uma condicional à tabela da sua primeira coluna,
+            ignorando as condicionais repetidas.
+
+            Args:
+                predicate (Predicate): A condicional.
+            """
+            target_table: str = search_table_of_column(predicate_columns(predicate)[0])
+            if predicate not in self.command_info[target_table]['restriction']:
+                self.command_info[target_table]['restriction'].append(predicate)
+
+        def convert_subqueries() -> None:
+            """Converte as subconsultas (dos IN e NOT IN) para Álgebra Relacional.
+
+            As subconsultas já foram analisadas pelo Parser ('sql_subqueries');
+            subconsultas repetidas são convertidas uma única vez.
+            """
+            for table in sql_context_tables:
+                for predicate in self.command_info[table]['restriction']:
+                    if isinstance(predicate, InSubquery) and predicate.text not in self.subquery_converters:
+                        subquery_parser: Parser = self.parser.sql_subqueries[predicate.text]
+                        subquery_parser.check_database_compatibility(database)
+                        subquery_converter: Converter = Converter(subquery_parser, self.join_orderer)
+                        subquery_converter.convert_in_database_context(database)
+                        self.subquery_converters[predicate.text] = subquery_converter
+
+        def read_materialized_view(join_conditions: List[JoinCondition]) -> List[JoinCondition]:
+            """Substitui algumas tabelas do comando por uma visão materializada
+            atualizada que contém as suas junções e condicionais (veja
+            'MaterializedView.covers'), preferindo a visão com mais tabelas.
+
+            As condicionais dessas tabelas que não estão na visão passam a
+            ser a seleção da visão, e as junções com as demais tabelas passam
+            a usar a visão. As colunas das condicionais são explícitas, pois
+            a visão pode possuir colunas com o mesmo nome em tabelas diferentes.
+
+            As visões são procuradas no catálogo do modelo de custo (com os
+            dados das tabelas), ou no catálogo do banco de dados.
+
+            Args:
+                join_conditions (List[JoinCondition]): As condicionais de junção do comando.
+
+            Returns:
+                List[JoinCondition]: As condicionais de junção restantes.
+            """
+            views_catalog: Catalog = join_orderer.cost_model.catalog or catalog
+            if len(sql_context_tables) < 2 or not views_catalog.views():
+                return join_conditions
+            tables: Dict[str, str] = {table.casefold(): table for table in sql_context_tables}
+            restrictions: Dict[str, List[Predicate]] = {
+                table: [qualify(predicate, search_table_of_column) for predicate in self.command_info[table]['restriction']]
+                for table in sql_context_tables
+            }
+            qualified_joins: List[Predicate] = [
+                qualify(condition.predicate, search_table_of_column) for condition in join_conditions
+            ]
+
+            def used_columns(view: MaterializedView) -> List[Tuple[str, str]]:
+                """Retorna as colunas das tabelas de uma visão que o comando lê
+                sobre as linhas da visão: as do SELECT e as das condicionais
+                que não estão na visão.
+
+                Args:
+                    view (MaterializedView): A visão.
+
+                Returns:
+                    List[Tuple[str, str]]: A tabela e a coluna, em minúsculo.
+                """
+                if select.is_star:
+                    return [(table, column) for table in view.tables for column in catalog.columns_of(table)]
+                columns: List[ColumnRef] = [qualify(column, search_table_of_column) for column in select.columns]
+                for predicate in qualified_joins + [predicate for table in restrictions.values() for predicate in table]:
+                    if predicate not in view.join_conditions and predicate not in view.restrictions:
+                        columns.extend(predicate_columns(predicate))
+                return [(column.table, column.column) for column in columns if column.table in view.tables]
+
+            candidates: List[MaterializedView] = [
+                view for view in views_catalog.views()
+                if len(view.tables) >= 2 and view.is_fresh(views_catalog) and view.covers(
+                    tables, qualified_joins, [predicate for table in restrictions.values() for predicate in table],
+                    used_columns(view)
+                )
+            ]
+            if not candidates:
+                return join_conditions
+            view: MaterializedView = max(candidates, key=lambda view: (len(view.tables), -view.table.row_count))
+            covered: List[str] = [table for table in sql_context_tables if table.casefold() in view.tables]
+
+            # As condicionais que não estão na visão: as seleções das tabelas
+            # e as junções entre as tabelas da visão.
+            view_restriction: List[Predicate] = [
+                predicate for table in covered for predicate in restrictions[table] if predicate not in view.restrictions
+            ]
+            remaining: List[JoinCondition] = []
+            for condition, qualified in zip(join_conditions, qualified_joins):
+                relations: Tuple[str, ...] = tuple(
+                    view.name if column.table in view.tables else tables[column.table]
+                    for column in predicate_columns(qualified)
+                )
+                if set(relations) != {view.name}:
+                    remaining.append(JoinCondition(qualified, relations) if view.name in relations else condition)
+                elif qualified not in view.join_conditions and qualified not in view_restriction:
+                    view_restriction.append(qualified)
+
+            self.command_info = OrderedDict(
+                (view.name, {
+                    "projection": [],
+                    "restriction": view_restriction,
+                    "junction": [condition.predicate for condition in remaining if view.name in condition.tables]
+                }) if table == covered[0] else (table, self.command_info[table])
+                for table in sql_context_tables if table not in covered[1:]
+            )
+            sql_context_tables[:] = list(self.command_info)
+            self.__materialized_view = view
+            return remaining
+
+        def simplify_restrictions() -> None:
+            """Simplifica as condicionais da seleção de cada tabela (veja
+            'simplify'): as repetições são removidas e os intervalos de uma
+            mesma coluna são unidos. As tabelas com condicionais
+            contraditórias são lidas como relações vazias (veja
+            'plan.EmptyScan'), sem acessar os seus dados.
+            """
+            for table in sql_context_tables:
+                (restriction, contradictory) = simplify(self.command_info[table]['restriction'])
+                self.command_info[table]['restriction'] = restriction
+                if contradictory:
+                    contradictory_tables.add(table)
+
+        def search_table_of_column(column: ColumnRef) -> str:
+            """Procura pelo nome da tabela correspondente de uma coluna,
+            usando o nome da tabela, caso esteja explícito.
+
+            Args:
+                column (ColumnRef): A coluna.
+
+            Returns:
+                str: O nome da tabela.
+
+            Raises:
+                TableMismatchException: Exceção customizada para alertar
+                a utilização de uma tabela que não está no comando SQL.
+            """
+            if column.table is not None:
+                if column.table not in self.command_info:
+                    Exceptions.raise_table_mismatch_exception(str(column))
+                return column.table
+            return search_table_in_database(column.column.lower())
 
         def search_table_in_database(target_column: str) -> str:
             """Procura pelo nome da tabela correspondente de uma coluna.
 
-            Itera sobre todas as tabelas de 'database' e verifica se a
-            coluna a qual não possui o nome da tabela explicita, está
-            incluída na lista.
+            Consulta o índice de colunas do catálogo de 'database',
+            considerando somente as tabelas usadas pelo comando SQL.
 
             'database' é a mesma variável usada em 'convert_in_database_context'.
 
@@ -348,73 +589,148 @@ class Converter:
                 ColumnMismatchException: Exceção customizada
                 para alertar a utilização de colunas icompatíveis
                 em uma cláusula SQL.
+                AmbiguousColumnException: Exceção customizada para
+                alertar a utilização de uma coluna presente em mais
+                de uma tabela do comando SQL.
+            """
+            return catalog.resolve_column(target_column, self.command_info.keys())
+
+        def render_projection(table: str) -> str:
+            """Representa as colunas projetadas de uma tabela.
+
+            Args:
+                table (str): O nome da tabela.
+
+            Returns:
+                str: As colunas, separadas por vírgula.
+            """
+            return ", ".join(self.command_info[table]['projection'])
+
+        def render_predicates(predicates: List[Predicate]) -> str:
+            """Representa uma lista de condicionais, unidas por AND.
+
+            Args:
+                predicates (List[Predicate]): As condicionais.
+
+            Returns:
+                str: As condicionais, unidas por AND.
             """
-            # Itera sobre as tabelas e colunas do banco de dados exemplar.
-            for example_table, example_columns in database.items():
-                # Procura somente nas tabelas que foram usadas pelo comando SQL.
-                if example_table in self.command_info.keys():
-                    # Retorna o nome da tabela, caso encontre a coluna correspondente..
-                    if target_column in example_columns:
-                        return example_table
-            Exceptions.raise_column_mismatch_in_example_exception(target_column)
+            return plan.render_predicates(predicates, self.subquery_converters)
 
         def mount_ra() -> str:
             """Monta a Álgebra Relacional.
 
             Pega as informações convertidas e armazenadas em 'command_info'
-            e monta a Álgebra Relacional na ordem esperada.
+            e monta a Álgebra Relacional na ordem das junções escolhida
+            ('join_order'), no formato '((exp1 |x| ... exp2) |x| ... exp3)'.
 
             Returns:
                 str: A Álgebra Relacional montada.
             """
 
-            def cross_join(*expressions: str) -> str:
-                """Recebe qualquer quantia de expressões, de uma Álgebra Relacional,
-                e junta-as no formato '((exp1exp2) ... exp3) ...', basicamente
-                adiciona um parênteses extra em duas expressões.
+            def table2ra(table: str) -> str:
+                """Monta a Álgebra Relacional de uma tabela (projeção e seleção).
+
+                Args:
+                    table (str): O nome da tabela.
 
                 Returns:
-                    str: As expressões com um novo conjunto de parênteses.
+                    str: A Álgebra Relacional da tabela, entre parênteses.
                 """
-                return reduce(lambda exp1, exp2: f"({exp1.strip()}{exp2.strip()})", expressions)
-
-            relational_algebra: str = ''
-            for table in sql_context_tables:
-                # Extrai as variáveis de 'command_info'.
-                table_projection: str = self.command_info[table]['projection'].strip()
-                table_restriction: str = self.command_info[table]['restriction'].strip()
-                table_junction: str = self.command_info[table]['junction'].strip()
+                table_projection: str = render_projection(table)
+                table_restriction: str = render_predicates(self.command_info[table]['restriction'])
+                table_name: str = table
+                # A seleção contraditória não é avaliada: a tabela é uma relação vazia.
+                if table in contradictory_tables:
+                    (table_restriction, table_name) = ("", plan.EmptyScan(table).render())
 
                 # Reorganiza as variáveis para Álgebra Relacional.
-                table_projection = f"(π {table_projection.replace(' ', ', ')} " if bool(table_projection) else ""
-                table_restriction = f"(σ {table_restriction.replace('AND', '', 1).strip()} " if bool(table_restriction) else ""
-                table_junction = f"@jn |x| {table_junction}" if bool(table_junction) else ""
+                operations: List[str] = []
+                if table_projection:
+                    operations.append(f"(π {table_projection} ")
+                if table_restriction:
+                    operations.append(f"(σ {table_restriction} ")
 
                 # Junta tudo, organizando a qntd. de parênteses.
-                converted2ra: str = f"{table_projection}{table_restriction}({table}"
-                relational_algebra += f"{converted2ra}{')' * converted2ra.count('(')} {table_junction} "
-
-            # Tira os espaços em brancos incorretos.
-            relational_algebra = relational_algebra.strip()
-
-            # Arruma os parênteses usando o reduce.
-            if '@jn' in relational_algebra: # '@jn' é um placeholder.
-                relational_algebra = f"{cross_join(*relational_algebra.split('@jn')).replace('|x|', ' |x|')}"
+                return f"{''.join(operations)}({table_name}{')' * (len(operations) + 1)}"
 
+            (first_table, _) = join_order[0]
+            relational_algebra: str = table2ra(first_table)
+            for table, conditions in join_order[1:]:
+                relational_algebra = f"({relational_algebra} {plan.Join(conditions).render()} {table2ra(table)})"
             return relational_algebra
 
         def setup_tree() -> Node:
             """Cria uma árvore com base nas informações de 'command_info'.
 
             As seguintes restrições estão atribuídas à árvore:
-            1. JUNÇÕES ficam SEMPRE em nós filhos à esquerda. (caso tenha junção)
+            1. JUNÇÕES ficam SEMPRE em nós filhos à esquerda, na ordem de 'join_order'. (caso tenha junção)
             2. INFORMAÇÕES DE ALGUMA TABELA ficam SEMPRE em nós filhos à direita. (caso a esquerda tenha junção)
             3. A SELEÇÃO será SEMPRE o nó raiz, mesmo que tenha '*' como parâmetro.
+            4. Tabelas sem condicionais de junção são unidas por um produto cartesiano (×).
+            5. Cada JUNÇÃO exibe o seu algoritmo físico (veja 'JoinOrderer.join_methods').
+            6. Uma tabela é lida por um índice quando mais barato (veja 'CostModel.choose_index').
+            7. Uma visão materializada é uma folha, no lugar das tabelas que ela contém.
+            8. Cada leitura lê somente as colunas usadas acima dela (veja 'prune_columns').
+            9. Uma tabela com condicionais contraditórias é uma relação vazia (veja 'simplify_restrictions').
 
             Returns:
                 Node: O nó raiz da árvore criada.
             """
 
+            def subquery_tree(table: str) -> Union[Node, None]:
+                """Retorna a árvore da subconsulta usada na seleção de uma tabela.
+
+                Args:
+                    table (str): O nome da tabela.
+
+                Returns:
+                    Node | None: O nó raiz da árvore da subconsulta, ou None
+                    caso a seleção não possua subconsultas.
+                """
+                subquery_roots: List[Node] = [
+                    self.subquery_converters[predicate.text].relational_algebra_tree
+                    for predicate in self.command_info[table]['restriction']
+                    if isinstance(predicate, InSubquery)
+                ]
+                # Mais de uma subconsulta são combinadas em um produto cartesiano.
+                return reduce(
+                    lambda left, right: Node(plan.Join([]), left_children=left, right_children=right),
+                    subquery_roots
+                ) if subquery_roots else None
+
+            def table_access(table: str) -> Tuple[List[Predicate], plan.Scan]:
+                """Escolhe a leitura de uma tabela: completa ou, quando mais
+                barata, por um índice secundário (veja 'CostModel.choose_index').
+                Uma visão materializada é sempre lida por completo, e uma tabela
+                com condicionais contraditórias não é lida.
+
+                Args:
+                    table (str): O nome da tabela (ou da visão).
+
+                Returns:
+                    Tuple[List[Predicate], plan.Scan]: As condicionais restantes
+                    da seleção (nenhuma, para uma relação vazia) e o operador
+                    da leitura.
+                """
+                table_restriction: List[Predicate] = self.command_info[table]['restriction']
+                if self.materialized_view is not None and table == self.materialized_view.name:
+                    view_tables: List[str] = [name for name in self.context_tables if name.casefold() in self.materialized_view.tables]
+                    return (table_restriction, plan.ViewScan(table, view_tables))
+                if table in contradictory_tables:
+                    # A seleção contraditória é descartada, junto às suas subconsultas.
+                    return ([], plan.EmptyScan(table))
+                choice: Union[Tuple[Index, List[Predicate]], None] = join_orderer.cost_model.choose_index(
+                    table, table_restriction
+                )
+                if choice is None:
+                    return (table_restriction, plan.Scan(table))
+                (index, predicates) = choice
+                return (
+                    [restriction for restriction in table_restriction if restriction not in predicates],
+                    plan.IndexScan(table, index.name, index.kind, predicates)
+                )
+
             def add_info_to_left_children(root: Node, table: str) -> None:
                 """Adiciona informações da Álgebra Relacional de uma tabela
                 à esquerda do nó pai.
@@ -431,27 +747,34 @@ class Converter:
                 # Uma cópia do nó pai.
                 root_cp: Node = root
                 # As informações da tabela.
-                table_projection: str = self.command_info[table]['projection'].strip().replace(" ", ", ")
-                table_restriction: str = self.command_info[table]['restriction'].replace('AND', '', 1).strip()
+                table_projection: plan.Project = plan.Project([
+                    ColumnRef(None, column) for column in self.command_info[table]['projection']
+                ])
+                (table_restriction, table_scan) = table_access(table)
 
                 # Se tiver 'projection' (SELECT), um nó é adicionado antes ao nó pai,
                 # contendo as informações de 'projection'.
-                if bool(table_projection) and f"π {table_projection}" != select2ra:
-                    children = Node(value=f"π {table_projection}", parent=root_cp, execution_order=self.node_count)
+                if table_projection.columns and table_projection.render() != select2ra:
+                    children = Node(table_projection, parent=root_cp, execution_order=self.node_count)
                     root_cp.left_children = children
                     root_cp = root_cp.left_children
                     self.node_count += 1
 
                 # Se tiver 'restriction' (WHERE), um nó é adicionado antes ao nó pai,
                 # contendo as informações de 'restriction'.
-                if bool(table_restriction):
-                    children = Node(value=f"σ {table_restriction}", parent=root_cp, execution_order=self.node_count)
+                if table_restriction:
+                    children = Node(
+                        plan.Select(table_restriction, self.subquery_converters),
+                        parent=root_cp, execution_order=self.node_count
+                    )
                     root_cp.left_children = children
                     root_cp = root_cp.left_children
                     self.node_count += 1
+                    # A árvore da subconsulta fica no outro filho da seleção.
+                    root_cp.right_children = subquery_tree(table)
 
                 # Adiciona o nome da tabela como filho direito do nó pai.
-                children = Node(value=table, parent=root_cp, execution_order=self.node_count)
+                children = Node(table_scan, parent=root_cp, execution_order=self.node_count)
                 root_cp.left_children = children
                 self.node_count += 1
 
@@ -471,33 +794,40 @@ class Converter:
                 # Uma cópia do nó pai.
                 root_cp: Node = root
                 # As informações da tabela.
-                table_projection: str = self.command_info[table]['projection'].strip().replace(" ", ", ")
-                table_restriction: str = self.command_info[table]['restriction'].replace('AND', '', 1).strip()
+                table_projection: plan.Project = plan.Project([
+                    ColumnRef(None, column) for column in self.command_info[table]['projection']
+                ])
+                (table_restriction, table_scan) = table_access(table)
 
                 # Se tiver 'projection' (SELECT), um nó é adicionado antes ao nó pai,
                 # contendo as informações de 'projection'.
-                if bool(table_projection) and f"π {table_projection}" != select2ra:
-                    children = Node(value=f"π {table_projection}", parent=root_cp, execution_order=self.node_count)
+                if table_projection.columns and table_projection.render() != select2ra:
+                    children = Node(table_projection, parent=root_cp, execution_order=self.node_count)
                     root_cp.right_children = children
                     root_cp = root_cp.right_children
                     self.node_count += 1
 
                 # Se tiver 'restriction' (WHERE), um nó é adicionado antes ao nó pai,
                 # contendo as informações de 'restriction'.
-                if bool(table_restriction):
-                    children = Node(value=f"σ {table_restriction}", parent=root_cp, execution_order=self.node_count)
+                if table_restriction:
+                    children = Node(
+                        plan.Select(table_restriction, self.subquery_converters),
+                        parent=root_cp, execution_order=self.node_count
+                    )
                     root_cp.right_children = children
                     root_cp = root_cp.right_children
                     self.node_count += 1
+                    # A árvore da subconsulta fica no outro filho da seleção.
+                    root_cp.left_children = subquery_tree(table)
 
                 # Adiciona o nome da tabela como filho direito do nó pai.
-                children = Node(value=table, parent=root_cp, execution_order=self.node_count)
+                children = Node(table_scan, parent=root_cp, execution_order=self.node_count)
                 root_cp.right_children = children
                 self.node_count += 1
 
-            # Cria um nó raiz com base no 'SELECT', se não for "*", caso contrário cria um nó vazio.
+            # Cria um nó raiz com a projeção do 'SELECT' (um "*" não é exibido).
             self.node_count = 0
-            root: Node = Node(value=select2ra, execution_order=self.node_count) if select2ra != "*" else Node(execution_order=-1)
+            root: Node = Node(plan.Project(select.columns), execution_order=self.node_count)
             self.node_count += 1
 
             # Indica duas ou mais tabelas, é provável que tenha JUNÇÃO, pois o FROM só pode ter 1 tabela.
@@ -507,66 +837,148 @@ class Converter:
                 # Uma cópia do nó pai.
                 root_cp: Node = root
 
-                # 'left_table' -> Adicionará somente a junção.
-                # 'right_table' -> Adicionará as informações da tabela.
-                left_table: str
-                right_table: str
-                # A JUNÇÃO contida em 'left_table'.
-                left_table_junction: str
-                for i in range(-2, -(len(sql_context_tables) + 1), -1):
-                    left_table: str = sql_context_tables[i]
-                    right_table = sql_context_tables[i + 1]
-                    left_table_junction = self.command_info[left_table]['junction'].strip()
-
-                    # Adiciona a JUNÇÃO ao nó pai.
-                    if bool(left_table_junction):
-                        children = Node(value=f"|x| {left_table_junction}", parent=root_cp, execution_order=self.node_count)
-                        root_cp.left_children = children
-                        root_cp = root_cp.left_children
-                        self.node_count += 1
-                        add_info_to_right_children(root_cp, right_table)
+                # Da última junção à primeira: a JUNÇÃO fica à esquerda e
+                # as informações da tabela unida ficam à direita.
+                for (right_table, conditions), (method, build_left, merge_key) in zip(reversed(join_order[1:]), reversed(join_methods)):
+                    # Adiciona a JUNÇÃO ao nó pai, com o seu algoritmo físico.
+                    children = Node(
+                        plan.Join(conditions, method, build_left, merge_key),
+                        parent=root_cp, execution_order=self.node_count
+                    )
+                    root_cp.left_children = children
+                    root_cp = root_cp.left_children
+                    self.node_count += 1
+                    add_info_to_right_children(root_cp, right_table)
 
                 # Adiciona as informações da primeira tabela.
-                add_info_to_left_children(root_cp, sql_context_tables[0])
+                add_info_to_left_children(root_cp, join_order[0][0])
             # Somente uma tabela, informações de tabela são adicionadas sempre na DIREITA.
             else:
-                add_info_to_right_children(root, sql_context_tables[0])
+                add_info_to_right_children(root, join_order[0][0])
 
             return root
 
+        def prune_columns(node: Node, required: Union[Set[Tuple[Union[str, None], str]], None]) -> None:
+            """Poda as colunas lidas por cada tabela (ou visão) da árvore.
+
+            Percorre a árvore a partir da raiz, acumulando as colunas usadas
+            pelos operadores (projeções, seleções e junções); cada leitura
+            passa a ler somente as colunas da sua tabela usadas acima dela.
+            Uma projeção produz somente as suas colunas: abaixo dela, as
+            colunas usadas recomeçam pelas colunas projetadas. As árvores
+            das subconsultas são podadas pelos seus próprios Conversores.
+
+            Args:
+                node (Node): O nó.
+                required (Set[Tuple[str | None, str]] | None): As colunas
+                usadas acima do nó (a tabela, ou None caso não seja explícita,
+                e a coluna, em minúsculo); None representa todas as colunas ('*').
+            """
+            operator: plan.Operator = node.operator
+            if isinstance(operator, plan.Scan):
+                operator.columns = None if required is None else scan_columns(operator, required)
+                return
+
+            columns: List[ColumnRef] = []
+            if isinstance(operator, plan.Project) and not operator.is_star:
+                (required, columns) = (set(), operator.columns)
+            elif isinstance(operator, plan.Select):
+                columns = [column for predicate in operator.predicates for column in predicate_columns(predicate)]
+            elif isinstance(operator, plan.Join):
+                columns = [column for condition in operator.conditions for column in predicate_columns(condition)]
+            if required is not None:
+                required = required | column_keys(columns)
+
+            for child in (node.left_children, node.right_children):
+                if child is not None and child.parent is node:
+                    prune_columns(child, required)
+
+        def column_keys(columns: Iterable[ColumnRef]) -> Set[Tuple[Union[str, None], str]]:
+            """Representa as colunas pela tabela (ou None) e pelo nome, em minúsculo.
+
+            Args:
+                columns (Iterable[ColumnRef]): As colunas.
+
+            Returns:
+                Set[Tuple[str | None, str]]: A tabela e o nome de cada coluna.
+            """
+            return {
+                (column.table.casefold() if column.table is not None else None, column.column.casefold())
+                for column in columns
+            }
+
+        def scan_columns(scan: plan.Scan, required: Set[Tuple[Union[str, None], str]]) -> List[str]:
+            """Escolhe as colunas lidas por uma tabela (ou visão).
+
+            Uma leitura por índice também lê as colunas da sua condicional,
+            usadas caso o índice seja removido antes da execução. Uma
+            leitura sem colunas usadas lê a primeira coluna, mantendo a
+            quantia de linhas (como em um produto cartesiano).
+
+            Args:
+                scan (plan.Scan): A leitura.
+                required (Set[Tuple[str | None, str]]): As colunas usadas acima da leitura.
+
+            Returns:
+                List[str]: As colunas lidas, em minúsculo, na ordem da tabela;
+                as colunas de uma visão estão no formato 'tabela.coluna'.
+            """
+            if isinstance(scan, plan.IndexScan):
+                required = required | column_keys(
+                    column for predicate in scan.predicates for column in predicate_columns(predicate)
+                )
+            if isinstance(scan, plan.ViewScan):
+                available: List[Tuple[str, str]] = list(self.materialized_view.columns)
+            else:
+                available = [(scan.table.casefold(), column.casefold()) for column in table_schema[scan.table.casefold()]]
+            names: List[str] = [
+                f"{table}.{column}" if isinstance(scan, plan.ViewScan) else column
+                for table, column in available
+            ]
+            return [
+                name for name, (table, column) in zip(names, available)
+                if (table, column) in required or (None, column) in required
+            ] or names[:1]
+
         def configure_execution_order(node: Node) -> None:
-            """Realiza um DFS na árvore da Álgebra Relacional.
+            """Realiza um DFS (pós-ordem) na árvore da Álgebra Relacional.
 
-            Itera sobre cada nó, DFS, invertendo a ordem de
-            execução de cada um.
+            Itera sobre cada nó, DFS, numerando a ordem de execução
+            de cada um: os filhos (esquerdo e direito) são executados
+            antes do pai, inclusive os nós das subconsultas.
 
             Args:
                 node (Node): O nó inicial, o ponto de partida.
             """
-            if node:
-                # Checa se o nó ainda não foi visitado.
-                if node not in self.node_execution_order:
-                    # Altera a ordem de execução.
-                    node.execution_order = self.node_count - node.execution_order
-                    self.node_execution_order.append(node)
+            # Checa se o nó ainda não foi visitado (a árvore de uma
+            # subconsulta repetida é compartilhada).
+            if node and node not in visited_nodes:
+                visited_nodes.add(node)
 
                 # Visita o filho da esquerda, se houver.
-                if node.left_children:
-                    configure_execution_order(node.left_children)
+                configure_execution_order(node.left_children)
 
                 # Visita o filho da direita, se houver.
-                if node.right_children:
-                    configure_execution_order(node.right_children)
+                configure_execution_order(node.right_children)
+
+                # Altera a ordem de execução.
+                self.node_execution_order.append(node)
+                node.execution_order = len(self.node_execution_order)
 
         # Cria um dicionário para a Álgebra Relacional do comando SQL,
         # incluindo informações já otimizadas conforme descrito previamente.
-        sql_context_tables: List[str] = self.parser.sql_tables["FROM"] + self.parser.sql_tables["JOIN"]
+        catalog: Catalog = Catalog.for_database(database)
+        join_orderer: JoinOrderer = self.join_orderer if self.join_orderer is not None else JoinOrderer(CostModel(catalog=catalog))
+        select: Select = self.parser.sql_ast
+        sql_context_tables: List[str] = list(OrderedDict.fromkeys(
+            [table.name for table in select.tables] + [join.table.name for join in select.joins]
+        ))
         for table in sql_context_tables:
             self.command_info.update({
                 table: {
-                    "projection": "",
-                    "restriction": "",
-                    "junction": ""
+                    "projection": [],
+                    "restriction": [],
+                    "junction": []
                 }
             })
 
@@ -579,9 +991,32 @@ class Converter:
         # Cria a restrição para as tabelas.
         convert_where2ra()
 
+        # Converte as subconsultas das restrições.
+        convert_subqueries()
+
+        join_conditions: List[JoinCondition] = [
+            JoinCondition(condition, tuple(search_table_of_column(column) for column in predicate_columns(condition)))
+            for table in sql_context_tables
+            for condition in self.command_info[table]['junction']
+        ]
+
+        # Lê uma visão materializada no lugar das junções que ela contém.
+        self.__context_tables = list(sql_context_tables)
+        join_conditions = read_materialized_view(join_conditions)
+
+        # Simplifica as seleções e encontra as tabelas com condicionais contraditórias.
+        contradictory_tables: Set[str] = set()
+        simplify_restrictions()
+
+        # Escolhe a ordem das junções, de menor custo estimado, e o algoritmo de cada junção.
+        restrictions: Dict[str, List[Predicate]] = {
+            table: self.command_info[table]['restriction'] for table in sql_context_tables
+        }
+        join_order: JoinOrder = join_orderer.order(sql_context_tables, restrictions, join_conditions)
+        join_methods: List[JoinMethod] = join_orderer.join_methods(join_order, restrictions, join_conditions)
+
         # Estrutura a Álgebra Relacional.
-        select_params: str = self.parser.sql_params[0]
-        select2ra: str = f"π {select_params}" if select_params != '*' else ""
+        select2ra: str = plan.Project(select.columns).render()
         self.relational_algebra = f"{select2ra} {mount_ra()}".strip()
 
         print("[OK!] Criado uma Álgebra Relacional otimizada para o comando SQL fornecido.")
@@ -589,8 +1024,13 @@ class Converter:
         # Monta a árvore da Álgebra Relaciona.
         self.relational_algebra_tree = setup_tree()
 
+        # Poda as colunas lidas de cada tabela.
+        table_schema: Dict[str, List[str]] = {table.casefold(): columns for table, columns in database.items()}
+        prune_columns(self.relational_algebra_tree, None)
+
         # Inverte a ordem de execução da Álgebra Relacional.
         self.node_execution_order = []
+        visited_nodes: set = set()
         configure_execution_order(self.relational_algebra_tree)
 
         return self.relational_algebra
@@ -0,0 +1,644 @@
+"""Arquivo responsável pela escolha da ordem das junções,
+baseada em custo, com programação dinâmica (estilo Selinger)
+e uma heurística gulosa para comandos com muitas tabelas."""
+
+import math
+from typing import Dict, FrozenSet, List, Set, Tuple, Union
+
+# pylint: disable=import-error
+from Catalog import Catalog, ColumnStatistics, TableStatistics
+from Storage import Index, SORTED_INDEX
+from Parser.sql_ast import ColumnRef, Comparison, InList, Literal, Predicate
+from RelationalAlgebra import plan
+
+# A ordem das junções (árvore à esquerda): cada tabela e as condicionais
+# aplicadas na sua junção com as tabelas anteriores (vazia na primeira).
+JoinOrder = List[Tuple[str, List[Predicate]]]
+
+# O algoritmo físico de uma junção (veja 'plan.Join'), se a tabela
+# de hash é construída com a entrada esquerda e, no merge join, a
+# igualdade pela qual as duas entradas estão ordenadas.
+JoinMethod = Tuple[str, bool, Union[Predicate, None]]
+# Uma chave de junção: as colunas (tabela, coluna) da esquerda e da
+# direita, e a igualdade de origem.
+JoinKey = Tuple[Tuple[str, str], Tuple[str, str], Predicate]
+
+class JoinCondition:
+    """Representa uma condicional de junção e as tabelas das suas colunas."""
+
+    __slots__ = ("predicate", "tables")
+
+    def __init__(self, predicate: Predicate, tables: Tuple[str, ...]) -> None:
+        """Construtor da classe.
+
+        Args:
+            predicate (Predicate): A condicional.
+            tables (Tuple[str, ...]): A tabela de cada coluna da
+            condicional, na ordem de 'predicate_columns'.
+        """
+        self.predicate = predicate
+        self.tables = tables
+
+    def __repr__(self) -> str:
+        return f"JoinCondition({self.predicate!r}, {self.tables!r})"
+
+class CostModel:
+    """Modelo de custo e de estimativa de cardinalidade.
+
+    Sem estatísticas, usa as estimativas clássicas do System R: toda
+    tabela possui 'default_rows' linhas, uma igualdade com um literal
+    seleciona 1/10 das linhas, uma comparação de intervalo 1/3, e uma
+    junção por igualdade 1/max(valores distintos das duas colunas).
+
+    Com um catálogo, as tabelas analisadas (ANALYZE) usam as suas
+    estatísticas: a quantia real de linhas, os valores distintos e a
+    fração de nulos das colunas, e os histogramas nas comparações de
+    intervalo com um literal.
+
+    O custo de um plano é a soma das cardinalidades dos resultados
+    intermediários (C_out). Com índices secundários no catálogo, a
+    leitura de cada tabela pode ser feita por um índice (veja
+    'choose_index'). Subclasses podem redefinir qualquer método.
+    """
+
+    # A quantia de linhas assumida para uma tabela sem estatísticas.
+    __default_rows: float
+    # O catálogo com as estatísticas das tabelas, caso haja.
+    __catalog: Union[Catalog, None]
+    # O custo de ler uma linha pela sua posição, relativo a uma linha lida em sequência.
+    __random_access_cost: float
+
+    def __init__(
+            self,
+            default_rows: float = 1000,
+            catalog: Union[Catalog, None] = None,
+            random_access_cost: float = 4.0) -> None:
+        """Construtor da classe.
+
+        Args:
+            default_rows (float, optional): A quantia de linhas assumida
+            para cada tabela. Valor padrão: 1000.
+            catalog (Catalog | None, optional): O catálogo com as
+            estatísticas (e os índices) das tabelas. Valor padrão: None.
+            random_access_cost (float, optional): O custo de ler uma linha
+            por um índice, relativo a uma linha lida na leitura completa
+            da tabela. Valor padrão: 4.0.
+        """
+        self.__default_rows = default_rows
+        self.__catalog = catalog
+        self.__random_access_cost = random_access_cost
+
+    @property
+    def default_rows(self) -> float:
+        """Extrai o conteúdo da variável privada default_rows.
+
+        Returns:
+            float: A quantia de linhas assumida para cada tabela.
+        """
+        return self.__default_rows
+
+    @property
+    def catalog(self) -> Union[Catalog, None]:
+        """Extrai o conteúdo da variável privada catalog.
+
+        Returns:
+            Catalog | None: O catálogo com as estatísticas das tabelas.
+        """
+        return self.__catalog
+
+    def statistics(self, table: str) -> Union[TableStatistics, None]:
+        """Retorna as estatísticas de uma tabela, caso tenha sido analisada.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            TableStatistics | None: As estatísticas da tabela.
+        """
+        return self.catalog.statistics(table) if self.catalog is not None else None
+
+    def column_statistics(self, table: str, column: str) -> Union[ColumnStatistics, None]:
+        """Retorna as estatísticas de uma coluna, caso a tabela tenha sido analisada.
+
+        Args:
+            table (str): O nome da tabela.
+            column (str): O nome da coluna.
+
+        Returns:
+            ColumnStatistics | None: As estatísticas da coluna.
+        """
+        statistics: Union[TableStatistics, None] = self.statistics(table)
+        return statistics.column(column) if statistics is not None else None
+
+    def cardinality(self, table: str) -> float:
+        """Estima a quantia de linhas de uma tabela.
+
+        Args:
+            table (str): O nome da tabela.
+
+        Returns:
+            float: A quantia de linhas estimada.
+        """
+        statistics: Union[TableStatistics, None] = self.statistics(table)
+        return statistics.row_count if statistics is not None else self.default_rows
+
+    def is_sorted(self, table: str, column: str) -> bool:
+        """Verifica se uma coluna está em ordem crescente na ordem das linhas da tabela.
+
+        Args:
+            table (str): O nome da tabela.
+            column (str): O nome da coluna.
+
+        Returns:
+            bool: Verdadeiro caso a coluna esteja ordenada (falso sem estatísticas).
+        """
+        statistics: Union[ColumnStatistics, None] = self.column_statistics(table, column)
+        return statistics is not None and statistics.is_sorted
+
+    def comparable(self, left: Tuple[str, str], right: Tuple[str, str]) -> bool:
+        """Verifica se os valores de duas colunas podem ser comparados entre
+        si (números com números, ou textos com textos), pelos histogramas.
+
+        Args:
+            left (Tuple[str, str]): A tabela e o nome da primeira coluna.
+            right (Tuple[str, str]): A tabela e o nome da segunda coluna.
+
+        Returns:
+            bool: Verdadeiro caso os valores sejam comparáveis, ou caso
+            alguma das colunas não possua valores (falso sem estatísticas).
+        """
+        statistics: List[Union[ColumnStatistics, None]] = [self.column_statistics(*column) for column in (left, right)]
+        if statistics[0] is None or statistics[1] is None:
+            return False
+        (first, second) = (statistics[0].histogram, statistics[1].histogram)
+        if first and second:
+            try:
+                _ = first[0] < second[0]
+            except TypeError:
+                return False
+        return True
+
+    def distinct(self, table: str, column: str) -> float:
+        """Estima a quantia de valores distintos de uma coluna.
+
+        Args:
+            table (str): O nome da tabela.
+            column (str): O nome da coluna.
+
+        Returns:
+            float: A quantia de valores distintos estimada.
+        """
+        statistics: Union[ColumnStatistics, None] = self.column_statistics(table, column)
+        return statistics.distinct if statistics is not None else self.cardinality(table)
+
+    def selectivity(self, table: str, predicate: Predicate) -> float:
+        """Estima a fração das linhas de uma tabela que satisfaz uma condicional.
+
+        Args:
+            table (str): O nome da tabela.
+            predicate (Predicate): A condicional (de uma seleção).
+
+        Returns:
+            float: A seletividade, entre 0 e 1.
+        """
+        if (estimate := self.__selectivity_from_statistics(table, predicate)) is not None:
+            return estimate
+        if isinstance(predicate, Comparison):
+            if predicate.operator == "=":
+                return 1 / 10
+            if predicate.operator == "<>":
+                return 1 - 1 / 10
+            return 1 / 3
+        if isinstance(predicate, InList):
+            selectivity: float = min(1.0, len(predicate.values) / 10)
+            return 1 - selectivity if predicate.negated else selectivity
+        # Subconsultas e colunas sozinhas.
+        return 1 / 2
+
+    def __selectivity_from_statistics(self, table: str, predicate: Predicate) -> Union[float, None]:
+        """Estima a seletividade de uma condicional pelas estatísticas da coluna.
+
+        Args:
+            table (str): O nome da tabela.
+            predicate (Predicate): A condicional (de uma seleção).
+
+        Returns:
+            float | None: A seletividade, entre 0 e 1, ou None caso não
+            haja estatísticas aplicáveis à condicional.
+        """
+        if isinstance(predicate, Comparison) and isinstance(predicate.right, Literal):
+            statistics: Union[ColumnStatistics, None] = self.column_statistics(table, predicate.left.column)
+            if statistics is None:
+                return None
+            value = predicate.right.value
+            if predicate.operator == "=":
+                return statistics.equality_selectivity(value)
+            if predicate.operator == "<>":
+                return max(0.0, 1 - statistics.null_fraction - statistics.equality_selectivity(value))
+            return statistics.range_selectivity(predicate.operator, value)
+        if isinstance(predicate, InList):
+            statistics = self.column_statistics(table, predicate.column.column)
+            if statistics is None:
+                return None
+            selectivity: float = min(
+                1 - statistics.null_fraction,
+                sum(statistics.equality_selectivity(value.value) for value in set(predicate.values))
+            )
+            return max(0.0, 1 - statistics.null_fraction - selectivity) if predicate.negated else selectivity
+        return None
+
+    def choose_index(self, table: str, predicates: List[Predicate]) -> Union[Tuple[Index, List[Predicate]], None]:
+        """Escolhe o índice secundário, caso haja, mais barato para ler uma tabela.
+
+        A leitura completa custa uma unidade por linha; a leitura por um
+        índice custa 'random_access_cost' por linha selecionada, além da
+        busca no índice (logarítmica). O índice somente é escolhido
+        quando é mais barato que a leitura completa. Um índice ordenado
+        também pode responder, com uma única busca, a todas as suas
+        comparações juntas (um intervalo, como 'a > 1 AND a < 9').
+
+        Args:
+            table (str): O nome da tabela.
+            predicates (List[Predicate]): As condicionais da seleção da tabela.
+
+        Returns:
+            Tuple[Index, List[Predicate]] | None: O índice e as condicionais
+            que ele responde, ou None caso a leitura completa seja mais barata.
+        """
+        if self.catalog is None:
+            return None
+        rows: float = self.cardinality(table)
+        best: Union[Tuple[Index, List[Predicate]], None] = None
+        best_cost: float = rows
+        for index in self.catalog.indexes(table):
+            supported: List[Predicate] = [predicate for predicate in predicates if index.supports(predicate)]
+            candidates: List[List[Predicate]] = [[predicate] for predicate in supported]
+            comparisons: List[Predicate] = [predicate for predicate in supported if isinstance(predicate, Comparison)]
+            if index.kind == SORTED_INDEX and len(comparisons) > 1:
+                candidates.append(comparisons)
+            for candidate in candidates:
+                lookups: int = len(candidate[0].values) if isinstance(candidate[0], InList) else 1
+                selectivity: float = math.prod(self.selectivity(table, predicate) for predicate in candidate)
+                cost: float = self.__random_access_cost * selectivity * rows + lookups * math.log2(rows + 1)
+                if cost < best_cost:
+                    (best, best_cost) = ((index, candidate), cost)
+        return best
+
+    def join_selectivity(self, condition: JoinCondition) -> float:
+        """Estima a fração do produto cartesiano que satisfaz uma condicional de junção.
+
+        Args:
+            condition (JoinCondition): A condicional de junção.
+
+        Returns:
+            float: A seletividade, entre 0 e 1.
+        """
+        predicate: Predicate = condition.predicate
+        if isinstance(predicate, Comparison) and isinstance(predicate.right, ColumnRef) and len(condition.tables) == 2:
+            if predicate.operator == "=":
+                return 1 / max(
+                    1.0,
+                    self.distinct(condition.tables[0], predicate.left.column),
+                    self.distinct(condition.tables[1], predicate.right.column)
+                )
+            return 1 / 3
+        return self.selectivity(condition.tables[0], predicate)
+
+    def join_cost(self, left_rows: float, right_rows: float, output_rows: float) -> float:
+        """Estima o custo de uma junção (além do custo das suas entradas).
+
+        Args:
+            left_rows (float): A cardinalidade da entrada esquerda.
+            right_rows (float): A cardinalidade da entrada direita.
+            output_rows (float): A cardinalidade do resultado.
+
+        Returns:
+            float: O custo da junção.
+        """
+        return output_rows
+
+class JoinOrderer:
+    """Classe responsável pela escolha da ordem das junções.
+
+    Enumera, com programação dinâmica sobre os subconjuntos de tabelas,
+    as árvores à esquerda (o formato desenhado pela interface gráfica),
+    evitando produtos cartesianos sempre que o grafo de junções permite.
+    Acima de 'dp_table_limit' tabelas, usa uma heurística gulosa: começa
+    pela menor tabela e adiciona, a cada passo, a junção com o menor
+    resultado estimado.
+    """
+
+    # O modelo de custo e de estimativa de cardinalidade.
+    __cost_model: CostModel
+    # A quantia máxima de tabelas enumeradas com programação dinâmica.
+    __dp_table_limit: int
+
+    def __init__(self, cost_model: Union[CostModel, None] = None, dp_table_limit: int = 10) -> None:
+        """Construtor da classe.
+
+        Args:
+            cost_model (CostModel | None, optional): O modelo de custo.
+            Valor padrão: None (um 'CostModel' sem estatísticas).
+            dp_table_limit (int, optional): A quantia máxima de tabelas
+            enumeradas com programação dinâmica. Valor padrão: 10.
+        """
+        self.__cost_model = cost_model if cost_model is not None else CostModel()
+        self.__dp_table_limit = dp_table_limit
+
+    @property
+    def cost_model(self) -> CostModel:
+        """Extrai o conteúdo da variável privada cost_model.
+
+        Returns:
+            CostModel: O modelo de custo.
+        """
+        return self.__cost_model
+
+    @property
+    def dp_table_limit(self) -> int:
+        """Extrai o conteúdo da variável privada dp_table_limit.
+
+        Returns:
+            int: A quantia máxima de tabelas enumeradas com programação dinâmica.
+        """
+        return self.__dp_table_limit
+
+    def order(
+            self,
+            tables: List[str],
+            restrictions: Dict[str, List[Predicate]],
+            conditions: List[JoinCondition]) -> JoinOrder:
+        """Escolhe a ordem das junções de menor custo estimado.
+
+        Em caso de empate, a ordem textual do comando é mantida.
+
+        Args:
+            tables (List[str]): As tabelas do comando, na ordem textual.
+            restrictions (Dict[str, List[Predicate]]): As condicionais da
+            seleção de cada tabela, aplicadas antes das junções.
+            conditions (List[JoinCondition]): As condicionais de junção.
+
+        Returns:
+            JoinOrder: Cada tabela, na ordem escolhida, e as condicionais
+            aplicadas na sua junção.
+        """
+        rows: List[float] = self.__table_rows(tables, restrictions)
+
+        # O subconjunto de tabelas (máscara de bits) de cada condicional.
+        index: Dict[str, int] = {table: i for i, table in enumerate(tables)}
+        masks: List[int] = [
+            sum(1 << index[table] for table in set(condition.tables) if table in index)
+            for condition in conditions
+        ]
+        selectivities: List[float] = [self.cost_model.join_selectivity(condition) for condition in conditions]
+
+        if len(tables) <= self.dp_table_limit:
+            steps: List[int] = self.__dynamic_programming(rows, masks, selectivities)
+        else:
+            steps = self.__greedy(rows, masks, selectivities)
+
+        order: JoinOrder = []
+        joined: int = 0
+        for step in steps:
+            new: int = joined | (1 << step)
+            order.append((tables[step], [
+                condition.predicate
+                for condition, mask in zip(conditions, masks)
+                if joined and self.__is_applied(mask, joined, new)
+            ]))
+            joined = new
+        return order
+
+    def join_methods(
+            self,
+            join_order: JoinOrder,
+            restrictions: Dict[str, List[Predicate]],
+            conditions: List[JoinCondition]) -> List[JoinMethod]:
+        """Escolhe o algoritmo físico de cada junção da ordem escolhida.
+
+        Junções sem igualdades entre as entradas usam laços aninhados.
+        Quando as duas entradas chegam ordenadas por uma chave da junção
+        (colunas ordenadas nas estatísticas, ou o resultado de um merge
+        join anterior), é usado o merge join; caso contrário, o hash join,
+        com a tabela de hash construída com a menor entrada estimada.
+
+        Args:
+            join_order (JoinOrder): A ordem das junções (veja 'order').
+            restrictions (Dict[str, List[Predicate]]): As condicionais da
+            seleção de cada tabela.
+            conditions (List[JoinCondition]): As condicionais de junção.
+
+        Returns:
+            List[JoinMethod]: O algoritmo de cada junção, na ordem de
+            'join_order[1:]'.
+        """
+        tables: List[str] = [table for table, _ in join_order]
+        rows: List[float] = self.__table_rows(tables, restrictions)
+        left_rows: float = rows[0]
+        # A ordem das linhas da esquerda: a ordem física de uma tabela,
+        # ou as colunas (tabela, coluna) pelas quais as linhas estão ordenadas.
+        left_order: Union[str, FrozenSet[Tuple[str, str]]] = tables[0]
+        methods: List[JoinMethod] = []
+
+        for step, (table, predicates) in enumerate(join_order[1:], start=1):
+            applied: List[JoinCondition] = [condition for condition in conditions if condition.predicate in predicates]
+            keys: List[JoinKey] = self.__join_keys(applied, set(tables[:step]), table)
+
+            if not keys:
+                methods.append((plan.NESTED_LOOP, False, None))
+            elif merge_keys := [
+                    (left, right, predicate) for left, right, predicate in keys
+                    if self.__is_sorted(left, left_order) and self.cost_model.is_sorted(*right)
+                    and self.cost_model.comparable(left, right)]:
+                # O merge é feito pela chave ordenada (e de tipos comparáveis),
+                # que não é necessariamente a primeira.
+                (left, right, predicate) = merge_keys[0]
+                methods.append((plan.MERGE, False, predicate))
+                left_order = frozenset((left, right))
+            else:
+                build_left: bool = left_rows < rows[step]
+                methods.append((plan.HASH, build_left, None))
+                # O resultado segue a ordem da entrada que não é a tabela de hash.
+                if build_left:
+                    left_order = table
+
+            output: float = left_rows * rows[step]
+            for condition in applied:
+                output *= self.cost_model.join_selectivity(condition)
+            left_rows = max(1.0, output)
+        return methods
+
+    def __is_sorted(self, column: Tuple[str, str], order: Union[str, FrozenSet[Tuple[str, str]]]) -> bool:
+        """Verifica se as linhas de uma entrada estão ordenadas por uma coluna.
+
+        Args:
+            column (Tuple[str, str]): A tabela e o nome da coluna.
+            order (str | FrozenSet[Tuple[str, str]]): A ordem das linhas:
+            a ordem física de uma tabela, ou as colunas ordenadas.
+
+        Returns:
+            bool: Verdadeiro caso as linhas estejam ordenadas pela coluna.
+        """
+        if isinstance(order, str):
+            return column[0] == order and self.cost_model.is_sorted(*column)
+        return column in order
+
+    @staticmethod
+    def __join_keys(
+            conditions: List[JoinCondition],
+            joined: Set[str],
+            table: str) -> List[JoinKey]:
+        """Extrai as chaves (igualdades entre colunas) de uma junção.
+
+        Args:
+            conditions (List[JoinCondition]): As condicionais da junção.
+            joined (Set[str]): As tabelas já unidas (entrada esquerda).
+            table (str): A nova tabela (entrada direita).
+
+        Returns:
+            List[JoinKey]: Os pares de colunas, (tabela, coluna) da
+            esquerda e da direita, com a igualdade de origem.
+        """
+        keys: List[JoinKey] = []
+        for condition in conditions:
+            predicate: Predicate = condition.predicate
+            if not (isinstance(predicate, Comparison) and predicate.operator == "="
+                    and isinstance(predicate.right, ColumnRef) and len(condition.tables) == 2):
+                continue
+            left: Tuple[str, str] = (condition.tables[0], predicate.left.column)
+            right: Tuple[str, str] = (condition.tables[1], predicate.right.column)
+            if left[0] in joined and right[0] == table:
+                keys.append((left, right, predicate))
+            elif right[0] in joined and left[0] == table:
+                keys.append((right, left, predicate))
+        return keys
+
+    def __table_rows(self, tables: List[str], restrictions: Dict[str, List[Predicate]]) -> List[float]:
+        """Estima a cardinalidade de cada tabela, após a sua seleção.
+
+        Args:
+            tables (List[str]): As tabelas.
+            restrictions (Dict[str, List[Predicate]]): As condicionais da
+            seleção de cada tabela.
+
+        Returns:
+            List[float]: A cardinalidade de cada tabela, na ordem de 'tables'.
+        """
+        rows: List[float] = []
+        for table in tables:
+            estimate: float = self.cost_model.cardinality(table)
+            for predicate in restrictions.get(table, []):
+                estimate *= self.cost_model.selectivity(table, predicate)
+            rows.append(max(1.0, estimate))
+        return rows
+
+    @staticmethod
+    def __is_applied(mask: int, joined: int, new: int) -> bool:
+        """Verifica se uma condicional é aplicada na junção de 'joined'
+        (tabelas já unidas) com uma nova tabela ('new' = todas).
+
+        Uma condicional é aplicada na primeira junção que contém todas
+        as suas tabelas.
+
+        Args:
+            mask (int): As tabelas da condicional.
+            joined (int): As tabelas já unidas.
+            new (int): As tabelas após a junção.
+
+        Returns:
+            bool: Verdadeiro caso a condicional seja aplicada nessa junção.
+        """
+        first_join: bool = joined & (joined - 1) == 0
+        return mask != 0 and mask & new == mask and (first_join or mask & joined != mask)
+
+    def __join(self, left_rows: float, right_rows: float, masks: List[int], selectivities: List[float],
+               joined: int, new: int) -> Tuple[float, bool]:
+        """Estima a cardinalidade de uma junção.
+
+        Args:
+            left_rows (float): A cardinalidade das tabelas já unidas.
+            right_rows (float): A cardinalidade da nova tabela.
+            masks (List[int]): As tabelas de cada condicional.
+            selectivities (List[float]): A seletividade de cada condicional.
+            joined (int): As tabelas já unidas.
+            new (int): As tabelas após a junção.
+
+        Returns:
+            Tuple[float, bool]: A cardinalidade do resultado e se alguma
+            condicional conecta as entradas (falso para um produto cartesiano).
+        """
+        output: float = left_rows * right_rows
+        connected: bool = False
+        for mask, selectivity in zip(masks, selectivities):
+            if self.__is_applied(mask, joined, new):
+                output *= selectivity
+                connected = connected or mask & joined != 0 and mask & (new ^ joined) != 0
+        return (max(1.0, output), connected)
+
+    def __dynamic_programming(self, rows: List[float], masks: List[int], selectivities: List[float]) -> List[int]:
+        """Enumera as árvores à esquerda com programação dinâmica.
+
+        Args:
+            rows (List[float]): A cardinalidade de cada tabela.
+            masks (List[int]): As tabelas de cada condicional.
+            selectivities (List[float]): A seletividade de cada condicional.
+
+        Returns:
+            List[int]: O índice das tabelas, na ordem escolhida.
+        """
+        count: int = len(rows)
+        # O melhor plano de cada subconjunto: custo, cardinalidade e ordem.
+        best: Dict[int, Tuple[float, float, List[int]]] = {1 << i: (0.0, rows[i], [i]) for i in range(count)}
+
+        for joined in range(1, 1 << count):
+            if joined not in best:
+                continue
+            (cost, joined_rows, steps) = best[joined]
+            candidates: List[Tuple[int, float, bool]] = []
+            for table in range(count):
+                if not joined & (1 << table):
+                    new: int = joined | (1 << table)
+                    (output, connected) = self.__join(joined_rows, rows[table], masks, selectivities, joined, new)
+                    candidates.append((table, output, connected))
+            # Produtos cartesianos somente quando nenhuma junção conecta as tabelas.
+            has_connected: bool = any(connected for _, _, connected in candidates)
+            for table, output, connected in candidates:
+                if connected or not has_connected:
+                    new = joined | (1 << table)
+                    new_cost: float = cost + self.cost_model.join_cost(joined_rows, rows[table], output)
+                    if new not in best or new_cost < best[new][0]:
+                        best[new] = (new_cost, output, steps + [table])
+
+        return best[(1 << count) - 1][2]
+
+    def __greedy(self, rows: List[float], masks: List[int], selectivities: List[float]) -> List[int]:
+        """Escolhe a ordem com uma heurística gulosa.
+
+        Args:
+            rows (List[float]): A cardinalidade de cada tabela.
+            masks (List[int]): As tabelas de cada condicional.
+            selectivities (List[float]): A seletividade de cada condicional.
+
+        Returns:
+            List[int]: O índice das tabelas, na ordem escolhida.
+        """
+        first: int = min(range(len(rows)), key=lambda table: rows[table])
+        steps: List[int] = [first]
+        joined: int = 1 << first
+        joined_rows: float = rows[first]
+        remaining: List[int] = [table for table in range(len(rows)) if table != first]
+
+        while remaining:
+            # A melhor junção: conectada, com o menor resultado (empates na ordem textual).
+            candidates: List[Tuple[bool, float, int]] = []
+            for table in remaining:
+                (output, connected) = self.__join(
+                    joined_rows, rows[table], masks, selectivities, joined, joined | (1 << table)
+                )
+                candidates.append((not connected, output, table))
+            (_, joined_rows, table) = min(candidates)
+            steps.append(table)
+            joined |= 1 << table
+            remaining.remove(table)
+
+        return steps
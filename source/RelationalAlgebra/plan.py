@@ -0,0 +1,259 @@
+"""Arquivo responsável pelos operadores tipados do plano de
+execução (Álgebra Relacional), usados nos nós da árvore."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple, Union
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef, Comparison, InSubquery, Predicate
+
+def render_predicates(predicates: List[Predicate], subqueries: Dict[str, Any]) -> str:
+    """Representa uma lista de condicionais, unidas por AND.
+
+    Args:
+        predicates (List[Predicate]): As condicionais.
+        subqueries (Dict[str, Any]): Os Conversores das subconsultas,
+        indexados pelo texto da subconsulta.
+
+    Returns:
+        str: As condicionais, unidas por AND. As subconsultas são
+        representadas pela sua Álgebra Relacional.
+    """
+    return " AND ".join(
+        f"{predicate.column} {'NOT IN' if predicate.negated else 'IN'} "
+        f"({subqueries[predicate.text].relational_algebra})"
+        if isinstance(predicate, InSubquery) else str(predicate)
+        for predicate in predicates
+    )
+
+class Operator(ABC):
+    """Representa um operador da Álgebra Relacional.
+
+    Os operadores possuem '__slots__', mantendo o uso de memória
+    constante por nó, e são representados (render) no mesmo formato
+    textual exibido na árvore da interface gráfica.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def render(self) -> str:
+        """Representa o operador em Álgebra Relacional.
+
+        Returns:
+            str: O operador, no formato exibido na árvore.
+        """
+
+    def __str__(self) -> str:
+        return self.render()
+
+class Scan(Operator):
+    """Representa a leitura de uma tabela (folha da árvore).
+
+    As colunas lidas ('columns') são as necessárias aos operadores acima
+    da leitura (veja a poda de colunas do Conversor); as demais colunas
+    não são lidas do armazenamento.
+    """
+
+    __slots__ = ("table", "columns")
+
+    def __init__(self, table: str, columns: Union[List[str], None] = None) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (str): O nome da tabela.
+            columns (List[str] | None, optional): As colunas lidas, em
+            minúsculo. Valor padrão: None (todas as colunas).
+        """
+        self.table = table
+        self.columns = columns
+
+    def render(self) -> str:
+        return self.table
+
+    def __repr__(self) -> str:
+        return f"Scan({self.table!r})"
+
+class IndexScan(Scan):
+    """Representa a leitura, por um índice secundário, somente das
+    linhas de uma tabela que satisfazem as condicionais do índice.
+
+    Um índice ordenado responde a um intervalo (um limite inferior e um
+    superior sobre a coluna) com uma única busca.
+    """
+
+    __slots__ = ("index", "kind", "predicates")
+
+    def __init__(self, table: str, index: str, kind: str, predicates: List[Predicate]) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (str): O nome da tabela.
+            index (str): O nome do índice (veja 'Catalog.create_index').
+            kind (str): O tipo do índice ('hash' ou 'sorted').
+            predicates (List[Predicate]): As condicionais (unidas por AND)
+            respondidas pelo índice.
+        """
+        super().__init__(table)
+        self.index = index
+        self.kind = kind
+        self.predicates = predicates
+
+    def render(self) -> str:
+        return f"{self.table} [index scan ({self.kind}): {' AND '.join(map(str, self.predicates))}]"
+
+    def __repr__(self) -> str:
+        return f"IndexScan({self.table!r}, {self.index!r}, {self.predicates!r})"
+
+class EmptyScan(Scan):
+    """Representa uma tabela cujas condicionais são contraditórias (veja
+    'simplify'): nenhuma linha é lida, e o resultado é vazio."""
+
+    __slots__ = ()
+
+    def render(self) -> str:
+        return f"{self.table} [relação vazia: condicionais contraditórias]"
+
+    def __repr__(self) -> str:
+        return f"EmptyScan({self.table!r})"
+
+class ViewScan(Scan):
+    """Representa a leitura de uma visão materializada, no lugar das
+    junções das tabelas que ela contém."""
+
+    __slots__ = ("tables",)
+
+    def __init__(self, view: str, tables: List[str]) -> None:
+        """Construtor da classe.
+
+        Args:
+            view (str): O nome da visão (veja 'Catalog.add_view').
+            tables (List[str]): As tabelas substituídas pela visão.
+        """
+        super().__init__(view)
+        self.tables = tables
+
+    def render(self) -> str:
+        return f"{self.table} [materialized view: {' |x| '.join(self.tables)}]"
+
+    def __repr__(self) -> str:
+        return f"ViewScan({self.table!r}, {self.tables!r})"
+
+class Project(Operator):
+    """Representa uma projeção (π)."""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: List[ColumnRef]) -> None:
+        """Construtor da classe.
+
+        Args:
+            columns (List[ColumnRef]): As colunas projetadas; '*'
+            representa todas as colunas.
+        """
+        self.columns = columns
+
+    @property
+    def is_star(self) -> bool:
+        """Verifica se a projeção mantém todas as colunas ('*').
+
+        Returns:
+            bool: Verdadeiro caso a projeção seja um '*'.
+        """
+        return any(column.column == "*" for column in self.columns)
+
+    def render(self) -> str:
+        # Uma projeção de todas as colunas não é exibida.
+        return "" if self.is_star else f"π {', '.join(map(str, self.columns))}"
+
+    def __repr__(self) -> str:
+        return f"Project({self.columns!r})"
+
+class Select(Operator):
+    """Representa uma seleção (σ), com as condicionais unidas por AND."""
+
+    __slots__ = ("predicates", "subqueries")
+
+    def __init__(self, predicates: List[Predicate], subqueries: Dict[str, Any]) -> None:
+        """Construtor da classe.
+
+        Args:
+            predicates (List[Predicate]): As condicionais da seleção.
+            subqueries (Dict[str, Any]): Os Conversores das subconsultas
+            (dos IN e NOT IN), indexados pelo texto da subconsulta.
+        """
+        self.predicates = predicates
+        self.subqueries = subqueries
+
+    def render(self) -> str:
+        return f"σ {render_predicates(self.predicates, self.subqueries)}"
+
+    def __repr__(self) -> str:
+        return f"Select({self.predicates!r})"
+
+# Os algoritmos físicos de uma junção.
+NESTED_LOOP: str = "nested loop"
+HASH: str = "hash join"
+MERGE: str = "merge join"
+
+class Join(Operator):
+    """Representa uma junção (|x|) ou, sem condicionais, um produto cartesiano (×).
+
+    O algoritmo físico ('method'), quando escolhido pelo planejador, é
+    exibido na árvore junto às condicionais.
+    """
+
+    __slots__ = ("conditions", "method", "build_left", "merge_key")
+
+    def __init__(
+            self,
+            conditions: List[Predicate],
+            method: Union[str, None] = None,
+            build_left: bool = False,
+            merge_key: Union[Predicate, None] = None) -> None:
+        """Construtor da classe.
+
+        Args:
+            conditions (List[Predicate]): As condicionais da junção
+            (unidas por AND).
+            method (str | None, optional): O algoritmo físico (NESTED_LOOP,
+            HASH ou MERGE). Valor padrão: None (não escolhido).
+            build_left (bool, optional): Verdadeiro caso a tabela de hash
+            seja construída com a entrada esquerda. Valor padrão: False.
+            merge_key (Predicate | None, optional): No merge join, a
+            igualdade (uma das condicionais) pela qual as duas entradas
+            estão ordenadas. Valor padrão: None.
+        """
+        self.conditions = conditions
+        self.method = method
+        self.build_left = build_left
+        self.merge_key = merge_key
+
+    @property
+    def keys(self) -> List[Tuple[ColumnRef, ColumnRef]]:
+        """Extrai as chaves da junção: as igualdades entre duas colunas.
+
+        Returns:
+            List[Tuple[ColumnRef, ColumnRef]]: Os pares de colunas
+            (esquerda, direita) comparados por igualdade.
+        """
+        return [
+            (condition.left, condition.right)
+            for condition in self.conditions
+            if isinstance(condition, Comparison)
+            and condition.operator == "="
+            and isinstance(condition.right, ColumnRef)
+        ]
+
+    def render(self) -> str:
+        if not self.conditions:
+            return "×"
+        method: str = ""
+        if self.method == HASH:
+            method = f" [{HASH}, build à {'esquerda' if self.build_left else 'direita'}]"
+        elif self.method is not None:
+            method = f" [{self.method}]"
+        return f"|x| {render_predicates(self.conditions, {})}{method}"
+
+    def __repr__(self) -> str:
+        return f"Join({self.conditions!r}, method={self.method!r})"
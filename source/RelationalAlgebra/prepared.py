@@ -0,0 +1,298 @@
+"""Arquivo responsável pelos comandos SQL preparados, ou seja,
+comandos com marcadores de parâmetros ('?') que são verificados
+e convertidos para Álgebra Relacional uma única vez."""
+
+import re
+from typing import Dict, Iterator, List, Tuple, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Parser.lexer import Lexer
+from Parser.parser import Parser
+from Parser.sql_ast import Comparison, InList, Literal, Parameter, Select
+from RelationalAlgebra.Converter import Node, Converter
+
+# Um texto dividido nos marcadores de parâmetros: textos nas posições
+# pares e o índice do parâmetro nas posições ímpares.
+Template = List[Union[str, int]]
+
+class PreparedStatement:
+    """Classe responsável por um comando SQL preparado.
+
+    O comando, com marcadores de parâmetros ('?') em posições de
+    literais (WHERE, ON e IN), passa pelo Parser e pelo Converter
+    uma única vez. Cada marcador é substituído por um literal
+    sentinela, e os textos da Álgebra Relacional (do comando e das
+    subconsultas) que contém algum sentinela são divididos em modelos.
+
+    Ao atribuir os parâmetros (bind), os literais sentinelas da Árvore
+    Sintática Abstrata recebem os parâmetros e somente os modelos são
+    preenchidos: o comando não é analisado novamente e a árvore da
+    Álgebra Relacional, cujos operadores usam os mesmos literais, não
+    é reconstruída.
+    """
+
+    # O comando SQL preparado, com os marcadores '?'.
+    __sql_command: str
+    # O Parser do comando, com os sentinelas no lugar dos marcadores.
+    __parser: Parser
+    # O Conversor do comando, com os sentinelas no lugar dos marcadores.
+    __converter: Converter
+    # A quantia de marcadores de parâmetros do comando.
+    __param_count: int
+    # Os modelos da Álgebra Relacional do comando e das subconsultas.
+    __algebra_templates: List[Tuple[Converter, Template]]
+    # Os literais sentinelas e o índice do parâmetro de cada um.
+    __sentinel_literals: List[Tuple[int, Literal]]
+
+    def __init__(self, sql_command: str, database: Dict[str, List[str]]) -> None:
+        """Construtor da classe.
+
+        Verifica, valida e converte o comando SQL para Álgebra Relacional.
+
+        Args:
+            sql_command (str): O comando SQL, com marcadores '?'.
+            database (Dict[str, List[str]]): Um dicionário contendo o nome
+            das tabelas (chaves) e uma lista com as colunas da tabela (valor).
+
+        Veja '/source/Examples' para mais detalhes sobre a estrutura de 'database'.
+        """
+        self.__sql_command = sql_command
+        placeholders: List[int] = Lexer(sql_command).placeholders
+        self.__param_count = len(placeholders)
+
+        # Escolhe um prefixo de sentinela que não aparece no comando.
+        prefix: str = "prepared"
+        while prefix in sql_command.lower():
+            prefix += "x"
+        sentinel_pattern: re.Pattern = re.compile(f"'{prefix}([0-9]+)'")
+
+        # Substitui cada marcador por um literal sentinela (ex.: 'prepared0').
+        sql_pieces: List[str] = []
+        last: int = 0
+        for i, position in enumerate(placeholders):
+            sql_pieces.append(f"{sql_command[last:position]}'{prefix}{i}'")
+            last = position + 1
+        sql_pieces.append(sql_command[last:])
+
+        self.__parser = Parser("".join(sql_pieces))
+        self.__parser.check_database_compatibility(database)
+
+        def mark_parameters(parser: Parser) -> None:
+            """Substitui os literais sentinelas de um comando (e das suas
+            subconsultas) por parâmetros, antes da conversão: as
+            condicionais com parâmetros não são simplificadas com os
+            valores dos sentinelas.
+
+            Args:
+                parser (Parser): O Parser do comando.
+            """
+            select: Select = parser.sql_ast
+            for predicate in select.where + [condition for join in select.joins for condition in join.conditions]:
+                if isinstance(predicate, Comparison) and isinstance(predicate.right, Literal):
+                    if sentinel_pattern.fullmatch(predicate.right.text) is not None:
+                        predicate.right = Parameter(predicate.right.value, predicate.right.text)
+                elif isinstance(predicate, InList):
+                    predicate.values = [
+                        Parameter(value.value, value.text) if sentinel_pattern.fullmatch(value.text) is not None
+                        else value
+                        for value in predicate.values
+                    ]
+            for subquery_parser in parser.sql_subqueries.values():
+                mark_parameters(subquery_parser)
+
+        mark_parameters(self.__parser)
+        self.__converter = Converter(self.__parser)
+        self.__converter.convert_in_database_context(database)
+
+        def split_template(text: str) -> Template:
+            """Divide um texto nos sentinelas.
+
+            Args:
+                text (str): O texto a ser dividido.
+
+            Returns:
+                Template: O texto dividido, com o índice dos parâmetros
+                nas posições ímpares.
+            """
+            return [
+                int(piece) if i % 2 else piece
+                for i, piece in enumerate(sentinel_pattern.split(text))
+            ]
+
+        def converters(converter: Converter) -> Iterator[Converter]:
+            """Percorre um Conversor e os Conversores das suas subconsultas.
+
+            Args:
+                converter (Converter): O Conversor inicial.
+
+            Yields:
+                Converter: Cada Conversor, incluindo o inicial.
+            """
+            yield converter
+            for subquery_converter in converter.subquery_converters.values():
+                yield from converters(subquery_converter)
+
+        def literals(select: Select) -> Iterator[Literal]:
+            """Percorre os literais das condicionais de um comando (sem as subconsultas).
+
+            Args:
+                select (Select): A Árvore Sintática Abstrata do comando.
+
+            Yields:
+                Literal: Cada literal das condicionais do ON e do WHERE.
+            """
+            for predicate in select.where + [condition for join in select.joins for condition in join.conditions]:
+                if isinstance(predicate, Comparison) and isinstance(predicate.right, Literal):
+                    yield predicate.right
+                elif isinstance(predicate, InList):
+                    yield from predicate.values
+
+        self.__algebra_templates = []
+        self.__sentinel_literals = []
+        for converter in converters(self.__converter):
+            if len(template := split_template(converter.relational_algebra)) > 1:
+                self.__algebra_templates.append((converter, template))
+            for literal in literals(converter.parser.sql_ast):
+                if isinstance(literal, Parameter):
+                    self.__sentinel_literals.append((int(sentinel_pattern.fullmatch(literal.text).group(1)), literal))
+
+    @property
+    def sql_command(self) -> str:
+        """Extrai o conteúdo da variável privada sql_command.
+
+        Returns:
+            str: O comando SQL preparado, com os marcadores '?'.
+        """
+        return self.__sql_command
+
+    @property
+    def parser(self) -> Parser:
+        """Extrai o conteúdo da variável privada parser.
+
+        Returns:
+            Parser: O Parser do comando preparado.
+        """
+        return self.__parser
+
+    @property
+    def converter(self) -> Converter:
+        """Extrai o conteúdo da variável privada converter.
+
+        Returns:
+            Converter: O Conversor do comando preparado.
+        """
+        return self.__converter
+
+    @property
+    def param_count(self) -> int:
+        """Extrai o conteúdo da variável privada param_count.
+
+        Returns:
+            int: A quantia de marcadores de parâmetros do comando.
+        """
+        return self.__param_count
+
+    @property
+    def relational_algebra(self) -> str:
+        """Extrai o conteúdo da variável privada relational_algebra.
+
+        Returns:
+            str: A Álgebra Relacional com os últimos parâmetros
+            atribuídos (ou com os sentinelas, caso nenhum parâmetro
+            tenha sido atribuído).
+        """
+        return self.__converter.relational_algebra
+
+    @property
+    def relational_algebra_tree(self) -> Node:
+        """Extrai a Árvore da Álgebra Relacional do comando preparado.
+
+        Os nós da árvore são atualizados a cada atribuição de parâmetros.
+
+        Returns:
+            Node: A Árvore da Álgebra Relacional.
+        """
+        return self.__converter.relational_algebra_tree
+
+    @staticmethod
+    def to_literal(parameter: Union[int, float, str, bool, None]) -> str:
+        """Converte um parâmetro para a sua representação em literal SQL.
+
+        Args:
+            parameter (int | float | str | bool | None): O parâmetro.
+
+        Returns:
+            str: O literal SQL correspondente ao parâmetro.
+
+        Raises:
+            ParameterMismatchException: Exceção customizada para
+            alertar a utilização de um parâmetro incompatível.
+        """
+        if parameter is None:
+            return "NULL"
+        if isinstance(parameter, bool):
+            return "true" if parameter else "false"
+        if isinstance(parameter, (int, float)):
+            return repr(parameter)
+        if isinstance(parameter, str):
+            escaped: str = parameter.replace("\\", "\\\\").replace("'", "\\'")
+            return f"'{escaped}'"
+        Exceptions.raise_parameter_type_mismatch_exception(parameter)
+
+    def bind(self, *parameters: Union[int, float, str, bool, None]) -> str:
+        """Atribui os parâmetros aos marcadores, na ordem em que aparecem.
+
+        Atribui os parâmetros aos literais sentinelas e preenche os
+        modelos da Álgebra Relacional, sem analisar novamente o comando.
+
+        Args:
+            *parameters (int | float | str | bool | None): Os parâmetros.
+
+        Returns:
+            str: A Álgebra Relacional com os parâmetros atribuídos.
+
+        Raises:
+            ParameterMismatchException: Exceção customizada para alertar
+            uma quantia incorreta de parâmetros, ou um parâmetro incompatível.
+        """
+        if len(parameters) != self.param_count:
+            Exceptions.raise_parameter_count_mismatch_exception(self.param_count, len(parameters))
+
+        literals: List[str] = [self.to_literal(parameter) for parameter in parameters]
+
+        def fill_template(template: Template) -> str:
+            """Preenche um modelo com os literais dos parâmetros.
+
+            Args:
+                template (Template): O modelo a ser preenchido.
+
+            Returns:
+                str: O texto preenchido.
+            """
+            return "".join(
+                literals[piece] if i % 2 else piece
+                for i, piece in enumerate(template)
+            )
+
+        for index, literal in self.__sentinel_literals:
+            literal.value = parameters[index]
+            literal.text = literals[index]
+        for converter, template in self.__algebra_templates:
+            converter.relational_algebra = fill_template(template)
+        return self.relational_algebra
+
+def prepare(sql_command: str, database: Dict[str, List[str]]) -> PreparedStatement:
+    """Prepara um comando SQL com marcadores de parâmetros ('?').
+
+    Args:
+        sql_command (str): O comando SQL, com marcadores '?' em
+        posições de literais (WHERE, ON e IN).
+        database (Dict[str, List[str]]): Um dicionário contendo o nome
+        das tabelas (chaves) e uma lista com as colunas da tabela (valor).
+
+    Returns:
+        PreparedStatement: O comando preparado, pronto para receber
+        os parâmetros.
+    """
+    return PreparedStatement(sql_command, database)
@@ -0,0 +1,279 @@
+"""Arquivo responsável pela simplificação das condicionais da seleção
+de uma tabela: remove as condicionais repetidas, une os intervalos de
+uma mesma coluna e detecta as condicionais contraditórias."""
+
+from typing import Any, Dict, List, Tuple, Union
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef, Comparison, InList, Literal, Parameter, Predicate
+
+# Um limite de um intervalo: o valor, se o valor pertence ao intervalo
+# (>= e <=) e a condicional de origem.
+Bound = Tuple[Any, bool, Comparison]
+
+def value_kind(value: Any) -> str:
+    """Classifica um valor pelo seu tipo, para a comparação entre literais.
+
+    Args:
+        value (Any): O valor (não nulo) de um literal.
+
+    Returns:
+        str: 'bool', 'number' (inteiros e reais) ou 'text'.
+    """
+    if isinstance(value, bool):
+        return "bool"
+    return "number" if isinstance(value, (int, float)) else "text"
+
+class ColumnRange:
+    """Representa as condicionais de uma seleção sobre uma mesma coluna
+    com literais: o intervalo (limites inferior e superior), os valores
+    permitidos (= e IN) e os valores excluídos (<> e NOT IN).
+
+    As condicionais são unidas por AND: os limites guardam somente o
+    mais restritivo de cada lado, e os valores permitidos são a
+    intersecção das listas.
+    """
+
+    # A coluna, como escrita na primeira condicional.
+    __column: ColumnRef
+    # As condicionais recebidas, na ordem do comando.
+    __predicates: List[Predicate]
+    # Os limites mais restritivos do intervalo.
+    __lower: Union[Bound, None]
+    __upper: Union[Bound, None]
+    # Os literais permitidos (= e IN), ou None caso não haja restrição.
+    __allowed: Union[List[Literal], None]
+    # As condicionais de exclusão (<> e NOT IN).
+    __excluded: List[Predicate]
+    # Os tipos dos literais ('value_kind').
+    __kinds: set
+    # Verdadeiro caso alguma condicional nunca seja verdadeira (comparação com nulo).
+    __unknown: bool
+
+    def __init__(self, column: ColumnRef) -> None:
+        """Construtor da classe.
+
+        Args:
+            column (ColumnRef): A coluna.
+        """
+        self.__column = column
+        self.__predicates = []
+        self.__lower = None
+        self.__upper = None
+        self.__allowed = None
+        self.__excluded = []
+        self.__kinds = set()
+        self.__unknown = False
+
+    def add(self, predicate: Union[Comparison, InList]) -> None:
+        """Inclui uma condicional da coluna (com um literal, ou um IN).
+
+        Args:
+            predicate (Comparison | InList): A condicional.
+        """
+        self.__predicates.append(predicate)
+        if isinstance(predicate, InList):
+            operator: str = "<>" if predicate.negated else "="
+            values: List[Literal] = [value for value in predicate.values if value.value is not None]
+            # Um NOT IN com um nulo na lista nunca é verdadeiro.
+            self.__unknown |= predicate.negated and len(values) < len(predicate.values)
+            self.__kinds.update(value_kind(value.value) for value in values)
+        else:
+            (operator, values) = (predicate.operator, [predicate.right])
+            # Uma comparação com um nulo nunca é verdadeira.
+            self.__unknown |= predicate.right.value is None
+            if predicate.right.value is not None:
+                self.__kinds.add(value_kind(predicate.right.value))
+        if self.__unknown or len(self.__kinds) > 1:
+            # Os literais de tipos diferentes não são comparados (veja 'simplify').
+            return
+
+        # Um IN restringe os valores como um =, e um NOT IN os exclui como um <>.
+        if operator == "<>":
+            self.__excluded.append(predicate)
+        elif operator == "=":
+            self.__restrict(values)
+        elif operator in (">", ">="):
+            bound: Bound = (values[0].value, operator == ">=", predicate)
+            if self.__lower is None or self.__tighter(bound, self.__lower, lower=True):
+                self.__lower = bound
+        else:
+            bound = (values[0].value, operator == "<=", predicate)
+            if self.__upper is None or self.__tighter(bound, self.__upper, lower=False):
+                self.__upper = bound
+
+    def simplify(self) -> Union[List[Predicate], None]:
+        """Une as condicionais da coluna.
+
+        Returns:
+            List[Predicate] | None: As condicionais equivalentes (um
+            intervalo, uma igualdade ou um IN, e as exclusões restantes), ou
+            None caso as condicionais sejam contraditórias. Literais de
+            tipos diferentes não são comparados: as condicionais são
+            mantidas como recebidas.
+        """
+        if self.__unknown:
+            return None
+        if len(self.__kinds) > 1:
+            return list(self.__predicates)
+
+        if self.__allowed is not None:
+            allowed: List[Literal] = [
+                literal for literal in self.__allowed
+                if self.__in_range(literal.value) and not self.__is_excluded(literal.value)
+            ]
+            if not allowed:
+                return None
+            if len(allowed) == 1:
+                return [self.__equality(allowed[0])]
+            original: Union[Predicate, None] = next((
+                predicate for predicate in self.__predicates
+                if isinstance(predicate, InList) and not predicate.negated and predicate.values == allowed
+            ), None)
+            return [original if original is not None else InList(self.__column, allowed, False)]
+
+        result: List[Predicate] = []
+        if self.__lower is not None and self.__upper is not None:
+            ((lower, lower_inclusive, _), (upper, upper_inclusive, _)) = (self.__lower, self.__upper)
+            if lower > upper or (lower == upper and not (lower_inclusive and upper_inclusive)):
+                return None
+            if lower == upper:
+                return None if self.__is_excluded(lower) else [self.__equality(self.__lower[2].right)]
+        result.extend(bound[2] for bound in (self.__lower, self.__upper) if bound is not None)
+        # As exclusões fora do intervalo são sempre verdadeiras para os valores não nulos.
+        result.extend(
+            predicate for predicate in self.__excluded
+            if isinstance(predicate, InList) or self.__in_range(predicate.right.value)
+        )
+        return result
+
+    def __restrict(self, values: List[Literal]) -> None:
+        """Intersecta os valores permitidos com os literais de um = (ou de um IN).
+
+        Args:
+            values (List[Literal]): Os literais não nulos.
+        """
+        if self.__allowed is None:
+            self.__allowed = list({literal.value: literal for literal in values}.values())
+            return
+        permitted: set = {literal.value for literal in values}
+        self.__allowed = [literal for literal in self.__allowed if literal.value in permitted]
+
+    def __equality(self, literal: Literal) -> Comparison:
+        """Retorna a igualdade da coluna com um literal, reaproveitando a
+        condicional do comando, caso exista.
+
+        Args:
+            literal (Literal): O literal.
+
+        Returns:
+            Comparison: A igualdade.
+        """
+        for predicate in self.__predicates:
+            if isinstance(predicate, Comparison) and predicate.operator == "=" and predicate.right.value == literal.value:
+                return predicate
+        return Comparison(self.__column, "=", literal)
+
+    def __in_range(self, value: Any) -> bool:
+        """Verifica se um valor pertence ao intervalo da coluna.
+
+        Args:
+            value (Any): O valor (não nulo).
+
+        Returns:
+            bool: Verdadeiro caso o valor respeite os dois limites.
+        """
+        if self.__lower is not None:
+            (lower, inclusive, _) = self.__lower
+            if value < lower or (value == lower and not inclusive):
+                return False
+        if self.__upper is not None:
+            (upper, inclusive, _) = self.__upper
+            if value > upper or (value == upper and not inclusive):
+                return False
+        return True
+
+    def __is_excluded(self, value: Any) -> bool:
+        """Verifica se um valor é excluído por um <> (ou por um NOT IN).
+
+        Args:
+            value (Any): O valor (não nulo).
+
+        Returns:
+            bool: Verdadeiro caso o valor seja excluído.
+        """
+        return any(
+            value in {literal.value for literal in predicate.values} if isinstance(predicate, InList)
+            else value == predicate.right.value
+            for predicate in self.__excluded
+        )
+
+    @staticmethod
+    def __tighter(bound: Bound, current: Bound, lower: bool) -> bool:
+        """Verifica se um limite é mais restritivo que o limite atual.
+
+        Args:
+            bound (Bound): O novo limite.
+            current (Bound): O limite atual.
+            lower (bool): Verdadeiro para os limites inferiores (> e >=).
+
+        Returns:
+            bool: Verdadeiro caso o novo limite restrinja mais o intervalo.
+        """
+        if bound[0] == current[0]:
+            return current[1] and not bound[1]
+        return bound[0] > current[0] if lower else bound[0] < current[0]
+
+def simplify(predicates: List[Predicate]) -> Tuple[List[Predicate], bool]:
+    """Simplifica as condicionais (unidas por AND) da seleção de uma tabela.
+
+    As condicionais repetidas são removidas, e as condicionais de uma
+    mesma coluna com literais são unidas (veja 'ColumnRange'):
+    'a > 5 AND a > 7 AND a < 10' resulta em 'a > 7 AND a < 10', e
+    'a IN (1, 2, 3) AND a > 1' resulta em 'a IN (2, 3)'. As demais
+    condicionais (entre colunas, subconsultas e colunas sozinhas) são
+    mantidas, assim como as condicionais com marcadores de parâmetros
+    ('Parameter'), cujo valor não é conhecido antes do bind. As
+    condicionais de cada coluna (como escrita: 'a' e 't.a' são tratadas
+    separadamente) ficam na posição da primeira condicional da coluna.
+
+    Args:
+        predicates (List[Predicate]): As condicionais de uma única tabela.
+
+    Returns:
+        Tuple[List[Predicate], bool]: As condicionais simplificadas e se
+        elas são contraditórias (nenhuma linha as satisfaz, como em
+        'a = 1 AND a = 2'); as condicionais contraditórias são retornadas
+        somente sem as repetições.
+    """
+    unique: List[Predicate] = list(dict.fromkeys(predicates))
+    ranges: Dict[str, ColumnRange] = {}
+    # As condicionais mantidas e, na posição da primeira condicional de
+    # cada coluna, o nome da coluna.
+    slots: List[Union[Predicate, str]] = []
+    for predicate in unique:
+        if (isinstance(predicate, Comparison) and isinstance(predicate.right, Literal)
+                and not isinstance(predicate.right, Parameter)):
+            column: ColumnRef = predicate.left
+        elif isinstance(predicate, InList) and not any(isinstance(value, Parameter) for value in predicate.values):
+            column = predicate.column
+        else:
+            slots.append(predicate)
+            continue
+        # As colunas explícitas de uma visão podem ter o mesmo nome em tabelas diferentes.
+        key: str = f"{column.table or ''}.{column.column}".casefold()
+        if key not in ranges:
+            ranges[key] = ColumnRange(column)
+            slots.append(key)
+        ranges[key].add(predicate)
+
+    result: List[Predicate] = []
+    for slot in slots:
+        if not isinstance(slot, str):
+            result.append(slot)
+            continue
+        simplified: Union[List[Predicate], None] = ranges[slot].simplify()
+        if simplified is None:
+            return (unique, True)
+        result.extend(simplified)
+    return (result, False)
@@ -0,0 +1,26 @@
+"""Arquivo responsável pela junção de todas as funcionalidades
+do armazenamento dos dados das tabelas."""
+
+# pylint: disable=import-error
+from .table import Table
+from .csv_loader import CsvLoader, LoadReport, write_csv
+from .index import Index, HashIndex, SortedIndex, HASH_INDEX, SORTED_INDEX
+from .columnar import MappedTable, MappedColumn, write_columnar, open_columnar, open_columnar_database
+
+# Indica o que, neste pacote, está disponível para uso.
+__all__ = [
+    'Table',
+    'CsvLoader',
+    'LoadReport',
+    'write_csv',
+    'Index',
+    'HashIndex',
+    'SortedIndex',
+    'HASH_INDEX',
+    'SORTED_INDEX',
+    'MappedTable',
+    'MappedColumn',
+    'write_columnar',
+    'open_columnar',
+    'open_columnar_database'
+]
@@ -0,0 +1,386 @@
+"""Arquivo responsável pelo formato binário, em colunas, dos dados
+de uma tabela, lido do disco sob demanda (mmap).
+
+Cada tabela é um diretório com um cabeçalho ('table.json') e um
+arquivo por coluna: os valores de tamanho fixo (inteiros ou reais de
+64 bits) ou, nas colunas de texto, as posições ('.offsets') e os bytes
+em UTF-8 ('.data') de cada valor. As colunas com nulos possuem, também,
+uma máscara com um byte por linha ('.nulls'). Abrir uma tabela somente
+lê o cabeçalho e mapeia os arquivos na memória: os valores são lidos
+do disco pelo sistema operacional quando acessados."""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union, overload
+
+# pylint: disable=import-error
+import Exceptions
+from Storage.table import Table
+
+# A versão do formato, gravada no cabeçalho.
+FORMAT_VERSION: int = 1
+# O nome do arquivo do cabeçalho, em cada diretório de tabela.
+HEADER_FILE: str = "table.json"
+# Os tipos das colunas e o formato ('array'/'memoryview') dos seus valores.
+INT: str = "int64"
+FLOAT: str = "float64"
+TEXT: str = "text"
+FORMATS: Dict[str, str] = {INT: "q", FLOAT: "d", TEXT: "q"}
+# A quantia de linhas convertidas por vez ao percorrer uma coluna.
+BLOCK_SIZE: int = 1 << 16
+
+class MappedColumn(Sequence):
+    """Representa uma coluna mapeada na memória.
+
+    Os valores são convertidos para objetos do Python somente quando
+    acessados, um a um ou em blocos ao percorrer a coluna.
+    """
+
+    __slots__ = ("kind", "values", "nulls", "data")
+
+    def __init__(
+            self,
+            kind: str,
+            values: memoryview,
+            nulls: Union[memoryview, None],
+            data: Union[memoryview, None]) -> None:
+        """Construtor da classe.
+
+        Args:
+            kind (str): O tipo da coluna ('int64', 'float64' ou 'text').
+            values (memoryview): Os valores ou, no texto, as posições de
+            cada valor nos bytes (uma a mais que a quantia de linhas).
+            nulls (memoryview | None): A máscara dos nulos, ou None caso a
+            coluna não possua nulos.
+            data (memoryview | None): Os bytes dos textos, ou None caso
+            não seja uma coluna de texto.
+        """
+        self.kind = kind
+        self.values = values
+        self.nulls = nulls
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.values) - 1 if self.kind == TEXT else len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("A posição está fora da coluna.")
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        if self.kind == TEXT:
+            return str(self.data[self.values[index]:self.values[index + 1]], "utf-8")
+        return self.values[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Percorre os valores da coluna, convertendo-os em blocos.
+
+        Returns:
+            Iterator[Any]: Os valores, na ordem das linhas.
+        """
+        for start in range(0, len(self), BLOCK_SIZE):
+            yield from self.block(start, min(len(self), start + BLOCK_SIZE))
+
+    def block(self, start: int, end: int) -> List[Any]:
+        """Converte um intervalo de linhas da coluna.
+
+        Args:
+            start (int): A primeira linha.
+            end (int): A linha final (exclusiva).
+
+        Returns:
+            List[Any]: Os valores do intervalo.
+        """
+        if self.kind == TEXT:
+            offsets: List[int] = self.values[start:end + 1].tolist()
+            raw: bytes = bytes(self.data[offsets[0]:offsets[-1]])
+            base: int = offsets[0]
+            if raw.isascii():
+                # Sem acentos, as posições dos bytes são as posições dos caracteres.
+                text: str = raw.decode("ascii")
+                values: List[Any] = [text[first - base:last - base] for first, last in zip(offsets, offsets[1:])]
+            else:
+                values = [str(raw[first - base:last - base], "utf-8") for first, last in zip(offsets, offsets[1:])]
+        else:
+            values = self.values[start:end].tolist()
+        if self.nulls is not None:
+            nulls: bytes = bytes(self.nulls[start:end])
+            if any(nulls):
+                values = [None if null else value for value, null in zip(values, nulls)]
+        return values
+
+class MappedTable(Table):
+    """Classe responsável pelos dados de uma tabela no formato em colunas,
+    mapeados na memória.
+
+    Pode ser usada em qualquer lugar que aceite uma 'Table' (por exemplo,
+    em 'Catalog.attach_table'), mas é somente leitura: novas linhas devem
+    ser incluídas em uma 'Table' e gravadas novamente com 'write_columnar'.
+    """
+
+    # O diretório da tabela.
+    __path: str
+    # A quantia de linhas.
+    __row_count: int
+    # A versão dos dados, gravada no cabeçalho.
+    __mapped_version: int
+    # As colunas mapeadas, na ordem das colunas.
+    __mapped_columns: List[MappedColumn]
+    # Os arquivos mapeados na memória, fechados em 'close'.
+    __maps: List[mmap.mmap]
+
+    def __init__(self, path: str) -> None:
+        """Construtor da classe: lê o cabeçalho e mapeia os arquivos das colunas.
+
+        Args:
+            path (str): O diretório da tabela.
+
+        Raises:
+            ValueError: Caso o formato (ou a ordem dos bytes) do diretório
+            seja diferente do formato lido por esta versão.
+        """
+        with open(os.path.join(path, HEADER_FILE), encoding="utf-8") as file:
+            header: Dict[str, Any] = json.load(file)
+        if header.get("format") != FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+            raise ValueError(
+                f"O diretório {path} não está no formato {FORMAT_VERSION} ({sys.byteorder}) das tabelas em colunas."
+            )
+        super().__init__(header["name"], [column["name"] for column in header["columns"]])
+        self.__path = path
+        self.__row_count = header["row_count"]
+        self.__mapped_version = header["version"]
+        self.__maps = []
+        self.__mapped_columns = [
+            MappedColumn(
+                column["type"],
+                self.__map(f"{position}.{'offsets' if column['type'] == TEXT else 'values'}", FORMATS[column["type"]]),
+                self.__map(f"{position}.nulls", "B") if column["nulls"] else None,
+                self.__map(f"{position}.data", "B") if column["type"] == TEXT else None
+            )
+            for position, column in enumerate(header["columns"])
+        ]
+
+    @property
+    def path(self) -> str:
+        """Extrai o conteúdo da variável privada path.
+
+        Returns:
+            str: O diretório da tabela.
+        """
+        return self.__path
+
+    @property
+    def version(self) -> int:
+        """Extrai o conteúdo da variável privada mapped_version.
+
+        Returns:
+            int: A versão dos dados, gravada no cabeçalho.
+        """
+        return self.__mapped_version
+
+    @property
+    def row_count(self) -> int:
+        """Retorna a quantia de linhas da tabela.
+
+        Returns:
+            int: A quantia de linhas.
+        """
+        return self.__row_count
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """Percorre as linhas da tabela, convertendo as colunas em blocos.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: As linhas, na ordem da tabela.
+        """
+        return self.scan()
+
+    def scan(self, columns: Union[Sequence[str], None] = None) -> Iterator[Tuple[Any, ...]]:
+        """Percorre as linhas da tabela, convertendo em blocos somente
+        algumas colunas: os arquivos das demais colunas não são lidos.
+
+        Args:
+            columns (Sequence[str] | None, optional): O nome das colunas
+            lidas, em qualquer caixa. Valor padrão: None (todas as colunas).
+
+        Yields:
+            Tuple[Any, ...]: Cada linha, com os valores das colunas na
+            ordem de 'columns'.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar
+            a utilização de uma coluna que não existe na tabela.
+        """
+        mapped_columns: List[MappedColumn] = (
+            self.__mapped_columns if columns is None else [self.column(column) for column in columns]
+        )
+        for start in range(0, self.row_count, BLOCK_SIZE):
+            end: int = min(self.row_count, start + BLOCK_SIZE)
+            yield from zip(*(column.block(start, end) for column in mapped_columns))
+
+    def column(self, column: str) -> MappedColumn:
+        """Retorna os valores de uma coluna, mapeados na memória.
+
+        Args:
+            column (str): O nome da coluna, em qualquer caixa.
+
+        Returns:
+            MappedColumn: Os valores da coluna, na ordem das linhas.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar
+            a utilização de uma coluna que não existe na tabela.
+        """
+        if not self.has_column(column):
+            Exceptions.raise_column_mismatch_in_example_exception(f"{self.name}.{column}")
+        return self.__mapped_columns[[name.casefold() for name in self.columns].index(column.casefold())]
+
+    def extend(self, rows: Any) -> None:
+        """Tabelas mapeadas são somente leitura.
+
+        Raises:
+            TypeError: Sempre que alguma linha for incluída.
+        """
+        if any(True for _ in rows):
+            raise TypeError(f"A tabela {self.name}, mapeada de {self.path}, é somente leitura.")
+
+    def close(self) -> None:
+        """Libera os arquivos mapeados; a tabela não pode mais ser lida."""
+        for column in self.__mapped_columns:
+            for view in (column.values, column.nulls, column.data):
+                if view is not None:
+                    view.release()
+        for mapped in self.__maps:
+            mapped.close()
+        self.__maps = []
+
+    def __map(self, file_name: str, view_format: str) -> memoryview:
+        """Mapeia um arquivo da tabela na memória, somente para leitura.
+
+        Args:
+            file_name (str): O nome do arquivo, no diretório da tabela.
+            view_format (str): O formato dos valores ('q', 'd' ou 'B').
+
+        Returns:
+            memoryview: Os valores do arquivo, sem cópia.
+        """
+        with open(os.path.join(self.__path, file_name), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"").cast(view_format)
+            mapped: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__maps.append(mapped)
+        return memoryview(mapped).cast(view_format)
+
+def column_type(values: Sequence[Any]) -> str:
+    """Escolhe o tipo de uma coluna pelos seus valores não nulos.
+
+    Args:
+        values (Sequence[Any]): Os valores da coluna.
+
+    Returns:
+        str: 'int64', 'float64' ou 'text'.
+
+    Raises:
+        ValueError: Caso a coluna misture textos e números, ou possua
+        valores de outros tipos.
+    """
+    types: set = {type(value) for value in values if value is not None}
+    if types <= {int, bool}:
+        return INT
+    if types <= {int, float, bool}:
+        return FLOAT
+    if types == {str}:
+        return TEXT
+    raise ValueError(f"Os tipos {sorted(kind.__name__ for kind in types)} não podem ser gravados na mesma coluna.")
+
+def write_columnar(table: Table, directory: str) -> str:
+    """Grava uma tabela no formato em colunas, em '<directory>/<nome da tabela>'.
+
+    Args:
+        table (Table): A tabela.
+        directory (str): O diretório do banco de dados.
+
+    Returns:
+        str: O diretório da tabela.
+
+    Raises:
+        ValueError: Caso alguma coluna misture textos e números.
+    """
+    path: str = os.path.join(directory, table.name)
+    os.makedirs(path, exist_ok=True)
+    columns: List[Dict[str, Any]] = []
+    for position, name in enumerate(table.columns):
+        values: Sequence[Any] = table.column(name)
+        kind: str = column_type(values)
+        has_nulls: bool = any(value is None for value in values)
+        if kind == TEXT:
+            encoded: List[bytes] = [b"" if value is None else value.encode("utf-8") for value in values]
+            offsets: array = array("q", [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            (stored, data) = (offsets, b"".join(encoded))
+        else:
+            fill: Union[int, float] = 0 if kind == INT else 0.0
+            stored = array(FORMATS[kind], (fill if value is None else value for value in values))
+            data = None
+        with open(os.path.join(path, f"{position}.{'offsets' if kind == TEXT else 'values'}"), "wb") as file:
+            stored.tofile(file)
+        if data is not None:
+            with open(os.path.join(path, f"{position}.data"), "wb") as file:
+                file.write(data)
+        if has_nulls:
+            with open(os.path.join(path, f"{position}.nulls"), "wb") as file:
+                file.write(bytes(value is None for value in values))
+        columns.append({"name": name, "type": kind, "nulls": has_nulls})
+
+    # O cabeçalho é gravado por último: um diretório sem cabeçalho está incompleto.
+    with open(os.path.join(path, HEADER_FILE), "w", encoding="utf-8") as file:
+        json.dump({
+            "format": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "name": table.name,
+            "row_count": table.row_count,
+            "version": table.version,
+            "columns": columns
+        }, file, ensure_ascii=False, indent=2)
+    return path
+
+def open_columnar(path: str) -> MappedTable:
+    """Abre uma tabela gravada no formato em colunas.
+
+    Args:
+        path (str): O diretório da tabela.
+
+    Returns:
+        MappedTable: A tabela, mapeada na memória.
+    """
+    return MappedTable(path)
+
+def open_columnar_database(directory: str) -> Dict[str, MappedTable]:
+    """Abre todas as tabelas gravadas em um diretório de banco de dados.
+
+    Args:
+        directory (str): O diretório do banco de dados.
+
+    Returns:
+        Dict[str, MappedTable]: As tabelas, indexadas pelo nome da tabela.
+    """
+    tables: List[MappedTable] = [
+        open_columnar(os.path.join(directory, entry))
+        for entry in sorted(os.listdir(directory))
+        if os.path.isfile(os.path.join(directory, entry, HEADER_FILE))
+    ]
+    return {table.name: table for table in tables}
@@ -0,0 +1,421 @@
+"""Arquivo responsável pela carga, em paralelo, dos dados das
+tabelas de um banco de dados exemplar a partir de arquivos CSV.
+
+Cada arquivo é dividido em trechos de bytes, que são lidos e
+analisados por um conjunto de processos; cada trecho retorna os seus
+valores já separados em colunas e com os tipos inferidos, e as colunas
+dos trechos são concatenadas na tabela final."""
+
+import csv
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List, Sequence, Tuple, Type, Union
+
+# pylint: disable=import-error
+import Exceptions
+from Storage.table import Table
+
+# Os tipos inferidos das colunas, do mais restrito ao mais amplo: uma
+# coluna com um inteiro e um real é real, e com um texto é texto.
+COLUMN_TYPES: List[Type] = [int, float, str]
+
+# Um trecho de um arquivo: o caminho, o primeiro byte e o byte final (exclusivo).
+ByteRange = Tuple[str, int, int]
+
+# Um trecho analisado: os valores de cada coluna e o tipo de cada coluna.
+ParsedChunk = Tuple[List[List[Any]], List[Type]]
+
+class LoadReport:
+    """Representa o resultado da carga de um arquivo CSV."""
+
+    __slots__ = ("table", "rows", "size", "seconds", "chunks", "workers")
+
+    def __init__(self, table: str, rows: int, size: int, seconds: float, chunks: int, workers: int) -> None:
+        """Construtor da classe.
+
+        Args:
+            table (str): O nome da tabela carregada.
+            rows (int): A quantia de linhas carregadas.
+            size (int): O tamanho do arquivo, em bytes.
+            seconds (float): O tempo total da carga, em segundos.
+            chunks (int): A quantia de trechos do arquivo.
+            workers (int): A quantia de processos usados.
+        """
+        self.table = table
+        self.rows = rows
+        self.size = size
+        self.seconds = seconds
+        self.chunks = chunks
+        self.workers = workers
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Retorna a vazão da carga.
+
+        Returns:
+            float: Os megabytes (10^6 bytes) lidos por segundo.
+        """
+        return self.size / 1e6 / self.seconds if self.seconds > 0 else float("inf")
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.table}: {self.rows:,} linhas, {self.size / 1e6:.1f} MB em {self.seconds:.2f} s "
+            f"({self.megabytes_per_second:.1f} MB/s, {self.chunks} trechos, {self.workers} processos)"
+        )
+
+def read_lines(byte_range: ByteRange) -> bytes:
+    """Lê as linhas completas que começam em um trecho de um arquivo.
+
+    Uma linha pertence ao trecho em que começa: a linha que começa
+    antes do trecho é ignorada, e a última linha é lida até o fim,
+    mesmo que ultrapasse o trecho. O primeiro byte de um trecho nunca é
+    o primeiro byte do arquivo (o cabeçalho vem antes).
+
+    Args:
+        byte_range (ByteRange): O trecho do arquivo.
+
+    Returns:
+        bytes: As linhas do trecho.
+    """
+    (path, start, end) = byte_range
+    with open(path, "rb") as file:
+        # O byte anterior indica se o trecho começa no início de uma linha.
+        file.seek(start - 1)
+        data: bytes = file.read(end - start + 1)
+        newline: int = data.find(b"\n")
+        if newline < 0:
+            return b""
+        data = data[newline + 1:]
+        if data and not data.endswith(b"\n"):
+            data += file.readline()
+    return data
+
+def infer_column(values: List[str], null: str) -> Tuple[List[Any], Type]:
+    """Infere o tipo de uma coluna e converte os seus valores.
+
+    Args:
+        values (List[str]): Os valores, como escritos no arquivo.
+        null (str): O valor que representa NULL.
+
+    Returns:
+        Tuple[List[Any], Type]: Os valores convertidos e o tipo inferido.
+    """
+    for column_type in COLUMN_TYPES[:-1]:
+        try:
+            return ([None if value == null else column_type(value) for value in values], column_type)
+        except ValueError:
+            continue
+    return ([None if value == null else value for value in values], str)
+
+def convert_column(values: List[str], null: str, column_type: Type) -> List[Any]:
+    """Converte os valores de uma coluna para um tipo já conhecido.
+
+    Args:
+        values (List[str]): Os valores, como escritos no arquivo.
+        null (str): O valor que representa NULL.
+        column_type (Type): O tipo da coluna.
+
+    Returns:
+        List[Any]: Os valores convertidos.
+    """
+    if column_type is str:
+        return [None if value == null else value for value in values]
+    return [None if value == null else column_type(value) for value in values]
+
+def parse_chunk(
+        byte_range: ByteRange,
+        positions: List[int],
+        delimiter: str,
+        null: str,
+        encoding: str,
+        types: Union[List[Type], None] = None) -> ParsedChunk:
+    """Lê e analisa um trecho de um arquivo CSV, em colunas.
+
+    Executada nos processos de carga. Trechos sem aspas são separados
+    diretamente pelo delimitador; os demais usam o 'csv.reader'.
+
+    Args:
+        byte_range (ByteRange): O trecho do arquivo.
+        positions (List[int]): A posição, no arquivo, de cada coluna da tabela.
+        delimiter (str): O delimitador dos valores.
+        null (str): O valor que representa NULL.
+        encoding (str): A codificação do arquivo.
+        types (List[Type] | None, optional): O tipo de cada coluna, caso já
+        conhecido; senão, os tipos são inferidos. Valor padrão: None.
+
+    Returns:
+        ParsedChunk: Os valores de cada coluna (na ordem da tabela) e o tipo de cada coluna.
+
+    Raises:
+        ValueError: Caso alguma linha possua uma quantia de valores
+        diferente da quantia de colunas do cabeçalho.
+    """
+    text: str = read_lines(byte_range).decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    lines: List[str] = [line for line in text.split("\n") if line]
+    rows: List[Sequence[str]] = (
+        [line.split(delimiter) for line in lines] if '"' not in text
+        else list(csv.reader(lines, delimiter=delimiter))
+    )
+    width: int = len(positions)
+    if any(len(row) != width for row in rows):
+        raise ValueError(
+            f"O trecho de bytes {byte_range[1]}-{byte_range[2]} de {byte_range[0]} possui linhas "
+            f"com uma quantia de valores diferente das {width} colunas do cabeçalho."
+        )
+    file_columns: List[Tuple[str, ...]] = list(zip(*rows)) if rows else [() for _ in positions]
+
+    columns: List[List[Any]] = []
+    column_types: List[Type] = []
+    for index, position in enumerate(positions):
+        values: List[str] = list(file_columns[position])
+        if types is None:
+            (converted, column_type) = infer_column(values, null)
+        else:
+            (converted, column_type) = (convert_column(values, null, types[index]), types[index])
+        columns.append(converted)
+        column_types.append(column_type)
+    return (columns, column_types)
+
+class CsvLoader:
+    """Classe responsável pela carga dos arquivos CSV das tabelas de um
+    banco de dados exemplar (como 'Examples.pagamento_example_db').
+
+    A primeira linha de cada arquivo é o cabeçalho, com o nome das
+    colunas (em qualquer ordem); por padrão, um valor vazio representa NULL. Os
+    valores entre aspas não podem conter quebras de linha, pois os
+    trechos do arquivo são divididos nas quebras de linha.
+
+    Os processos somente são criados quando o arquivo possui mais de um
+    trecho; como em todo 'ProcessPoolExecutor', a carga deve ser
+    iniciada a partir de um bloco 'if __name__ == "__main__"'.
+    """
+
+    # O banco de dados exemplar: as colunas de cada tabela.
+    __database: Dict[str, List[str]]
+    # A quantia de processos de carga.
+    __workers: int
+    # O tamanho máximo, em bytes, de cada trecho.
+    __chunk_size: int
+    # O delimitador dos valores.
+    __delimiter: str
+    # O valor que representa NULL.
+    __null: str
+    # A codificação dos arquivos.
+    __encoding: str
+    # O resultado de cada carga, na ordem das cargas.
+    __reports: List[LoadReport]
+
+    def __init__(
+            self,
+            database: Dict[str, List[str]],
+            workers: Union[int, None] = None,
+            chunk_size: int = 32 << 20,
+            delimiter: str = ",",
+            null: str = "",
+            encoding: str = "utf-8") -> None:
+        """Construtor da classe.
+
+        Args:
+            database (Dict[str, List[str]]): O banco de dados exemplar.
+            workers (int | None, optional): A quantia de processos de
+            carga; None usa a quantia de processadores. Valor padrão: None.
+            chunk_size (int, optional): O tamanho máximo, em bytes, de cada
+            trecho. Valor padrão: 32 MiB.
+            delimiter (str, optional): O delimitador dos valores. Valor padrão: ",".
+            null (str, optional): O valor que representa NULL. Valor padrão: "".
+            encoding (str, optional): A codificação dos arquivos. Valor padrão: "utf-8".
+        """
+        self.__database = {table.casefold(): columns for table, columns in database.items()}
+        self.__workers = max(1, workers or os.cpu_count() or 1)
+        self.__chunk_size = max(1, chunk_size)
+        self.__delimiter = delimiter
+        self.__null = null
+        self.__encoding = encoding
+        self.__reports = []
+
+    @property
+    def workers(self) -> int:
+        """Extrai o conteúdo da variável privada workers.
+
+        Returns:
+            int: A quantia de processos de carga.
+        """
+        return self.__workers
+
+    @property
+    def reports(self) -> List[LoadReport]:
+        """Extrai o conteúdo da variável privada reports.
+
+        Returns:
+            List[LoadReport]: O resultado de cada carga, na ordem das cargas.
+        """
+        return self.__reports
+
+    def load(self, table: str, path: str) -> Table:
+        """Carrega os dados de uma tabela a partir de um arquivo CSV.
+
+        Args:
+            table (str): O nome da tabela, no banco de dados exemplar.
+            path (str): O caminho do arquivo.
+
+        Returns:
+            Table: Os dados da tabela, com as colunas na ordem do banco de dados.
+
+        Raises:
+            InvalidCsvException: Exceção customizada para alertar que a
+            tabela não existe ou que o cabeçalho não possui as colunas da tabela.
+            ValueError: Caso alguma linha possua uma quantia de valores
+            diferente da quantia de colunas do cabeçalho.
+        """
+        start: float = perf_counter()
+        columns: List[str] = self.__database.get(table.casefold(), [])
+        if not columns:
+            Exceptions.raise_invalid_csv_exception(path, f"a tabela {table} não existe")
+        (positions, header_end) = self.__read_header(path, columns)
+        ranges: List[ByteRange] = self.split(path, header_end)
+
+        workers: int = min(self.workers, len(ranges))
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                data: List[List[Any]] = self.__assemble(pool, ranges, positions)
+        else:
+            data = self.__assemble(None, ranges, positions)
+
+        loaded: Table = Table.from_columns(table, columns, data)
+        size: int = os.path.getsize(path)
+        self.__reports.append(LoadReport(table, loaded.row_count, size, perf_counter() - start, len(ranges), workers))
+        return loaded
+
+    def load_directory(self, directory: str) -> Dict[str, Table]:
+        """Carrega os dados de todas as tabelas com um arquivo '<tabela>.csv' em um diretório.
+
+        Args:
+            directory (str): O caminho do diretório.
+
+        Returns:
+            Dict[str, Table]: Os dados de cada tabela, indexados pelo nome da tabela.
+        """
+        return {
+            table: self.load(table, path)
+            for table in self.__database
+            if os.path.isfile(path := os.path.join(directory, f"{table}.csv"))
+        }
+
+    def split(self, path: str, start: int) -> List[ByteRange]:
+        """Divide os dados de um arquivo em trechos de bytes.
+
+        O arquivo é dividido em trechos de até 'chunk_size' bytes e, caso
+        seja pequeno, em um trecho por processo (com, no mínimo, 1 MiB
+        por trecho).
+
+        Args:
+            path (str): O caminho do arquivo.
+            start (int): O primeiro byte dos dados (após o cabeçalho).
+
+        Returns:
+            List[ByteRange]: Os trechos, na ordem do arquivo.
+        """
+        size: int = os.path.getsize(path) - start
+        if size <= 0:
+            return []
+        chunk_size: int = min(self.__chunk_size, max(1 << 20, -(-size // self.workers)))
+        return [
+            (path, offset, min(offset + chunk_size, start + size))
+            for offset in range(start, start + size, chunk_size)
+        ]
+
+    def __read_header(self, path: str, columns: List[str]) -> Tuple[List[int], int]:
+        """Lê o cabeçalho de um arquivo e encontra a posição de cada coluna da tabela.
+
+        Args:
+            path (str): O caminho do arquivo.
+            columns (List[str]): As colunas da tabela.
+
+        Returns:
+            Tuple[List[int], int]: A posição, no arquivo, de cada coluna da
+            tabela e o primeiro byte após o cabeçalho.
+
+        Raises:
+            InvalidCsvException: Exceção customizada para alertar que o
+            cabeçalho não possui as colunas da tabela.
+        """
+        with open(path, "rb") as file:
+            header_line: str = file.readline().decode(self.__encoding).lstrip("\ufeff")
+            header_end: int = file.tell()
+        header: List[str] = [column.strip().casefold() for column in next(csv.reader([header_line], delimiter=self.__delimiter), [])]
+        expected: List[str] = [column.casefold() for column in columns]
+        if sorted(header) != sorted(expected):
+            Exceptions.raise_invalid_csv_exception(
+                path, f"o cabeçalho ({', '.join(header)}) deve possuir as colunas {', '.join(columns)}"
+            )
+        return ([header.index(column) for column in expected], header_end)
+
+    def __assemble(self, pool: Union[Executor, None], ranges: List[ByteRange], positions: List[int]) -> List[List[Any]]:
+        """Analisa os trechos e concatena as suas colunas.
+
+        Cada trecho infere os tipos das suas colunas; o tipo final de uma
+        coluna é o mais amplo entre os trechos. Os inteiros de um trecho
+        cuja coluna é real são convertidos diretamente; os trechos cuja
+        coluna é texto são analisados novamente, para manter os valores
+        como escritos no arquivo.
+
+        Args:
+            pool (Executor | None): Os processos de carga, ou None para
+            analisar os trechos no processo atual.
+            ranges (List[ByteRange]): Os trechos.
+            positions (List[int]): A posição, no arquivo, de cada coluna da tabela.
+
+        Returns:
+            List[List[Any]]: Os valores de cada coluna.
+        """
+        arguments: Tuple[Any, ...] = (positions, self.__delimiter, self.__null, self.__encoding)
+        chunks: List[ParsedChunk] = (
+            [parse_chunk(byte_range, *arguments) for byte_range in ranges] if pool is None
+            else list(pool.map(parse_chunk, ranges, *([argument] * len(ranges) for argument in arguments)))
+        )
+        types: List[Type] = [
+            max((chunk[1][index] for chunk in chunks), key=COLUMN_TYPES.index, default=str)
+            for index in range(len(positions))
+        ]
+
+        # Os trechos com algum texto analisado como número.
+        reparse: List[int] = [
+            number for number, (_, chunk_types) in enumerate(chunks)
+            if any(chunk_type is not str and column_type is str for chunk_type, column_type in zip(chunk_types, types))
+        ]
+        reparsed: List[ParsedChunk] = (
+            [parse_chunk(ranges[number], *arguments, types) for number in reparse] if pool is None
+            else list(pool.map(
+                parse_chunk, [ranges[number] for number in reparse],
+                *([argument] * len(reparse) for argument in (*arguments, types))
+            ))
+        )
+        for number, chunk in zip(reparse, reparsed):
+            chunks[number] = chunk
+
+        data: List[List[Any]] = [[] for _ in positions]
+        for (chunk_columns, chunk_types) in chunks:
+            for index, (values, chunk_type) in enumerate(zip(chunk_columns, chunk_types)):
+                if chunk_type is int and types[index] is float:
+                    values = [None if value is None else float(value) for value in values]
+                data[index].extend(values)
+        return data
+
+def write_csv(table: Table, path: str, delimiter: str = ",", encoding: str = "utf-8") -> None:
+    """Escreve os dados de uma tabela em um arquivo CSV, com cabeçalho.
+
+    NULL é escrito como um valor vazio.
+
+    Args:
+        table (Table): A tabela.
+        path (str): O caminho do arquivo.
+        delimiter (str, optional): O delimitador dos valores. Valor padrão: ",".
+        encoding (str, optional): A codificação do arquivo. Valor padrão: "utf-8".
+    """
+    with open(path, "w", newline="", encoding=encoding) as file:
+        writer = csv.writer(file, delimiter=delimiter, lineterminator="\n")
+        writer.writerow(table.columns)
+        writer.writerows(table)
@@ -0,0 +1,338 @@
+"""Arquivo responsável pelos índices secundários das colunas de
+uma tabela: hash (igualdades e listas do IN) e ordenado (intervalos)."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from typing import Any, Dict, List, Set, Tuple, Union
+
+# pylint: disable=import-error
+from Parser.sql_ast import Comparison, InList, Literal, Predicate
+from Storage.table import Table
+
+# Os tipos de índice.
+HASH_INDEX: str = "hash"
+SORTED_INDEX: str = "sorted"
+
+class Index(ABC):
+    """Representa um índice secundário sobre uma coluna de uma tabela.
+
+    O índice guarda a posição das linhas de cada valor (os nulos não são
+    indexados, pois nunca satisfazem uma comparação) e é mantido pela
+    tabela: cada inclusão de linhas ('Table.extend') indexa somente as
+    novas linhas (veja 'update').
+
+    As subclasses implementam a estrutura do índice ('_operators',
+    '_insert' e '_find'); o construtor já indexa as linhas da tabela,
+    logo a estrutura deve ser criada antes de 'super().__init__'.
+    """
+
+    # O tipo do índice.
+    kind: str = ""
+
+    # O nome do índice.
+    __name: str
+    # O nome da tabela.
+    __table: str
+    # O nome da coluna indexada.
+    __column: str
+    # A quantia de linhas da tabela já indexadas.
+    __indexed: int
+
+    def __init__(self, name: str, table: Table, column: str) -> None:
+        """Construtor da classe: indexa as linhas existentes da tabela.
+
+        Args:
+            name (str): O nome do índice.
+            table (Table): A tabela.
+            column (str): O nome da coluna indexada.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar que
+            a coluna não existe na tabela.
+        """
+        table.column(column)
+        self.__name = name
+        self.__table = table.name
+        self.__column = column
+        self.__indexed = 0
+        self.update(table)
+
+    @property
+    def name(self) -> str:
+        """Extrai o conteúdo da variável privada name.
+
+        Returns:
+            str: O nome do índice.
+        """
+        return self.__name
+
+    @property
+    def table(self) -> str:
+        """Extrai o conteúdo da variável privada table.
+
+        Returns:
+            str: O nome da tabela.
+        """
+        return self.__table
+
+    @property
+    def column(self) -> str:
+        """Extrai o conteúdo da variável privada column.
+
+        Returns:
+            str: O nome da coluna indexada.
+        """
+        return self.__column
+
+    def update(self, table: Table) -> None:
+        """Indexa as linhas incluídas na tabela desde a última atualização.
+
+        Args:
+            table (Table): A tabela.
+        """
+        rows: List[Tuple[Any, int]] = [
+            (value, row)
+            for row, value in enumerate(islice(table.column(self.column), self.__indexed, None), self.__indexed)
+            if value is not None
+        ]
+        if rows:
+            self._insert(rows)
+        # As linhas somente são consideradas indexadas após a inclusão.
+        self.__indexed = table.row_count
+
+    def validate(self, values: List[Any]) -> None:
+        """Verifica se novos valores da coluna podem ser incluídos no índice,
+        antes que a tabela inclua as suas linhas.
+
+        Args:
+            values (List[Any]): Os novos valores da coluna.
+
+        Raises:
+            ValueError: Caso algum valor não possa ser incluído no índice.
+        """
+
+    def supports(self, predicate: Predicate) -> bool:
+        """Verifica se o índice pode responder a uma condicional.
+
+        Args:
+            predicate (Predicate): A condicional (de uma seleção).
+
+        Returns:
+            bool: Verdadeiro caso a condicional seja sobre a coluna indexada
+            e o índice possa encontrar as suas linhas.
+        """
+        if isinstance(predicate, Comparison):
+            return (
+                isinstance(predicate.right, Literal)
+                and predicate.left.column.casefold() == self.column.casefold()
+                and predicate.operator in self._operators()
+            )
+        return (
+            isinstance(predicate, InList) and not predicate.negated
+            and predicate.column.column.casefold() == self.column.casefold()
+        )
+
+    def lookup(self, predicate: Predicate) -> List[int]:
+        """Encontra as linhas que satisfazem uma condicional.
+
+        Args:
+            predicate (Predicate): A condicional, aceita por 'supports'.
+
+        Returns:
+            List[int]: A posição das linhas, em ordem crescente.
+        """
+        if isinstance(predicate, InList):
+            values: List[Any] = list({value.value for value in predicate.values if value.value is not None})
+            return sorted(row for value in values for row in self._find("=", value))
+        if predicate.right.value is None:
+            return []
+        return sorted(self._find(predicate.operator, predicate.right.value))
+
+    def lookup_all(self, predicates: List[Predicate]) -> List[int]:
+        """Encontra as linhas que satisfazem condicionais unidas por AND.
+
+        Args:
+            predicates (List[Predicate]): As condicionais, aceitas por 'supports'.
+
+        Returns:
+            List[int]: A posição das linhas (a intersecção das linhas de
+            cada condicional), em ordem crescente.
+        """
+        if len(predicates) == 1:
+            return self.lookup(predicates[0])
+        rows: Set[int] = set(self.lookup(predicates[0]))
+        for predicate in predicates[1:]:
+            rows.intersection_update(self.lookup(predicate))
+        return sorted(rows)
+
+    @abstractmethod
+    def _operators(self) -> Tuple[str, ...]:
+        """Retorna os operadores de comparação respondidos pelo índice.
+
+        Returns:
+            Tuple[str, ...]: Os operadores.
+        """
+
+    @abstractmethod
+    def _insert(self, rows: List[Tuple[Any, int]]) -> None:
+        """Inclui linhas no índice.
+
+        Args:
+            rows (List[Tuple[Any, int]]): O valor (não nulo) e a posição de cada linha.
+        """
+
+    @abstractmethod
+    def _find(self, operator: str, value: Any) -> List[int]:
+        """Encontra as linhas cujo valor satisfaz uma comparação com um literal.
+
+        Args:
+            operator (str): O operador de comparação.
+            value (Any): O literal (não nulo).
+
+        Returns:
+            List[int]: A posição das linhas, em qualquer ordem.
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.table}.{self.column})"
+
+class HashIndex(Index):
+    """Índice hash: as linhas de cada valor, em um dicionário.
+
+    Responde às igualdades e às listas do IN em tempo constante por valor.
+    """
+
+    kind: str = HASH_INDEX
+
+    # As posições das linhas de cada valor.
+    __rows: Dict[Any, List[int]]
+
+    def __init__(self, name: str, table: Table, column: str) -> None:
+        self.__rows = {}
+        super().__init__(name, table, column)
+
+    def _operators(self) -> Tuple[str, ...]:
+        return ("=",)
+
+    def _insert(self, rows: List[Tuple[Any, int]]) -> None:
+        for (value, row) in rows:
+            self.__rows.setdefault(value, []).append(row)
+
+    def _find(self, operator: str, value: Any) -> List[int]:
+        return self.__rows.get(value, [])
+
+class SortedIndex(Index):
+    """Índice ordenado (equivalente a uma árvore B em memória): os
+    valores em ordem crescente, com a posição de cada linha.
+
+    Responde às igualdades, às listas do IN e às comparações de intervalo
+    com buscas binárias. Inclusões com valores maiores que os já
+    indexados (como chaves crescentes) somente estendem o índice; as
+    demais são intercaladas com os valores existentes.
+    """
+
+    kind: str = SORTED_INDEX
+
+    # Os valores indexados, em ordem crescente.
+    __keys: List[Any]
+    # A posição da linha de cada valor de 'keys'.
+    __rows: List[int]
+
+    def __init__(self, name: str, table: Table, column: str) -> None:
+        """Construtor da classe: indexa as linhas existentes da tabela.
+
+        Args:
+            name (str): O nome do índice.
+            table (Table): A tabela.
+            column (str): O nome da coluna indexada.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar que
+            a coluna não existe na tabela.
+            ValueError: Caso a coluna possua valores que não podem ser
+            comparados entre si (por exemplo, textos e números).
+        """
+        self.__keys = []
+        self.__rows = []
+        super().__init__(name, table, column)
+
+    def _operators(self) -> Tuple[str, ...]:
+        return ("=", "<", "<=", ">", ">=")
+
+    def _insert(self, rows: List[Tuple[Any, int]]) -> None:
+        try:
+            rows.sort()
+            if self.__keys and rows[0][0] < self.__keys[-1]:
+                rows = list(merge(zip(self.__keys, self.__rows), rows))
+                (self.__keys, self.__rows) = ([], [])
+        except TypeError as error:
+            raise ValueError(f"A coluna {self.table}.{self.column} possui valores não comparáveis.") from error
+        self.__keys.extend(value for value, _ in rows)
+        self.__rows.extend(row for _, row in rows)
+
+    def validate(self, values: List[Any]) -> None:
+        # Os novos valores devem ser comparáveis entre si e aos já indexados.
+        keys: List[Any] = [value for value in values if value is not None]
+        try:
+            keys.sort()
+            if keys and self.__keys:
+                _ = keys[0] < self.__keys[-1]
+        except TypeError as error:
+            raise ValueError(f"A coluna {self.table}.{self.column} possui valores não comparáveis.") from error
+
+    def lookup_all(self, predicates: List[Predicate]) -> List[int]:
+        """Encontra as linhas que satisfazem condicionais unidas por AND.
+
+        As comparações (como os limites de um intervalo, 'a > 1 AND a < 9')
+        são respondidas com uma única fatia do índice: cada comparação
+        somente estreita o início e o fim da fatia.
+
+        Args:
+            predicates (List[Predicate]): As condicionais, aceitas por 'supports'.
+
+        Returns:
+            List[int]: A posição das linhas, em ordem crescente.
+        """
+        if len(predicates) == 1 or not all(isinstance(predicate, Comparison) for predicate in predicates):
+            return super().lookup_all(predicates)
+        (start, end) = (0, len(self.__keys))
+        for predicate in predicates:
+            bounds: Union[Tuple[int, int], None] = (
+                None if predicate.right.value is None else self.__bounds(predicate.operator, predicate.right.value)
+            )
+            if bounds is None:
+                return []
+            (start, end) = (max(start, bounds[0]), min(end, bounds[1]))
+        return sorted(self.__rows[start:end]) if start < end else []
+
+    def _find(self, operator: str, value: Any) -> List[int]:
+        bounds: Union[Tuple[int, int], None] = self.__bounds(operator, value)
+        return [] if bounds is None else self.__rows[bounds[0]:bounds[1]]
+
+    def __bounds(self, operator: str, value: Any) -> Union[Tuple[int, int], None]:
+        """Encontra a fatia dos valores que satisfazem uma comparação com um literal.
+
+        Args:
+            operator (str): O operador de comparação.
+            value (Any): O literal (não nulo).
+
+        Returns:
+            Tuple[int, int] | None: O início e o fim da fatia de 'keys', ou
+            None caso o literal não seja comparável aos valores da coluna.
+        """
+        (start, end) = (0, len(self.__keys))
+        try:
+            if operator in ("=", ">="):
+                start = bisect_left(self.__keys, value)
+            elif operator == ">":
+                start = bisect_right(self.__keys, value)
+            if operator in ("=", "<="):
+                end = bisect_right(self.__keys, value)
+            elif operator == "<":
+                end = bisect_left(self.__keys, value)
+        except TypeError:
+            # Um literal de outro tipo nunca é comparável aos valores da coluna.
+            return None
+        return (start, end)
@@ -0,0 +1,239 @@
+"""Arquivo responsável pelo armazenamento, em colunas, dos
+dados de uma tabela de um banco de dados exemplar."""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# pylint: disable=import-error
+import Exceptions
+
+if TYPE_CHECKING:
+    from Storage.index import Index
+
+class Table:
+    """Classe responsável pelos dados de uma tabela.
+
+    Os dados são armazenados em colunas (uma lista por coluna) e a
+    tabela somente recebe novas linhas (append), de modo que as linhas
+    já existentes nunca mudam de posição. A versão da tabela aumenta a
+    cada inclusão, permitindo que estatísticas e resultados derivados
+    identifiquem que os dados mudaram.
+    """
+
+    # O nome da tabela.
+    __name: str
+    # O nome das colunas, na ordem das linhas.
+    __columns: List[str]
+    # A posição de cada coluna, indexada pelo nome em minúsculo.
+    __column_index: Dict[str, int]
+    # Os dados, uma lista de valores por coluna.
+    __data: List[List[Any]]
+    # A versão dos dados, incrementada a cada inclusão de linhas.
+    __version: int
+    # Os índices secundários das colunas, atualizados a cada inclusão.
+    __indexes: List['Index']
+
+    def __init__(self, name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]] = ()) -> None:
+        """Construtor da classe.
+
+        Args:
+            name (str): O nome da tabela.
+            columns (Sequence[str]): O nome das colunas.
+            rows (Iterable[Sequence[Any]], optional): As linhas iniciais,
+            com um valor por coluna (None representa NULL). Valor padrão: ().
+        """
+        self.__name = name
+        self.__columns = list(columns)
+        self.__column_index = {column.casefold(): i for i, column in enumerate(self.__columns)}
+        self.__data = [[] for _ in self.__columns]
+        self.__version = 0
+        self.__indexes = []
+        self.extend(rows)
+
+    @classmethod
+    def from_columns(cls, name: str, columns: Sequence[str], data: Sequence[List[Any]]) -> 'Table':
+        """Cria uma tabela a partir dos dados já separados em colunas.
+
+        As listas são usadas diretamente, sem cópia e sem percorrer as
+        linhas, e passam a pertencer à tabela.
+
+        Args:
+            name (str): O nome da tabela.
+            columns (Sequence[str]): O nome das colunas.
+            data (Sequence[List[Any]]): Os valores de cada coluna, na
+            ordem das colunas (None representa NULL).
+
+        Returns:
+            Table: A tabela.
+
+        Raises:
+            ValueError: Caso a quantia de listas seja diferente da quantia
+            de colunas, ou as listas possuam tamanhos diferentes.
+        """
+        table: Table = cls(name, columns)
+        if len(data) != len(table.columns) or len({len(values) for values in data}) > 1:
+            raise ValueError(f"Os dados da tabela {name} devem possuir uma lista, do mesmo tamanho, por coluna.")
+        table.__data = list(data)
+        table.__version = 1 if table.row_count else 0
+        return table
+
+    @property
+    def name(self) -> str:
+        """Extrai o conteúdo da variável privada name.
+
+        Returns:
+            str: O nome da tabela.
+        """
+        return self.__name
+
+    @property
+    def columns(self) -> List[str]:
+        """Extrai o conteúdo da variável privada columns.
+
+        Returns:
+            List[str]: O nome das colunas, na ordem das linhas.
+        """
+        return self.__columns
+
+    @property
+    def version(self) -> int:
+        """Extrai o conteúdo da variável privada version.
+
+        Returns:
+            int: A versão dos dados, incrementada a cada inclusão de linhas.
+        """
+        return self.__version
+
+    @property
+    def row_count(self) -> int:
+        """Retorna a quantia de linhas da tabela.
+
+        Returns:
+            int: A quantia de linhas.
+        """
+        return len(self.__data[0]) if self.__data else 0
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """Percorre as linhas da tabela.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: As linhas, na ordem de inclusão.
+        """
+        return zip(*self.__data)
+
+    def scan(self, columns: Union[Sequence[str], None] = None) -> Iterator[Tuple[Any, ...]]:
+        """Percorre as linhas da tabela, lendo somente algumas colunas.
+
+        Args:
+            columns (Sequence[str] | None, optional): O nome das colunas
+            lidas, em qualquer caixa. Valor padrão: None (todas as colunas).
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: As linhas, com os valores das
+            colunas na ordem de 'columns', na ordem de inclusão.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar
+            a utilização de uma coluna que não existe na tabela.
+        """
+        if columns is None:
+            return iter(self)
+        return zip(*map(self.column, columns))
+
+    def has_column(self, column: str) -> bool:
+        """Verifica se a tabela possui uma coluna.
+
+        Args:
+            column (str): O nome da coluna, em qualquer caixa.
+
+        Returns:
+            bool: Verdadeiro caso a coluna exista.
+        """
+        return column.casefold() in self.__column_index
+
+    def column(self, column: str) -> List[Any]:
+        """Retorna os valores de uma coluna.
+
+        A lista retornada é a própria coluna armazenada e não deve ser alterada.
+
+        Args:
+            column (str): O nome da coluna, em qualquer caixa.
+
+        Returns:
+            List[Any]: Os valores da coluna, na ordem das linhas.
+
+        Raises:
+            ColumnMismatchException: Exceção customizada para alertar
+            a utilização de uma coluna que não existe na tabela.
+        """
+        if (index := self.__column_index.get(column.casefold())) is None:
+            Exceptions.raise_column_mismatch_in_example_exception(f"{self.name}.{column}")
+        return self.__data[index]
+
+    @property
+    def indexes(self) -> List['Index']:
+        """Extrai o conteúdo da variável privada indexes.
+
+        Returns:
+            List[Index]: Os índices secundários das colunas da tabela.
+        """
+        return self.__indexes
+
+    def add_index(self, index: 'Index') -> None:
+        """Registra um índice, que passa a ser atualizado a cada inclusão de linhas.
+
+        Args:
+            index (Index): O índice, já construído sobre as linhas atuais.
+        """
+        self.__indexes.append(index)
+
+    def remove_index(self, index: 'Index') -> None:
+        """Remove o registro de um índice.
+
+        Args:
+            index (Index): O índice.
+        """
+        if index in self.__indexes:
+            self.__indexes.remove(index)
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Inclui uma linha na tabela.
+
+        Args:
+            row (Sequence[Any]): Um valor por coluna (None representa NULL).
+
+        Raises:
+            ValueError: Caso a quantia de valores seja diferente da quantia de colunas.
+        """
+        self.extend((row,))
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Inclui várias linhas na tabela, incrementando a versão uma única vez.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): As linhas, com um valor por coluna.
+
+        Raises:
+            ValueError: Caso a quantia de valores de alguma linha seja
+            diferente da quantia de colunas, ou caso algum valor não possa
+            ser incluído nos índices da tabela; nenhuma linha é incluída.
+        """
+        # Todas as linhas são validadas antes da inclusão, sem inclusões parciais.
+        new_rows: List[Sequence[Any]] = list(rows)
+        for row in new_rows:
+            if len(row) != len(self.__columns):
+                raise ValueError(
+                    f"A linha possui {len(row)} valores, mas a tabela {self.name} possui {len(self.__columns)} colunas."
+                )
+        if not new_rows:
+            return
+        for index in self.__indexes:
+            position: int = self.__column_index[index.column.casefold()]
+            index.validate([row[position] for row in new_rows])
+        for values, column in zip(self.__data, zip(*new_rows)):
+            values.extend(column)
+        self.__version += 1
+        for index in self.__indexes:
+            index.update(self)
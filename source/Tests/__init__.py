@@ -0,0 +1,59 @@
+"""Arquivo responsável pela junção de todos os testes do
+processador de consultas.
+
+Os testes podem ser executados, a partir de '/source', com
+'python -m unittest discover Tests'."""
+
+import contextlib
+import io
+from typing import Dict, List, Union
+
+# pylint: disable=import-error
+import Examples
+from Catalog import Catalog
+from Parser.parser import Parser
+from RelationalAlgebra.Converter import Converter
+from RelationalAlgebra.join_order import CostModel, JoinOrderer
+
+def convert(
+        sql_command: str,
+        catalog: Union[Catalog, None] = None,
+        database: Union[Dict[str, List[str]], None] = None) -> Converter:
+    """Verifica e converte um comando SQL, descartando as mensagens impressas.
+
+    Args:
+        sql_command (str): O comando SQL.
+        catalog (Catalog | None, optional): O catálogo do teste, com os
+        dados, as estatísticas, os índices e as visões usados pelo
+        Conversor. Valor padrão: None (o catálogo de 'Catalog.for_database').
+        database (Dict[str, List[str]] | None, optional): O banco de
+        dados exemplar. Valor padrão: None ('Examples.pagamento_example_db').
+
+    Returns:
+        Converter: O Conversor, com o comando SQL já convertido.
+    """
+    database = database if database is not None else Examples.pagamento_example_db
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser: Parser = Parser(sql_command)
+        parser.check_database_compatibility(database)
+        converter: Converter = Converter(parser, JoinOrderer(CostModel(catalog=catalog)) if catalog is not None else None)
+        converter.convert_in_database_context(database)
+    return converter
+
+def example_catalog(scale: float = 0.1) -> Catalog:
+    """Cria um catálogo próprio do teste, com os dados exemplares de pagamentos.
+
+    O catálogo compartilhado ('Catalog.for_database') não é alterado,
+    logo os testes não dependem da ordem de execução.
+
+    Args:
+        scale (float, optional): A escala dos dados (veja
+        'Examples.pagamento_example_data'). Valor padrão: 0.1.
+
+    Returns:
+        Catalog: O catálogo, com as tabelas anexadas.
+    """
+    catalog: Catalog = Catalog(Examples.pagamento_example_db)
+    for table in Examples.pagamento_example_data(scale).values():
+        catalog.attach_table(table)
+    return catalog
@@ -0,0 +1,37 @@
+"""Arquivo responsável pelos testes do processamento em lote."""
+
+import unittest
+from typing import Any, Dict, List
+
+# pylint: disable=import-error
+from Batch import BatchProcessor
+from Tests import convert
+
+class BatchProcessorTest(unittest.TestCase):
+    """Testa que o processamento em lote preserva a ordem e os erros de cada comando."""
+
+    STATEMENTS: List[str] = [
+        "select nome from usuario where idusuario = 1;",
+        "select nome from usuario where idusuario = 1",
+        "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario;",
+        "select inexistente from usuario;",
+        "select descricao from contas where saldoinicial > 100;",
+    ]
+
+    def check(self, results: List[Dict[str, Any]]) -> None:
+        """Compara os resultados com a conversão de cada comando, um a um."""
+        self.assertEqual([result["index"] for result in results], list(range(len(self.STATEMENTS))))
+        self.assertEqual([result["sql"] for result in results], self.STATEMENTS)
+        self.assertEqual(results[1]["error"]["type"], "MissingSemicolonException")
+        self.assertEqual(results[3]["error"]["type"], "ColumnMismatchException")
+        for i in (0, 2, 4):
+            self.assertEqual(results[i]["relational_algebra"], convert(self.STATEMENTS[i]).relational_algebra)
+
+    def test_single_worker(self) -> None:
+        self.check(BatchProcessor(workers=1, chunk_size=2).process(self.STATEMENTS))
+
+    def test_worker_processes(self) -> None:
+        self.check(BatchProcessor(workers=2, chunk_size=2).process(self.STATEMENTS))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Arquivo responsável pelos testes do catálogo dos bancos de dados exemplares."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+import Examples
+from Catalog import Catalog
+from Exceptions.ambiguous_column import AmbiguousColumnException
+from Exceptions.column_mismatch import ColumnMismatchException
+from Tests import convert
+
+class CatalogTest(unittest.TestCase):
+    """Testa as buscas de tabelas e colunas do catálogo."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = Catalog(Examples.pagamento_example_db)
+
+    def test_lookups(self) -> None:
+        self.assertTrue(self.catalog.has_table('USUARIO'))
+        self.assertFalse(self.catalog.has_table('usuarios'))
+        self.assertTrue(self.catalog.has_column('SaldoInicial'))
+        self.assertEqual(self.catalog.tables_of('descricao'), frozenset({'contas', 'movimentacao'}))
+        self.assertEqual(self.catalog.columns_of('categoria'), frozenset({'idcategoria', 'desccategoria'}))
+
+    def test_resolve_column(self) -> None:
+        self.assertEqual(self.catalog.resolve_column('saldoinicial', ['usuario', 'Contas']), 'Contas')
+        with self.assertRaises(AmbiguousColumnException):
+            self.catalog.resolve_column('descricao', ['contas', 'movimentacao'])
+        with self.assertRaises(ColumnMismatchException):
+            self.catalog.resolve_column('valor', ['usuario', 'contas'])
+        with self.assertRaises(AmbiguousColumnException):
+            convert(
+                "select descricao from contas join movimentacao on contas.idconta = movimentacao.contas_idconta;"
+            )
+
+    def test_for_database(self) -> None:
+        database: Dict[str, List[str]] = {'t': ['a']}
+        catalog: Catalog = Catalog.for_database(database)
+        self.assertIs(Catalog.for_database(database), catalog)
+        # Somente os catálogos dos últimos bancos de dados usados são guardados.
+        copies: List[Dict[str, List[str]]] = [dict(database) for _ in range(100)]
+        for copy in copies:
+            self.assertIsNot(Catalog.for_database(copy), catalog)
+        self.assertIsNot(Catalog.for_database(database), catalog)
+
+if __name__ == '__main__':
+    unittest.main()
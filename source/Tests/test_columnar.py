@@ -0,0 +1,57 @@
+"""Arquivo responsável pelos testes do formato em colunas (mmap)."""
+
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Storage import MappedColumn, MappedTable, Table, open_columnar, open_columnar_database, write_columnar
+from Storage.columnar import BLOCK_SIZE
+
+class ColumnarTest(unittest.TestCase):
+    """Testa a gravação e a leitura de uma tabela com nulos e textos."""
+
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        # Mais de um bloco, para percorrer as colunas em blocos.
+        self.rows: List[tuple] = [
+            (i, None if i % 5 == 0 else i / 2, None if i % 3 == 0 else f"usuário {i}", "")
+            for i in range(BLOCK_SIZE + 10)
+        ]
+        self.table: MappedTable = open_columnar(
+            write_columnar(Table('t', ['a', 'b', 'c', 'd'], self.rows), self.directory.name)
+        )
+
+    def tearDown(self) -> None:
+        self.table.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        self.assertEqual(self.table.row_count, len(self.rows))
+        self.assertEqual(self.table.columns, ['a', 'b', 'c', 'd'])
+        self.assertEqual(list(self.table), self.rows)
+
+    def test_columns(self) -> None:
+        column: MappedColumn = self.table.column('C')
+        self.assertEqual(len(column), len(self.rows))
+        self.assertIsNone(column[3])
+        self.assertEqual(column[4], "usuário 4")
+        self.assertEqual(column[-1], self.rows[-1][2])
+        self.assertEqual(column[1:4], ["usuário 1", "usuário 2", None])
+        self.assertEqual(list(self.table.scan(['d', 'a']))[:2], [("", 0), ("", 1)])
+
+    def test_read_only(self) -> None:
+        with self.assertRaises(TypeError):
+            self.table.extend([(1, 1.0, 'x', 'y')])
+        tables: Dict[str, MappedTable] = open_columnar_database(self.directory.name)
+        self.assertEqual(list(tables), ['t'])
+        tables['t'].close()
+        self.assertTrue(os.path.isfile(os.path.join(self.directory.name, 't', 'table.json')))
+
+    def test_mixed_column(self) -> None:
+        with self.assertRaises(ValueError):
+            write_columnar(Table('m', ['a'], [(1,), ('1',)]), self.directory.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Arquivo responsável pelos testes da carga dos arquivos CSV."""
+
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Storage import CsvLoader, Table, write_csv
+
+# O banco de dados do teste.
+DATABASE: Dict[str, List[str]] = {
+    't': ['id', 'valor', 'codigo', 'nome'],
+}
+
+class CsvLoaderTest(unittest.TestCase):
+    """Testa a escrita e a carga de um arquivo dividido em vários trechos."""
+
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, 't.csv')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        # 'valor' é inteira nos primeiros trechos e real no último; 'codigo'
+        # parece numérica nos primeiros trechos, mas é texto no último.
+        rows: List[tuple] = [
+            (i, i if i < 900 else i / 4, str(i) if i < 900 else f"c{i}", None if i % 7 == 0 else f"nome, {i}")
+            for i in range(1000)
+        ]
+        write_csv(Table('t', DATABASE['t'], rows), self.path)
+
+        loader: CsvLoader = CsvLoader(DATABASE, workers=1, chunk_size=1024)
+        table: Table = loader.load('T', self.path)
+        self.assertGreater(loader.reports[-1].chunks, 1)
+        self.assertEqual(loader.reports[-1].rows, 1000)
+        self.assertEqual(table.columns, DATABASE['t'])
+        self.assertEqual(list(table), [
+            (i, float(valor), codigo, nome) for (i, valor, codigo, nome) in rows
+        ])
+        self.assertTrue(all(isinstance(value, float) for value in table.column('valor')))
+
+    def test_header_order(self) -> None:
+        # As colunas do arquivo podem estar em qualquer ordem.
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("nome,codigo,valor,id\nx,a,1.5,1\n,b,,2\n")
+        table: Table = CsvLoader(DATABASE, workers=1).load('t', self.path)
+        self.assertEqual(list(table), [(1, 1.5, 'a', 'x'), (2, None, 'b', None)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Arquivo responsável pelos testes da execução das árvores (modelo de iteradores)."""
+
+import unittest
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor
+from Tests import convert, example_catalog
+
+def expected_rows(catalog: Catalog) -> Dict[str, List[tuple]]:
+    """Calcula, em Python puro, o resultado esperado de cada comando de 'QUERIES'.
+
+    Args:
+        catalog (Catalog): O catálogo, com os dados exemplares.
+
+    Returns:
+        Dict[str, List[tuple]]: As linhas de cada comando, ordenadas.
+    """
+    (usuario, contas) = (list(catalog.table('usuario')), list(catalog.table('contas')))
+    rich: set = {conta[3] for conta in contas if conta[4] > 5000}
+    results: Dict[str, Callable[[], Iterator[tuple]]] = {
+        "select nome from usuario where idusuario <= 10;":
+            lambda: ((u[1],) for u in usuario if u[0] <= 10),
+        "select nome, uf from usuario where uf = 'SP' and idusuario > 20;":
+            lambda: ((u[1], u[6]) for u in usuario if u[6] == 'SP' and u[0] > 20),
+        "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+        "where saldoinicial > 5000;":
+            lambda: ((u[1], c[4]) for u in usuario for c in contas if u[0] == c[3] and c[4] > 5000),
+        "select nome from usuario where idusuario in (select usuario_idusuario from contas where saldoinicial > 5000);":
+            lambda: ((u[1],) for u in usuario if u[0] in rich),
+        "select nome from usuario where idusuario not in (select usuario_idusuario from contas where saldoinicial > 5000);":
+            lambda: ((u[1],) for u in usuario if u[0] not in rich),
+    }
+    return {sql_command: sorted(rows()) for sql_command, rows in results.items()}
+
+class ExecutorTest(unittest.TestCase):
+    """Testa o resultado da execução de comandos sobre os dados exemplares."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.executor: Executor = Executor(self.catalog)
+
+    def test_queries(self) -> None:
+        for sql_command, expected in expected_rows(self.catalog).items():
+            self.assertTrue(expected, sql_command)
+            self.assertEqual(sorted(self.executor.execute(convert(sql_command, self.catalog))), expected, sql_command)
+
+    def test_streaming(self) -> None:
+        # As linhas são produzidas sob demanda.
+        rows: Iterator[Tuple] = self.executor.execute(convert("select * from movimentacao;", self.catalog))
+        self.assertEqual(len(next(rows)), 7)
+        self.assertEqual(1 + sum(1 for _ in rows), 2000)
+
+if __name__ == '__main__':
+    unittest.main()
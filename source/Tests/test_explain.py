@@ -0,0 +1,63 @@
+"""Arquivo responsável pelos testes do EXPLAIN ANALYZE."""
+
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor, NodeStatistics, PlanAnalysis, strip_explain_analyze
+from RelationalAlgebra.Converter import Converter, Node
+from Tests import convert, example_catalog
+from Tests.test_plan import plan_nodes
+
+class ExplainAnalyzeTest(unittest.TestCase):
+    """Testa as medidas de cada nó da árvore, nos dois modos de execução."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.executor: Executor = Executor(self.catalog)
+
+    def test_strip(self) -> None:
+        self.assertEqual(strip_explain_analyze("  EXPLAIN analyze select 1;"), ("select 1;", True))
+        self.assertEqual(strip_explain_analyze("select 1;"), ("select 1;", False))
+
+    def test_measures(self) -> None:
+        converter: Converter = convert(
+            "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+            "where saldoinicial > 5000;", self.catalog
+        )
+        expected: int = len(list(self.executor.execute(converter)))
+        for vectorized in (False, True):
+            analysis: PlanAnalysis = self.executor.explain_analyze(converter, vectorized=vectorized)
+            self.assertEqual(analysis.result_rows, expected)
+            root: NodeStatistics = analysis.statistics(converter.relational_algebra_tree)
+            self.assertEqual(root.loops, 1)
+            self.assertIsNotNone(root.peak_memory)
+            self.assertGreaterEqual(root.time, root.self_time)
+            self.assertTrue(analysis.render().endswith(f"{expected} linhas"))
+
+            # Os nós mais lentos estão em ordem; o mais lento é o único destacado por completo.
+            hottest: List[Node] = analysis.hottest()
+            times: List[float] = [analysis.statistics(node).self_time for node in hottest]
+            self.assertEqual(times, sorted(times, reverse=True))
+            if hottest:
+                self.assertEqual(analysis.heat(hottest[0]), 1.0)
+            for node in plan_nodes(converter):
+                self.assertLessEqual(analysis.heat(node), 1.0)
+
+    def test_zero_self_time(self) -> None:
+        # Tempos exibidos como '0.00 ms' não destacam nenhum nó.
+        converter: Converter = convert("select nome from usuario;", self.catalog)
+        analysis: PlanAnalysis = PlanAnalysis(converter, trace_memory=False)
+        nodes: List[Node] = plan_nodes(converter)
+        for number, node in enumerate(nodes):
+            analysis.register(node).self_time = number * 1e-6
+        self.assertEqual(analysis.hottest(), [])
+        self.assertEqual([analysis.heat(node) for node in nodes], [0.0] * len(nodes))
+
+        analysis.statistics(nodes[0]).self_time = 0.002
+        self.assertEqual(analysis.hottest(), [nodes[0]])
+        self.assertEqual(analysis.heat(nodes[0]), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Arquivo responsável pelos testes do IN e do NOT IN (listas e subconsultas) com nulos."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor
+from Storage import Table
+from Tests import convert
+
+# O banco de dados do teste: 'va' e 'vb' possuem nulos.
+DATABASE: Dict[str, List[str]] = {
+    'ta': ['ida', 'va'],
+    'tb': ['idb', 'vb'],
+}
+
+class InListTest(unittest.TestCase):
+    """Testa a lógica de três valores do IN e do NOT IN, nos dois modos de execução."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = Catalog(DATABASE)
+        self.catalog.attach_table(Table('ta', DATABASE['ta'], [(1, 1), (2, 2), (3, None), (4, 3)]))
+        self.catalog.attach_table(Table('tb', DATABASE['tb'], [(1, 1), (2, None)]))
+        self.executor: Executor = Executor(self.catalog)
+
+    def assertRows(self, sql_command: str, expected: List[int]) -> None:
+        """Verifica os identificadores ('ida') retornados pelos dois modos de execução."""
+        converter = convert(sql_command, self.catalog, DATABASE)
+        for vectorized in (False, True):
+            rows: List[int] = sorted(row[0] for row in self.executor.execute(converter, vectorized=vectorized))
+            self.assertEqual(rows, expected, f"{sql_command} (vectorized={vectorized})")
+
+    def test_lists(self) -> None:
+        # Um nulo nunca está (nem deixa de estar) em uma lista.
+        self.assertRows("select ida from ta where va in (1, 2);", [1, 2])
+        self.assertRows("select ida from ta where va not in (1, 2);", [4])
+        # Um texto nunca é igual a um número.
+        self.assertRows("select ida from ta where va in ('1');", [])
+
+    def test_subqueries(self) -> None:
+        self.assertRows("select ida from ta where va in (select vb from tb);", [1])
+        self.assertRows("select ida from ta where va not in (select vb from tb where idb = 1);", [2, 4])
+
+    def test_subquery_with_nulls(self) -> None:
+        # Com um nulo na subconsulta, o NOT IN nunca é verdadeiro.
+        self.assertRows("select ida from ta where va not in (select vb from tb);", [])
+
+    def test_empty_subquery(self) -> None:
+        # Nada está em uma subconsulta vazia; tudo, inclusive o nulo, não está.
+        self.assertRows("select ida from ta where va in (select vb from tb where idb > 100);", [])
+        self.assertRows("select ida from ta where va not in (select vb from tb where idb > 100);", [1, 2, 3, 4])
+
+if __name__ == '__main__':
+    unittest.main()
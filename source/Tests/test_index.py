@@ -0,0 +1,58 @@
+"""Arquivo responsável pelos testes dos índices secundários."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor, IndexScan
+from Parser.sql_ast import ColumnRef, Comparison, InList, Literal
+from Storage import SORTED_INDEX, SortedIndex, Table
+from Tests import convert
+
+# O banco de dados do teste.
+DATABASE: Dict[str, List[str]] = {
+    't': ['a', 'b'],
+}
+
+def comparison(operator: str, value: int) -> Comparison:
+    """Cria a comparação 'a <operador> <valor>'."""
+    return Comparison(ColumnRef(None, 'a'), operator, Literal(value, str(value)))
+
+class SortedIndexTest(unittest.TestCase):
+    """Testa o índice ordenado e a sua manutenção pela tabela."""
+
+    def setUp(self) -> None:
+        self.table: Table = Table('t', DATABASE['t'], [(i, f"b{i}") for i in range(1000)])
+        self.catalog: Catalog = Catalog(DATABASE)
+        self.catalog.attach_table(self.table)
+        self.index: SortedIndex = self.catalog.create_index('t', 'a', kind=SORTED_INDEX)
+
+    def test_lookup(self) -> None:
+        self.assertEqual(self.index.lookup(comparison('=', 7)), [7])
+        self.assertEqual(self.index.lookup_all([comparison('>', 10), comparison('<=', 13)]), [11, 12, 13])
+        self.assertEqual(self.index.lookup(InList(ColumnRef(None, 'a'), [Literal(3, '3'), Literal(None, 'null')], False)), [3])
+        self.assertEqual(self.index.lookup(Comparison(ColumnRef(None, 'a'), '=', Literal('x', "'x'"))), [])
+
+    def test_extend_out_of_order(self) -> None:
+        self.table.extend([(-1, 'menor'), (5, 'repetido')])
+        self.assertEqual(self.index.lookup(comparison('<', 1)), [0, 1000])
+        self.assertEqual(self.index.lookup(comparison('=', 5)), [5, 1001])
+
+    def test_incomparable_extend(self) -> None:
+        version: int = self.table.version
+        with self.assertRaises(ValueError):
+            self.table.extend([(1001, 'x'), ('zz', 99)])
+        self.assertEqual(self.table.row_count, 1000)
+        self.assertEqual(self.table.version, version)
+
+        # As linhas incluídas após a falha continuam sendo indexadas.
+        self.table.extend([(1001, 'x')])
+        self.catalog.analyze()
+        converter = convert('select b from t where a = 1001;', self.catalog, DATABASE)
+        executor: Executor = Executor(self.catalog)
+        self.assertIsInstance(executor.compile(converter).child.child, IndexScan)
+        self.assertEqual(list(executor.execute(converter)), [('x',)])
+
+if __name__ == '__main__':
+    unittest.main()
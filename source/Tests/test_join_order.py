@@ -0,0 +1,60 @@
+"""Arquivo responsável pelos testes da escolha da ordem das junções."""
+
+import unittest
+from typing import Dict, List, Tuple
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef, Comparison
+from RelationalAlgebra.join_order import CostModel, JoinCondition, JoinOrderer
+
+class FixedCostModel(CostModel):
+    """Modelo de custo com cardinalidades e seletividades fixas."""
+
+    def __init__(self, rows: Dict[str, float], selectivities: Dict[Tuple[str, ...], float]) -> None:
+        super().__init__()
+        self.rows = rows
+        self.selectivities = selectivities
+
+    def cardinality(self, table: str) -> float:
+        return self.rows[table]
+
+    def join_selectivity(self, condition: JoinCondition) -> float:
+        return self.selectivities[condition.tables]
+
+class JoinOrderTest(unittest.TestCase):
+    """Testa a programação dinâmica e a heurística gulosa, no limite de 10 tabelas.
+
+    As tabelas formam uma cadeia 'a - b - c - t3 - t4 ...'. A menor tabela,
+    'a', é a primeira da heurística gulosa, mas a sua junção com 'b' não é
+    seletiva; começar pela junção de 'b' e 'c' é muito mais barato.
+    """
+
+    def order(self, table_count: int) -> List[str]:
+        """Escolhe a ordem das junções da cadeia com 'table_count' tabelas."""
+        tables: List[str] = ['a', 'b', 'c'] + [f"t{i}" for i in range(3, table_count)]
+        rows: Dict[str, float] = {table: 1000.0 for table in tables}
+        rows['a'] = 10.0
+        conditions: List[JoinCondition] = []
+        selectivities: Dict[Tuple[str, ...], float] = {}
+        for left, right in zip(tables, tables[1:]):
+            predicate: Comparison = Comparison(ColumnRef(left, 'k'), '=', ColumnRef(right, 'k'))
+            conditions.append(JoinCondition(predicate, (left, right)))
+            selectivities[(left, right)] = 1.0 if left == 'a' else 1e-3
+        selectivities[('b', 'c')] = 1e-6
+        orderer: JoinOrderer = JoinOrderer(FixedCostModel(rows, selectivities))
+        join_order = orderer.order(tables, {table: [] for table in tables}, conditions)
+
+        # Nenhuma junção é um produto cartesiano.
+        for step, (_, predicates) in enumerate(join_order):
+            self.assertEqual(bool(predicates), step > 0)
+        self.assertEqual(sorted(table for table, _ in join_order), sorted(tables))
+        return [table for table, _ in join_order]
+
+    def test_dynamic_programming(self) -> None:
+        self.assertEqual(set(self.order(10)[:2]), {'b', 'c'})
+
+    def test_greedy_above_limit(self) -> None:
+        self.assertEqual(self.order(11)[:3], ['a', 'b', 'c'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Arquivo responsável pelos testes da análise léxica dos comandos SQL."""
+
+import re
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Parser.lexer import Lexer
+
+# A antiga expressão regular de extração de cláusulas, usada como referência.
+LEGACY_TOKEN_PATTERN: str = r'(?<!\()\b(select|from|join|on|where|and|in|not\s+in)\b(?!([^()]*\)))|(;$)'
+
+class LexerTest(unittest.TestCase):
+    """Testa que o Lexer extrai as mesmas cláusulas da antiga expressão regular."""
+
+    COMMANDS: List[str] = [
+        "select nome from usuario where idusuario = 1 ;",
+        "SELECT * FROM usuario JOIN contas ON usuario.idusuario = contas.usuario_idusuario WHERE saldoinicial > 10 ;",
+        "select nome from usuario where idusuario in (select usuario_idusuario from contas) and nome = 'ana' ;",
+        "select nome from usuario where idusuario not  in (1, 2, 3) and uf = 'sp' ;",
+        "select joinha, onde from selection where fromage = 1 ;",
+    ]
+
+    def test_legacy_tokens(self) -> None:
+        for command in self.COMMANDS:
+            legacy: list = [
+                (match.group(), match.start()) for match in re.finditer(LEGACY_TOKEN_PATTERN, command, re.IGNORECASE)
+            ]
+            self.assertEqual(Lexer(command).tokens, legacy, command)
+
+    def test_keywords_inside_literals(self) -> None:
+        # A expressão regular antiga extraía as palavras dentro das aspas.
+        command: str = "select nome from usuario where nome = 'select from' ;"
+        self.assertEqual(Lexer(command).tokens, [('select', 0), ('from', 12), ('where', 25), (';', 52)])
+
+if __name__ == '__main__':
+    unittest.main()
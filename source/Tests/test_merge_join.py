@@ -0,0 +1,62 @@
+"""Arquivo responsável pelos testes do merge join com várias chaves."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor, MergeJoin
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter, Node
+from Storage import Table
+from Tests import convert
+
+# O banco de dados do teste: 'ka', 'kb' e 'kc' estão ordenadas, 'xa' e 'xb' não.
+DATABASE: Dict[str, List[str]] = {
+    'ta': ['ida', 'xa', 'ka'],
+    'tb': ['idb', 'xb', 'kb'],
+    'tc': ['idc', 'kc'],
+}
+
+class MergeJoinTest(unittest.TestCase):
+    """Testa o merge join quando somente a segunda chave da junção está ordenada."""
+
+    def setUp(self) -> None:
+        self.ta: Table = Table('ta', DATABASE['ta'], [(i, (i * 7) % 13, i // 3) for i in range(300)])
+        self.tb: Table = Table('tb', DATABASE['tb'], [(i, (i * 5) % 13, i // 2) for i in range(400)])
+        self.tc: Table = Table('tc', DATABASE['tc'], [(i, f"k{i:05d}") for i in range(200)])
+        self.catalog: Catalog = Catalog(DATABASE)
+        for table in (self.ta, self.tb, self.tc):
+            self.catalog.attach_table(table)
+        self.catalog.analyze()
+        self.executor: Executor = Executor(self.catalog)
+
+    def join(self, converter: Converter) -> plan.Join:
+        """Retorna o operador da (única) junção da árvore."""
+        node: Node = converter.relational_algebra_tree
+        while not isinstance(node.operator, plan.Join):
+            node = node.left_children
+        return node.operator
+
+    def test_merge_on_sorted_key(self) -> None:
+        converter: Converter = convert(
+            'select ida, idb from ta join tb on ta.xa = tb.xb and ta.ka = tb.kb;', self.catalog, DATABASE
+        )
+        expected: List[tuple] = sorted(
+            (a[0], b[0]) for a in self.ta for b in self.tb if a[1] == b[1] and a[2] == b[2]
+        )
+        self.assertEqual(self.join(converter).method, plan.MERGE)
+        self.assertEqual(self.join(converter).merge_key.left.column, 'ka')
+        self.assertIsInstance(self.executor.compile(converter).child, MergeJoin)
+        self.assertEqual(sorted(self.executor.execute(converter)), expected)
+        self.assertEqual(sorted(self.executor.execute(converter, vectorized=True)), expected)
+
+    def test_keys_of_different_types(self) -> None:
+        # As duas chaves estão ordenadas, mas números e textos não são comparáveis.
+        converter: Converter = convert('select ida, idc from ta join tc on ta.ka = tc.kc;', self.catalog, DATABASE)
+        self.assertNotEqual(self.join(converter).method, plan.MERGE)
+        self.assertEqual(list(self.executor.execute(converter)), [])
+        self.assertEqual(list(self.executor.execute(converter, vectorized=True)), [])
+
+if __name__ == '__main__':
+    unittest.main()
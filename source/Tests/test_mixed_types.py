@@ -0,0 +1,78 @@
+"""Arquivo responsável pelos testes das comparações entre tipos diferentes."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor
+from Storage import Table
+from Tests import convert, example_catalog
+
+# O banco de dados do teste: 'km' e 'kn' misturam números e textos, e 'sn' possui números em texto.
+DATABASE: Dict[str, List[str]] = {
+    'tm': ['idm', 'km'],
+    'tn': ['idn', 'kn', 'sn'],
+}
+
+class MixedTypeComparisonTest(unittest.TestCase):
+    """Testa que os dois modos de execução tratam da mesma forma as
+    comparações entre um texto e um número."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.executor: Executor = Executor(self.catalog)
+
+    def count(self, sql_command: str) -> tuple:
+        """Executa um comando nos dois modos, retornando a quantia de linhas de cada um."""
+        converter = convert(sql_command, self.catalog)
+        return (
+            len(list(self.executor.execute(converter))),
+            len(list(self.executor.execute(converter, vectorized=True))),
+        )
+
+    def test_ordering_comparison(self) -> None:
+        self.assertEqual(self.count("select nome from usuario where nome > 5;"), (0, 0))
+        self.assertEqual(self.count("select nome from usuario where idusuario < 'abc';"), (0, 0))
+
+    def test_equality_comparison(self) -> None:
+        self.assertEqual(self.count("select nome from usuario where nome = 5;"), (0, 0))
+        self.assertEqual(self.count("select nome from usuario where nome <> 5;"), (100, 100))
+
+    def test_sorted_index(self) -> None:
+        self.catalog.create_index('usuario', 'nome', kind='sorted')
+        self.assertEqual(self.count("select nome from usuario where nome > 5;"), (0, 0))
+
+class MixedTypeJoinTest(unittest.TestCase):
+    """Testa as junções sobre chaves que misturam números e textos."""
+
+    def setUp(self) -> None:
+        self.tm: Table = Table('tm', DATABASE['tm'], [(i, i if i % 2 else f"k{i}") for i in range(20)])
+        self.tn: Table = Table('tn', DATABASE['tn'], [(i, i if i % 3 else f"k{i}", str(i)) for i in range(20)])
+        self.catalog: Catalog = Catalog(DATABASE)
+        for table in (self.tm, self.tn):
+            self.catalog.attach_table(table)
+        self.executor: Executor = Executor(self.catalog)
+
+    def test_mixed_keys(self) -> None:
+        converter = convert('select idm, idn from tm join tn on tm.km = tn.kn;', self.catalog, DATABASE)
+        expected: List[tuple] = sorted((m[0], n[0]) for m in self.tm for n in self.tn if m[1] == n[1])
+        self.assertEqual(len(expected), 11)
+        self.assertEqual(sorted(self.executor.execute(converter)), expected)
+        self.assertEqual(sorted(self.executor.execute(converter, vectorized=True)), expected)
+
+    def test_number_and_mixed_keys(self) -> None:
+        converter = convert('select idm, idn from tm join tn on tm.idm = tn.kn;', self.catalog, DATABASE)
+        expected: List[tuple] = sorted((m[0], n[0]) for m in self.tm for n in self.tn if m[0] == n[1])
+        self.assertEqual(len(expected), 13)
+        self.assertEqual(sorted(self.executor.execute(converter)), expected)
+        self.assertEqual(sorted(self.executor.execute(converter, vectorized=True)), expected)
+
+    def test_number_and_text_keys(self) -> None:
+        # Um número nunca é igual ao seu texto ('2' <> 2).
+        converter = convert('select idm, idn from tm join tn on tm.idm = tn.sn;', self.catalog, DATABASE)
+        self.assertEqual(list(self.executor.execute(converter)), [])
+        self.assertEqual(list(self.executor.execute(converter, vectorized=True)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Arquivo responsável pelos testes da junção paralela."""
+
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor
+from Executor.vectorized import BatchOperator, ParallelHashJoin, VectorizedExecutor
+from RelationalAlgebra.Converter import Converter
+from Tests import convert, example_catalog
+
+class ParallelJoinTest(unittest.TestCase):
+    """Testa o compartilhamento dos processos entre as junções paralelas."""
+
+    SQL_COMMAND: str = (
+        "select nome, valor from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+        "join movimentacao on contas.idconta = movimentacao.contas_idconta;"
+    )
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.converter: Converter = convert(self.SQL_COMMAND, self.catalog)
+
+    @staticmethod
+    def joins(operator: BatchOperator) -> List[ParallelHashJoin]:
+        """Retorna as junções paralelas abaixo de um operador."""
+        found: List[ParallelHashJoin] = [operator] if isinstance(operator, ParallelHashJoin) else []
+        for attribute in ("child", "left", "right"):
+            if isinstance(child := getattr(operator, attribute, None), BatchOperator):
+                found.extend(ParallelJoinTest.joins(child))
+        return found
+
+    def test_shared_pool(self) -> None:
+        expected: List[tuple] = sorted(Executor(self.catalog).execute(self.converter))
+        with Executor(self.catalog, workers=2) as executor:
+            vectorized: VectorizedExecutor = executor.vectorized_executor
+            for _ in range(2):
+                root: BatchOperator = vectorized.compile(self.converter)
+                joins: List[ParallelHashJoin] = self.joins(root)
+                self.assertEqual(len(joins), 2)
+                self.assertTrue(all(join.pool is vectorized.pool for join in joins))
+                # Sem o limite de linhas, as partições são unidas nos processos.
+                for join in joins:
+                    join.threshold = 0
+                self.assertEqual(sorted(row for batch in root for row in batch.rows()), expected)
+            pool: object = vectorized.pool
+        # Os processos são encerrados ao final do 'with', e criados novamente em um novo uso.
+        self.assertIsNot(vectorized.pool, pool)
+        vectorized.close()
+
+if __name__ == '__main__':
+    unittest.main()
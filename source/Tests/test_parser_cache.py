@@ -0,0 +1,44 @@
+"""Arquivo responsável pelos testes do cache de comandos SQL analisados."""
+
+import unittest
+
+# pylint: disable=import-error
+from Exceptions.incorrect_order import IncorrectClauseOrderException
+from Exceptions.missing_semicolon import MissingSemicolonException
+from Parser.cache import ParserCache
+from Parser.parser import Parser
+
+class ParserCacheTest(unittest.TestCase):
+    """Testa o reaproveitamento dos comandos com o mesmo formato."""
+
+    def setUp(self) -> None:
+        self.cache: ParserCache = ParserCache(max_size=2)
+
+    def assert_same_parse(self, sql_command: str) -> None:
+        """Verifica que o resultado do cache é igual ao do Parser."""
+        (cached, parser) = (self.cache.parse(sql_command), Parser(sql_command))
+        self.assertEqual(cached.sql_command, parser.sql_command)
+        self.assertEqual(cached.sql_tokens, parser.sql_tokens)
+        self.assertEqual(cached.sql_params, parser.sql_params)
+
+    def test_literals_rebound(self) -> None:
+        self.assert_same_parse("select nome from usuario where idusuario = 1 and nome = 'ana';")
+        self.assert_same_parse("select nome from usuario  where idusuario = 25 and nome = 'bia';")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_different_shapes(self) -> None:
+        self.assert_same_parse("select nome from usuario where idusuario = 1;")
+        self.assert_same_parse("select nome from usuario where idusuario > 1;")
+        self.assert_same_parse("select nome, uf from usuario where idusuario = 1;")
+        self.assertEqual((self.cache.hits, self.cache.misses, self.cache.evictions), (0, 3, 1))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_invalid_command(self) -> None:
+        with self.assertRaises(MissingSemicolonException):
+            self.cache.parse("select nome from usuario where idusuario = 1")
+        with self.assertRaises(IncorrectClauseOrderException):
+            self.cache.parse("select nome usuario;")
+        self.assertEqual(len(self.cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
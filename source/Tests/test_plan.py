@@ -0,0 +1,98 @@
+"""Arquivo responsável pelos testes dos operadores tipados da árvore."""
+
+import unittest
+from typing import Dict, List, Union
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter, Node
+from Tests import convert
+
+def plan_nodes(converter: Converter) -> List[Node]:
+    """Percorre os nós da árvore de um Conversor, a partir da raiz.
+
+    Args:
+        converter (Converter): O Conversor.
+
+    Returns:
+        List[Node]: Os nós da árvore, em pré-ordem.
+    """
+    nodes: List[Node] = []
+    pending: List[Node] = [converter.relational_algebra_tree]
+    while pending:
+        nodes.append(node := pending.pop())
+        pending.extend(child for child in (node.left_children, node.right_children) if child is not None)
+    return nodes
+
+class PlanOperatorTest(unittest.TestCase):
+    """Testa os operadores guardados nos nós da árvore."""
+
+    def test_operators(self) -> None:
+        nodes: List[Node] = plan_nodes(convert(
+            "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+            "where uf = 'sp';"
+        ))
+        for node in nodes:
+            # O texto de cada nó é gerado pelo seu operador.
+            self.assertEqual(node.value, node.operator.render())
+            self.assertEqual(str(node.operator), node.value)
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertFalse(hasattr(node.operator, "__dict__"))
+
+        operators: List[plan.Operator] = [node.operator for node in nodes]
+        self.assertIsInstance(operators[0], plan.Project)
+        self.assertEqual(sorted(operator.table for operator in operators if isinstance(operator, plan.Scan)), ['contas', 'usuario'])
+        joins: List[plan.Join] = [operator for operator in operators if isinstance(operator, plan.Join)]
+        self.assertEqual(len(joins), 1)
+        self.assertEqual(joins[0].keys, [(ColumnRef('usuario', 'idusuario'), ColumnRef('contas', 'usuario_idusuario'))])
+        self.assertEqual(len([operator for operator in operators if isinstance(operator, plan.Select)]), 1)
+
+class WhereJoinTest(unittest.TestCase):
+    """Testa as junções entre as tabelas do FROM feitas pelas condicionais do WHERE."""
+
+    def test_join_predicates(self) -> None:
+        operators: List[plan.Operator] = [node.operator for node in plan_nodes(convert(
+            "select nome, saldoinicial from usuario, contas, tipoconta "
+            "where usuario.idusuario = contas.usuario_idusuario and contas.tipoconta_idtipoconta = tipoconta.idtipoconta "
+            "and uf = 'SP';"
+        ))]
+        # Nenhum produto cartesiano: cada junção possui a sua condicional.
+        joins: List[plan.Join] = [operator for operator in operators if isinstance(operator, plan.Join)]
+        self.assertEqual(sorted(len(join.conditions) for join in joins), [1, 1])
+        self.assertEqual(
+            sorted(str(condition) for join in joins for condition in join.conditions),
+            ['contas.tipoconta_idtipoconta = tipoconta.idtipoconta', 'usuario.idusuario = contas.usuario_idusuario']
+        )
+        # A condicional de uma só tabela continua sendo uma seleção.
+        selects: List[plan.Select] = [operator for operator in operators if isinstance(operator, plan.Select)]
+        self.assertEqual([str(predicate) for select in selects for predicate in select.predicates], ["uf = 'SP'"])
+
+class ProjectionPruningTest(unittest.TestCase):
+    """Testa as colunas lidas por cada tabela após a poda das colunas."""
+
+    def scan_columns(self, sql_command: str) -> Dict[str, Union[List[str], None]]:
+        """Extrai as colunas lidas por cada tabela de um comando."""
+        return {
+            node.operator.table: node.operator.columns
+            for node in plan_nodes(convert(sql_command))
+            if isinstance(node.operator, plan.Scan)
+        }
+
+    def test_pruning(self) -> None:
+        self.assertEqual(self.scan_columns(
+            "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+            "where saldoinicial > 5000;"
+        ), {'usuario': ['idusuario', 'nome'], 'contas': ['usuario_idusuario', 'saldoinicial']})
+
+    def test_star(self) -> None:
+        self.assertEqual(self.scan_columns("select * from usuario;"), {'usuario': None})
+
+    def test_cross_product(self) -> None:
+        # Uma tabela sem colunas usadas ainda lê uma coluna, para manter a quantia de linhas.
+        self.assertEqual(self.scan_columns("select usuario.nome from usuario, tipoconta;"), {
+            'usuario': ['nome'], 'tipoconta': ['idtipoconta']
+        })
+
+if __name__ == '__main__':
+    unittest.main()
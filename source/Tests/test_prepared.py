@@ -0,0 +1,82 @@
+"""Arquivo responsável pelos testes dos comandos SQL preparados."""
+
+import contextlib
+import io
+import unittest
+from typing import List, Tuple
+
+# pylint: disable=import-error
+import Examples
+from Catalog import Catalog
+from Exceptions.parameter_mismatch import ParameterMismatchException
+from Executor import Executor
+from RelationalAlgebra.prepared import PreparedStatement, prepare
+from Tests import convert, example_catalog
+
+class PreparedStatementTest(unittest.TestCase):
+    """Testa a atribuição dos parâmetros de um comando preparado."""
+
+    SQL_COMMAND: str = (
+        "select nome from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+        "where idusuario = ? and saldoinicial > ? and uf in (?, ?);"
+    )
+
+    def setUp(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.statement: PreparedStatement = prepare(self.SQL_COMMAND, Examples.pagamento_example_db)
+
+    def test_bind(self) -> None:
+        self.assertEqual(self.statement.param_count, 4)
+        for parameters in ((1, 100, 'sp', 'rj'), (2, 0, 'mg', 'ba')):
+            sql_command: str = self.SQL_COMMAND
+            for parameter in parameters:
+                sql_command = sql_command.replace("?", PreparedStatement.to_literal(parameter), 1)
+            expected: str = convert(sql_command).relational_algebra
+            self.assertEqual(self.statement.bind(*parameters), expected)
+            self.assertEqual(self.statement.relational_algebra, expected)
+
+    def test_parameter_count(self) -> None:
+        with self.assertRaises(ParameterMismatchException):
+            self.statement.bind(1)
+
+class PreparedSimplificationTest(unittest.TestCase):
+    """Testa que as condicionais com parâmetros não são simplificadas antes do bind."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.executor: Executor = Executor(self.catalog)
+        self.ids: List[int] = [row[0] for row in self.catalog.table('usuario')]
+
+    def execute(self, sql_command: str, *parameters: int) -> Tuple[List[tuple], List[tuple]]:
+        """Prepara e executa um comando, nos dois modos de execução."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            statement: PreparedStatement = prepare(sql_command, Examples.pagamento_example_db)
+        statement.bind(*parameters)
+        return (
+            sorted(self.executor.execute(statement.converter)),
+            sorted(self.executor.execute(statement.converter, vectorized=True)),
+        )
+
+    def test_repeated_bounds(self) -> None:
+        expected: List[tuple] = [(i,) for i in self.ids if i > 45]
+        rows = self.execute("select idusuario from usuario where idusuario > ? and idusuario > ?;", 45, 1)
+        self.assertEqual(rows, (expected, expected))
+
+    def test_equal_parameters(self) -> None:
+        rows = self.execute("select idusuario from usuario where idusuario = ? and idusuario = ?;", 5, 5)
+        self.assertEqual(rows, ([(5,)], [(5,)]))
+        rows = self.execute("select idusuario from usuario where idusuario in (?, ?) and idusuario = ?;", 5, 6, 5)
+        self.assertEqual(rows, ([(5,)], [(5,)]))
+
+    def test_rebind(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            statement: PreparedStatement = prepare(
+                "select idusuario from usuario where idusuario = ? and idusuario = ?;", Examples.pagamento_example_db
+            )
+        statement.bind(5, 6)
+        self.assertEqual(list(self.executor.execute(statement.converter)), [])
+        statement.bind(7, 7)
+        self.assertEqual(list(self.executor.execute(statement.converter)), [(7,)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Arquivo responsável pelos testes do cache de resultados."""
+
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+import Examples
+from Catalog import Catalog
+from Executor import Executor, ResultCache
+from Executor.result_cache import result_size
+from RelationalAlgebra.prepared import PreparedStatement, prepare
+from Tests import convert, example_catalog
+
+class ResultCacheTest(unittest.TestCase):
+    """Testa o cache de resultados com comandos preparados."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.cache: ResultCache = ResultCache(Executor(self.catalog))
+
+    def test_normalized_command(self) -> None:
+        first: list = self.cache.execute(convert("select nome from usuario where idusuario = 1;", self.catalog))
+        second: list = self.cache.execute(convert("SELECT  nome FROM usuario WHERE idusuario = 1 ;", self.catalog))
+        self.assertEqual(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (1, 1, 1))
+
+    def test_invalidation(self) -> None:
+        sql_command: str = "select idconta from contas where usuario_idusuario = 1;"
+        before: list = self.cache.execute(convert(sql_command, self.catalog))
+        self.catalog.table('contas').append((10_000, 'nova', 1, 1, 0.0))
+        after: list = self.cache.execute(convert(sql_command, self.catalog))
+        self.assertEqual(sorted(after), sorted(before + [(10_000,)]))
+        self.assertEqual((self.cache.hits, self.cache.misses, self.cache.invalidations), (0, 2, 1))
+
+    def test_eviction(self) -> None:
+        # Somente o resultado mais recente cabe no cache.
+        self.cache.max_bytes = result_size(self.cache.execute(convert("select * from usuario;", self.catalog)))
+        self.cache.execute(convert("select * from usuario where idusuario > 0;", self.catalog))
+        self.assertEqual((len(self.cache), self.cache.evictions), (1, 1))
+        self.cache.execute(convert("select * from usuario;", self.catalog))
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_prepared_bindings(self) -> None:
+        statement: PreparedStatement = prepare(
+            "select idusuario from usuario where idusuario = ?;", Examples.pagamento_example_db
+        )
+        results: List[list] = []
+        for parameter in (1, 2, 1):
+            statement.bind(parameter)
+            results.append(self.cache.execute(statement.converter))
+
+        self.assertEqual(results, [[(1,)], [(2,)], [(1,)]])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
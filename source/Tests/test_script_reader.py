@@ -0,0 +1,48 @@
+"""Arquivo responsável pelos testes da leitura em fluxo dos scripts SQL."""
+
+import io
+import os
+import tempfile
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Exceptions.missing_semicolon import MissingSemicolonException
+from Parser.parser import Parser
+from Parser.script_reader import ScriptReader
+
+class ScriptReaderTest(unittest.TestCase):
+    """Testa a divisão dos scripts nos ';' fora de aspas, parênteses e comentários."""
+
+    SCRIPT: str = (
+        "select nome from usuario where nome = 'a;b'; -- comentário; com ';'\n"
+        "select * from contas\n  where idconta in (select idconta from contas where descricao = \"x;\");\n"
+        "select nome from usuario"
+    )
+    STATEMENTS: List[str] = [
+        "select nome from usuario where nome = 'a;b';",
+        "select * from contas\n  where idconta in (select idconta from contas where descricao = \"x;\");",
+        "select nome from usuario",
+    ]
+
+    def test_small_chunks(self) -> None:
+        # Blocos pequenos dividem as aspas, os comentários e os comandos entre leituras.
+        for chunk_size in (1, 2, 5, 64, 1 << 16):
+            self.assertEqual(list(ScriptReader(io.StringIO(self.SCRIPT), chunk_size).statements()), self.STATEMENTS)
+
+    def test_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "script.sql")
+            with open(path, "w", encoding="utf-8") as script:
+                script.write(self.SCRIPT)
+            self.assertEqual(list(ScriptReader(path, chunk_size=3)), self.STATEMENTS)
+
+    def test_parse(self) -> None:
+        script: str = "select nome from usuario where idusuario = 1;\nselect nome from usuario where idusuario = 2"
+        results: list = list(ScriptReader(io.StringIO(script)).parse())
+        self.assertIsInstance(results[0][1], Parser)
+        self.assertEqual(results[0][1].sql_tokens, Parser(results[0][0]).sql_tokens)
+        self.assertIsInstance(results[1][1], MissingSemicolonException)
+
+if __name__ == '__main__':
+    unittest.main()
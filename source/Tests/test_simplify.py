@@ -0,0 +1,37 @@
+"""Arquivo responsável pelos testes da simplificação das condicionais."""
+
+import unittest
+
+# pylint: disable=import-error
+from Executor import Executor
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter, Node
+from Tests import convert, example_catalog
+
+class ContradictionTest(unittest.TestCase):
+    """Testa as tabelas com condicionais contraditórias (relações vazias)."""
+
+    def test_empty_scan_without_selection(self) -> None:
+        converter: Converter = convert(
+            "select nome from usuario where idusuario in (select usuario_idusuario from contas) "
+            "and idusuario = 3 and idusuario = 4;"
+        )
+        self.assertEqual(
+            converter.relational_algebra,
+            "π nome (π nome, idusuario (usuario [relação vazia: condicionais contraditórias]))"
+        )
+        # Os operadores da árvore, sem a subconsulta descartada.
+        operators: list = []
+        nodes: list = [converter.relational_algebra_tree]
+        while nodes:
+            node: Node = nodes.pop()
+            operators.append(node.operator)
+            nodes.extend(child for child in (node.left_children, node.right_children) if child is not None)
+        self.assertEqual([type(operator) for operator in operators], [plan.Project, plan.Project, plan.EmptyScan])
+
+        executor: Executor = Executor(example_catalog())
+        self.assertEqual(list(executor.execute(converter)), [])
+        self.assertEqual(list(executor.execute(converter, vectorized=True)), [])
+
+if __name__ == '__main__':
+    unittest.main()
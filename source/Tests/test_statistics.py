@@ -0,0 +1,60 @@
+"""Arquivo responsável pelos testes das estatísticas das tabelas (ANALYZE)."""
+
+import unittest
+from typing import Dict, List
+
+# pylint: disable=import-error
+from Catalog import Catalog, ColumnStatistics, TableStatistics
+from Parser.sql_ast import ColumnRef, Comparison, Literal
+from RelationalAlgebra.join_order import CostModel
+from Storage import Table
+
+# O banco de dados do teste.
+DATABASE: Dict[str, List[str]] = {
+    't': ['a', 'b'],
+}
+
+class StatisticsTest(unittest.TestCase):
+    """Testa as estimativas calculadas sobre a amostra de uma tabela."""
+
+    def setUp(self) -> None:
+        # 'a' possui 100 valores distintos; 'b' é nula em uma a cada quatro linhas.
+        self.table: Table = Table(
+            't', DATABASE['t'], [(i % 100, None if i % 4 == 0 else i) for i in range(50_000)]
+        )
+        self.catalog: Catalog = Catalog(DATABASE)
+        self.catalog.attach_table(self.table)
+        self.catalog.analyze()
+
+    def test_estimates(self) -> None:
+        statistics: TableStatistics = self.catalog.statistics('t')
+        self.assertEqual(statistics.row_count, 50_000)
+        self.assertEqual(statistics.sample_rows, 10_000)
+        self.assertAlmostEqual(statistics.column('a').distinct, 100, delta=10)
+        column: ColumnStatistics = statistics.column('B')
+        self.assertAlmostEqual(column.null_fraction, 0.25, delta=0.03)
+        self.assertEqual(column.histogram, sorted(column.histogram))
+        self.assertAlmostEqual(column.range_selectivity('<', 25_000), 0.375, delta=0.05)
+        self.assertIsNone(column.range_selectivity('<', 'texto'))
+
+    def test_cost_model(self) -> None:
+        cost_model: CostModel = CostModel(catalog=self.catalog)
+        self.assertEqual(cost_model.cardinality('t'), 50_000)
+        equality: Comparison = Comparison(ColumnRef(None, 'a'), '=', Literal(5, '5'))
+        self.assertAlmostEqual(cost_model.selectivity('t', equality), 0.01, delta=0.002)
+
+    def test_incremental_analyze(self) -> None:
+        statistics: TableStatistics = self.catalog.statistics('t')
+        self.table.extend([(1, 1)] * 50_000)
+        self.assertNotEqual(statistics.table_version, self.table.version)
+        self.catalog.analyze('t')
+        statistics = self.catalog.statistics('t')
+        self.assertEqual(statistics.row_count, 100_000)
+        self.assertEqual(statistics.table_version, self.table.version)
+        self.assertEqual(statistics.sample_rows, 10_000)
+        # Metade das linhas (e da amostra) possui 'a' = 1: metade dos limites do histograma.
+        histogram: list = statistics.column('a').histogram
+        self.assertAlmostEqual(histogram.count(1) / len(histogram), 0.5, delta=0.1)
+
+if __name__ == '__main__':
+    unittest.main()
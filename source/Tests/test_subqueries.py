@@ -0,0 +1,38 @@
+"""Arquivo responsável pelos testes das subconsultas do IN."""
+
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Parser.parser import Parser
+from RelationalAlgebra.Converter import Converter, Node
+from Tests import convert
+
+class SubqueryTest(unittest.TestCase):
+    """Testa que cada subconsulta é analisada e convertida uma única vez."""
+
+    SUBQUERY: str = "select usuario_idusuario from contas where saldoinicial > 10"
+
+    def test_parsed_and_converted_once(self) -> None:
+        converter: Converter = convert(
+            f"select nome from usuario where idusuario in ({self.SUBQUERY}) "
+            f"and idusuario not in ({self.SUBQUERY});"
+        )
+        parser: Parser = converter.parser
+        self.assertEqual(list(parser.sql_subqueries), [self.SUBQUERY])
+        self.assertEqual(list(converter.subquery_converters), [self.SUBQUERY])
+        for predicate in parser.sql_ast.where:
+            self.assertIs(predicate.query, parser.sql_subqueries[self.SUBQUERY].sql_ast)
+
+        # A árvore da subconsulta faz parte da árvore do comando.
+        nodes: List[Node] = []
+        pending: List[Node] = [converter.relational_algebra_tree]
+        while pending:
+            nodes.append(node := pending.pop())
+            pending.extend(child for child in (node.left_children, node.right_children) if child is not None)
+        subquery_tree: Node = converter.subquery_converters[self.SUBQUERY].relational_algebra_tree
+        self.assertTrue(any(node is subquery_tree for node in nodes))
+        self.assertEqual(max(node.execution_order for node in nodes), converter.relational_algebra_tree.execution_order)
+
+if __name__ == '__main__':
+    unittest.main()
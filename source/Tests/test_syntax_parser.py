@@ -0,0 +1,44 @@
+"""Arquivo responsável pelos testes da Árvore Sintática Abstrata dos comandos SQL."""
+
+import unittest
+
+# pylint: disable=import-error
+from Parser.parser import Parser
+from Parser.sql_ast import ColumnRef, Comparison, InList, InSubquery, Literal, Select
+
+class SyntaxParserTest(unittest.TestCase):
+    """Testa os nós tipados produzidos pelo Parser."""
+
+    def test_select(self) -> None:
+        select: Select = Parser(
+            "select nome, contas.saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+            "where uf = 'sp' and idusuario >= 10;"
+        ).sql_ast
+        self.assertEqual(select.columns, [ColumnRef(None, 'nome'), ColumnRef('contas', 'saldoinicial')])
+        self.assertEqual([table.name for table in select.tables], ['usuario'])
+        self.assertEqual([join.table.name for join in select.joins], ['contas'])
+        self.assertEqual(
+            select.joins[0].conditions,
+            [Comparison(ColumnRef('usuario', 'idusuario'), '=', ColumnRef('contas', 'usuario_idusuario'))]
+        )
+        self.assertEqual(select.where, [
+            Comparison(ColumnRef(None, 'uf'), '=', Literal('sp', "'sp'")),
+            Comparison(ColumnRef(None, 'idusuario'), '>=', Literal(10, '10')),
+        ])
+        self.assertFalse(select.is_star)
+
+    def test_in(self) -> None:
+        select: Select = Parser(
+            "select * from usuario where idusuario not in (1, 2) "
+            "and idusuario in (select usuario_idusuario from contas where saldoinicial > 0);"
+        ).sql_ast
+        self.assertTrue(select.is_star)
+        self.assertEqual(select.where[0], InList(ColumnRef(None, 'idusuario'), [Literal(1, '1'), Literal(2, '2')], True))
+        subquery: InSubquery = select.where[1]
+        self.assertIsInstance(subquery, InSubquery)
+        self.assertFalse(subquery.negated)
+        self.assertEqual(subquery.query.columns, [ColumnRef(None, 'usuario_idusuario')])
+        self.assertEqual(subquery.query.where, [Comparison(ColumnRef(None, 'saldoinicial'), '>', Literal(0, '0'))])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""Arquivo responsável pelos testes das tabelas em memória."""
+
+import unittest
+
+# pylint: disable=import-error
+from Parser.sql_ast import ColumnRef, Comparison, Literal
+from Storage import HashIndex, Table
+
+class TableExtendTest(unittest.TestCase):
+    """Testa a inclusão de várias linhas em uma tabela."""
+
+    def setUp(self) -> None:
+        self.table: Table = Table('t', ['a', 'b'], [(1, 'x'), (2, 'y')])
+        self.index: HashIndex = HashIndex('t_a', self.table, 'a')
+        self.table.add_index(self.index)
+
+    def test_invalid_row(self) -> None:
+        version: int = self.table.version
+        with self.assertRaises(ValueError):
+            self.table.extend([(3, 'z'), (4,)])
+        self.assertEqual(list(self.table), [(1, 'x'), (2, 'y')])
+        self.assertEqual(self.table.version, version)
+
+    def test_extend(self) -> None:
+        version: int = self.table.version
+        self.table.extend(row for row in [(3, 'z'), (4, 'w')])
+        self.assertEqual(list(self.table), [(1, 'x'), (2, 'y'), (3, 'z'), (4, 'w')])
+        self.assertEqual(self.table.version, version + 1)
+        self.assertEqual(self.index.lookup(Comparison(ColumnRef(None, 'a'), '=', Literal(4, '4'))), [3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Arquivo responsável pelos testes da execução vetorizada."""
+
+import unittest
+
+# pylint: disable=import-error
+from Catalog import Catalog
+from Executor import Executor
+from Tests import convert, example_catalog
+from Tests.test_executor import expected_rows
+
+class VectorizedExecutorTest(unittest.TestCase):
+    """Testa que o modo vetorizado produz as mesmas linhas do modo por linhas."""
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+
+    def test_queries(self) -> None:
+        # Lotes pequenos dividem as tabelas (e as junções) em vários lotes.
+        for batch_size in (7, 1 << 16):
+            executor: Executor = Executor(self.catalog, batch_size=batch_size)
+            for sql_command, expected in expected_rows(self.catalog).items():
+                rows: list = sorted(executor.execute(convert(sql_command, self.catalog), vectorized=True))
+                self.assertEqual(rows, expected, sql_command)
+
+    def test_nulls(self) -> None:
+        # Os nulos nunca satisfazem uma comparação.
+        executor: Executor = Executor(self.catalog)
+        converter = convert("select idmovimentacao from movimentacao where descricao <> 'x';", self.catalog)
+        expected: list = sorted(executor.execute(converter))
+        self.assertLess(len(expected), 2000)
+        self.assertEqual(sorted(executor.execute(converter, vectorized=True)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
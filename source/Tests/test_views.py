@@ -0,0 +1,59 @@
+"""Arquivo responsável pelos testes das visões materializadas."""
+
+import unittest
+from typing import List
+
+# pylint: disable=import-error
+from Catalog import Catalog, MaterializedView
+from Executor import Executor
+from RelationalAlgebra import plan
+from RelationalAlgebra.Converter import Converter
+from Tests import convert, example_catalog
+from Tests.test_plan import plan_nodes
+
+class MaterializedViewTest(unittest.TestCase):
+    """Testa a leitura das visões e a sua atualização, inclusive com subconsultas."""
+
+    SQL_COMMAND: str = (
+        "select idconta, nome from usuario join contas on usuario.idusuario = contas.usuario_idusuario "
+        "where tipoconta_idtipoconta in (select idtipomovimentacao from tipomovimentacao where descmovimentacao = 'novo');"
+    )
+
+    def setUp(self) -> None:
+        self.catalog: Catalog = example_catalog()
+        self.executor: Executor = Executor(self.catalog)
+
+    def test_view_rewrite(self) -> None:
+        join: str = "select nome, saldoinicial from usuario join contas on usuario.idusuario = contas.usuario_idusuario"
+        self.executor.create_materialized_view("mv_contas", convert(f"{join};", self.catalog))
+        converter: Converter = convert(f"{join} where saldoinicial > 5000;", self.catalog)
+        scans: List[plan.Scan] = [node.operator for node in plan_nodes(converter) if isinstance(node.operator, plan.Scan)]
+        self.assertEqual([type(scan) for scan in scans], [plan.ViewScan])
+
+        # A visão é atualizada quando uma das suas tabelas recebe linhas.
+        self.catalog.table('contas').append((10_000, 'nova', 1, 1, 9000.0))
+        expected: List[tuple] = sorted(
+            (usuario[1], conta[4])
+            for usuario in self.catalog.table('usuario') for conta in self.catalog.table('contas')
+            if usuario[0] == conta[3] and conta[4] > 5000
+        )
+        self.assertIn((self.catalog.table('usuario').column('nome')[0], 9000.0), expected)
+        self.assertEqual(sorted(self.executor.execute(converter)), expected)
+
+    def test_subquery_table_change(self) -> None:
+        view: MaterializedView = self.executor.create_materialized_view("mv_novo", convert(self.SQL_COMMAND, self.catalog))
+        self.assertEqual(view.table.row_count, 0)
+        self.assertTrue(view.is_fresh(self.catalog))
+
+        self.catalog.table('tipomovimentacao').append((2, 'novo'))
+        self.assertFalse(view.is_fresh(self.catalog))
+
+        expected: List[tuple] = sorted(
+            (conta[0], usuario[1])
+            for usuario in self.catalog.table('usuario') for conta in self.catalog.table('contas')
+            if usuario[0] == conta[3] and conta[2] == 2
+        )
+        self.assertEqual(sorted(self.executor.execute(convert(self.SQL_COMMAND, self.catalog))), expected)
+
+if __name__ == '__main__':
+    unittest.main()
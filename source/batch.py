@@ -0,0 +1,48 @@
+"""Arquivo principal do processamento em lote (sem interface gráfica).
+
+Uso:
+    python source/batch.py comandos.sql [--output resultados.jsonl]
+        [--workers N] [--chunk-size N] [--benchmark 1 2 4]
+"""
+
+import sys
+import json
+import argparse
+from typing import Dict, Iterator, List
+
+# pylint: disable=import-error
+from Batch import BatchProcessor, benchmark, read_statements
+
+def main() -> None:
+    """Função principal."""
+    argument_parser = argparse.ArgumentParser(
+        description="Verifica e converte, em lote, comandos SQL para Álgebra Relacional."
+    )
+    argument_parser.add_argument("input", help="Script com comandos SQL separados por ';'.")
+    argument_parser.add_argument("--output", help="Arquivo de saída (JSON Lines). Padrão: saída padrão.")
+    argument_parser.add_argument("--workers", type=int, default=None, help="Quantia de processos.")
+    argument_parser.add_argument("--chunk-size", type=int, default=256, help="Quantia de comandos por bloco.")
+    argument_parser.add_argument(
+        "--benchmark", type=int, nargs="+", metavar="WORKERS",
+        help="Mede a quantia de comandos por segundo para cada quantia de processos."
+    )
+    arguments = argument_parser.parse_args()
+
+    if arguments.benchmark:
+        statements: List[str] = list(read_statements(arguments.input))
+        for workers, throughput in benchmark(statements, arguments.benchmark, arguments.chunk_size).items():
+            print(f"{workers:>3} processo(s): {throughput:,.0f} comandos/s")
+        return
+
+    # Os comandos são lidos, processados e escritos sob demanda.
+    results: Iterator[Dict] = BatchProcessor(arguments.workers, arguments.chunk_size).process_file(arguments.input)
+    output = open(arguments.output, "w", encoding="utf-8") if arguments.output else sys.stdout
+    try:
+        for result in results:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+if __name__ == '__main__':
+    main()